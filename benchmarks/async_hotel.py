@@ -0,0 +1,91 @@
+"""Benchmark: latency of many concurrent asyncio clients, `AsyncHotel` against `run_in_executor`.
+
+Every simulated client searches a free room for one of a few popular date windows and
+books it. Latency is measured per client from its request to its answer.
+
+Usage:
+    python -m benchmarks.async_hotel [clients]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.async_hotel import AsyncHotel
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+DEFAULT_CLIENTS = 5_000
+ROOMS = 300
+WINDOWS = 20
+
+
+def build_hotel() -> Hotel:
+    return Hotel([Room(RoomTypeEnum.SUITE, 1000, []) for _ in range(ROOMS)])
+
+
+def requests(clients: int) -> list:
+    generator = random.Random(7)
+    start = datetime(2025, 1, 1)
+    windows = [(start + timedelta(days=3 * index), start + timedelta(days=3 * index + 2)) for index in range(WINDOWS)]
+    return [generator.choice(windows) for _ in range(clients)]
+
+
+async def run_clients(book, dates: list) -> list:
+    latencies = []
+
+    async def client(index, start_date, end_date):
+        started = time.perf_counter()
+        try:
+            await book(f"Guest {index}", start_date, end_date)
+        except RoomNotAvailable:
+            pass
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(client(index, *window) for index, window in enumerate(dates)))
+    return latencies
+
+
+async def with_executor(dates: list) -> list:
+    hotel = build_hotel()
+    loop = asyncio.get_running_loop()
+
+    async def book(client_name, start_date, end_date):
+        return await loop.run_in_executor(
+            None, hotel.schedule_a_room, client_name, RoomTypeEnum.SUITE, start_date, end_date
+        )
+
+    return await run_clients(book, dates)
+
+
+async def with_async_hotel(dates: list) -> list:
+    hotel = AsyncHotel(build_hotel())
+
+    async def book(client_name, start_date, end_date):
+        return await hotel.schedule_a_room(client_name, RoomTypeEnum.SUITE, start_date, end_date)
+
+    latencies = await run_clients(book, dates)
+    print(f"  searches run: {hotel.queries_computed}, coalesced: {hotel.queries_coalesced}")
+    return latencies
+
+
+def report(name: str, latencies: list) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:>16}: p50 {quantiles[49] * 1e3:8.2f} ms  p99 {quantiles[98] * 1e3:8.2f} ms")
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CLIENTS
+    dates = requests(clients)
+    print(f"{clients} concurrent clients, {ROOMS} rooms, {WINDOWS} date windows")
+    report("run_in_executor", asyncio.run(with_executor(dates)))
+    report("AsyncHotel", asyncio.run(with_async_hotel(dates)))
+
+
+if __name__ == "__main__":
+    main()
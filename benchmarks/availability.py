@@ -0,0 +1,58 @@
+"""Microbenchmark: indexed `Room.is_period_available` against the former list scan.
+
+Usage:
+    python -m benchmarks.availability
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+SIZES = (100, 1_000, 10_000)
+PROBES = 1_000
+
+
+def list_scan_is_period_available(room: Room, period: Period) -> bool:
+    """Overlap check as implemented before the interval index: one pass over every schedule."""
+    for scheduled in room.schedules:
+        if (
+            (scheduled.period.start <= period.start <= scheduled.period.end)
+            or (scheduled.period.start <= period.end <= scheduled.period.end)
+            or (period.start <= scheduled.period.start <= period.end)
+        ):
+            return False
+    return True
+
+
+def build_room(size: int) -> Room:
+    room = Room(RoomTypeEnum.SUITE, 1000, [])
+    start = datetime(2024, 1, 1)
+    for day in range(0, size * 3, 3):
+        room.add_schedule(Schedule("Guest", Period(start + timedelta(days=day), start + timedelta(days=day + 1))))
+    return room
+
+
+def main():
+    print(f"{'schedules':>10} {'list scan (us)':>15} {'index (us)':>11} {'speedup':>8}")
+    for size in SIZES:
+        room = build_room(size)
+        start = datetime(2024, 1, 1)
+        probes = [
+            Period(start + timedelta(days=offset, hours=36), start + timedelta(days=offset, hours=40))
+            for offset in range(0, size * 3, max(1, size * 3 // PROBES))
+        ]
+
+        scan = timeit.timeit(lambda: [list_scan_is_period_available(room, period) for period in probes], number=1)
+        indexed = timeit.timeit(lambda: [room.is_period_available(period) for period in probes], number=1)
+
+        scan_us = scan / len(probes) * 1e6
+        indexed_us = indexed / len(probes) * 1e6
+        print(f"{size:>10} {scan_us:>15.2f} {indexed_us:>11.2f} {scan_us / indexed_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Microbenchmark: `AvailabilityCache` on repeated search traffic with interleaved bookings.
+
+Searches draw from a small set of popular (room type, stay) questions, as search traffic
+does, and every tenth request books a room, invalidating the overlapping entries.
+
+Usage:
+    python -m benchmarks.availability_cache
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.availability_cache import AvailabilityCache
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 300
+SCHEDULES_PER_ROOM = 100
+REQUESTS = 20_000
+POPULAR_STAYS = 200
+ROOM_TYPES = list(RoomTypeEnum)[:3]
+
+
+def build_hotel(generator: random.Random) -> Hotel:
+    start = datetime(2024, 1, 1)
+    rooms = []
+    for number in range(ROOMS):
+        schedules = [
+            Schedule("Guest", Period(start + timedelta(days=day), start + timedelta(days=day + 1)))
+            for day in range(generator.randrange(3), SCHEDULES_PER_ROOM * 3, 3)
+        ]
+        rooms.append(Room(ROOM_TYPES[number % len(ROOM_TYPES)], 1000, schedules))
+    return Hotel(rooms)
+
+
+def make_traffic(generator: random.Random):
+    start = datetime(2024, 1, 1)
+    stays = []
+    for _ in range(POPULAR_STAYS):
+        day = start + timedelta(days=generator.randrange(SCHEDULES_PER_ROOM * 3))
+        stays.append((generator.choice(ROOM_TYPES), Period(day, day + timedelta(days=generator.randint(1, 4)))))
+    return [generator.choice(stays) for _ in range(REQUESTS)]
+
+
+def run(hotel: Hotel, search, traffic) -> float:
+    began = time.perf_counter()
+    for position, (room_type, period) in enumerate(traffic):
+        if position % 10 == 9:
+            room = hotel.find_available_room(room_type, period)
+            if room is not None:
+                room.add_schedule(Schedule("Walk-in", period))
+        else:
+            search(room_type, period)
+    return time.perf_counter() - began
+
+
+def main():
+    traffic = make_traffic(random.Random(7))
+    print(f"{ROOMS} rooms x {SCHEDULES_PER_ROOM} schedules, {REQUESTS} requests over {POPULAR_STAYS} popular stays")
+
+    hotel = build_hotel(random.Random(42))
+    uncached = run(hotel, hotel.find_available_rooms, traffic)
+
+    hotel = build_hotel(random.Random(42))
+    cache = AvailabilityCache(hotel, maxsize=POPULAR_STAYS)
+    cached = run(hotel, cache.find_available_rooms, traffic)
+
+    print(f"  hotel:  {uncached / REQUESTS * 1e6:8.2f} us per request")
+    print(f"  cache:  {cached / REQUESTS * 1e6:8.2f} us per request ({uncached / cached:.1f}x)")
+    print(
+        f"  hits {cache.hits}, misses {cache.misses}, evictions {cache.evictions}, invalidations {cache.invalidations}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Microbenchmark: `Hotel.available_windows` over a one-year horizon against probing day by day.
+
+Usage:
+    python -m benchmarks.available_windows
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 300
+HORIZON_DAYS = 365
+START = datetime(2024, 1, 1)
+
+
+def build_hotel() -> Hotel:
+    generator = random.Random(42)
+    rooms = []
+    for _ in range(ROOMS):
+        room = Room(RoomTypeEnum.SUITE, 1450, [])
+        day = generator.randint(0, 5)
+        while day < HORIZON_DAYS:
+            nights = generator.randint(1, 7)
+            start = START + timedelta(days=day)
+            room.add_schedule(Schedule("Guest", Period(start, start + timedelta(days=nights))))
+            day += nights + generator.randint(1, 6)
+        rooms.append(room)
+    return Hotel(rooms)
+
+
+def probe_day_by_day(hotel: Hotel) -> int:
+    """Free-day search without the sweep: one availability check per room and day."""
+    free_days = 0
+    for room in hotel.rooms:
+        for day in range(HORIZON_DAYS + 1):
+            date = START + timedelta(days=day)
+            free_days += room.is_period_available(Period(date, date))
+    return free_days
+
+
+def main():
+    hotel = build_hotel()
+    end = START + timedelta(days=HORIZON_DAYS)
+    schedules = sum(len(room.schedules) for room in hotel.rooms)
+    print(f"{ROOMS} rooms, {schedules} schedules, {HORIZON_DAYS}-day horizon")
+
+    repeats = 20
+    sweep = timeit.timeit(lambda: hotel.available_windows(RoomTypeEnum.SUITE, START, end), number=repeats) / repeats
+    probe = timeit.timeit(lambda: probe_day_by_day(hotel), number=1)
+    windows = sum(len(windows) for windows in hotel.available_windows(RoomTypeEnum.SUITE, START, end).values())
+
+    print(f"  available_windows: {sweep * 1e3:8.2f} ms ({windows} windows)")
+    print(f"  day-by-day probes: {probe * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Throughput of the streaming booking import and export, with the peak memory they use.
+
+Usage:
+    python -m benchmarks.booking_io
+"""
+
+import io
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.booking_io import export_bookings, import_bookings
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+ROOMS = 500
+SCHEDULES_PER_ROOM = 200
+
+
+class NullWriter(io.TextIOBase):
+    """Text sink counting written characters, so the export does not keep the file in memory."""
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        self.size += len(text)
+        return len(text)
+
+
+def csv_rows(rooms, start: datetime):
+    """Generates a booking CSV file line by line, never holding it whole."""
+    yield "room_number,client_name,start,end\n"
+    for day in range(0, SCHEDULES_PER_ROOM * 2, 2):
+        first, last = (start + timedelta(days=day)).isoformat(), (start + timedelta(days=day + 1)).isoformat()
+        for room in rooms:
+            yield f"{room.number},Guest {room.number}-{day},{first},{last}\n"
+
+
+def main():
+    rows = ROOMS * SCHEDULES_PER_ROOM
+    print(f"{rows} bookings over {ROOMS} rooms")
+    rooms = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(ROOMS)]
+    hotel = Hotel(rooms)
+    began = time.perf_counter()
+    import_bookings(hotel, csv_rows(rooms, datetime(2024, 1, 1)))
+    print(f"  import csv:   {rows / (time.perf_counter() - began):10,.0f} rows/s")
+    for file_format in ("csv", "jsonl"):
+        began = time.perf_counter()
+        export_bookings(hotel, NullWriter(), file_format)
+        print(f"  export {file_format}: {rows / (time.perf_counter() - began):10,.0f} rows/s")
+
+    # Transient memory: the peak above what the hotel keeps once the run is over.
+    tracemalloc.start()
+    rooms = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(ROOMS)]
+    second_hotel = Hotel(rooms)
+    import_bookings(second_hotel, csv_rows(rooms, datetime(2024, 1, 1)))
+    kept, peak = tracemalloc.get_traced_memory()
+    print(f"  import transient memory: {(peak - kept) / 1e6:6.1f} MB")
+    tracemalloc.reset_peak()
+    export_bookings(hotel, NullWriter(), "csv")
+    _, peak = tracemalloc.get_traced_memory()
+    print(f"  export transient memory: {(peak - kept) / 1e6:6.1f} MB")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: `Hotel.schedule_many` against one `Hotel.schedule_a_room` call per reservation.
+
+Usage:
+    python -m benchmarks.bulk_booking
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+BATCH_SIZES = (10_000, 50_000)
+ROOMS_PER_TYPE = 20
+ROOM_TYPES = (RoomTypeEnum.SINGLE, RoomTypeEnum.DOUBLE, RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY)
+
+
+def build_hotel() -> Hotel:
+    return Hotel([Room(room_type, 1000, []) for room_type in ROOM_TYPES for _ in range(ROOMS_PER_TYPE)])
+
+
+def build_requests(size: int, seed: int = 42) -> list:
+    generator = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    requests = []
+    for index in range(size):
+        check_in = start + timedelta(days=generator.randrange(3 * 365))
+        requests.append(
+            (
+                f"Guest {index}",
+                generator.choice(ROOM_TYPES),
+                check_in,
+                check_in + timedelta(days=generator.randint(1, 7)),
+            )
+        )
+    return requests
+
+
+def per_call(hotel: Hotel, requests: list) -> int:
+    booked = 0
+    for client_name, room_type, start_date, end_date in requests:
+        try:
+            hotel.schedule_a_room(client_name, room_type, start_date, end_date)
+            booked += 1
+        except RoomNotAvailable:
+            pass
+    return booked
+
+
+def batched(hotel: Hotel, requests: list) -> int:
+    return sum(isinstance(result, Room) for result in hotel.schedule_many(requests))
+
+
+def main():
+    print(f"{'batch':>8} {'per call (s)':>13} {'schedule_many (s)':>18} {'speedup':>8} {'booked':>13}")
+    for size in BATCH_SIZES:
+        requests = build_requests(size)
+
+        started = time.perf_counter()
+        booked_per_call = per_call(build_hotel(), requests)
+        per_call_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        booked_batched = batched(build_hotel(), requests)
+        batched_seconds = time.perf_counter() - started
+
+        print(
+            f"{size:>8} {per_call_seconds:>13.3f} {batched_seconds:>18.3f} "
+            f"{per_call_seconds / batched_seconds:>7.1f}x {booked_per_call:>6}/{booked_batched:<6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark: cost of publishing bookings to a `ChangeFeed`, by hotel size and subscribers.
+
+Books a fixed number of stays in hotels of growing size, without a feed and with a feed
+of 0, 1 and several subscribers draining their queues in batches. The overhead per
+booking should depend on the number of subscribers, not on the number of rooms.
+
+Usage:
+    python -m benchmarks.change_feed [bookings]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.change_feed import ChangeFeed
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+
+DEFAULT_BOOKINGS = 20_000
+ROOM_COUNTS = (10, 1_000)
+SUBSCRIBERS = (None, 0, 1, 8)
+
+
+def run(rooms: int, subscribers: int | None, bookings: int) -> float:
+    hotel = Hotel([Room(RoomTypeEnum.SUITE, 1000, []) for _ in range(rooms)])
+    subscriptions = []
+    if subscribers is not None:
+        feed = ChangeFeed(hotel)
+        subscriptions = [feed.subscribe(maxsize=bookings, overflow="drop_oldest") for _ in range(subscribers)]
+    start = datetime(2024, 1, 1)
+    began = time.perf_counter()
+    for index in range(bookings):
+        room = hotel.rooms[index % rooms]
+        day = start + timedelta(days=2 * (index // rooms))
+        hotel.book_room(room, RoomTypeEnum.SUITE, "Alastor", Period(day, day + timedelta(days=1)))
+        if index % 100 == 99:
+            for subscription in subscriptions:
+                subscription.get(max_items=100, timeout=0)
+    return (time.perf_counter() - began) / bookings
+
+
+def main():
+    bookings = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BOOKINGS
+    print(f"{bookings} bookings")
+    for rooms in ROOM_COUNTS:
+        baseline = run(rooms, None, bookings)
+        print(f"{rooms:>6} rooms, no feed       : {baseline * 1e6:7.2f} us/booking")
+        for subscribers in SUBSCRIBERS[1:]:
+            elapsed = run(rooms, subscribers, bookings)
+            print(
+                f"{rooms:>6} rooms, {subscribers} subscribers: {elapsed * 1e6:7.2f} us/booking "
+                f"(+{(elapsed - baseline) * 1e6:.2f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark: throughput of the batch and server command modes.
+
+Runs a mix of bookings and room listings through `run_batch`, then through the command
+server running in another process, fed by a local load generator that pipelines
+`WINDOW` commands at a time on a single connection.
+
+Usage:
+    python -m benchmarks.commands
+"""
+
+import asyncio
+import io
+import json
+import multiprocessing
+import random
+import socket
+import time
+from datetime import date, timedelta
+
+from hazbin_hotel.src.commands import CommandProcessor, run_batch, start_server
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+ROOMS = 400
+HORIZON_DAYS = 3 * 365
+COMMANDS = 50_000
+WINDOW = 1_000
+ROOM_TYPES = list(RoomTypeEnum)[:4]
+
+
+def build_processor() -> CommandProcessor:
+    return CommandProcessor(Hotel([Room(ROOM_TYPES[number % len(ROOM_TYPES)], 1000, []) for number in range(ROOMS)]))
+
+
+def make_commands(generator: random.Random) -> list:
+    start = date(2024, 1, 1)
+    commands = []
+    for index in range(COMMANDS):
+        if index % 500 == 499:
+            commands.append({"command": "list_rooms", "id": index})
+            continue
+        day = start + timedelta(days=generator.randrange(HORIZON_DAYS))
+        end = day + timedelta(days=generator.randint(0, 3))
+        room_type = generator.choice(ROOM_TYPES).value
+        commands.append(
+            {
+                "command": "book",
+                "client_name": "Guest",
+                "room_type": room_type,
+                "start": day.isoformat(),
+                "end": end.isoformat(),
+                "id": index,
+            }
+        )
+    return [json.dumps(command) + "\n" for command in commands]
+
+
+def run_server(port_queue):
+    async def serve():
+        server = await start_server(build_processor())
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def load(port: int, lines: list) -> float:
+    connection = socket.create_connection(("127.0.0.1", port))
+    answers = connection.makefile("rb")
+    began = time.perf_counter()
+    for position in range(0, len(lines), WINDOW):
+        window = lines[position : position + WINDOW]
+        connection.sendall("".join(window).encode())
+        for _ in window:
+            answers.readline()
+    elapsed = time.perf_counter() - began
+    connection.close()
+    return elapsed
+
+
+def main():
+    lines = make_commands(random.Random(42))
+    print(f"{ROOMS} rooms, {COMMANDS} commands (bookings and one room listing in 500)")
+
+    output = io.StringIO()
+    began = time.perf_counter()
+    run_batch(build_processor(), lines, output)
+    elapsed = time.perf_counter() - began
+    print(f"  batch:  {COMMANDS / elapsed:10,.0f} commands/s")
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=run_server, args=(port_queue,), daemon=True)
+    server.start()
+    try:
+        elapsed = load(port_queue.get(timeout=10), lines)
+    finally:
+        server.terminate()
+        server.join()
+    print(f"  server: {COMMANDS / elapsed:10,.0f} commands/s (pipelining {WINDOW} commands)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark: booking throughput of a shared `Hotel` by thread count.
+
+Each thread books its own room type, so bookings never contend for the same room
+lock. On a GIL build throughput is bounded by one core; on a free-threaded build the
+per-room locks let it scale with the threads.
+
+Usage:
+    python -m benchmarks.concurrency [bookings_per_thread]
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+DEFAULT_BOOKINGS_PER_THREAD = 20_000
+THREAD_COUNTS = (1, 2, 4, 8)
+ROOM_TYPES = list(RoomTypeEnum)
+
+
+def run(threads: int, bookings_per_thread: int) -> float:
+    hotel = Hotel([Room(ROOM_TYPES[index], 1000, []) for index in range(threads)])
+    barrier = threading.Barrier(threads + 1)
+    start = datetime(2025, 1, 1)
+
+    def book(room_type: RoomTypeEnum):
+        barrier.wait()
+        for day in range(bookings_per_thread):
+            check_in = start + timedelta(days=2 * day)
+            hotel.schedule_a_room("Guest", room_type, check_in, check_in + timedelta(days=1))
+
+    workers = [threading.Thread(target=book, args=(ROOM_TYPES[index],)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * bookings_per_thread / (time.perf_counter() - started)
+
+
+def main():
+    bookings_per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BOOKINGS_PER_THREAD
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    print(f"{'threads':>7} {'bookings/s':>11} {'scaling':>8}")
+    baseline = None
+    for threads in THREAD_COUNTS:
+        throughput = run(threads, bookings_per_thread)
+        baseline = baseline or throughput
+        print(f"{threads:>7} {throughput:>11.0f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
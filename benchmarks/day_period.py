@@ -0,0 +1,64 @@
+"""Microbenchmark: overlap tests with `Period`, `DayPeriod` and the vectorized `DayPeriod` batch.
+
+Tests one stay against many booked periods: by comparing `Period` datetimes through their
+properties, with `DayPeriod.overlaps`, and with a single `DayPeriod.overlaps_batch` call
+over arrays of ordinals packed once.
+
+Usage:
+    python -m benchmarks.day_period
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.period import DayPeriod, Period
+
+PERIODS = 100_000
+PROBES = 20
+
+
+def timed(function) -> float:
+    began = time.perf_counter()
+    for _ in range(PROBES):
+        function()
+    return (time.perf_counter() - began) / PROBES
+
+
+def main():
+    generator = random.Random(42)
+    start = datetime(2024, 1, 1)
+    periods = []
+    for _ in range(PERIODS):
+        day = start + timedelta(days=generator.randrange(3 * 365))
+        periods.append(Period(day, day + timedelta(days=generator.randint(0, 7))))
+    day_periods = [DayPeriod.from_period(period) for period in periods]
+    stay = Period(start + timedelta(days=400), start + timedelta(days=403))
+    day_stay = DayPeriod.from_period(stay)
+
+    DayPeriod.to_arrays([])  # Imports NumPy outside the timing.
+    began = time.perf_counter()
+    starts, ends = DayPeriod.to_arrays(day_periods)
+    packing = time.perf_counter() - began
+
+    def with_period():
+        return [period.start <= stay.end and stay.start <= period.end for period in periods]
+
+    def with_day_period():
+        return [day_stay.overlaps(period) for period in day_periods]
+
+    def with_batch():
+        return day_stay.overlaps_batch(starts, ends)
+
+    assert with_period() == with_day_period() == with_batch().tolist()
+    baseline = timed(with_period)
+    print(f"One stay against {PERIODS} periods, average of {PROBES}")
+    print(f"  Period properties      {baseline * 1e3:8.2f} ms")
+    for label, function in (("DayPeriod.overlaps", with_day_period), ("DayPeriod.overlaps_batch", with_batch)):
+        elapsed = timed(function)
+        print(f"  {label:<22} {elapsed * 1e3:8.2f} ms ({baseline / elapsed:.1f}x)")
+    print(f"  packing with to_arrays {packing * 1e3:8.2f} ms, once")
+
+
+if __name__ == "__main__":
+    main()
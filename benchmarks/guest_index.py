@@ -0,0 +1,66 @@
+"""Microbenchmark: `GuestIndex` look-ups against scanning every schedule of every room.
+
+Usage:
+    python -m benchmarks.guest_index
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.guest_index import GuestIndex
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 200
+SCHEDULES_PER_ROOM = 100
+GUESTS = 5_000
+LOOKUPS = 1_000
+
+
+def scan_bookings(hotel: Hotel, client_name: str) -> list:
+    """Guest look-up without the index: compare the name of every schedule."""
+    client_name = client_name.casefold()
+    return [
+        (room, schedule)
+        for room in hotel.rooms
+        for schedule in room.schedules
+        if schedule.client_name.casefold() == client_name
+    ]
+
+
+def main():
+    generator = random.Random(42)
+    names = [f"Guest {number:05d}" for number in range(GUESTS)]
+    start = datetime(2024, 1, 1)
+    rooms = [
+        Room(
+            RoomTypeEnum.SUITE,
+            1450,
+            [
+                Schedule(generator.choice(names), Period(start + timedelta(days=day), start + timedelta(days=day + 1)))
+                for day in range(0, SCHEDULES_PER_ROOM * 3, 3)
+            ],
+        )
+        for _ in range(ROOMS)
+    ]
+    hotel = Hotel(rooms)
+    probes = generator.sample(names, LOOKUPS)
+    print(f"{ROOMS * SCHEDULES_PER_ROOM} schedules, {GUESTS} guests, {LOOKUPS} look-ups")
+
+    build = timeit.timeit(lambda: GuestIndex(hotel).close(), number=1)
+    guests = GuestIndex(hotel)
+    scan = timeit.timeit(lambda: [scan_bookings(hotel, name) for name in probes[:50]], number=1) / 50
+    indexed = timeit.timeit(lambda: [guests.bookings(name) for name in probes], number=1) / LOOKUPS
+    prefix = timeit.timeit(lambda: guests.search("guest 012"), number=100) / 100
+    print(f"  index build:     {build * 1e3:8.2f} ms")
+    print(f"  scan:            {scan * 1e6:8.2f} us per look-up")
+    print(f"  bookings:        {indexed * 1e6:8.2f} us per look-up")
+    print(f"  prefix search:   {prefix * 1e6:8.2f} us ({len(guests.search('guest 012'))} bookings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Cold start check: import time of the package entry points, from `python -X importtime`.
+
+Each entry point is imported in a fresh interpreter `--runs` times and the fastest run is
+kept. The check fails when an entry point takes longer than its budget, or when it
+imports a module that must stay lazy, such as asyncio for the command line. Budgets
+depend on the machine, so they are only checked here, by the `bench` and `importtime`
+tasks; the test suite checks the lazy modules alone.
+
+Usage:
+    python -m benchmarks.import_time [--runs 5] [--scale 1.0]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BUDGETS_MS = {
+    "hazbin_hotel": 10,
+    "hazbin_hotel.src.hotel": 50,
+    "hazbin_hotel.src.main": 120,
+}
+"""dict: Import time budget of each entry point, in milliseconds, generous enough for a slow machine."""
+
+LAZY_MODULES = ("asyncio", "colorama", "multiprocessing", "numpy")
+"""tuple: Heavy or optional modules that no entry point may import eagerly."""
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Imports a module in a fresh interpreter and reports `-X importtime`.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        Dict[str, int]: Cumulative import time, in microseconds, of every module imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    return parse_import_times(process.stderr)
+
+
+def parse_import_times(report: str) -> Dict[str, int]:
+    """Parses the report written by `python -X importtime`.
+
+    Args:
+        report (str): The report.
+
+    Returns:
+        Dict[str, int]: Cumulative import time, in microseconds, of every module imported.
+
+    Examples:
+        >>> parse_import_times('''import time: self [us] | cumulative | imported package
+        ... import time:       120 |        120 |   hazbin_hotel.src
+        ... import time:       380 |        500 | hazbin_hotel''')
+        {'hazbin_hotel.src': 120, 'hazbin_hotel': 500}
+    """
+    times = {}
+    for line in report.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def eager_imports(times: Dict[str, int]) -> List[str]:
+    """Lists the modules of `LAZY_MODULES` found in an import report.
+
+    Args:
+        times (Dict[str, int]): Import times, as returned by `import_times`.
+
+    Returns:
+        List[str]: The lazy modules imported, sorted by name.
+
+    Examples:
+        >>> eager_imports({"hazbin_hotel": 500, "asyncio": 3000, "asyncio.events": 400})
+        ['asyncio']
+    """
+    return sorted(name for name in LAZY_MODULES if name in times)
+
+
+def check(module: str, budget_ms: float, runs: int) -> Tuple[float, List[str]]:
+    """Measures the cold start of a module against its budget.
+
+    Args:
+        module (str): The module to import.
+        budget_ms (float): Longest acceptable import time, in milliseconds.
+        runs (int): Imports to run, the fastest is kept.
+
+    Returns:
+        Tuple[float, List[str]]: The fastest import time in milliseconds, and the problems found.
+    """
+    best, problems = None, []
+    for _ in range(runs):
+        times = import_times(module)
+        elapsed = times[module] / 1000
+        best = elapsed if best is None else min(best, elapsed)
+    eager = eager_imports(times)
+    if eager:
+        problems.append(f"{module} imports {', '.join(eager)} eagerly")
+    if best > budget_ms:
+        problems.append(f"{module} takes {best:.1f} ms to import, over its {budget_ms:.0f} ms budget")
+    return best, problems
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="imports per entry point, the fastest is kept")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier applied to every budget")
+    arguments = parser.parse_args(argv)
+
+    failures = []
+    for module, budget in BUDGETS_MS.items():
+        elapsed, problems = check(module, budget * arguments.scale, arguments.runs)
+        print(f"  {module:<26} {elapsed:8.1f} ms (budget {budget * arguments.scale:.0f} ms)")
+        failures.extend(problems)
+    for problem in failures:
+        print(f"REGRESSION {problem}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark: replica startup from a mapped snapshot against a full `HotelStore` restore.
+
+Usage:
+    python -m benchmarks.mapped_snapshot [rooms] [schedules_per_room]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.mapped_snapshot import MappedSnapshot, write_mapped_snapshot
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.persistence import HotelStore
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+DEFAULT_ROOMS = 500
+DEFAULT_SCHEDULES_PER_ROOM = 1_000
+QUERIES = 10_000
+
+
+def build_hotel(rooms: int, schedules_per_room: int) -> Hotel:
+    start = datetime(2020, 1, 1)
+    hotel = Hotel([])
+    for _ in range(rooms):
+        schedules = [
+            Schedule("Guest", Period(start + timedelta(days=3 * day), start + timedelta(days=3 * day + 2)))
+            for day in range(schedules_per_room)
+        ]
+        hotel.add_room(Room(RoomTypeEnum.SUITE, 1000, schedules))
+    return hotel
+
+
+def query(hotel: Hotel, schedules_per_room: int) -> float:
+    start = datetime(2020, 1, 1)
+    started = time.perf_counter()
+    for index in range(QUERIES):
+        check_in = start + timedelta(days=index % (3 * schedules_per_room))
+        hotel.find_available_room(RoomTypeEnum.SUITE, Period(check_in, check_in + timedelta(hours=1)))
+    return (time.perf_counter() - started) / QUERIES
+
+
+def main():
+    rooms = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROOMS
+    schedules_per_room = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SCHEDULES_PER_ROOM
+    print(f"{rooms} rooms x {schedules_per_room} schedules")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = HotelStore(directory, sync_every=1024, compact_after=None)
+        hotel = store.load()
+        for room in build_hotel(rooms, schedules_per_room).rooms:
+            hotel.add_room(room)
+        store.compact()
+        store.close()
+        mapped_path = os.path.join(directory, "hotel.map")
+        write_mapped_snapshot(hotel, mapped_path)
+        del hotel
+
+        started = time.perf_counter()
+        restored_store = HotelStore(directory, compact_after=None)
+        restored = restored_store.load()
+        restore_startup = time.perf_counter() - started
+        restore_query = query(restored, schedules_per_room)
+        restored_store.close()
+        del restored
+
+        started = time.perf_counter()
+        with MappedSnapshot(mapped_path) as snapshot:
+            mapped = snapshot.hotel()
+            mapped_startup = time.perf_counter() - started
+            mapped_query = query(mapped, schedules_per_room)
+            del mapped
+
+    print(f"{'HotelStore.load':>16}: startup {restore_startup:8.3f} s, query {restore_query * 1e6:6.1f} us")
+    print(f"{'MappedSnapshot':>16}: startup {mapped_startup:8.3f} s, query {mapped_query * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
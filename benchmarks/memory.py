@@ -0,0 +1,75 @@
+"""Memory footprint of bookings, measured with tracemalloc.
+
+Compares, for the same bookings:
+    - `Schedule`/`Period` objects carrying an instance `__dict__` (the former layout);
+    - the `__slots__` `Schedule`/`Period` classes;
+    - a columnar `ScheduleStore`.
+
+Usage:
+    python -m benchmarks.memory [bookings]
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.schedule_store import ScheduleStore
+
+DEFAULT_BOOKINGS = 1_000_000
+CLIENT_NAMES = [f"Guest {index}" for index in range(10_000)]
+
+
+class DictPeriod(Period):
+    """`Period` with an instance `__dict__`, as before `__slots__` were added."""
+
+
+class DictSchedule(Schedule):
+    """`Schedule` with an instance `__dict__`, as before `__slots__` were added."""
+
+
+def booking_dates(bookings: int):
+    start = datetime(2020, 1, 1)
+    for index in range(bookings):
+        check_in = start + timedelta(hours=index)
+        yield CLIENT_NAMES[index % len(CLIENT_NAMES)], check_in, check_in + timedelta(days=3)
+
+
+def build_objects(bookings: int, period_class, schedule_class) -> list:
+    return [schedule_class(name, period_class(start, end)) for name, start, end in booking_dates(bookings)]
+
+
+def build_store(bookings: int) -> ScheduleStore:
+    store = ScheduleStore()
+    for name, start, end in booking_dates(bookings):
+        store.append(name, start, end)
+    return store
+
+
+def measure(build, *args) -> int:
+    tracemalloc.start()
+    data = build(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main():
+    bookings = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BOOKINGS
+    results = [
+        ("__dict__ objects", measure(build_objects, bookings, DictPeriod, DictSchedule)),
+        ("__slots__ objects", measure(build_objects, bookings, Period, Schedule)),
+        ("ScheduleStore", measure(build_store, bookings)),
+    ]
+
+    baseline = results[0][1]
+    print(f"{bookings} bookings")
+    print(f"{'layout':>18} {'MiB':>9} {'bytes/booking':>14} {'vs __dict__':>12}")
+    for name, size in results:
+        print(f"{name:>18} {size / 2**20:>9.1f} {size / bookings:>14.1f} {size / baseline:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Microbenchmark: overhead of `Metrics` on the booking hot path.
+
+Times `Hotel.schedule_a_room` and `Room.is_period_available` before metrics were ever
+enabled, after an enable/disable cycle (which must cost nothing), and while enabled.
+
+Usage:
+    python -m benchmarks.metrics
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.metrics import Metrics
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 200
+SCHEDULES_PER_ROOM = 100
+OPERATIONS = 20_000
+REPEAT = 5
+ROOM_TYPES = list(RoomTypeEnum)[:3]
+
+
+def build_hotel() -> Hotel:
+    start = datetime(2024, 1, 1)
+    rooms = [
+        Room(
+            ROOM_TYPES[number % len(ROOM_TYPES)],
+            1000,
+            [
+                Schedule("Guest", Period(start + timedelta(days=day), start + timedelta(days=day + 1)))
+                for day in range(0, SCHEDULES_PER_ROOM * 3, 3)
+            ],
+        )
+        for number in range(ROOMS)
+    ]
+    return Hotel(rooms)
+
+
+def make_stays(generator: random.Random):
+    start = datetime(2024, 1, 1)
+    stays = []
+    for _ in range(OPERATIONS):
+        day = start + timedelta(days=generator.randrange(SCHEDULES_PER_ROOM * 3))
+        stays.append((generator.choice(ROOM_TYPES), Period(day, day + timedelta(days=generator.randint(0, 2)))))
+    return stays
+
+
+def time_schedule_a_room(stays) -> float:
+    best = None
+    for _ in range(REPEAT):
+        hotel = build_hotel()
+        began = time.perf_counter()
+        for room_type, period in stays:
+            try:
+                hotel.schedule_a_room("Guest", room_type, period.start, period.end)
+            except RoomNotAvailable:
+                pass
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(stays) * 1e6
+
+
+def time_is_period_available(stays) -> float:
+    rooms = build_hotel().rooms
+    probes = [(rooms[position % len(rooms)], period) for position, (_, period) in enumerate(stays)]
+    best = None
+    for _ in range(REPEAT):
+        began = time.perf_counter()
+        for room, period in probes:
+            room.is_period_available(period)
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(probes) * 1e6
+
+
+def main():
+    stays = make_stays(random.Random(7))
+    print(f"{ROOMS} rooms x {SCHEDULES_PER_ROOM} schedules, {OPERATIONS} operations, best of {REPEAT}")
+
+    metrics = Metrics()
+    timings = {"never enabled": (time_schedule_a_room(stays), time_is_period_available(stays))}
+    metrics.enable()
+    metrics.disable()
+    timings["disabled"] = (time_schedule_a_room(stays), time_is_period_available(stays))
+    with metrics:
+        timings["enabled"] = (time_schedule_a_room(stays), time_is_period_available(stays))
+
+    baseline = timings["never enabled"]
+    print(f"  {'':<14} {'schedule_a_room':>22} {'is_period_available':>24}")
+    for label, (schedule, check) in timings.items():
+        print(
+            f"  {label:<14} {schedule:9.2f} us ({schedule / baseline[0]:4.2f}x)"
+            f" {check:11.2f} us ({check / baseline[1]:4.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Microbenchmark: `OccupancyMatrix` against nested Python loops over rooms, schedules and days.
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.occupancy
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.occupancy import OccupancyMatrix
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 500
+SEASON_DAYS = 365
+START = datetime(2024, 1, 1)
+ROOM_TYPES = (RoomTypeEnum.FAMILY, RoomTypeEnum.DELUXE, RoomTypeEnum.SUITE)
+
+
+def build_hotel() -> Hotel:
+    generator = random.Random(42)
+    rooms = []
+    for index in range(ROOMS):
+        room = Room(ROOM_TYPES[index % len(ROOM_TYPES)], 1000, [])
+        day = generator.randint(0, 5)
+        while day < SEASON_DAYS:
+            nights = generator.randint(1, 7)
+            start = START + timedelta(days=day)
+            room.add_schedule(Schedule("Guest", Period(start, start + timedelta(days=nights))))
+            day += nights + generator.randint(1, 6)
+        rooms.append(room)
+    return Hotel(rooms)
+
+
+def python_occupancy(hotel: Hotel) -> list:
+    """Occupancy as computed without the engine: every night of every schedule of every room."""
+    occupancy = []
+    for room in hotel.rooms:
+        nights = [0] * SEASON_DAYS
+        for schedule in room.schedules:
+            first = (schedule.period.start - START).days
+            stop = max((schedule.period.end - START).days, first + 1)
+            for day in range(max(first, 0), min(stop, SEASON_DAYS)):
+                nights[day] = 1
+        occupancy.append(nights)
+    return occupancy
+
+
+def main():
+    hotel = build_hotel()
+    schedules = sum(len(room.schedules) for room in hotel.rooms)
+    print(f"{ROOMS} rooms, {schedules} schedules, {SEASON_DAYS}-night season")
+
+    loops = timeit.timeit(lambda: python_occupancy(hotel), number=3) / 3
+    build = timeit.timeit(lambda: OccupancyMatrix(hotel, START, SEASON_DAYS).close(), number=3) / 3
+    print(f"  python loops:       {loops * 1e3:8.2f} ms")
+    print(f"  vectorized build:   {build * 1e3:8.2f} ms")
+
+    occupancy = OccupancyMatrix(hotel, START, SEASON_DAYS)
+    room = Room(RoomTypeEnum.SUITE, 1000, [])
+    hotel.add_room(room)
+    periods = [Period(START + timedelta(days=day), START + timedelta(days=day + 1)) for day in range(0, 360, 3)]
+    update = timeit.timeit(lambda: [room.add_schedule(Schedule("Guest", period)) for period in periods], number=1)
+    print(f"  incremental update: {update / len(periods) * 1e6:8.2f} us per booking")
+    rates = timeit.timeit(occupancy.type_rates, number=10) / 10
+    print(f"  type_rates:         {rates * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: WAL write latency per booking and recovery time of `HotelStore`.
+
+Write latency is measured for several `sync_every` values (fsync batching). Recovery
+is measured from a WAL only and from a snapshot with a short WAL tail.
+
+Usage:
+    python -m benchmarks.persistence [bookings]
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.persistence import HotelStore
+from hazbin_hotel.src.room import Room
+
+DEFAULT_BOOKINGS = 20_000
+ROOMS = 100
+SYNC_INTERVALS = (1, 32, 1024)
+
+
+def book(hotel, bookings: int, first: int = 0) -> list:
+    latencies = []
+    start = datetime(2025, 1, 1)
+    for index in range(first, first + bookings):
+        check_in = start + timedelta(days=2 * (index // ROOMS))
+        started = time.perf_counter()
+        hotel.schedule_a_room(f"Guest {index}", RoomTypeEnum.SUITE, check_in, check_in + timedelta(days=1))
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def populated_store(directory: str, bookings: int, sync_every: int) -> tuple:
+    store = HotelStore(directory, sync_every=sync_every, compact_after=None)
+    hotel = store.load()
+    for _ in range(ROOMS):
+        hotel.add_room(Room(RoomTypeEnum.SUITE, 1000, []))
+    return store, book(hotel, bookings)
+
+
+def recovery_seconds(directory: str) -> float:
+    started = time.perf_counter()
+    store = HotelStore(directory, compact_after=None)
+    store.load()
+    elapsed = time.perf_counter() - started
+    store.close()
+    return elapsed
+
+
+def main():
+    bookings = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BOOKINGS
+
+    print(f"Write latency per booking ({bookings} bookings, {ROOMS} rooms)")
+    print(f"{'sync_every':>10} {'p50 (us)':>9} {'p99 (us)':>9} {'bookings/s':>11}")
+    for sync_every in SYNC_INTERVALS:
+        with tempfile.TemporaryDirectory() as directory:
+            store, latencies = populated_store(directory, bookings, sync_every)
+            store.close()
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{sync_every:>10} {quantiles[49] * 1e6:>9.1f} {quantiles[98] * 1e6:>9.1f} "
+            f"{len(latencies) / sum(latencies):>11.0f}"
+        )
+
+    print()
+    print("Recovery time")
+    with tempfile.TemporaryDirectory() as directory:
+        store, _ = populated_store(directory, bookings, sync_every=1024)
+        store.close()
+        print(f"{'WAL only':>22}: {recovery_seconds(directory):.3f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store, _ = populated_store(directory, bookings, sync_every=1024)
+        store.compact()
+        book(store.hotel, ROOMS, first=bookings + ROOMS)
+        store.close()
+        print(f"{'snapshot + WAL tail':>22}: {recovery_seconds(directory):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Microbenchmark: `PricingEngine.quote_many` against pricing every night of every stay.
+
+Usage:
+    python -m benchmarks.pricing
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.pricing import WEEKEND, PricingEngine
+from hazbin_hotel.src.room import Room
+
+QUOTES = 10_000
+START = datetime(2024, 1, 1)
+ROOM_TYPES = (RoomTypeEnum.FAMILY, RoomTypeEnum.DELUXE, RoomTypeEnum.SUITE)
+
+
+def build_engine() -> PricingEngine:
+    engine = PricingEngine(START, 365, weekday_factors={day: 1.2 for day in WEEKEND})
+    engine.add_season(datetime(2024, 6, 15), datetime(2024, 8, 31), 1.5)
+    engine.add_season(datetime(2024, 12, 20), datetime(2024, 12, 31), 1.8, [RoomTypeEnum.SUITE])
+    return engine
+
+
+def per_night_quote(engine: PricingEngine, room: Room, period: Period) -> float:
+    """Stay cost computed as callers did before the engine: one nightly rate per night."""
+    nights = max((period.end - period.start).days, 1)
+    return round(sum(engine.nightly_rate(room, period.start + timedelta(days=night)) for night in range(nights)), 2)
+
+
+def main():
+    generator = random.Random(42)
+    rooms = [Room(ROOM_TYPES[index % len(ROOM_TYPES)], generator.randint(500, 2000), []) for index in range(300)]
+    quotes = []
+    for _ in range(QUOTES):
+        start = START + timedelta(days=generator.randint(0, 330))
+        quotes.append((generator.choice(rooms), Period(start, start + timedelta(days=generator.randint(1, 14)))))
+
+    engine = build_engine()
+    print(f"{QUOTES} quotes, stays of 1 to 14 nights")
+    per_night = timeit.timeit(lambda: [per_night_quote(engine, room, period) for room, period in quotes], number=1)
+    batched = timeit.timeit(lambda: engine.quote_many(quotes), number=5) / 5
+    print(f"  per night:  {per_night * 1e3:8.2f} ms")
+    print(f"  quote_many: {batched * 1e3:8.2f} ms ({batched / QUOTES * 1e6:.2f} us per quote)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Microbenchmark: `Hotel.find_available_rooms` through the availability index against probing every room.
+
+The hotel is sold out over the searched stay but for a few rooms, the case where probing
+each room of the type costs the most.
+
+Usage:
+    python -m benchmarks.room_search
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+SIZES = (100, 1_000, 10_000)
+FREE_ROOMS = 3
+SEARCHES = 200
+
+
+def build_hotel(size: int, start: datetime) -> Hotel:
+    rooms = [Room(RoomTypeEnum.SUITE, 1000, []) for _ in range(size)]
+    for position, room in enumerate(rooms):
+        if position % (size // FREE_ROOMS) != 0:
+            for day in range(0, 30, 3):
+                room.add_schedule(
+                    Schedule("Guest", Period(start + timedelta(days=day), start + timedelta(days=day + 2)))
+                )
+    return Hotel(rooms)
+
+
+def main():
+    print(f"{'rooms':>8} {'probe all (us)':>15} {'index (us)':>11} {'speedup':>8}")
+    for size in SIZES:
+        start = datetime(2024, 1, 1)
+        hotel = build_hotel(size, start)
+        periods = [
+            Period(start + timedelta(days=search % 25), start + timedelta(days=search % 25 + 2))
+            for search in range(SEARCHES)
+        ]
+        # The index is built once searches have met enough busy rooms, leave that out of the timings.
+        for period in periods:
+            hotel.find_available_rooms(RoomTypeEnum.SUITE, period)
+
+        probe = timeit.timeit(
+            lambda: [
+                [room for room in hotel.rooms_of_type(RoomTypeEnum.SUITE) if room.is_period_available(period)]
+                for period in periods
+            ],
+            number=1,
+        )
+        indexed = timeit.timeit(
+            lambda: [hotel.find_available_rooms(RoomTypeEnum.SUITE, period) for period in periods], number=1
+        )
+
+        probe_us = probe / len(periods) * 1e6
+        indexed_us = indexed / len(periods) * 1e6
+        print(f"{size:>8} {probe_us:>15.2f} {indexed_us:>11.2f} {probe_us / indexed_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Microbenchmark: schedule lookup by ID through the hotel-wide index against scanning every room.
+
+Usage:
+    python -m benchmarks.schedule_lookup
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+ROOMS = 200
+SCHEDULES_PER_ROOM = 100
+LOOKUPS = 1_000
+
+
+def scan_for_schedule(hotel: Hotel, schedule_id: int) -> Schedule:
+    """Lookup as it had to be done before the index: every schedule of every room."""
+    for room in hotel.rooms:
+        for schedule in room.schedules:
+            if schedule.id == schedule_id:
+                return schedule
+    raise KeyError(schedule_id)
+
+
+def build_hotel() -> Hotel:
+    start = datetime(2024, 1, 1)
+    rooms = []
+    for _ in range(ROOMS):
+        rooms.append(
+            Room(
+                RoomTypeEnum.SUITE,
+                1450,
+                [
+                    Schedule("Guest", Period(start + timedelta(days=day), start + timedelta(days=day + 1)))
+                    for day in range(0, SCHEDULES_PER_ROOM * 3, 3)
+                ],
+            )
+        )
+    return Hotel(rooms)
+
+
+def main():
+    hotel = build_hotel()
+    ids = [schedule.id for room in hotel.rooms for schedule in room.schedules]
+    probes = random.Random(42).sample(ids, LOOKUPS)
+    print(f"{len(ids)} schedules in {ROOMS} rooms, {LOOKUPS} lookups")
+
+    build = timeit.timeit(lambda: hotel.get_schedule(probes[0]), number=1)
+    scan = timeit.timeit(lambda: [scan_for_schedule(hotel, schedule_id) for schedule_id in probes], number=1)
+    indexed = timeit.timeit(lambda: [hotel.get_schedule(schedule_id) for schedule_id in probes], number=1)
+    print(f"  index build (first lookup): {build * 1e3:8.2f} ms")
+    print(f"  scan:                       {scan / LOOKUPS * 1e6:8.2f} us per lookup")
+    print(f"  get_schedule:               {indexed / LOOKUPS * 1e6:8.2f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
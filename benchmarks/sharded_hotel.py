@@ -0,0 +1,63 @@
+"""Booking throughput of `ShardedHotel` from 1 to N worker processes, against a single `Hotel`.
+
+Bookings are sent in batches through `schedule_many`, which splits each batch between
+the shards so they book in parallel. Throughput only scales with real cores: on a machine
+with fewer cores than shards, the extra processes just add pipe and pickling overhead.
+
+Usage:
+    python -m benchmarks.sharded_hotel [max_shards]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.sharded_hotel import ShardedHotel
+
+ROOMS = 800
+BOOKINGS = 80_000
+BATCH = 10_000
+ROOM_TYPES = list(RoomTypeEnum)[:4]
+
+
+def make_rooms():
+    return [Room(ROOM_TYPES[number % len(ROOM_TYPES)], 1000, []) for number in range(ROOMS)]
+
+
+def make_requests():
+    start = datetime(2024, 1, 1)
+    requests = []
+    for number in range(BOOKINGS):
+        day = start + timedelta(days=2 * (number // ROOMS))
+        requests.append((f"Guest {number}", ROOM_TYPES[number % len(ROOM_TYPES)], day, day + timedelta(days=1)))
+    return requests
+
+
+def throughput(hotel, requests) -> float:
+    began = time.perf_counter()
+    for first in range(0, len(requests), BATCH):
+        hotel.schedule_many(requests[first : first + BATCH])
+    return len(requests) / (time.perf_counter() - began)
+
+
+def main():
+    max_shards = int(sys.argv[1]) if len(sys.argv) > 1 else max(os.cpu_count() or 1, 4)
+    requests = make_requests()
+    print(f"{BOOKINGS} bookings over {ROOMS} rooms in batches of {BATCH}, {os.cpu_count()} CPUs")
+
+    baseline = throughput(Hotel(make_rooms()), requests)
+    print(f"  Hotel:              {baseline:10,.0f} bookings/s")
+    shards = 1
+    while shards <= max_shards:
+        with ShardedHotel(make_rooms(), shards=shards) as hotel:
+            rate = throughput(hotel, requests)
+        print(f"  ShardedHotel x {shards:<3} {rate:10,.0f} bookings/s ({rate / baseline:.2f}x)")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark: booking throughput while heavy reports run, with snapshots against room locks.
+
+Booking threads book random stays in a busy hotel for a fixed time, while report threads
+repeatedly count the booked nights of every room, writing out a page of results every
+`PAGE_ROOMS` rooms, which takes `PAGE_WRITE_SECONDS`:
+
+- `none`: no report runs, the baseline throughput;
+- `snapshot`: reports read a `Hotel.snapshot`, bookings keep committing meanwhile;
+- `locked`: reports hold every room lock while they read the live schedules, the only
+  way to read a consistent state without snapshots, which stalls the bookings.
+
+Reports and bookings share the interpreter lock, so the computing part of the reports
+slows bookings down in both modes; what snapshots remove is the wait of a booking for a
+report to finish, e.g. while the report writes its pages, visible in the throughput.
+
+Usage:
+    python -m benchmarks.snapshots [seconds]
+"""
+
+import random
+import statistics
+import sys
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+DEFAULT_SECONDS = 2.0
+ROOMS = 500
+BOOKED_PER_ROOM = 50
+BOOKERS = 4
+REPORTERS = 2
+START = datetime(2024, 1, 1)
+PAGE_ROOMS = 50
+PAGE_WRITE_SECONDS = 0.001
+
+
+def build_hotel() -> Hotel:
+    rooms = []
+    for _ in range(ROOMS):
+        schedules = [
+            Schedule("Guest", Period(START + timedelta(days=3 * day), START + timedelta(days=3 * day + 1)))
+            for day in range(BOOKED_PER_ROOM)
+        ]
+        rooms.append(Room(RoomTypeEnum.SUITE, 1000, schedules))
+    return Hotel(rooms)
+
+
+def count_nights(rooms, nights) -> int:
+    total = 0
+    for index, room in enumerate(rooms, 1):
+        total += sum(nights(schedule) for schedule in room.schedules)
+        if index % PAGE_ROOMS == 0:
+            time.sleep(PAGE_WRITE_SECONDS)
+    return total
+
+
+def snapshot_report(hotel: Hotel) -> int:
+    with hotel.snapshot() as snapshot:
+        return count_nights(snapshot.rooms, lambda schedule: (schedule.end - schedule.start).days)
+
+
+def locked_report(hotel: Hotel) -> int:
+    with ExitStack() as stack:
+        rooms = list(hotel.rooms)
+        for room in rooms:
+            stack.enter_context(room.lock)
+        return count_nights(rooms, lambda schedule: (schedule.period.end - schedule.period.start).days)
+
+
+REPORTS = {"none": None, "snapshot": snapshot_report, "locked": locked_report}
+"""dict: Report run by the report threads in each mode."""
+
+
+def run(mode: str, seconds: float) -> tuple:
+    hotel = build_hotel()
+    rooms = list(hotel.rooms)
+    deadline = time.perf_counter() + seconds
+    latencies = [[] for _ in range(BOOKERS)]
+    reports = [0] * REPORTERS
+
+    def book(index: int) -> None:
+        generator = random.Random(index)
+        while (began := time.perf_counter()) < deadline:
+            day = START + timedelta(days=generator.randrange(3 * BOOKED_PER_ROOM, 3_000))
+            room = generator.choice(rooms)
+            hotel.book_room(room, RoomTypeEnum.SUITE, "Client", Period(day, day + timedelta(days=1)))
+            latencies[index].append(time.perf_counter() - began)
+
+    def report(index: int) -> None:
+        while time.perf_counter() < deadline:
+            REPORTS[mode](hotel)
+            reports[index] += 1
+
+    threads = [threading.Thread(target=book, args=(index,)) for index in range(BOOKERS)]
+    if REPORTS[mode] is not None:
+        threads += [threading.Thread(target=report, args=(index,)) for index in range(REPORTERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = [latency for thread in latencies for latency in thread]
+    return len(latencies) / seconds, statistics.median(latencies), sum(reports) / seconds
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS
+    print(f"{ROOMS} rooms x {BOOKED_PER_ROOM} bookings, {BOOKERS} booking and {REPORTERS} report threads, {seconds}s")
+    for mode in REPORTS:
+        booked, median, reported = run(mode, seconds)
+        print(f"  {mode:<9} {booked:8.0f} bookings/s, median {median * 1e6:6.1f} us, {reported:5.1f} reports/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Benchmark suite for the booking core, with JSON results and regression checks.
+
+Times `Hotel.schedule_a_room`, `Room.is_period_available`, `Hotel.update_schedule`,
+`Hotel.remove_room`, `Hotel.remove_rooms` and bulk loading on synthetic hotels at several scales. Each case is
+run `--repeat` times on a freshly generated hotel and the fastest run is kept, which is
+the least noisy estimate on a shared machine.
+
+Results are written as JSON with `--output`. With `--compare`, they are checked against a
+baseline written by an earlier run: every case slower than the baseline by more than
+`--threshold` is flagged, and the command exits with status 1.
+
+Usage:
+    python -m benchmarks.suite [--scales small,medium] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotAvailable, ScheduleCannotBeOverwritten
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+SCALES = {"small": 50, "medium": 500, "large": 5_000}
+"""dict: Number of rooms of each named scale."""
+
+START = datetime(2024, 1, 1)
+OPERATIONS = 1_000
+MAX_STAY_NIGHTS = 4
+
+
+class Scenario:
+    """Shape of a synthetic hotel.
+
+    Attributes:
+        rooms (int): Number of rooms.
+        room_types (int): Number of room types, assigned to rooms round robin.
+        density (float): Probability that a free day starts a booking, between 0 and 1.
+        horizon_days (int): Days covered by the bookings.
+        seed (int): Seed of the random generator, so runs are reproducible.
+    """
+
+    def __init__(self, rooms: int, room_types: int = 4, density: float = 0.5, horizon_days: int = 365, seed: int = 42):
+        if not 1 <= room_types <= len(RoomTypeEnum):
+            raise ValueError(f"Room types must be between 1 and {len(RoomTypeEnum)}.")
+        if not 0 <= density <= 1:
+            raise ValueError("Density must be between 0 and 1.")
+        self.rooms = rooms
+        self.room_types = list(RoomTypeEnum)[:room_types]
+        self.density = density
+        self.horizon_days = horizon_days
+        self.seed = seed
+
+    def schedules(self, generator: random.Random) -> List[List[Schedule]]:
+        """Generates the bookings of every room: stays of 1 to `MAX_STAY_NIGHTS` nights, never overlapping."""
+        rooms = []
+        for _ in range(self.rooms):
+            schedules = []
+            day = 0
+            while day < self.horizon_days:
+                if generator.random() < self.density:
+                    nights = generator.randint(1, MAX_STAY_NIGHTS)
+                    start = START + timedelta(days=day)
+                    schedules.append(Schedule("Guest", Period(start, start + timedelta(days=nights))))
+                    day += nights + 1
+                else:
+                    day += 1
+            rooms.append(schedules)
+        return rooms
+
+    def build(self, generator: random.Random) -> Hotel:
+        """Generates a hotel with its bookings."""
+        return Hotel(
+            [
+                Room(self.room_types[number % len(self.room_types)], 1000, schedules)
+                for number, schedules in enumerate(self.schedules(generator))
+            ]
+        )
+
+    def stay(self, generator: random.Random) -> Period:
+        """Draws a random stay inside the horizon."""
+        start = START + timedelta(days=generator.randrange(self.horizon_days))
+        return Period(start, start + timedelta(days=generator.randint(1, MAX_STAY_NIGHTS)))
+
+
+Case = Callable[[Scenario, random.Random], Tuple[Callable[[], None], int]]
+"""Prepares a benchmark on a fresh hotel, returning the timed callable and the number of operations it runs."""
+
+
+def schedule_a_room(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    hotel = scenario.build(generator)
+    requests = [(generator.choice(scenario.room_types), scenario.stay(generator)) for _ in range(OPERATIONS)]
+
+    def run():
+        for room_type, period in requests:
+            try:
+                hotel.schedule_a_room("Guest", room_type, period.start, period.end)
+            except RoomNotAvailable:
+                pass
+
+    return run, len(requests)
+
+
+def is_period_available(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    hotel = scenario.build(generator)
+    probes = [(generator.choice(hotel.rooms), scenario.stay(generator)) for _ in range(OPERATIONS)]
+
+    def run():
+        for room, period in probes:
+            room.is_period_available(period)
+
+    return run, len(probes)
+
+
+def update_schedule(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    hotel = scenario.build(generator)
+    booked = [schedule.id for room in hotel.rooms for schedule in room.schedules]
+    updates = [
+        (Schedule("Guest", scenario.stay(generator)), schedule_id)
+        for schedule_id in generator.sample(booked, min(OPERATIONS, len(booked)))
+    ]
+    if booked:
+        hotel.get_schedule(booked[0])  # Builds the schedule index outside the timing.
+
+    def run():
+        for schedule, schedule_id in updates:
+            try:
+                hotel.update_schedule(schedule, schedule_id)
+            except ScheduleCannotBeOverwritten:
+                pass
+
+    return run, len(updates)
+
+
+def remove_room(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    hotel = scenario.build(generator)
+    empty = [Room(generator.choice(scenario.room_types), 1000, []) for _ in range(OPERATIONS)]
+    for room in empty:
+        hotel.add_room(room)
+    generator.shuffle(empty)
+
+    def run():
+        for room in empty:
+            hotel.remove_room(room)
+
+    return run, len(empty)
+
+
+def remove_rooms(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    hotel = scenario.build(generator)
+    empty = [Room(generator.choice(scenario.room_types), 1000, []) for _ in range(OPERATIONS)]
+    hotel.add_rooms(empty)
+
+    def run():
+        hotel.remove_rooms(empty)
+
+    return run, len(empty)
+
+
+def bulk_load(scenario: Scenario, generator: random.Random) -> Tuple[Callable[[], None], int]:
+    schedules = scenario.schedules(generator)
+    room_types = scenario.room_types
+
+    def run():
+        Hotel([Room(room_types[number % len(room_types)], 1000, room) for number, room in enumerate(schedules)])
+
+    return run, sum(len(room) for room in schedules)
+
+
+CASES: Dict[str, Case] = {
+    "schedule_a_room": schedule_a_room,
+    "is_period_available": is_period_available,
+    "update_schedule": update_schedule,
+    "remove_room": remove_room,
+    "remove_rooms": remove_rooms,
+    "bulk_load": bulk_load,
+}
+"""dict: Benchmark cases by name. `remove_rooms` counts one operation per removed room, `bulk_load`
+one per loaded booking."""
+
+
+def measure(case: Case, scenario: Scenario, repeat: int) -> Dict[str, float]:
+    """Runs a case `repeat` times on identical fresh hotels and keeps the fastest run.
+
+    Returns:
+        Dict[str, float]: Microseconds per operation of the fastest run, and operations per run.
+    """
+    best = None
+    for _ in range(repeat):
+        run, operations = case(scenario, random.Random(scenario.seed))
+        began = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - began
+        per_operation = elapsed / max(operations, 1) * 1e6
+        best = per_operation if best is None else min(best, per_operation)
+    return {"us_per_op": round(best, 4), "operations": operations}
+
+
+def run_suite(scales: List[str], room_types: int, density: float, repeat: int, cases: List[str]) -> Dict:
+    """Runs the selected cases at every scale.
+
+    Returns:
+        Dict: The results keyed by `"<scale>/<case>"`, with the run settings and platform under `"meta"`.
+    """
+    results = {}
+    for scale in scales:
+        scenario = Scenario(SCALES[scale], room_types, density)
+        for name in cases:
+            results[f"{scale}/{name}"] = measure(CASES[name], scenario, repeat)
+            print(f"  {scale + '/' + name:<28} {results[f'{scale}/{name}']['us_per_op']:12.3f} us/op", flush=True)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "room_types": room_types,
+            "density": density,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[Tuple[str, float, float, float]]:
+    """Finds the cases slower than the baseline by more than `threshold`.
+
+    Cases missing from either run are ignored.
+
+    Args:
+        current (Dict): Results of this run, as returned by `run_suite`.
+        baseline (Dict): Results of the baseline run.
+        threshold (float): Tolerated slowdown, e.g. 0.2 for 20 %.
+
+    Returns:
+        List[Tuple[str, float, float, float]]: Name, baseline and current microseconds per operation,
+            and ratio of every regressed case.
+
+    Examples:
+        >>> baseline = {"results": {"small/bulk_load": {"us_per_op": 2.0}, "small/remove_room": {"us_per_op": 1.0}}}
+        >>> current = {"results": {"small/bulk_load": {"us_per_op": 3.0}, "small/remove_room": {"us_per_op": 1.1}}}
+        >>> compare(current, baseline, threshold=0.2)
+        [('small/bulk_load', 2.0, 3.0, 1.5)]
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None or reference["us_per_op"] <= 0:
+            continue
+        ratio = result["us_per_op"] / reference["us_per_op"]
+        if ratio > 1 + threshold:
+            regressions.append((name, reference["us_per_op"], result["us_per_op"], round(ratio, 2)))
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="small,medium", help=f"comma separated, among {', '.join(SCALES)}")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma separated case names")
+    parser.add_argument("--room-types", type=int, default=4, help="number of room types")
+    parser.add_argument("--density", type=float, default=0.5, help="probability that a free day starts a booking")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest is kept")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerated slowdown (default: 0.25)")
+    arguments = parser.parse_args(argv)
+
+    scales = arguments.scales.split(",")
+    cases = arguments.cases.split(",")
+    unknown = [name for name in scales if name not in SCALES] + [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown scale or case: {', '.join(unknown)}")
+
+    print(f"Benchmarking {', '.join(cases)} at {', '.join(scales)} scale")
+    results = run_suite(scales, arguments.room_types, arguments.density, arguments.repeat, cases)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {arguments.output}")
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, arguments.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.3f} -> {after:.3f} us/op ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regression beyond {arguments.threshold:.0%} against {arguments.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
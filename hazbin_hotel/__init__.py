@@ -0,0 +1,56 @@
+"""Hazbin Hotel booking system.
+
+The public classes and functions can be imported from the package itself, e.g.
+`from hazbin_hotel import Hotel, Room`. Each one is imported from its module on first
+use, so importing the package costs almost nothing and a program only pays for the
+subsystems it uses: a booking script never loads asyncio, multiprocessing or NumPy.
+
+Examples:
+    >>> import hazbin_hotel
+    >>> hazbin_hotel.RoomTypeEnum.SUITE
+    <RoomTypeEnum.SUITE: 'SUITE'>
+"""
+
+import importlib
+
+_EXPORTS = {
+    "AsyncHotel": "hazbin_hotel.src.async_hotel",
+    "AvailabilityCache": "hazbin_hotel.src.availability_cache",
+    "ChangeFeed": "hazbin_hotel.src.change_feed",
+    "CommandProcessor": "hazbin_hotel.src.commands",
+    "GuestIndex": "hazbin_hotel.src.guest_index",
+    "HotelSnapshot": "hazbin_hotel.src.versioning",
+    "Hotel": "hazbin_hotel.src.hotel",
+    "HotelStore": "hazbin_hotel.src.persistence",
+    "MappedSnapshot": "hazbin_hotel.src.mapped_snapshot",
+    "Metrics": "hazbin_hotel.src.metrics",
+    "OccupancyMatrix": "hazbin_hotel.src.occupancy",
+    "Period": "hazbin_hotel.src.period",
+    "PricingEngine": "hazbin_hotel.src.pricing",
+    "Room": "hazbin_hotel.src.room",
+    "RoomRegistry": "hazbin_hotel.src.room_registry",
+    "RoomTypeEnum": "hazbin_hotel.src.enums.types",
+    "Schedule": "hazbin_hotel.src.schedule",
+    "ShardedHotel": "hazbin_hotel.src.sharded_hotel",
+    "export_bookings": "hazbin_hotel.src.booking_io",
+    "import_bookings": "hazbin_hotel.src.booking_io",
+    "run_batch": "hazbin_hotel.src.commands",
+    "write_mapped_snapshot": "hazbin_hotel.src.mapped_snapshot",
+}
+"""dict: Module defining each name exported by the package."""
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Imports an exported name from its module on first access, then caches it in the package."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
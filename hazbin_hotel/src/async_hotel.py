@@ -0,0 +1,184 @@
+import asyncio
+import weakref
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.utils import format_date
+
+
+class AsyncHotel:
+    """asyncio facade over a `Hotel`, for services running on an event loop.
+
+    Hotel operations are short and CPU bound, but they take locks that threads using the
+    hotel directly may hold, so nothing that could wait for a lock runs on the event loop.
+    Bookings of the same room are serialized with a per-room `asyncio.Lock`: a booking whose
+    room lock is free runs on the loop, and one whose room lock is held by a thread waits for
+    it in a worker thread. Searches, which lock every room they probe, and changes to the
+    set of rooms, which take the hotel lock, always run in a worker thread.
+
+    Concurrent availability queries for the same room type and dates are coalesced: the
+    first one schedules the search for the next loop iteration and every query arriving
+    before it starts awaits the same result. The shared result lists every free room, and
+    concurrent bookings walk it with a common cursor so they spread over the free rooms
+    instead of competing for the first one.
+
+    Attributes:
+        hotel (Hotel): The wrapped hotel.
+        queries_computed (int): Availability searches actually run.
+        queries_coalesced (int): Availability queries answered by a search started by another query.
+    """
+
+    def __init__(self, hotel: Hotel) -> None:
+        """Wraps a hotel.
+
+        Args:
+            hotel (Hotel): The hotel to wrap.
+        """
+        self.hotel = hotel
+        self.queries_computed = 0
+        self.queries_coalesced = 0
+        self._queries: Dict[Tuple[RoomTypeEnum, datetime, datetime], asyncio.Future] = {}
+        self._room_locks: "weakref.WeakKeyDictionary[Room, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    async def check_room_type_availability(self, room_type: RoomTypeEnum) -> Room | None:
+        """Checks if there is a room of the specified type, as `Hotel.check_room_type_availability` does.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room to check availability for.
+
+        Returns:
+            Room | None: A room of the specified type.
+
+        Raises:
+            RoomTypeNotAvailable: If no room of the specified type is available.
+        """
+        return self.hotel.check_room_type_availability(room_type)
+
+    async def find_available_room(
+        self, room_type: RoomTypeEnum, start_date: datetime, end_date: datetime
+    ) -> Room | None:
+        """Finds a free room of the specified type, sharing the search with identical concurrent queries.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            start_date (datetime): The start date of the period.
+            end_date (datetime): The end date of the period.
+
+        Returns:
+            Room | None: A free room of the specified type, or None if all of them are booked.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+            InvalidPeriodError: If the start date is after the end date.
+        """
+        free_rooms = await self._free_rooms(room_type, start_date, end_date)
+        return free_rooms.rooms[0] if free_rooms.rooms else None
+
+    async def schedule_a_room(
+        self, client_name: str, room_type: RoomTypeEnum, start_date: datetime, end_date: datetime
+    ) -> bool:
+        """Schedules a room for a client, as `Hotel.schedule_a_room` does.
+
+        The free rooms found by the (possibly shared) availability query are tried in turn,
+        each one booked under its `asyncio.Lock`. If concurrent bookings took all of them,
+        the hotel is searched again, until a search finds no free room.
+
+        Args:
+            client_name (str): The name of the client making the booking.
+            room_type (RoomTypeEnum): The type of room requested.
+            start_date (datetime): The start date of the booking period.
+            end_date (datetime): The end date of the booking period.
+
+        Returns:
+            bool: True if the booking was successful.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the requested type.
+            RoomNotAvailable: If no room of the requested type is available for the specified period.
+        """
+        period = Period(start_date, end_date)
+        while True:
+            free_rooms = await self._free_rooms(room_type, start_date, end_date)
+            if not free_rooms.rooms:
+                # The search started after this call, so the rooms were all booked meanwhile.
+                raise RoomNotAvailable(
+                    f'"{room_type.value}" is not available from {format_date(start_date)} to {format_date(end_date)}'
+                )
+            while free_rooms.cursor < len(free_rooms.rooms):
+                index = free_rooms.cursor
+                room = free_rooms.rooms[index]
+                free_rooms.cursor = max(free_rooms.cursor, index + 1)
+                if await self._on_room(room, self.hotel.book_room, room, room_type, client_name, period):
+                    return True
+
+    async def add_room(self, room: Room) -> None:
+        """Adds a new room to the hotel.
+
+        Args:
+            room (Room): The room to add to the hotel.
+        """
+        await asyncio.to_thread(self.hotel.add_room, room)
+
+    async def remove_room(self, room: Room) -> None:
+        """Removes a room from the hotel once the bookings of the facade pending on it are done.
+
+        Args:
+            room (Room): The room to be removed.
+
+        Raises:
+            RoomHasSchedule: If the room has scheduled bookings.
+        """
+        async with self._lock_for(room):
+            # The hotel lock is taken before the room lock, so the room lock cannot be tried here.
+            await asyncio.to_thread(self.hotel.remove_room, room)
+
+    async def _free_rooms(self, room_type: RoomTypeEnum, start_date: datetime, end_date: datetime) -> "_FreeRooms":
+        key = (room_type, start_date, end_date)
+        future = self._queries.get(key)
+        if future is None:
+            future = self._queries[key] = asyncio.ensure_future(self._answer(key))
+        else:
+            self.queries_coalesced += 1
+        return await asyncio.shield(future)
+
+    async def _on_room(self, room: Room, operation: Callable[..., Any], *args: Any) -> Any:
+        """Runs an operation locking a room, after the operations of the facade pending on the room.
+
+        The operation runs on the loop if the room lock is free, else in a worker thread.
+        """
+        async with self._lock_for(room):
+            if room.lock.acquire(blocking=False):
+                try:
+                    return operation(*args)
+                finally:
+                    room.lock.release()
+            return await asyncio.to_thread(operation, *args)
+
+    def _lock_for(self, room: Room) -> asyncio.Lock:
+        lock = self._room_locks.get(room)
+        if lock is None:
+            lock = self._room_locks[room] = asyncio.Lock()
+        return lock
+
+    async def _answer(self, key: Tuple[RoomTypeEnum, datetime, datetime]) -> "_FreeRooms":
+        """Runs an availability search in a worker thread for every query waiting for it."""
+        del self._queries[key]
+        self.queries_computed += 1
+        room_type, start_date, end_date = key
+        period = Period(start_date, end_date)
+        return _FreeRooms(await asyncio.to_thread(self.hotel.find_available_rooms, room_type, period))
+
+
+class _FreeRooms:
+    """Result of a shared availability search: the free rooms and the next one to try booking."""
+
+    __slots__ = ("rooms", "cursor")
+
+    def __init__(self, rooms: List[Room]) -> None:
+        self.rooms = rooms
+        self.cursor = 0
@@ -0,0 +1,251 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+
+
+class AvailabilityCache:
+    """Bounded LRU/TTL cache in front of the availability queries of a hotel.
+
+    Answers of `find_available_rooms`, `find_available_room` and `available_windows` are
+    cached by room type and date range. The cache follows the hotel events and drops only
+    the entries a change can affect: a booking, update or cancellation drops the entries
+    of the room type whose range overlaps the booked periods, while adding, removing or
+    retyping a room drops every entry of the room types involved.
+
+    Entries are evicted in least recently used order beyond `maxsize`, and expire `ttl`
+    seconds after being computed when a TTL is given.
+
+    Attributes:
+        hotel (Hotel): The hotel whose queries are cached.
+        maxsize (int): Maximum number of cached answers.
+        ttl (float | None): Seconds an answer stays valid, or None to keep it until evicted or invalidated.
+        hits (int): Queries answered from the cache.
+        misses (int): Queries answered by the hotel, including expired entries.
+        evictions (int): Entries dropped to make room for new ones or because they expired.
+        invalidations (int): Entries dropped because a hotel change could affect them.
+        _entries (OrderedDict): Cached answers with their expiry time, in least recently used order.
+        _ranges (Dict[RoomTypeEnum, Dict[Hashable, Tuple[datetime, datetime]]]): Date range of the cached
+            entries of each room type, used for invalidation.
+        _generations (Dict[RoomTypeEnum, int]): Invalidations seen per room type, so an answer computed
+            while its room type changed is not stored.
+        _lock (threading.Lock): Lock serializing cache updates.
+    """
+
+    def __init__(
+        self,
+        hotel: Hotel,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wraps a hotel and starts following its changes.
+
+        Args:
+            hotel (Hotel): The hotel to cache.
+            maxsize (int, optional): Maximum number of cached answers. Defaults to 1024.
+            ttl (float | None, optional): Seconds an answer stays valid. Defaults to no expiry.
+            clock (Callable[[], float], optional): Time source for the TTL. Defaults to `time.monotonic`.
+
+        Raises:
+            ValueError: If `maxsize` or `ttl` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache TTL must be positive.")
+
+        self.hotel = hotel
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._ranges: Dict[RoomTypeEnum, Dict[Hashable, Tuple[datetime, datetime]]] = {}
+        self._generations: Dict[RoomTypeEnum, int] = {}
+        self._lock = threading.Lock()
+        hotel.subscribe(self._on_hotel_event)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find_available_rooms(self, room_type: RoomTypeEnum, period: Period, limit: int | None = None) -> List[Room]:
+        """Finds the rooms of the specified type that are free during the whole period, as `Hotel` does.
+
+        Every free room is cached once per period, so queries differing only by `limit` share an entry.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the rooms must be free for.
+            limit (int | None, optional): Maximum number of rooms to return. Defaults to no limit.
+
+        Returns:
+            List[Room]: The free rooms of the specified type, in room number order.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, [])])
+            >>> cache = AvailabilityCache(hotel)
+            >>> period = Period(datetime(2024, 11, 16), datetime(2024, 11, 19))
+            >>> len(cache.find_available_rooms(RoomTypeEnum.SUITE, period)), cache.misses
+            (1, 1)
+            >>> len(cache.find_available_rooms(RoomTypeEnum.SUITE, period)), cache.hits
+            (1, 1)
+        """
+        start, end = period.start, period.end
+        rooms = self._get(
+            ("rooms", room_type, start, end),
+            room_type,
+            start,
+            end,
+            lambda: self.hotel.find_available_rooms(room_type, period),
+        )
+        return rooms[:limit]
+
+    def find_available_room(self, room_type: RoomTypeEnum, period: Period) -> Room | None:
+        """Finds a room of the specified type that is free during the whole period.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the room must be free for.
+
+        Returns:
+            Room | None: A free room of the specified type, or None if all of them are booked.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+        """
+        rooms = self.find_available_rooms(room_type, period, limit=1)
+        return rooms[0] if rooms else None
+
+    def available_windows(
+        self, room_type: RoomTypeEnum, start: datetime, end: datetime, min_nights: int = 1
+    ) -> Dict[Room, List[Period]]:
+        """Lists the free windows of every room of the specified type between two dates, as `Hotel` does.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_nights (int, optional): Shortest window to report, in nights. Defaults to 1.
+
+        Returns:
+            Dict[Room, List[Period]]: The free windows of each room of the type, in room number order.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+            InvalidPeriodError: If the start date is after the end date.
+        """
+        windows = self._get(
+            ("windows", room_type, start, end, min_nights),
+            room_type,
+            start,
+            end,
+            lambda: self.hotel.available_windows(room_type, start, end, min_nights),
+        )
+        return {room: list(room_windows) for room, room_windows in windows.items()}
+
+    def clear(self) -> None:
+        """Drops every cached answer, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._ranges.clear()
+            for room_type in RoomTypeEnum:
+                self._generations[room_type] = self._generations.get(room_type, 0) + 1
+
+    def close(self) -> None:
+        """Stops following the hotel changes."""
+        self.hotel.unsubscribe(self._on_hotel_event)
+
+    def _get(
+        self, key: Hashable, room_type: RoomTypeEnum, start: datetime, end: datetime, compute: Callable[[], Any]
+    ) -> Any:
+        """Answers a query from the cache, or computes and caches it.
+
+        Args:
+            key (Hashable): Key of the query.
+            room_type (RoomTypeEnum): Room type the answer depends on.
+            start (datetime): Start of the date range the answer depends on.
+            end (datetime): End of the date range the answer depends on.
+            compute (Callable[[], Any]): Computes the answer on a miss.
+
+        Returns:
+            Any: The cached or computed answer.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._drop(key, room_type)
+                self.evictions += 1
+            self.misses += 1
+            generation = self._generations.get(room_type, 0)
+
+        # The hotel is queried without holding the cache lock, so events fired meanwhile can be applied.
+        value = compute()
+
+        with self._lock:
+            if self._generations.get(room_type, 0) == generation:
+                self._entries[key] = (None if self.ttl is None else self._clock() + self.ttl, value)
+                self._entries.move_to_end(key)
+                self._ranges.setdefault(room_type, {})[key] = (start, end)
+                while len(self._entries) > self.maxsize:
+                    oldest = next(iter(self._entries))
+                    self._drop(oldest, oldest[1])  # Keys are (query, room type, ...).
+                    self.evictions += 1
+        return value
+
+    def _drop(self, key: Hashable, room_type: RoomTypeEnum) -> None:
+        del self._entries[key]
+        ranges = self._ranges[room_type]
+        del ranges[key]
+        if not ranges:
+            del self._ranges[room_type]
+
+    def _invalidate(
+        self, room_type: RoomTypeEnum, start: datetime = datetime.min, end: datetime = datetime.max
+    ) -> None:
+        """Drops the entries of a room type whose date range overlaps `[start, end]`."""
+        self._generations[room_type] = self._generations.get(room_type, 0) + 1
+        ranges = self._ranges.get(room_type)
+        if not ranges:
+            return
+        stale = [key for key, (key_start, key_end) in ranges.items() if key_start <= end and start <= key_end]
+        for key in stale:
+            self._drop(key, room_type)
+        self.invalidations += len(stale)
+
+    def _on_hotel_event(self, event: str, hotel: Hotel, *, room: Room, **details) -> None:
+        """Drops the cached answers a hotel change can affect."""
+        with self._lock:
+            if event in ("schedule_added", "schedule_cancelled"):
+                period = details["schedule"].period
+                self._invalidate(room.type, period.start, period.end)
+            elif event == "schedule_updated":
+                for schedule in (details["old_schedule"], details["new_schedule"]):
+                    self._invalidate(room.type, schedule.period.start, schedule.period.end)
+            elif event == "period_changed":
+                period = details["schedule"].period
+                self._invalidate(room.type, details["old_start"], details["old_end"])
+                self._invalidate(room.type, period.start, period.end)
+            elif event in ("room_added", "room_removed"):
+                self._invalidate(room.type)
+            elif event == "type_changed":
+                self._invalidate(details["old_type"])
+                self._invalidate(details["new_type"])
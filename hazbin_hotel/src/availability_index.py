@@ -0,0 +1,186 @@
+import threading
+from datetime import date, datetime, time, timezone
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+
+_HISTORY_DAYS = 366
+"""int: Days recorded before the first search of an index."""
+
+_HORIZON_DAYS = 3_660
+"""int: Days recorded from the base day of an index, about ten years; later days are not recorded."""
+
+_MIDNIGHT = time()
+
+
+def _utc(moment: datetime) -> datetime:
+    """Converts timezone-aware datetimes to UTC, so that their days are comparable."""
+    return moment if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
+class AvailabilityIndex:
+    """Rooms of one type in number order, grouped in a segment tree of the days they are all booked.
+
+    Each room is summarized by the days one of its bookings covers whole, as the bits of an
+    int counted from `base`, and each node of the tree holds the days booked in every room
+    below it. A search skips every node booked on a day of the searched period: such a day
+    is booked in each room below the node, so none of them is free. A search over a period
+    that is sold out, or nearly, probes O(r log k) nodes for r free rooms out of k, rather
+    than every room of the type.
+
+    The index only ever skips rooms that are surely booked, so the rooms it yields must still
+    be checked one by one. Days not covered whole, e.g. by a one-night stay with check-in
+    and check-out times, days before `base` and days past the horizon are not recorded:
+    rooms booked only on such days are probed as if the index did not exist. The days of
+    timezone-aware dates are counted in UTC.
+
+    Rooms are filled in one by one under their lock, and until then they are never skipped.
+    Changes of a room already filled are applied with its lock held, in the order they are
+    made. A search running while a room changes may see it as it was just before the change,
+    as a search probing rooms one by one would.
+
+    Attributes:
+        rooms (Tuple[Room, ...]): The rooms of the type, in number order.
+        base (date): First day recorded, `_HISTORY_DAYS` before the search the index was built for.
+        _base (int): Ordinal of `base`.
+        _positions (Dict[int, int]): Position of each room in `rooms`, by room number.
+        _filled (Set[int]): Positions of the rooms whose bookings are recorded.
+        _size (int): Number of leaves of the tree, a power of two.
+        _tree (List[int]): Days booked in every room below each node, the root at 1 and the
+            leaves from `_size`.
+        _lock (threading.Lock): Lock serializing the updates of the tree.
+    """
+
+    def __init__(self, rooms: Sequence[Room], since: datetime) -> None:
+        """Initializes an index over rooms whose bookings are not recorded yet.
+
+        Args:
+            rooms (Sequence[Room]): The rooms of the type, in number order.
+            since (datetime): Start of the search the index is built for.
+        """
+        self.rooms = tuple(rooms)
+        self._base = _utc(since).toordinal() - _HISTORY_DAYS
+        self.base = date.fromordinal(self._base)
+        self._positions: Dict[int, int] = {room.number: position for position, room in enumerate(self.rooms)}
+        self._filled: Set[int] = set()
+        self._size = 1 << max(len(self.rooms) - 1, 0).bit_length()
+        # Missing rooms are booked every day, so they never keep a node from being skipped.
+        self._tree: List[int] = [0] * (2 * self._size)
+        for leaf in range(self._size + len(self.rooms), 2 * self._size):
+            self._tree[leaf] = -1
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = self._tree[2 * node] & self._tree[2 * node + 1]
+        self._lock = threading.Lock()
+
+    def fill(self, room: Room) -> None:
+        """Records the bookings of a room of the index, with its lock held.
+
+        Args:
+            room (Room): The room.
+        """
+        base = self._base
+        with room.lock:
+            days = 0
+            # Inlines `_booked_days`, which costs most of the building of an index.
+            for schedule in room.schedules:
+                period = schedule.period
+                start, end = period.start, period.end
+                if start.tzinfo is not None:
+                    start, end = _utc(start), _utc(end)
+                low = start.toordinal() - base + (start.time() != _MIDNIGHT)
+                high = end.toordinal() - base - 1
+                if low < 0:
+                    low = 0
+                if high >= _HORIZON_DAYS:
+                    high = _HORIZON_DAYS - 1
+                if low <= high:
+                    days |= ((1 << (high - low + 1)) - 1) << low
+            position = self._positions[room.number]
+            with self._lock:
+                self._filled.add(position)
+                self._set(position, days)
+
+    def update(
+        self,
+        room: Room,
+        booked: Iterable[Tuple[datetime, datetime]] = (),
+        freed: Iterable[Tuple[datetime, datetime]] = (),
+    ) -> None:
+        """Records a change of the bookings of a room. Must be called with the room lock held.
+
+        Args:
+            room (Room): The changed room, ignored if it is not a room of the index.
+            booked (Iterable[Tuple[datetime, datetime]], optional): Bounds of the periods booked
+                by the change. Defaults to none.
+            freed (Iterable[Tuple[datetime, datetime]], optional): Bounds of the periods freed by
+                the change. Defaults to none.
+        """
+        position = self._positions.get(room.number)
+        if position is None or self.rooms[position] is not room:
+            return
+        # Bookings of a room never overlap, so a day covered whole belongs to a single one of
+        # them and can be cleared when it is freed.
+        cleared = 0
+        for start, end in freed:
+            cleared |= self._booked_days(start, end)
+        days = 0
+        for start, end in booked:
+            days |= self._booked_days(start, end)
+        with self._lock:
+            if position in self._filled:
+                self._set(position, self._tree[self._size + position] & ~cleared | days)
+
+    def candidates(self, period: Period) -> Iterator[Room]:
+        """Iterates over the rooms that may be free during a period, in number order.
+
+        Args:
+            period (Period): The searched period.
+
+        Yields:
+            Room: Each room not booked on a recorded day of the period.
+        """
+        start, end = _utc(period.start), _utc(period.end)
+        # Days the period enters: a booking covering one of them whole overlaps it.
+        last = end.toordinal() - (end.time() == _MIDNIGHT)
+        days = self._bits(start.toordinal() - self._base, last - self._base)
+        tree, size, count = self._tree, self._size, len(self.rooms)
+        nodes = [1]
+        while nodes:
+            node = nodes.pop()
+            if tree[node] & days:
+                continue
+            if node >= size:
+                if node - size < count:
+                    yield self.rooms[node - size]
+            else:
+                nodes.append(2 * node + 1)
+                nodes.append(2 * node)
+
+    def _booked_days(self, start: datetime, end: datetime) -> int:
+        """Gets the recorded days a booking covers whole, from midnight to midnight, as bits."""
+        start, end = _utc(start), _utc(end)
+        first = start.toordinal() + (start.time() != _MIDNIGHT)
+        return self._bits(first - self._base, end.toordinal() - 1 - self._base)
+
+    @staticmethod
+    def _bits(low: int, high: int) -> int:
+        """Gets the recorded days from `low` to `high`, counted from `base`, as bits."""
+        low = max(low, 0)
+        high = min(high, _HORIZON_DAYS - 1)
+        if high < low:
+            return 0
+        return ((1 << (high - low + 1)) - 1) << low
+
+    def _set(self, position: int, days: int) -> None:
+        """Sets the days of a leaf and updates its ancestors. Must be called with `_lock` held."""
+        tree = self._tree
+        node = self._size + position
+        tree[node] = days
+        node //= 2
+        while node:
+            value = tree[2 * node] & tree[2 * node + 1]
+            if tree[node] == value:
+                break
+            tree[node] = value
+            node //= 2
@@ -0,0 +1,254 @@
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+from hazbin_hotel.src.exceptions import BookingImportError, ScheduleNotFound
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+FILE_FORMATS = ("csv", "jsonl")
+"""tuple: Supported booking file formats."""
+
+FIELDS = ("id", "room_number", "client_name", "start", "end")
+"""tuple: Columns of a CSV booking file and keys of a JSONL booking record."""
+
+_Row = Tuple[int, str | None, str, str, str, str]  # line, id, room number, client name, start, end
+
+
+def parse_date(text: str) -> datetime:
+    """Parses a date written in ISO 8601 format, as `datetime.isoformat` writes it.
+
+    `datetime.fromisoformat` parses the fixed format in C, which is much faster than
+    `datetime.strptime`. Dates with a UTC offset are rejected, as the hotel works with
+    naive datetimes.
+
+    Args:
+        text (str): The date, e.g. `2024-11-16` or `2024-11-16T14:00:00`.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the text is not a naive ISO 8601 date.
+
+    Examples:
+        >>> parse_date("2024-11-16T14:00:00")
+        datetime.datetime(2024, 11, 16, 14, 0)
+    """
+    date = datetime.fromisoformat(text)
+    if date.tzinfo is not None:
+        raise ValueError(f'"{text}" has a UTC offset')
+    return date
+
+
+def iter_bookings(hotel: Hotel) -> Iterator[Tuple[Room, Schedule]]:
+    """Yields every booking of the hotel, room by room, without copying them into a list.
+
+    Args:
+        hotel (Hotel): The hotel to read.
+
+    Yields:
+        Tuple[Room, Schedule]: The room and schedule of each booking.
+    """
+    for room in hotel.rooms:
+        with room.lock:
+            schedules = tuple(room.schedules)
+        for schedule in schedules:
+            yield room, schedule
+
+
+def export_bookings(hotel: Hotel, file: TextIO, file_format: str = "csv") -> int:
+    """Writes every booking of the hotel to a text file, one row per booking.
+
+    Rows are generated and written one at a time, so memory use does not depend on the
+    number of bookings.
+
+    Args:
+        hotel (Hotel): The hotel to export.
+        file (TextIO): Destination file, opened in text mode (with `newline=""` for CSV).
+        file_format (str, optional): `"csv"` or `"jsonl"`. Defaults to `"csv"`.
+
+    Returns:
+        int: The number of bookings written.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    _validate_file_format(file_format)
+    exported = 0
+
+    def rows() -> Iterator[Tuple]:
+        nonlocal exported
+        for room, schedule in iter_bookings(hotel):
+            exported += 1
+            yield (
+                schedule.id,
+                room.number,
+                schedule.client_name,
+                schedule.period.start.isoformat(),
+                schedule.period.end.isoformat(),
+            )
+
+    if file_format == "csv":
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        writer.writerows(rows())
+    else:
+        file.writelines(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n" for row in rows())
+    return exported
+
+
+def import_bookings(hotel: Hotel, file: TextIO, file_format: str = "csv", chunk_size: int = 10_000) -> int:
+    """Reads bookings from a text file and adds them to the hotel rooms.
+
+    The file is parsed in chunks of `chunk_size` rows, and the bookings of each chunk are
+    added room by room under the room lock, so memory use for parsing does not depend
+    on the file size. Rows with an `id` keep it, and that ID is never allocated again;
+    rows without one get a new ID. An `id` already booked in the hotel is rejected.
+
+    An invalid row stops the import: the bookings of previous chunks stay in the hotel,
+    while those already added from the chunk of the invalid row are cancelled again, so
+    each chunk is imported entirely or not at all.
+
+    Args:
+        hotel (Hotel): The hotel receiving the bookings.
+        file (TextIO): Source file, opened in text mode (with `newline=""` for CSV).
+        file_format (str, optional): `"csv"` or `"jsonl"`. Defaults to `"csv"`.
+        chunk_size (int, optional): Number of rows parsed before they are booked. Defaults to 10 000.
+
+    Returns:
+        int: The number of bookings imported.
+
+    Raises:
+        ValueError: If the file format is not supported or `chunk_size` is not positive.
+        BookingImportError: If a row is malformed, names an unknown room, reuses a booked ID or
+            overlaps another booking.
+    """
+    _validate_file_format(file_format)
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    rooms = {str(room.number): room for room in hotel.rooms}
+    rows = _read_csv(file) if file_format == "csv" else _read_jsonl(file)
+    imported = 0
+    while chunk := list(islice(rows, chunk_size)):
+        added = []
+        try:
+            for room, bookings in _parse_chunk(chunk, rooms).items():
+                with room.lock:
+                    for line, schedule, kept_id in bookings:
+                        if kept_id and _is_booked(hotel, schedule.id):
+                            raise BookingImportError(f"Line {line}: schedule {schedule.id} is already booked")
+                        try:
+                            room.add_schedule(schedule)
+                        except ValueError as error:
+                            raise BookingImportError(f"Line {line}: {error}") from error
+                        added.append((room, schedule))
+        except BookingImportError:
+            _cancel_bookings(added)
+            raise
+        imported += len(chunk)
+    return imported
+
+
+def _cancel_bookings(bookings: List[Tuple[Room, Schedule]]) -> None:
+    """Cancels the bookings added from a chunk that failed, skipping those already cancelled by another thread."""
+    for room, schedule in reversed(bookings):
+        try:
+            room.cancel_schedule(schedule.id)
+        except ScheduleNotFound:
+            pass
+
+
+def _is_booked(hotel: Hotel, schedule_id: int) -> bool:
+    """Checks whether a schedule ID is already booked in the hotel."""
+    try:
+        hotel.get_schedule(schedule_id)
+    except ScheduleNotFound:
+        return False
+    return True
+
+
+def _parse_chunk(chunk: List[_Row], rooms: Dict[str, Room]) -> Dict[Room, List[Tuple[int, Schedule, bool]]]:
+    """Turns raw rows into schedules grouped by room, in file order, flagging those keeping their file ID."""
+    bookings = {}
+    for line, schedule_id, room_number, client_name, start, end in chunk:
+        try:
+            room = rooms[room_number]
+        except KeyError:
+            raise BookingImportError(f'Line {line}: room "{room_number}" is not in this hotel') from None
+        try:
+            schedule = Schedule(client_name, Period(parse_date(start), parse_date(end)))
+            if schedule_id:
+                schedule.id = int(schedule_id)
+                Schedule.reserve_ids_up_to(schedule.id)
+        except (ValueError, InvalidPeriodError) as error:
+            raise BookingImportError(f"Line {line}: {error}") from error
+        bookings.setdefault(room, []).append((line, schedule, bool(schedule_id)))
+    return bookings
+
+
+def _read_csv(file: TextIO) -> Iterator[_Row]:
+    """Yields the raw rows of a CSV booking file, located by the header columns."""
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = [header.index(field) if field in header else None for field in FIELDS]
+    if None in positions[1:]:
+        raise BookingImportError(f"Line 1: the header must have the columns {', '.join(FIELDS[1:])}")
+    id_column, room_column, name_column, start_column, end_column = positions
+    for line, row in enumerate(reader, start=2):
+        try:
+            yield (
+                line,
+                row[id_column] if id_column is not None else None,
+                row[room_column],
+                row[name_column],
+                row[start_column],
+                row[end_column],
+            )
+        except IndexError:
+            raise BookingImportError(f"Line {line}: expected {len(header)} columns") from None
+
+
+def _read_jsonl(file: TextIO) -> Iterator[_Row]:
+    """Yields the raw rows of a JSONL booking file, skipping blank lines."""
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+            schedule_id = record.get("id")
+            row = (
+                line,
+                None if schedule_id is None else str(schedule_id),
+                str(record["room_number"]),
+                record["client_name"],
+                record["start"],
+                record["end"],
+            )
+        except (ValueError, KeyError, AttributeError) as error:
+            raise BookingImportError(f"Line {line}: invalid record ({error})") from None
+        for field in ("client_name", "start", "end"):
+            if not isinstance(record[field], str):
+                raise BookingImportError(f'Line {line}: invalid record ("{field}" must be a string)')
+        yield row
+
+
+def _validate_file_format(file_format: str) -> None:
+    """Validates a booking file format.
+
+    Args:
+        file_format (str): The format to validate.
+
+    Raises:
+        ValueError: If the format is not one of `FILE_FORMATS`.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f'Unsupported booking file format "{file_format}"')
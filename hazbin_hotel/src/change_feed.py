@@ -0,0 +1,418 @@
+import asyncio
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from hazbin_hotel.src.exceptions import ChangeFeedGap
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+"""tuple: What a subscription does with a new change when its queue is full."""
+
+
+class Change:
+    """A booking or room change published by a `ChangeFeed`.
+
+    The data is copied when the change is published, so it keeps describing the change
+    after the schedule or room moves on.
+
+    Attributes:
+        sequence (int): Position of the change in the feed, starting at 1 and without gaps.
+        event (str): Name of the hotel event, see `Hotel` and `Room`.
+        room_number (int): Number of the room involved.
+        data (Dict[str, Any]): Event specific values, e.g. `schedule_id`, `client_name`,
+            `start` and `end` for bookings, with `old_` prefixed values for updates.
+    """
+
+    __slots__ = ("sequence", "event", "room_number", "data")
+
+    def __init__(self, sequence: int, event: str, room_number: int, data: Dict[str, Any]) -> None:
+        self.sequence = sequence
+        self.event = event
+        self.room_number = room_number
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"Change({self.sequence}, {self.event!r}, room={self.room_number}, {self.data!r})"
+
+
+class ChangeFeed:
+    """In-process feed of every change made to a hotel, for downstream consumers.
+
+    The feed follows the hotel events: bookings, updates and cancellations, periods
+    changed in place, client renames, price and type changes, and added or removed rooms.
+    Each one is published once as a `Change` with the next sequence number, and handed to
+    every subscription, so a consumer pays for the changes it reads, not for the size of
+    the hotel.
+
+    The last `retention` changes are kept, so a consumer that stopped can resume from the
+    last sequence number it processed with `subscribe(since=...)`.
+
+    A change is numbered and retained under the feed lock, then handed to the subscriptions
+    outside of it, in sequence order: publishers take turns by sequence number, so a
+    publisher waiting on a full `"block"` subscription delays the changes published after
+    its own, but never subscribing, closing or reading the retained changes.
+
+    Attributes:
+        hotel (Hotel): The hotel whose changes are published.
+        retention (int): Number of past changes kept for resuming subscribers.
+        sequence (int): Sequence number of the last published change, 0 before the first one.
+        _retained (Deque[Change]): The last published changes.
+        _subscriptions (Tuple[Subscription, ...]): Open subscriptions, replaced when they change.
+        _lock (threading.Lock): Lock serializing numbering and subscription.
+        _delivered (int): Sequence number of the last change handed to the subscriptions.
+        _turn (threading.Condition): Condition notified when `_delivered` moves on.
+    """
+
+    def __init__(self, hotel: Hotel, retention: int = 10_000) -> None:
+        """Starts publishing the changes of a hotel.
+
+        Args:
+            hotel (Hotel): The hotel to follow.
+            retention (int, optional): Number of past changes kept for resuming subscribers.
+                Defaults to 10000.
+
+        Raises:
+            ValueError: If `retention` is negative.
+        """
+        if retention < 0:
+            raise ValueError("Retention cannot be negative.")
+        self.hotel = hotel
+        self.retention = retention
+        self.sequence = 0
+        self._retained: Deque[Change] = deque(maxlen=retention)
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._lock = threading.Lock()
+        self._delivered = 0
+        self._turn = threading.Condition()
+        hotel.subscribe(self._on_hotel_event)
+
+    def subscribe(
+        self,
+        since: int | None = None,
+        maxsize: int = 1000,
+        overflow: str = "drop_oldest",
+        block_timeout: float | None = 1.0,
+    ) -> "Subscription":
+        """Opens a subscription read by blocking calls, e.g. from a worker thread.
+
+        By default a full queue drops its oldest change, so a slow consumer never slows the
+        hotel down. With the `"block"` policy, a change published while the queue is full
+        waits until the consumer makes room, or for `block_timeout` seconds, after which the
+        oldest queued change is dropped. The booking waits with its room locked and delays
+        the changes published after it, so a blocking consumer must keep up, and must not
+        book in the rooms it is waiting for.
+
+        Args:
+            since (int | None, optional): Sequence number of the last change already processed,
+                to receive the retained changes after it first. Defaults to new changes only.
+            maxsize (int, optional): Maximum number of queued changes. Defaults to 1000.
+            overflow (str, optional): One of `OVERFLOW_POLICIES`. Defaults to `"drop_oldest"`.
+            block_timeout (float | None, optional): Longest wait of a blocked publisher, in seconds,
+                None to wait as long as needed. Defaults to one second.
+
+        Returns:
+            Subscription: The subscription.
+
+        Raises:
+            ChangeFeedGap: If changes after `since` are no longer retained.
+            ValueError: If `since` is ahead of the feed, `maxsize` is not positive or
+                `overflow` is unknown.
+        """
+        return self._open(Subscription(self, maxsize, overflow, block_timeout), since)
+
+    def subscribe_async(
+        self, since: int | None = None, maxsize: int = 1000, overflow: str = "drop_oldest"
+    ) -> "AsyncSubscription":
+        """Opens a subscription read by coroutines on the running event loop.
+
+        Hotel changes are often made on the event loop itself, e.g. through `AsyncHotel`,
+        so an asyncio subscription cannot block the publisher: it drops changes instead.
+
+        Args:
+            since (int | None, optional): Sequence number of the last change already processed,
+                to receive the retained changes after it first. Defaults to new changes only.
+            maxsize (int, optional): Maximum number of queued changes. Defaults to 1000.
+            overflow (str, optional): `"drop_oldest"` or `"drop_newest"`. Defaults to `"drop_oldest"`.
+
+        Returns:
+            AsyncSubscription: The subscription.
+
+        Raises:
+            ChangeFeedGap: If changes after `since` are no longer retained.
+            RuntimeError: If no event loop is running.
+            ValueError: If `since` is ahead of the feed, `maxsize` is not positive or
+                `overflow` is not a drop policy.
+        """
+        if overflow == "block":
+            raise ValueError("An asyncio subscription cannot block the publisher.")
+        return self._open(AsyncSubscription(self, maxsize, overflow, asyncio.get_running_loop()), since)
+
+    def changes_since(self, since: int) -> List[Change]:
+        """Lists the retained changes published after a sequence number.
+
+        Args:
+            since (int): Sequence number of the last change already processed.
+
+        Returns:
+            List[Change]: The changes after `since`, in sequence order.
+
+        Raises:
+            ChangeFeedGap: If changes after `since` are no longer retained.
+            ValueError: If `since` is ahead of the feed.
+        """
+        with self._lock:
+            return self._changes_since(since)
+
+    def close(self) -> None:
+        """Stops following the hotel and closes every subscription."""
+        self.hotel.unsubscribe(self._on_hotel_event)
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, ()
+        for subscription in subscriptions:
+            subscription._close()
+
+    def _open(self, subscription: "Subscription", since: int | None) -> "Subscription":
+        """Registers a subscription, queuing the retained changes after `since` first."""
+        with self._lock:
+            if since is not None:
+                # Queued regardless of `maxsize`: the backlog is bounded by the retention.
+                backlog = self._changes_since(since)
+                subscription._changes.extend(backlog)
+                subscription.position = since
+            else:
+                subscription.position = self.sequence
+            # Changes numbered before are in the backlog or already seen, never handed to it.
+            self._subscriptions += (subscription,)
+        return subscription
+
+    def _detach(self, subscription: "Subscription") -> None:
+        with self._lock:
+            self._subscriptions = tuple(other for other in self._subscriptions if other is not subscription)
+
+    def _changes_since(self, since: int) -> List[Change]:
+        if since > self.sequence:
+            raise ValueError(f"Sequence number {since} is ahead of the feed, at {self.sequence}.")
+        missing = self.sequence - since
+        if missing > len(self._retained):
+            raise ChangeFeedGap(
+                f"Changes after {since} are no longer retained, the oldest is {self.sequence - len(self._retained) + 1}"
+            )
+        # The changes after `since` are the last `missing` ones, read from the newest end.
+        changes = list(islice(reversed(self._retained), missing))
+        changes.reverse()
+        return changes
+
+    def _on_hotel_event(self, event: str, hotel: Hotel, *, room: Room, **details) -> None:
+        """Publishes a hotel change to every subscription."""
+        data = _describe(event, room, details)
+        with self._lock:
+            self.sequence += 1
+            change = Change(self.sequence, event, room.number, data)
+            self._retained.append(change)
+            subscriptions = self._subscriptions
+        with self._turn:
+            self._turn.wait_for(lambda: self._delivered == change.sequence - 1)
+        try:
+            for subscription in subscriptions:
+                subscription._offer(change)
+        finally:
+            with self._turn:
+                self._delivered = change.sequence
+                self._turn.notify_all()
+
+
+class Subscription:
+    """Bounded queue of the changes published by a `ChangeFeed`, read in batches.
+
+    `get` returns the queued changes in sequence order, up to a batch size, waiting for the
+    first one if needed. Iterating the subscription yields batches until it is closed.
+    Dropped changes leave gaps in the sequence numbers; while they are retained, they can
+    be fetched again with `ChangeFeed.changes_since`.
+
+    Attributes:
+        maxsize (int): Maximum number of queued changes.
+        overflow (str): Policy applied when the queue is full, one of `OVERFLOW_POLICIES`.
+        block_timeout (float | None): Longest wait of a blocked publisher, in seconds.
+        position (int): Sequence number of the last change returned by `get`, to resume from.
+        dropped (int): Number of changes dropped because the queue was full.
+        closed (bool): Whether the subscription was closed, by itself or by the feed.
+        _changes (Deque[Change]): Queued changes.
+        _condition (threading.Condition): Condition guarding the queue, notified when it changes.
+    """
+
+    def __init__(self, feed: ChangeFeed, maxsize: int, overflow: str, block_timeout: float | None = None) -> None:
+        """Initializes an empty subscription, registered by `ChangeFeed`.
+
+        Raises:
+            ValueError: If `maxsize` is not positive or `overflow` is unknown.
+        """
+        if maxsize <= 0:
+            raise ValueError("Queue size must be positive.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy "{overflow}", expected one of {", ".join(OVERFLOW_POLICIES)}')
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.position = 0
+        self.dropped = 0
+        self.closed = False
+        self._feed = feed
+        self._changes: Deque[Change] = deque()
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __iter__(self) -> Iterator[List[Change]]:
+        while batch := self.get():
+            yield batch
+
+    def get(self, max_items: int = 100, timeout: float | None = None) -> List[Change]:
+        """Takes the next batch of changes, waiting for one if the queue is empty.
+
+        Args:
+            max_items (int, optional): Largest batch to return. Defaults to 100.
+            timeout (float | None, optional): Longest wait, in seconds. Defaults to waiting
+                until a change arrives or the subscription is closed.
+
+        Returns:
+            List[Change]: The next changes in sequence order, empty on timeout or once closed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._changes or self.closed, timeout)
+            return self._take(max_items)
+
+    def close(self) -> None:
+        """Stops receiving changes. Changes already queued can still be read."""
+        self._close()
+        self._feed._detach(self)
+
+    def _take(self, max_items: int) -> List[Change]:
+        """Pops a batch from the queue. Must be called with `_condition` held."""
+        changes = self._changes
+        batch = [changes.popleft() for _ in range(min(max_items, len(changes)))]
+        if batch:
+            self.position = batch[-1].sequence
+            if self.overflow == "block":
+                self._condition.notify_all()
+        return batch
+
+    def _offer(self, change: Change) -> None:
+        """Queues a published change, applying the overflow policy when the queue is full."""
+        with self._condition:
+            if self.closed:
+                return
+            changes = self._changes
+            if len(changes) >= self.maxsize and self.overflow == "block":
+                self._condition.wait_for(lambda: len(changes) < self.maxsize or self.closed, self.block_timeout)
+                if self.closed:
+                    return
+            if len(changes) >= self.maxsize:
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return
+                changes.popleft()
+            changes.append(change)
+            self._condition.notify_all()
+            self._wake()
+
+    def _wake(self) -> None:
+        """Wakes a consumer waiting outside `_condition`. Must be called with `_condition` held."""
+
+    def _close(self) -> None:
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+            self._wake()
+
+
+class AsyncSubscription(Subscription):
+    """Subscription read by coroutines, see `Subscription`.
+
+    Changes may be published from any thread: a waiting coroutine is woken through
+    `loop.call_soon_threadsafe`, only when it is actually waiting.
+
+    Attributes:
+        _loop (asyncio.AbstractEventLoop): The event loop of the consumer.
+        _ready (asyncio.Event): Set when changes arrive or the subscription closes while a coroutine waits.
+        _waiting (bool): Whether a coroutine waits for changes.
+    """
+
+    def __init__(self, feed: ChangeFeed, maxsize: int, overflow: str, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__(feed, maxsize, overflow)
+        self._loop = loop
+        self._ready = asyncio.Event()
+        self._waiting = False
+
+    def __iter__(self):
+        raise TypeError("Iterate an asyncio subscription with `async for`.")
+
+    async def __aiter__(self):
+        while batch := await self.get():
+            yield batch
+
+    async def get(self, max_items: int = 100, timeout: float | None = None) -> List[Change]:
+        """Takes the next batch of changes, waiting for one if the queue is empty.
+
+        Args:
+            max_items (int, optional): Largest batch to return. Defaults to 100.
+            timeout (float | None, optional): Longest wait, in seconds. Defaults to waiting
+                until a change arrives or the subscription is closed.
+
+        Returns:
+            List[Change]: The next changes in sequence order, empty on timeout or once closed.
+        """
+        with self._condition:
+            if self._changes or self.closed:
+                return self._take(max_items)
+            self._ready.clear()
+            self._waiting = True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        with self._condition:
+            self._waiting = False
+            return self._take(max_items)
+
+    def _wake(self) -> None:
+        if self._waiting:
+            self._waiting = False
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+
+def _describe(event: str, room: Room, details: Dict[str, Any]) -> Dict[str, Any]:
+    """Copies the values describing a hotel event."""
+    if event in ("schedule_added", "schedule_cancelled"):
+        return _schedule_data(details["schedule"])
+    if event == "schedule_updated":
+        return {"old_schedule_id": details["old_schedule"].id, **_schedule_data(details["new_schedule"])}
+    if event == "period_changed":
+        data = _schedule_data(details["schedule"])
+        return {**data, "old_start": details["old_start"], "old_end": details["old_end"]}
+    if event == "client_name_changed":
+        return {
+            "schedule_id": details["schedule"].id,
+            "old_client_name": details["old_client_name"],
+            "client_name": details["new_client_name"],
+        }
+    if event == "price_updated":
+        return {"old_price": details["old_price"], "price": details["new_price"]}
+    if event == "type_changed":
+        return {"old_type": details["old_type"].value, "type": details["new_type"].value}
+    if event == "room_added":
+        return {"type": room.type.value, "price": room.price}
+    return {}
+
+
+def _schedule_data(schedule: Schedule) -> Dict[str, Any]:
+    return {
+        "schedule_id": schedule.id,
+        "client_name": schedule.client_name,
+        "start": schedule.period.start,
+        "end": schedule.period.end,
+    }
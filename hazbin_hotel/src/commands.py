@@ -0,0 +1,306 @@
+import functools
+import json
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, TextIO
+
+from hazbin_hotel.src.booking_io import parse_date
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import InvalidCommand, RoomNotAvailable
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.utils import format_date
+
+if TYPE_CHECKING:  # asyncio is slow to import and only the server mode needs it.
+    import asyncio
+
+COMMANDS = ("book", "list_rooms", "list_available_dates")
+"""tuple: Names of the commands understood by `CommandProcessor`."""
+
+READ_SIZE = 64 * 1024
+"""int: Bytes read from a connection at a time by the command server."""
+
+MAX_LINE = 64 * 1024
+"""int: Longest command line accepted by the command server, in bytes."""
+
+
+class CommandProcessor:
+    """Runs line-delimited JSON commands against a hotel, for batch and server modes.
+
+    Each command is a JSON object naming the command and its arguments; each answer is a
+    JSON object with `"ok": true` and the result, or `"ok": false` with the name of the
+    exception and its message. An `"id"` given in a command is echoed in its answer, so
+    pipelining clients can match answers to commands. Commands run one at a time, in order.
+
+    - `{"command": "book", "client_name": ..., "start": ..., "end": ..., "room_type": ...}` books
+      the first free room of the type, or the room given by `"room_number"` instead of a type,
+      and answers with the booked `"room"`.
+    - `{"command": "list_rooms"}` answers with the `"rooms"` of the hotel.
+    - `{"command": "list_available_dates"}` answers with the free `"windows"` of every room, or
+      of the room given by `"room_number"`, between `"start"` and `"end"`: by default from today
+      to the end of `horizon`.
+
+    Dates are written in ISO 8601 format, as `datetime.isoformat` writes them.
+
+    Attributes:
+        hotel (Hotel): The hotel the commands run against.
+        horizon (timedelta): Default length of the range searched by `list_available_dates`.
+        _handlers (Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]): Handler of each command.
+    """
+
+    def __init__(self, hotel: Hotel, horizon: timedelta = timedelta(days=30)) -> None:
+        """Initializes a processor for a hotel.
+
+        Args:
+            hotel (Hotel): The hotel the commands run against.
+            horizon (timedelta, optional): Default length of the range searched by
+                `list_available_dates`. Defaults to 30 days.
+        """
+        self.hotel = hotel
+        self.horizon = horizon
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "book": self._book,
+            "list_rooms": self._list_rooms,
+            "list_available_dates": self._list_available_dates,
+        }
+
+    def execute(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs a command.
+
+        Args:
+            command (Dict[str, Any]): The decoded command.
+
+        Returns:
+            Dict[str, Any]: The answer, which reports failures instead of raising them.
+
+        Examples:
+            >>> from hazbin_hotel.src.room import Room
+            >>> processor = CommandProcessor(Hotel([Room(RoomTypeEnum.SUITE, 1450, [])]))
+            >>> processor.execute({"command": "book", "client_name": "Charlie", "room_type": "SUITE",
+            ...                    "start": "2024-11-16", "end": "2024-11-19", "id": 1})["ok"]
+            True
+            >>> processor.execute({"command": "book", "client_name": "Vaggie", "room_type": "SUITE",
+            ...                    "start": "2024-11-18", "end": "2024-11-20", "id": 2})["error"]
+            'RoomNotAvailable'
+        """
+        try:
+            if not isinstance(command, dict):
+                raise InvalidCommand("A command must be a JSON object.")
+            handler = self._handlers.get(command.get("command"))
+            if handler is None:
+                raise InvalidCommand(
+                    f'Unknown command "{command.get("command")}", expected one of {", ".join(COMMANDS)}.'
+                )
+            answer = handler(command)
+        except Exception as error:
+            answer = _failure(error)
+        if isinstance(command, dict) and "id" in command:
+            answer["id"] = command["id"]
+        return answer
+
+    def handle_line(self, line: str | bytes) -> str:
+        """Runs a command given as a line of JSON.
+
+        Args:
+            line (str | bytes): The command, encoded as JSON.
+
+        Returns:
+            str: The answer encoded as JSON, ending with a newline.
+        """
+        try:
+            command = json.loads(line)
+        except ValueError as error:
+            answer = _failure(InvalidCommand(f"Invalid JSON: {error}"))
+        else:
+            answer = self.execute(command)
+        return json.dumps(answer) + "\n"
+
+    def _book(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        client_name = _field(command, "client_name", str)
+        period = Period(_date(command, "start"), _date(command, "end"))
+        if "room_number" in command:
+            room = self._room(command)
+            if not self.hotel.book_room(room, room.type, client_name, period):
+                raise RoomNotAvailable(
+                    f'Room "{room.type.value}-{room.number}" is not available from '
+                    f"{format_date(period.start)} to {format_date(period.end)}"
+                )
+            return {"ok": True, "room": _describe(room)}
+
+        room_type = _room_type(command)
+        while True:
+            room = self.hotel.find_available_room(room_type, period)
+            if room is None:
+                raise RoomNotAvailable(
+                    f'"{room_type.value}" is not available from '
+                    f"{format_date(period.start)} to {format_date(period.end)}"
+                )
+            # Another thread may take the room between the search and the booking.
+            if self.hotel.book_room(room, room_type, client_name, period):
+                return {"ok": True, "room": _describe(room)}
+
+    def _list_rooms(self, _: Dict[str, Any]) -> Dict[str, Any]:
+        return {"ok": True, "rooms": [_describe(room) for room in self.hotel.rooms]}
+
+    def _list_available_dates(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        start = _date(command, "start") if "start" in command else datetime.combine(datetime.today(), time())
+        end = _date(command, "end") if "end" in command else start + self.horizon
+        if start > end:
+            raise InvalidPeriodError("Start date must be before end date.")
+        rooms = [self._room(command)] if "room_number" in command else self.hotel.rooms
+        return {
+            "ok": True,
+            "rooms": [
+                {
+                    **_describe(room),
+                    "windows": [
+                        [window.start.isoformat(), window.end.isoformat()]
+                        for window in room.available_windows(start, end)
+                    ],
+                }
+                for room in rooms
+            ],
+        }
+
+    def _room(self, command: Dict[str, Any]) -> Room:
+        number = _field(command, "room_number", int)
+        room = self.hotel.rooms.get(number)
+        if room is None:
+            raise InvalidCommand(f"The hotel has no room {number}.")
+        return room
+
+
+def run_batch(processor: CommandProcessor, lines: Iterable[str], output: TextIO) -> int:
+    """Runs a stream of commands, one JSON object per line, writing one answer per line.
+
+    Blank lines are skipped. Lines are read and answers written as the stream goes, so a
+    batch of any size runs in constant memory.
+
+    Args:
+        processor (CommandProcessor): The processor running the commands.
+        lines (Iterable[str]): The commands, e.g. an open file or `sys.stdin`.
+        output (TextIO): Where the answers are written.
+
+    Returns:
+        int: The number of commands run.
+
+    Examples:
+        >>> import io
+        >>> from hazbin_hotel.src.room import Room
+        >>> processor = CommandProcessor(Hotel([Room(RoomTypeEnum.SUITE, 1450, [])]))
+        >>> output = io.StringIO()
+        >>> run_batch(processor, ['{"command": "list_rooms"}', "", "oops"], output)
+        2
+        >>> [json.loads(line)["ok"] for line in output.getvalue().splitlines()]
+        [True, False]
+    """
+    count = 0
+
+    def answers():
+        nonlocal count
+        for line in lines:
+            if line.strip():
+                count += 1
+                yield processor.handle_line(line)
+
+    output.writelines(answers())
+    return count
+
+
+async def start_server(processor: CommandProcessor, host: str = "127.0.0.1", port: int = 0) -> "asyncio.Server":
+    """Starts serving commands over TCP, one JSON object per line in each direction.
+
+    Clients may pipeline: every complete line received is run as soon as it arrives and
+    the answers of one read are written back together, in the order of the commands. The
+    connections share the event loop, so commands never run concurrently.
+
+    Args:
+        processor (CommandProcessor): The processor running the commands.
+        host (str, optional): Interface to listen on. Defaults to the loopback interface.
+        port (int, optional): Port to listen on. Defaults to a free port chosen by the system.
+
+    Returns:
+        asyncio.Server: The listening server; its `sockets` tell the chosen port.
+    """
+    import asyncio
+
+    return await asyncio.start_server(functools.partial(_serve_connection, processor), host, port)
+
+
+async def serve(processor: CommandProcessor, host: str = "127.0.0.1", port: int = 0) -> None:
+    """Serves commands over TCP until cancelled, see `start_server`.
+
+    Args:
+        processor (CommandProcessor): The processor running the commands.
+        host (str, optional): Interface to listen on. Defaults to the loopback interface.
+        port (int, optional): Port to listen on. Defaults to a free port chosen by the system.
+    """
+    server = await start_server(processor, host, port)
+    async with server:
+        for address in (socket.getsockname() for socket in server.sockets):
+            print(f"Serving commands on {address[0]}:{address[1]}", flush=True)
+        await server.serve_forever()
+
+
+async def _serve_connection(
+    processor: CommandProcessor, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"
+):
+    pending = b""
+    try:
+        while True:
+            data = await reader.read(READ_SIZE)
+            if not data:
+                break
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            writer.write("".join([processor.handle_line(line) for line in lines if line.strip()]).encode())
+            if len(pending) > MAX_LINE:
+                # The complete commands read with the fragment are answered first.
+                answer = _failure(InvalidCommand(f"Commands must be shorter than {MAX_LINE} bytes."))
+                writer.write(f"{json.dumps(answer)}\n".encode())
+                await writer.drain()
+                pending = b""
+                break
+            await writer.drain()
+        if pending.strip():
+            writer.write(processor.handle_line(pending).encode())
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def _field(command: Dict[str, Any], name: str, kind: type) -> Any:
+    value = command.get(name)
+    if not isinstance(value, kind) or isinstance(value, bool):
+        raise InvalidCommand(f'"{name}" must be a {kind.__name__}.')
+    return value
+
+
+def _date(command: Dict[str, Any], name: str) -> datetime:
+    try:
+        return parse_date(_field(command, name, str))
+    except ValueError as error:
+        raise InvalidCommand(f'"{name}" must be an ISO 8601 date: {error}') from None
+
+
+def _room_type(command: Dict[str, Any]) -> RoomTypeEnum:
+    value = _field(command, "room_type", str)
+    try:
+        return RoomTypeEnum(value)
+    except ValueError:
+        raise InvalidCommand(f'Unknown room type "{value}".') from None
+
+
+def _failure(error: Exception) -> Dict[str, Any]:
+    return {"ok": False, "error": type(error).__name__, "message": str(error)}
+
+
+def _describe(room: Room) -> Dict[str, Any]:
+    return {"number": room.number, "type": room.type.value, "price": room.price}
@@ -31,6 +31,28 @@ class RoomNotAvailable(Exception):
     pass
 
 
+class RoomNotFound(Exception):
+    """Exception raised when a room number does not match any room of the hotel.
+
+    This exception is raised when fetching or removing a room that is not
+    registered in the hotel.
+
+    """
+
+    pass
+
+
+class RoomNumberTaken(Exception):
+    """Exception raised when adding a room whose number is already in use.
+
+    This exception is raised when a hotel already has a different room
+    registered under the same number.
+
+    """
+
+    pass
+
+
 class RoomHasSchedule(Exception):
     """Exception raised when attempting to modify or delete a room with existing schedules.
 
@@ -51,3 +73,58 @@ class ScheduleCannotBeOverwritten(Exception):
     """
 
     pass
+
+
+class ScheduleNotFound(Exception):
+    """Exception raised when a schedule ID does not match any booking.
+
+    This exception is raised when fetching, updating or cancelling a schedule
+    by an ID that is not booked in the room or hotel.
+
+    """
+
+    pass
+
+
+class RoomIsReadOnly(Exception):
+    """Exception raised when attempting to change a read-only room.
+
+    This exception is raised by rooms served from a memory-mapped snapshot,
+    which answer availability queries but cannot take bookings.
+
+    """
+
+    pass
+
+
+class BookingImportError(Exception):
+    """Exception raised when a booking file cannot be imported.
+
+    This exception is raised for malformed rows, unknown rooms and bookings
+    overlapping existing ones; the message starts with the offending line number.
+
+    """
+
+    pass
+
+
+class InvalidCommand(Exception):
+    """Exception raised when a batch or server command is malformed.
+
+    This exception is raised for lines that are not JSON objects, unknown
+    commands and missing or invalid command fields.
+
+    """
+
+    pass
+
+
+class ChangeFeedGap(Exception):
+    """Exception raised when a change feed subscriber cannot resume where it stopped.
+
+    This exception is raised when some changes after the requested sequence number
+    are no longer retained by the feed.
+
+    """
+
+    pass
@@ -0,0 +1,156 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.observable import Observable
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+
+def normalize_client_name(client_name: str) -> str:
+    """Normalizes a client name for case-insensitive look-ups.
+
+    Args:
+        client_name (str): The name to normalize.
+
+    Returns:
+        str: The name case-folded, with runs of whitespace collapsed to single spaces.
+
+    Examples:
+        >>> normalize_client_name("  Charlie   MORNINGSTAR ")
+        'charlie morningstar'
+    """
+    return " ".join(client_name.casefold().split())
+
+
+class GuestIndex:
+    """Bookings of a hotel indexed by normalized client name.
+
+    The index follows the hotel events, so bookings, schedule updates, cancellations and
+    added rooms are reflected immediately, and it subscribes to every indexed schedule to
+    follow changes made through the `Schedule.client_name` setter. Look-ups cost time
+    proportional to the number of bookings returned, whatever the size of the hotel.
+
+    Attributes:
+        hotel (Hotel): The hotel whose bookings are indexed.
+        _bookings (Dict[str, Dict[Schedule, Room]]): Bookings of each normalized name, in booking order.
+        _names (List[str]): Indexed normalized names, sorted for prefix searches.
+        _lock (threading.Lock): Lock serializing updates and look-ups.
+    """
+
+    def __init__(self, hotel: Hotel) -> None:
+        """Indexes every booking of a hotel and starts following its changes.
+
+        Args:
+            hotel (Hotel): The hotel to index.
+        """
+        self.hotel = hotel
+        self._bookings = {}
+        self._names = []
+        self._lock = threading.Lock()
+        with self._lock:
+            for room in hotel.rooms:
+                for schedule in room.schedules:
+                    self._add(room, schedule)
+        hotel.subscribe(self._on_hotel_event)
+
+    def bookings(self, client_name: str) -> List[Tuple[Room, Schedule]]:
+        """Gets every booking of a guest, ignoring case and extra whitespace.
+
+        Args:
+            client_name (str): The name of the guest.
+
+        Returns:
+            List[Tuple[Room, Schedule]]: The room and schedule of each booking, in booking order.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> from hazbin_hotel.src.enums.types import RoomTypeEnum
+            >>> from hazbin_hotel.src.period import Period
+            >>> room = Room(RoomTypeEnum.SUITE, 1450, [])
+            >>> room.add_schedule(Schedule("Charlie", Period(datetime(2024, 11, 16), datetime(2024, 11, 19))))
+            >>> guests = GuestIndex(Hotel([room]))
+            >>> [schedule.client_name for _, schedule in guests.bookings("CHARLIE")]
+            ['Charlie']
+        """
+        with self._lock:
+            return [
+                (room, schedule)
+                for schedule, room in self._bookings.get(normalize_client_name(client_name), {}).items()
+            ]
+
+    def search(self, prefix: str) -> List[Tuple[Room, Schedule]]:
+        """Gets every booking of the guests whose name starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The start of the guest names.
+
+        Returns:
+            List[Tuple[Room, Schedule]]: The room and schedule of each booking, grouped by guest
+                name in alphabetical order.
+        """
+        prefix = normalize_client_name(prefix)
+        with self._lock:
+            matches = []
+            for position in range(bisect_left(self._names, prefix), len(self._names)):
+                name = self._names[position]
+                if not name.startswith(prefix):
+                    break
+                matches.extend((room, schedule) for schedule, room in self._bookings[name].items())
+            return matches
+
+    def close(self) -> None:
+        """Stops following the hotel and its schedules."""
+        self.hotel.unsubscribe(self._on_hotel_event)
+        with self._lock:
+            for bookings in self._bookings.values():
+                for schedule in bookings:
+                    if isinstance(schedule, Observable):
+                        schedule.unsubscribe(self._on_schedule_event)
+
+    def _add(self, room: Room, schedule: Schedule) -> None:
+        name = normalize_client_name(schedule.client_name)
+        bookings = self._bookings.get(name)
+        if bookings is None:
+            bookings = self._bookings[name] = {}
+            insort(self._names, name)
+        bookings[schedule] = room
+        # Schedules stored outside `Schedule` objects (e.g. `StoredSchedule` views) cannot be followed.
+        if isinstance(schedule, Observable):
+            schedule.subscribe(self._on_schedule_event)
+
+    def _remove(self, schedule: Schedule, client_name: str | None = None) -> Room | None:
+        name = normalize_client_name(schedule.client_name if client_name is None else client_name)
+        bookings = self._bookings.get(name, {})
+        room = bookings.pop(schedule, None)
+        if room is None:
+            return None
+        if isinstance(schedule, Observable):
+            schedule.unsubscribe(self._on_schedule_event)
+        if not bookings:
+            del self._bookings[name]
+            del self._names[bisect_left(self._names, name)]
+        return room
+
+    def _on_hotel_event(self, event: str, hotel: Hotel, *, room: Room, **details) -> None:
+        """Applies a hotel change to the index."""
+        with self._lock:
+            if event == "schedule_added":
+                self._add(room, details["schedule"])
+            elif event == "schedule_updated":
+                self._remove(details["old_schedule"])
+                self._add(room, details["new_schedule"])
+            elif event == "schedule_cancelled":
+                self._remove(details["schedule"])
+            elif event == "room_added":
+                for schedule in room.schedules:
+                    self._add(room, schedule)
+
+    def _on_schedule_event(self, event: str, schedule: Schedule, **details) -> None:
+        """Moves a renamed booking to its new client name."""
+        if event == "client_name_changed":
+            with self._lock:
+                room = self._remove(schedule, details["old_client_name"])
+                if room is not None:
+                    self._add(room, schedule)
@@ -1,23 +1,71 @@
-from datetime import datetime
-from typing import List
+import heapq
+import threading
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from itertools import dropwhile
+from typing import Callable, Dict, Iterable, List, Tuple
 
+from hazbin_hotel.src.availability_index import AvailabilityIndex
 from hazbin_hotel.src.enums.types import RoomTypeEnum
 from hazbin_hotel.src.exceptions import (
     RoomHasSchedule,
     RoomNotAvailable,
+    RoomNotFound,
     RoomTypeNotAvailable,
+    ScheduleNotFound,
 )
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.observable import Observable
 from hazbin_hotel.src.period import Period
 from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.room_registry import RoomRegistry, RoomsView
 from hazbin_hotel.src.schedule import Schedule
 from hazbin_hotel.src.utils import format_date
+from hazbin_hotel.src.versioning import HotelSnapshot
 
 
-class Hotel:
+class Hotel(Observable):
     """Represents a hotel that manages room bookings and availability.
 
+    Subscribed listeners are notified with `"room_added"` and `"room_removed"` events, and
+    every event of the hotel rooms is forwarded to them. All events carry the `room` involved
+    besides the details documented in `Room`.
+
+    The hotel can be shared between threads. Bookings lock only the room being booked, so
+    bookings of different rooms run concurrently, while adding, removing and retyping rooms
+    is serialized by a hotel-wide lock.
+
+    Rooms are kept in a `RoomRegistry` keyed by room number, so getting a room by number takes
+    constant time, and `rooms` is a read-only view rather than a copy. Adding or removing a
+    room keeps the rooms in number order overall and by type, which costs O(b + n/b + k) for
+    n rooms, k of them of its type, in blocks of b rooms: `add_rooms` and `remove_rooms`
+    change many rooms at once in O(n + m log m) for m rooms.
+
+    Reports read a `HotelSnapshot` from `snapshot`: a consistent view of every room and
+    schedule at one point in time, which bookings made meanwhile do not change and which
+    does not block them.
+
+    Schedules can be fetched, updated and cancelled by ID through a hotel-wide index. The
+    index is built on first use and then kept up to date by the room events.
+
+    Searches for free rooms of a type probe its rooms one by one, until the busy rooms they
+    probed outnumber the rooms and bookings of the type, about what building an index costs.
+    They then go through an `AvailabilityIndex` of the type, built once and kept up to date by
+    the room events, which skips groups of rooms booked on a common day of the searched period
+    rather than probing each of them. The index of a type is dropped, and its count of busy
+    rooms probed reset, whenever rooms of the type are added, removed or retyped.
+
     Attributes:
-        rooms (List[Room]): List of Room objects representing the rooms in the hotel.
+        rooms (RoomsView): Read-only view of the rooms in the hotel, in room number order.
+        _rooms (RoomRegistry): Rooms by number and by type.
+        _lock (threading.RLock): Lock serializing changes to the set of rooms.
+        _schedule_locations (Dict[int, Tuple[Room, Schedule]] | None): Room and schedule of each schedule ID,
+            once the index is built.
+        _schedule_locations_ready (bool): Whether `_schedule_locations` holds every schedule of the hotel.
+        _availability (Dict[RoomTypeEnum, AvailabilityIndex]): Availability index of each room type
+            searched since its rooms last changed.
+        _probe_allowance (Dict[RoomTypeEnum, int]): Busy rooms the searches of each room type without
+            an index may still probe one by one before it is built.
     """
 
     def __init__(self, rooms: List[Room]):
@@ -25,13 +73,53 @@ class Hotel:
 
         Args:
             rooms (List[Room]): A list of Room objects available in the hotel.
+
+        Raises:
+            RoomNumberTaken: If two rooms share a number.
         """
-        self._rooms = rooms
+        super().__init__()
+        self._lock = threading.RLock()
+        self._rooms = RoomRegistry(rooms)
+        self._rooms_view = RoomsView(self._rooms)
+        self._schedule_locations: Dict[int, Tuple[Room, Schedule]] | None = None
+        self._schedule_locations_ready = False
+        self._availability: Dict[RoomTypeEnum, AvailabilityIndex] = {}
+        self._probe_allowance: Dict[RoomTypeEnum, int] = {}
+        for room in self._rooms:
+            room.subscribe(self._on_room_event)
 
     @property
-    def rooms(self) -> List[Room]:
-        """List[Room]: Gets the list of rooms in the hotel."""
-        return self._rooms
+    def rooms(self) -> RoomsView:
+        """RoomsView: Gets a read-only view of the rooms in the hotel, in room number order."""
+        return self._rooms_view
+
+    def get_room(self, number: int) -> Room:
+        """Gets a room of the hotel by its number.
+
+        Args:
+            number (int): The room number.
+
+        Returns:
+            Room: The room with the given number.
+
+        Raises:
+            RoomNotFound: If the hotel has no room with the given number.
+        """
+        room = self._rooms.get(number)
+        if room is None:
+            raise RoomNotFound(f"The hotel has no room {number}")
+        return room
+
+    def rooms_of_type(self, room_type: RoomTypeEnum) -> Tuple[Room, ...]:
+        """Lists the rooms of a type.
+
+        Args:
+            room_type (RoomTypeEnum): The room type.
+
+        Returns:
+            Tuple[Room, ...]: The rooms of the type, in room number order.
+        """
+        return self._rooms.of_type(room_type)
 
     def add_room(self, room: Room):
         """Adds a new room to the hotel.
@@ -39,8 +127,14 @@ class Hotel:
         Args:
             room (Room): The room to add to the hotel.
 
+        Raises:
+            RoomNumberTaken: If the hotel has another room with the same number.
         """
-        self._rooms.append(room)
+        with self._lock:
+            self._register_room(room)
+            if self._schedule_locations is not None:
+                self._locate_schedules_of(room)
+            self._notify("room_added", room=room)
 
     def remove_room(self, room: Room):
         """Removes a room from the hotel if it has no schedules.
@@ -50,11 +144,91 @@ class Hotel:
 
         Raises:
             RoomHasSchedule: If the room has scheduled bookings.
+            RoomNotFound: If the room is not a room of the hotel.
 
         """
-        if len(room.schedules) > 0:
-            raise RoomHasSchedule(f'Room "{room.type.value}-{room.number}" cannot be removed because it has schedules.')
-        self._rooms.remove(room)
+        with self._lock, room.lock:
+            if len(room.schedules) > 0:
+                raise RoomHasSchedule(
+                    f'Room "{room.type.value}-{room.number}" cannot be removed because it has schedules.'
+                )
+            self._unregister_room(room)
+            self._notify("room_removed", room=room)
+
+    def add_rooms(self, rooms: Iterable[Room]) -> None:
+        """Adds many rooms to the hotel at once, all or none of them.
+
+        Listeners are notified with a `"room_added"` event per room, in room number order.
+
+        Args:
+            rooms (Iterable[Room]): The rooms to add to the hotel.
+
+        Raises:
+            RoomNumberTaken: If the hotel has another room with the number of one of the rooms,
+                or if two of the rooms share a number.
+        """
+        rooms = sorted(rooms, key=lambda room: room.number)
+        with self._lock:
+            self._rooms.add_many(rooms)
+            self._drop_availability(*(room.type for room in rooms))
+            Observable.subscribe_all(rooms, self._on_room_event)
+            for room in rooms:
+                if self._schedule_locations is not None:
+                    self._locate_schedules_of(room)
+                self._notify("room_added", room=room)
+
+    def remove_rooms(self, rooms: Iterable[Room]) -> None:
+        """Removes many rooms from the hotel at once, all or none of them.
+
+        The rooms are locked in room number order while they are checked and removed.
+        Listeners are notified with a `"room_removed"` event per room, in room number order.
+
+        Args:
+            rooms (Iterable[Room]): The rooms to remove, none of which may have schedules.
+
+        Raises:
+            RoomHasSchedule: If one of the rooms has scheduled bookings.
+            RoomNotFound: If one of the rooms is not a room of the hotel, or is listed twice.
+        """
+        rooms = sorted(rooms, key=lambda room: room.number)
+        with self._lock, ExitStack() as locks:
+            for room in rooms:
+                locks.enter_context(room.lock)
+                if len(room.schedules) > 0:
+                    raise RoomHasSchedule(
+                        f'Room "{room.type.value}-{room.number}" cannot be removed because it has schedules.'
+                    )
+            self._rooms.remove_many(rooms)
+            self._drop_availability(*(room.type for room in rooms))
+            for room in rooms:
+                room.unsubscribe(self._on_room_event)
+                self._notify("room_removed", room=room)
+
+    def snapshot(self) -> HotelSnapshot:
+        """Opens a consistent, read-only view of the rooms and schedules of the hotel.
+
+        Opening a snapshot copies no room or schedule, it shares the immutable sequence of rooms
+        kept by the registry: rooms changed afterwards keep the state the snapshot reads until it is
+        released. Release it by closing it or by using it as a context manager.
+
+        Returns:
+            HotelSnapshot: The rooms and schedules as of now.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, [])])
+            >>> stay = datetime(2024, 11, 16), datetime(2024, 11, 19)
+            >>> with hotel.snapshot() as snapshot:
+            ...     hotel.schedule_a_room("Client A", RoomTypeEnum.SUITE, *stay)
+            ...     [len(room.schedules) for room in snapshot.rooms]
+            True
+            [0]
+            >>> with hotel.snapshot() as snapshot:
+            ...     [len(room.schedules) for room in snapshot.rooms]
+            [1]
+        """
+        with self._lock:
+            return HotelSnapshot(self._rooms.ordered())
 
     def check_room_type_availability(self, room_type: RoomTypeEnum) -> Room | None:
         """Checks if there is a room of the specified type available.
@@ -69,11 +243,84 @@ class Hotel:
             RoomTypeNotAvailable: If no room of the specified type is available.
 
         """
-        for room in self._rooms:
-            if room_type == room.type:
-                return room
+        room = self._rooms.first_of_type(room_type)
+        if room is not None:
+            return room
         raise RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
 
+    def find_available_room(self, room_type: RoomTypeEnum, period: Period) -> Room | None:
+        """Finds a room of the specified type that is free during the whole period.
+
+        Only the rooms registered under the requested type are probed, each one
+        through its interval index.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the room must be free for.
+
+        Returns:
+            Room | None: A free room of the specified type, or None if all of them are booked.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+
+        """
+        rooms = self.find_available_rooms(room_type, period, limit=1)
+        return rooms[0] if rooms else None
+
+    def available_windows(
+        self, room_type: RoomTypeEnum, start: datetime, end: datetime, min_nights: int = 1
+    ) -> Dict[Room, List[Period]]:
+        """Lists the free windows of every room of the specified type between two dates.
+
+        Each room answers with a single sweep over its sorted schedules, see
+        `Room.available_windows`.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_nights (int, optional): Shortest window to report, in nights. Defaults to 1.
+
+        Returns:
+            Dict[Room, List[Period]]: The free windows of each room of the type, in room number order.
+                Fully booked rooms map to an empty list.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+            InvalidPeriodError: If the start date is after the end date.
+        """
+        if start > end:
+            raise InvalidPeriodError("Start date must be before end date.")
+        rooms = self._rooms.of_type(room_type)
+        if not rooms:
+            raise RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
+        return {room: room.available_windows(start, end, min_nights) for room in rooms}
+
+    def find_available_rooms(self, room_type: RoomTypeEnum, period: Period, limit: int | None = None) -> List[Room]:
+        """Finds the rooms of the specified type that are free during the whole period.
+
+        Only the rooms of the type are probed, each through its interval index, in room number
+        order until `limit` free rooms are found, whatever the size of the hotel. Once searches
+        of the type have met enough busy rooms to pay for it, its availability index skips
+        groups of rooms booked on a common day of the period: a search then costs
+        O(r log k + c log m) for r free rooms out of k rooms holding m bookings each, c of them
+        probed. Rooms booked only on days the period shares partly, e.g. from noon, cannot be
+        skipped and are probed too.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the rooms must be free for.
+            limit (int | None, optional): Maximum number of rooms to return. Defaults to no limit.
+
+        Returns:
+            List[Room]: The free rooms of the specified type, in room number order.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+        """
+        return self._search(room_type, period, lambda room: room.is_period_available(period), limit)
+
     def schedule_a_room(
         self,
         client_name: str,
@@ -93,16 +340,336 @@ class Hotel:
             bool: True if the booking was successful.
 
         Raises:
-            RoomNotAvailable: If no room is available for the specified period.
+            RoomTypeNotAvailable: If the hotel has no room of the requested type.
+            RoomNotAvailable: If no room of the requested type is available for the specified period.
 
         """
-        room = self.check_room_type_availability(room_type)
         period = Period(start_date, end_date)
-
-        if room.is_period_available(period):
-            schedule = Schedule(client_name, period)
-            room.add_schedule(schedule)
+        if self._search(room_type, period, lambda room: self.book_room(room, room_type, client_name, period), 1):
             return True
         raise RoomNotAvailable(
-            f'"{room.type.value}" is not available from {format_date(start_date)} to {format_date(end_date)}'
+            f'"{room_type.value}" is not available from {format_date(start_date)} to {format_date(end_date)}'
         )
+
+    def schedule_many(self, requests: Iterable[Tuple[str, RoomTypeEnum, datetime, datetime]]) -> List[Room | Exception]:
+        """Schedules a batch of bookings, reporting the outcome of each one.
+
+        The batch is grouped by room type and swept by start date: the type lookup happens
+        once per group, conflicts inside the batch are resolved by tracking when each room
+        becomes free, and conflicts with existing schedules through each room's interval
+        index. A failed booking does not stop the batch.
+
+        Args:
+            requests (Iterable[Tuple[str, RoomTypeEnum, datetime, datetime]]): Bookings given as
+                `(client_name, room_type, start_date, end_date)`, as in `schedule_a_room`.
+
+        Returns:
+            List[Room | Exception]: For each request, in the given order, the room that was booked
+                or the exception `schedule_a_room` would have raised for it.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, [])])
+            >>> results = hotel.schedule_many([
+            ...     ("Charlie", RoomTypeEnum.SUITE, datetime(2024, 11, 16), datetime(2024, 11, 19)),
+            ...     ("Vaggie", RoomTypeEnum.SUITE, datetime(2024, 11, 18), datetime(2024, 11, 20)),
+            ...     ("Angel", RoomTypeEnum.BUNGALOW, datetime(2024, 11, 16), datetime(2024, 11, 19)),
+            ... ])
+            >>> [type(result).__name__ for result in results]
+            ['Room', 'RoomNotAvailable', 'RoomTypeNotAvailable']
+        """
+        requests = list(requests)
+        results: List[Room | Exception] = [None] * len(requests)
+
+        batches: Dict[RoomTypeEnum, List[Tuple[datetime, int]]] = {}
+        for position, (_, room_type, start_date, _) in enumerate(requests):
+            batches.setdefault(room_type, []).append((start_date, position))
+
+        for room_type, batch in batches.items():
+            rooms = self._rooms.of_type(room_type)
+            if not rooms:
+                for _, position in batch:
+                    results[position] = RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
+                continue
+
+            batch.sort()
+            # Rooms keyed by the end of their latest booking in this batch: since the batch is
+            # swept by start date, a room whose latest end is not before the start is busy, and
+            # the heap top is the only candidate unless an existing schedule gets in the way.
+            # Rooms not booked yet are free from just before the first start, which keeps
+            # timezone-aware and naive batches comparable.
+            first_free = batch[0][0] - timedelta.resolution
+            free_from = [(first_free, order, room) for order, room in enumerate(rooms)]
+            for _, position in batch:
+                client_name, _, start_date, end_date = requests[position]
+                try:
+                    period = Period(start_date, end_date)
+                except InvalidPeriodError as error:
+                    results[position] = error
+                    continue
+
+                skipped = []
+                while free_from and free_from[0][0] < start_date:
+                    candidate = heapq.heappop(free_from)
+                    room = candidate[2]
+                    if self.book_room(room, room_type, client_name, period):
+                        heapq.heappush(free_from, (end_date, candidate[1], room))
+                        results[position] = room
+                        break
+                    skipped.append(candidate)
+                else:
+                    results[position] = RoomNotAvailable(
+                        f'"{room_type.value}" is not available from '
+                        f"{format_date(start_date)} to {format_date(end_date)}"
+                    )
+                for candidate in skipped:
+                    heapq.heappush(free_from, candidate)
+        return results
+
+    def book_room(self, room: Room, room_type: RoomTypeEnum, client_name: str, period: Period) -> bool:
+        """Books a specific room if it is still a hotel room of the requested type and is free.
+
+        The check and the booking happen under the room lock, so concurrent bookings of
+        the same room cannot both succeed.
+
+        Args:
+            room (Room): The room to book.
+            room_type (RoomTypeEnum): The type of room requested.
+            client_name (str): The name of the client making the booking.
+            period (Period): The booking period.
+
+        Returns:
+            bool: True if the room was booked, False if it was taken, removed or retyped meanwhile.
+        """
+        with room.lock:
+            if not self._rooms.has_type(room, room_type) or not room.is_period_available(period):
+                return False
+            room.add_schedule(Schedule(client_name, period))
+            return True
+
+    def get_schedule(self, schedule_id: int) -> Schedule:
+        """Gets a booked schedule by its ID.
+
+        Args:
+            schedule_id (int): ID of the schedule.
+
+        Returns:
+            Schedule: The schedule with the given ID.
+
+        Raises:
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        return self._locate_schedule(schedule_id)[1]
+
+    def update_schedule(self, schedule: Schedule, schedule_id: int) -> None:
+        """Replaces a booked schedule, as `Room.update_schedule` does, in the room holding it.
+
+        Args:
+            schedule (Schedule): New schedule details.
+            schedule_id (int): ID of the schedule to update.
+
+        Raises:
+            ScheduleCannotBeOverwritten: If the new period is not available in the room.
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        room, _ = self._locate_schedule(schedule_id)
+        room.update_schedule(schedule, schedule_id)
+
+    def cancel_schedule(self, schedule_id: int) -> Schedule:
+        """Cancels a booked schedule, freeing its period in the room holding it.
+
+        Args:
+            schedule_id (int): ID of the schedule to cancel.
+
+        Returns:
+            Schedule: The cancelled schedule.
+
+        Raises:
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        room, _ = self._locate_schedule(schedule_id)
+        return room.cancel_schedule(schedule_id)
+
+    def _locate_schedule(self, schedule_id: int) -> Tuple[Room, Schedule]:
+        """Looks a schedule up in the hotel-wide index, building the index on first use.
+
+        Args:
+            schedule_id (int): ID of the schedule.
+
+        Returns:
+            Tuple[Room, Schedule]: The room holding the schedule and the schedule.
+
+        Raises:
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        if not self._schedule_locations_ready:
+            with self._lock:
+                if not self._schedule_locations_ready:
+                    # Events fired while the index is filled update it too, so the index is
+                    # published first and each room is read under its lock.
+                    self._schedule_locations = {}
+                    for room in self._rooms:
+                        self._locate_schedules_of(room)
+                    self._schedule_locations_ready = True
+        location = self._schedule_locations.get(schedule_id)
+        if location is None:
+            raise ScheduleNotFound(f"Schedule {schedule_id} is not booked in this hotel")
+        return location
+
+    def _locate_schedules_of(self, room: Room) -> None:
+        with room.lock:
+            for schedule in room.schedules:
+                self._schedule_locations[schedule.id] = (room, schedule)
+
+    def _search(
+        self, room_type: RoomTypeEnum, period: Period, probe: Callable[[Room], bool], limit: int | None
+    ) -> List[Room]:
+        """Probes the rooms of a type that may be free during a period, in room number order.
+
+        Without an index of the type, the rooms are probed one by one until the allowance of busy
+        rooms of the type is spent; the index is then built and the search carries on through it.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the rooms must be free for.
+            probe (Callable[[Room], bool]): Checks, or books, a room, returning whether it was free.
+            limit (int | None): Number of free rooms after which to stop, or None to probe every room.
+
+        Returns:
+            List[Room]: The rooms found free, in room number order.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+        """
+        rooms = self._rooms.of_type(room_type)
+        if not rooms:
+            raise RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
+        index = self._availability.get(room_type)
+        candidates = iter(rooms) if index is None else index.candidates(period)
+        allowance = self._probe_allowance.get(room_type)
+        if index is None and allowance is None:
+            allowance = len(rooms) + sum(len(room.schedules) for room in rooms)
+        found = []
+        busy = 0
+        last = None
+        for room in candidates:
+            if probe(room):
+                found.append(room)
+                if len(found) == limit:
+                    break
+            elif index is None:
+                busy += 1
+                if busy >= allowance:
+                    last = room.number
+                    break
+        if last is None:
+            if index is None:
+                self._probe_allowance[room_type] = allowance - busy
+            return found
+
+        # Carry on through the index, from the room after the last one probed.
+        for room in dropwhile(
+            lambda room: room.number <= last, self._availability_of(room_type, period).candidates(period)
+        ):
+            if probe(room):
+                found.append(room)
+                if len(found) == limit:
+                    break
+        return found
+
+    def _availability_of(self, room_type: RoomTypeEnum, period: Period) -> AvailabilityIndex:
+        """Gets the availability index of a room type, building it on first use.
+
+        Args:
+            room_type (RoomTypeEnum): The room type.
+            period (Period): The searched period.
+
+        Returns:
+            AvailabilityIndex: The index of the rooms of the type.
+        """
+        index = self._availability.get(room_type)
+        if index is None:
+            with self._lock:
+                index = self._availability.get(room_type)
+                if index is None:
+                    rooms = self._rooms.of_type(room_type)
+                    # Events fired while the index is filled update it too, so the index is
+                    # published first and each room is read under its lock.
+                    index = self._availability[room_type] = AvailabilityIndex(rooms, period.start)
+                    for room in rooms:
+                        index.fill(room)
+        return index
+
+    def _update_availability(self, event: str, room: Room, details: dict) -> None:
+        """Records a change of the bookings of a room in the availability index of its type."""
+        index = self._availability.get(room.type)
+        if index is None:
+            return
+        if event == "schedule_added":
+            period = details["schedule"].period
+            index.update(room, booked=[(period.start, period.end)])
+        elif event == "schedule_cancelled":
+            period = details["schedule"].period
+            index.update(room, freed=[(period.start, period.end)])
+        elif event == "schedule_updated":
+            old, new = details["old_schedule"].period, details["new_schedule"].period
+            index.update(room, booked=[(new.start, new.end)], freed=[(old.start, old.end)])
+        elif event == "period_changed":
+            period = details["schedule"].period
+            index.update(room, booked=[(period.start, period.end)], freed=[(details["old_start"], details["old_end"])])
+
+    def _drop_availability(self, *room_types: RoomTypeEnum) -> None:
+        """Drops the availability indexes of room types whose rooms changed. Must be called with `_lock` held."""
+        for room_type in room_types:
+            self._availability.pop(room_type, None)
+            self._probe_allowance.pop(room_type, None)
+
+    def _register_room(self, room: Room) -> None:
+        """Adds a room to the registry and follows its changes.
+
+        Args:
+            room (Room): The room to register.
+
+        Raises:
+            RoomNumberTaken: If the hotel has another room with the same number.
+        """
+        self._rooms.add(room)
+        self._drop_availability(room.type)
+        room.subscribe(self._on_room_event)
+
+    def _unregister_room(self, room: Room) -> None:
+        """Removes a room from the registry and stops following it.
+
+        Args:
+            room (Room): The room to unregister.
+
+        Raises:
+            RoomNotFound: If the room is not a room of the hotel.
+        """
+        self._rooms.remove(room)
+        self._drop_availability(room.type)
+        room.unsubscribe(self._on_room_event)
+
+    def _on_room_event(self, event: str, room: Room, **details) -> None:
+        """Keeps the type registry in sync with changes made directly on a room and forwards them.
+
+        Args:
+            event (str): Name of the room event.
+            room (Room): The room that changed.
+            **details: Event details.
+        """
+        if event == "type_changed":
+            with self._lock:
+                self._rooms.retype(room, details["old_type"], details["new_type"])
+                self._drop_availability(details["old_type"], details["new_type"])
+        else:
+            self._update_availability(event, room, details)
+            if self._schedule_locations is not None:
+                if event == "schedule_added":
+                    self._schedule_locations[details["schedule"].id] = (room, details["schedule"])
+                elif event == "schedule_updated":
+                    self._schedule_locations.pop(details["old_schedule"].id, None)
+                    self._schedule_locations[details["new_schedule"].id] = (room, details["new_schedule"])
+                elif event == "schedule_cancelled":
+                    self._schedule_locations.pop(details["schedule"].id, None)
+        self._notify(event, room=room, **details)
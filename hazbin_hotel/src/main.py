@@ -1,26 +1,43 @@
-from datetime import datetime
+import argparse
+import os
+import sys
+from datetime import datetime, time, timedelta
 
+from hazbin_hotel.src.commands import CommandProcessor, run_batch, serve
 from hazbin_hotel.src.enums.types import RoomTypeEnum
 from hazbin_hotel.src.hotel import Hotel
 from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.persistence import HotelStore
 from hazbin_hotel.src.room import Room
-from hazbin_hotel.src.schedule import Schedule
 
+DATA_DIRECTORY = os.environ.get("HAZBIN_HOTEL_DATA", "hazbin_hotel_data")
+AVAILABILITY_HORIZON = timedelta(days=30)
 
-def hotel_setup() -> Hotel:
-    rooms = [
+
+def default_rooms() -> list:
+    return [
         Room(RoomTypeEnum.FAMILY, 1000, []),
         Room(RoomTypeEnum.DELUXE, 1300, []),
         Room(RoomTypeEnum.SUITE, 1450, []),
     ]
 
-    return Hotel(rooms)
+
+def hotel_setup(store: HotelStore | None = None) -> Hotel:
+    if store is None:
+        return Hotel(default_rooms())
+
+    hotel = store.load()
+    if not hotel.rooms:
+        for room in default_rooms():
+            hotel.add_room(room)
+
+    return hotel
 
 
 def book_a_room(hotel: Hotel):
     name = input("Whats your name? ")
 
-    rooms = check_hotel_rooms(hotel)
+    check_hotel_rooms(hotel)
     chosen_room = input("Choose a Room: ")
 
     try:
@@ -30,8 +47,9 @@ def book_a_room(hotel: Hotel):
         print("Please enter a valid number.")
         return
 
-    if chosen_room - 1 < len(hotel.rooms):
-        available_dates = check_available_dates()
+    room = hotel.rooms.get(chosen_room)
+    if room is not None:
+        available_dates = check_available_dates(hotel, room)
         chosen_date = input("Choose a date: ")
 
         try:
@@ -41,15 +59,18 @@ def book_a_room(hotel: Hotel):
             print("Please enter a valid number.")
             return
 
-        if chosen_date - 1 < len(available_dates):
-            print(f"Your book has been confirmed! Thank you {name}")
-
-            room = rooms[chosen_room - 1]
-            print(f"Room: {room.type.value} - R$ {room.price}")
+        if 1 <= chosen_date <= len(available_dates):
+            window = available_dates[chosen_date - 1]
+            date = choose_stay(window)
+            if date is None:
+                return
 
-            date = available_dates[chosen_date - 1]
+            if not hotel.book_room(room, room.type, name, Period(date["start_date"], date["end_date"])):
+                print("The room was booked meanwhile, please choose another date.")
+                return
 
-            room.add_schedule(create_schedule(name, date))
+            print(f"Your book has been confirmed! Thank you {name}")
+            print(f"Room: {room.type.value} - R$ {room.price}")
             print(f"Date: {date['start_date'].date()} -> {date['end_date'].date()}\n")
 
             return
@@ -57,33 +78,41 @@ def book_a_room(hotel: Hotel):
     print("Invalid options.")
 
 
-def create_schedule(name: str, date: dict):
-    period = Period(date["start_date"], date["end_date"])
-    schedule = Schedule(name, period)
+def choose_stay(window: dict) -> dict | None:
+    """Asks for the check-in and check-out dates of a stay inside a free window.
 
-    return schedule
+    Args:
+        window (dict): The free window, with its `start_date` and `end_date`.
 
+    Returns:
+        dict | None: The stay, with its `start_date` and `end_date`, or None if the dates are invalid.
+    """
+    try:
+        start_date = datetime.strptime(input("Check-in date (YYYY-MM-DD): "), "%Y-%m-%d")
+        end_date = datetime.strptime(input("Check-out date (YYYY-MM-DD): "), "%Y-%m-%d")
+        print()
+    except ValueError:
+        print("Please enter a valid date.")
+        return None
 
-def get_available_dates():
-    date_format = "%d/%m/%Y"
+    if not window["start_date"] <= start_date <= end_date <= window["end_date"]:
+        print(f"Please choose dates between {window['start_date'].date()} and {window['end_date'].date()}.")
+        return None
 
-    available_dates = [
-        {"start_date": "16/11/2024", "end_date": "19/11/2024"},
-        {"start_date": "21/11/2024", "end_date": "26/11/2024"},
-        {"start_date": "23/11/2024", "end_date": "27/11/2024"},
-    ]
+    return {"start_date": start_date, "end_date": end_date}
 
-    for date_range in available_dates:
-        date_range["start_date"] = datetime.strptime(date_range["start_date"], date_format)
-        date_range["end_date"] = datetime.strptime(date_range["end_date"], date_format)
 
-    return available_dates
+def get_available_dates(hotel: Hotel, room: Room) -> list:
+    start_date = datetime.combine(datetime.today(), time())
+    windows = hotel.available_windows(room.type, start_date, start_date + AVAILABILITY_HORIZON)
 
+    return [{"start_date": window.start, "end_date": window.end} for window in windows.get(room, [])]
 
-def check_available_dates() -> list:
-    available_dates = get_available_dates()
 
-    print("------ Available Dates ------")
+def check_available_dates(hotel: Hotel, room: Room) -> list:
+    available_dates = get_available_dates(hotel, room)
+
+    print(f"------ Available Dates: {room.type.value} ------")
     for index, date in enumerate(available_dates):
         print(f"{index + 1}. {date['start_date'].date()} -> {date['end_date'].date()}")
     print()
@@ -93,16 +122,14 @@ def check_available_dates() -> list:
 
 def check_hotel_rooms(hotel: Hotel) -> list:
     print("------ Available Rooms ------")
-    for index, room in enumerate(hotel.rooms):
-        print(f"{index + 1} - {room.type.value} - R$ {room.price}")
+    for room in hotel.rooms:
+        print(f"{room.number} - {room.type.value} - R$ {room.price}")
     print()
     return hotel.rooms
 
 
-if __name__ == "__main__":
+def interactive(hotel: Hotel):
     print("Welcome to Hazbin Hotel")
-
-    hotel = hotel_setup()
     need_to_stop = False
 
     while not need_to_stop:
@@ -120,8 +147,59 @@ if __name__ == "__main__":
             case "2":
                 check_hotel_rooms(hotel)
             case "3":
-                check_available_dates()
+                for room in hotel.rooms:
+                    check_available_dates(hotel, room)
             case "4":
                 need_to_stop = True
-            case default:
+            case _:
                 print("Option not available")
+
+
+def parse_address(address: str) -> tuple:
+    """Splits a `[HOST:]PORT` address, the host defaulting to the loopback interface.
+
+    Examples:
+        >>> parse_address("8000"), parse_address("0.0.0.0:8000")
+        (('127.0.0.1', 8000), ('0.0.0.0', 8000))
+    """
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Hazbin Hotel booking system, interactive by default.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--batch",
+        metavar="FILE",
+        nargs="?",
+        const="-",
+        help="run the JSON line commands of FILE, or of stdin, and write the answers to stdout",
+    )
+    mode.add_argument("--serve", metavar="[HOST:]PORT", type=parse_address, help="serve JSON line commands over TCP")
+    arguments = parser.parse_args(argv)
+
+    store = HotelStore(DATA_DIRECTORY)
+    try:
+        hotel = hotel_setup(store)
+        if arguments.batch is None and arguments.serve is None:
+            interactive(hotel)
+        elif arguments.serve is not None:
+            import asyncio
+
+            try:
+                asyncio.run(serve(CommandProcessor(hotel, AVAILABILITY_HORIZON), *arguments.serve))
+            except KeyboardInterrupt:
+                pass
+        elif arguments.batch == "-":
+            run_batch(CommandProcessor(hotel, AVAILABILITY_HORIZON), sys.stdin, sys.stdout)
+        else:
+            with open(arguments.batch) as file:
+                run_batch(CommandProcessor(hotel, AVAILABILITY_HORIZON), file, sys.stdout)
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
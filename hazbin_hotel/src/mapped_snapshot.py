@@ -0,0 +1,339 @@
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import List
+
+from hazbin_hotel.src.enums.types import ROOM_MULTIPLIERS, RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomIsReadOnly
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.observable import Observable
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.schedule_index import free_windows
+from hazbin_hotel.src.utils import from_timestamp, to_timestamp
+
+MAPPED_SNAPSHOT_MAGIC = b"HZBMAP01"
+"""bytes: Signature at the start of every memory-mappable snapshot file."""
+
+_HEADER = struct.Struct("<8sQQQ")  # magic, room count, schedule count, client names size
+_ROOM = struct.Struct("<qd24sQQ")  # number, price, type, first schedule row, schedule count
+_DAY = 24 * 60 * 60 * 1_000_000  # one day in timestamp units (microseconds)
+
+
+def write_mapped_snapshot(hotel: Hotel, path: str) -> None:
+    """Writes the hotel rooms and schedules in the memory-mappable snapshot format.
+
+    The file holds a header, a fixed-size record per room and, for all schedules, int64
+    columns of start timestamps, end timestamps, IDs and client name offsets followed by
+    the UTF-8 client names. The schedules of each room are contiguous and sorted by start
+    date, so they can be searched in place once the file is mapped. The rooms are read
+    from a `Hotel.snapshot`, so bookings made meanwhile never tear the file, and the file
+    is replaced atomically.
+
+    Args:
+        hotel (Hotel): The hotel to write.
+        path (str): Destination file.
+    """
+    with hotel.snapshot() as snapshot:
+        rooms = snapshot.rooms
+    room_records = bytearray()
+    starts, ends, ids, name_offsets = array("q"), array("q"), array("q"), array("q", [0])
+    names = bytearray()
+
+    for room in rooms:
+        schedules = sorted(room.schedules, key=lambda schedule: schedule.start)
+        room_records += _ROOM.pack(room.number, room.price, room.type.value.encode(), len(ids), len(schedules))
+        for schedule in schedules:
+            starts.append(to_timestamp(schedule.start))
+            ends.append(to_timestamp(schedule.end))
+            ids.append(schedule.id)
+            names += schedule.client_name.encode("utf-8")
+            name_offsets.append(len(names))
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_HEADER.pack(MAPPED_SNAPSHOT_MAGIC, len(rooms), len(ids), len(names)))
+        file.write(room_records)
+        for column in (starts, ends, ids, name_offsets):
+            file.write(column.tobytes())
+        file.write(names)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def _timestamp_period(start: int, end: int) -> Period:
+    return Period(from_timestamp(start), from_timestamp(end))
+
+
+class MappedSnapshot:
+    """Read-only hotel served straight from a memory-mapped snapshot file.
+
+    Opening a snapshot only reads the header and the room records; schedules stay in the
+    mapped file and are searched in place. Use it as a context manager, or call `close`
+    once the rooms are no longer needed.
+
+    Attributes:
+        path (str): The mapped snapshot file.
+        rooms (List[MappedRoom]): The rooms stored in the snapshot.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Maps a snapshot written by `write_mapped_snapshot`.
+
+        Args:
+            path (str): The snapshot file.
+
+        Raises:
+            ValueError: If the file is not a mapped snapshot, or if its size or room records do
+                not match its header, e.g. a truncated file.
+        """
+        self.path = path
+        self._last_bounds = (None, None, 0, 0)
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f'"{path}" is not a mapped snapshot.')
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, room_count, schedule_count, names_size = _HEADER.unpack_from(self._map, 0)
+        if magic != MAPPED_SNAPSHOT_MAGIC:
+            self._map.close()
+            raise ValueError(f'"{path}" is not a mapped snapshot.')
+        size = _HEADER.size + room_count * _ROOM.size + (4 * schedule_count + 1) * 8 + names_size
+        if size != len(self._map):
+            message = f'Mapped snapshot "{path}" holds {len(self._map)} bytes, its header describes {size}.'
+            self._map.close()
+            raise ValueError(message)
+
+        view = memoryview(self._map)
+        offset = _HEADER.size + room_count * _ROOM.size
+        columns = []
+        for length in (schedule_count, schedule_count, schedule_count, schedule_count + 1):
+            columns.append(view[offset : offset + length * 8].cast("q"))
+            offset += length * 8
+        self._starts, self._ends, self._ids, self._name_offsets = columns
+        self._names = view[offset : offset + names_size]
+        self._views = [view, *columns, self._names]
+
+        try:
+            self.rooms = self._read_rooms(room_count, schedule_count)
+            if self._name_offsets[0] != 0 or self._name_offsets[schedule_count] != names_size:
+                raise ValueError(f'Client names of mapped snapshot "{path}" do not match its header.')
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_rooms(self, room_count: int, schedule_count: int) -> List["MappedRoom"]:
+        """Reads the room records, checking that their schedules are within the file.
+
+        Raises:
+            ValueError: If a room has schedules past the last one, or an unknown type.
+        """
+        rooms = []
+        for number, price, room_type, first, count in _ROOM.iter_unpack(
+            self._map[_HEADER.size : _HEADER.size + room_count * _ROOM.size]
+        ):
+            if first + count > schedule_count:
+                raise ValueError(f'Room {number} of mapped snapshot "{self.path}" has schedules past the last one.')
+            room_type = RoomTypeEnum(room_type.rstrip(b"\0").decode())
+            rooms.append(MappedRoom(self, number, room_type, price, first, first + count))
+        return rooms
+
+    def _timestamps(self, period: Period) -> tuple:
+        """Converts the bounds of a period to timestamps, remembering the last conversion.
+
+        A hotel-wide search probes many rooms with the same period, so this saves one pair
+        of conversions per room after the first one. The conversion is remembered as a
+        single tuple, so threads searching the snapshot never mix the bounds of two periods.
+
+        Args:
+            period (Period): The period to convert.
+
+        Returns:
+            tuple: The start and end timestamps of the period.
+        """
+        start, end = period.start, period.end
+        bounds = self._last_bounds
+        if bounds[0] != start or bounds[1] != end:
+            bounds = self._last_bounds = (start, end, to_timestamp(start), to_timestamp(end))
+        return bounds[2], bounds[3]
+
+    def hotel(self) -> Hotel:
+        """Builds a `Hotel` answering availability queries from the mapped rooms.
+
+        Returns:
+            Hotel: A hotel over the mapped rooms. Booking raises `RoomIsReadOnly`.
+        """
+        return Hotel(list(self.rooms))
+
+    def close(self) -> None:
+        """Unmaps the snapshot. The mapped rooms cannot be queried afterwards."""
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+    def __enter__(self) -> "MappedSnapshot":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class MappedRoom(Observable):
+    """Read-only room whose schedules live in a `MappedSnapshot`.
+
+    It offers the query side of `Room`: availability checks run a binary search over the
+    mapped start and end timestamps, and `Schedule` objects are only built when
+    `schedules` is read.
+
+    Attributes:
+        number (int): The unique identifier of the room.
+        _snapshot (MappedSnapshot): The snapshot holding the schedules.
+        _first (int): First schedule row of the room in the snapshot.
+        _stop (int): Row after the last schedule of the room.
+    """
+
+    def __init__(
+        self, snapshot: MappedSnapshot, number: int, room_type: RoomTypeEnum, price: float, first: int, stop: int
+    ) -> None:
+        super().__init__()
+        self.number = number
+        self._snapshot = snapshot
+        self._type = room_type
+        self._price = price
+        self._first = first
+        self._stop = stop
+        self._schedules = None
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """threading.RLock: Gets the lock of the room, as `Room.lock` does."""
+        return self._lock
+
+    @property
+    def type(self) -> RoomTypeEnum:
+        """RoomTypeEnum: Gets the type of the room."""
+        return self._type
+
+    @property
+    def price(self) -> float:
+        """float: Gets the base price of the room."""
+        return self._price
+
+    @property
+    def multiplier_factor_price(self) -> float:
+        """float: Gets the multiplier factor for the room price based on room type."""
+        return ROOM_MULTIPLIERS[self._type]
+
+    @property
+    def schedules(self) -> List[Schedule]:
+        """List[Schedule]: Gets the schedules of the room, built from the snapshot on first access."""
+        with self._lock:
+            if self._schedules is None:
+                self._schedules = self._build_schedules()
+        return self._schedules
+
+    def _build_schedules(self) -> List[Schedule]:
+        snapshot = self._snapshot
+        schedules = []
+        for row in range(self._first, self._stop):
+            client_name = bytes(snapshot._names[snapshot._name_offsets[row] : snapshot._name_offsets[row + 1]]).decode(
+                "utf-8"
+            )
+            schedule = Schedule(
+                client_name, Period(from_timestamp(snapshot._starts[row]), from_timestamp(snapshot._ends[row]))
+            )
+            schedule.id = snapshot._ids[row]
+            schedules.append(schedule)
+        return schedules
+
+    def is_period_available(
+        self,
+        period: Period,
+        *,
+        ignore_schedule: bool = False,
+        schedule_id: int = None,
+    ) -> bool:
+        """Checks if a given period is available, as `Room.is_period_available` does.
+
+        Args:
+            period (Period): The period to check.
+            ignore_schedule (bool, optional): Whether to ignore a specific schedule. Defaults to False.
+            schedule_id (int, optional): ID of the schedule to ignore if `ignore_schedule` is True.
+
+        Returns:
+            bool: True if the period is available, False otherwise.
+
+        Raises:
+            ValueError: If `ignore_schedule` is True but `schedule_id` is None.
+        """
+        if ignore_schedule and schedule_id is None:
+            raise ValueError("Schedule ID is missing")
+
+        snapshot = self._snapshot
+        start, end = snapshot._timestamps(period)
+        position = bisect_right(snapshot._starts, end, self._first, self._stop) - 1
+        if ignore_schedule and position >= self._first and snapshot._ids[position] == schedule_id:
+            position -= 1
+        return position < self._first or snapshot._ends[position] < start
+
+    def available_windows(self, start: datetime, end: datetime, min_nights: int = 1) -> List[Period]:
+        """Lists the free windows of the room between two dates, as `Room.available_windows` does.
+
+        Args:
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_nights (int, optional): Shortest window to report, in nights. Defaults to 1.
+
+        Returns:
+            List[Period]: The free windows of the room, in date order.
+        """
+        snapshot = self._snapshot
+        return free_windows(
+            snapshot._starts,
+            snapshot._ends,
+            to_timestamp(start),
+            to_timestamp(end),
+            min_nights * _DAY,
+            _DAY,
+            self._first,
+            self._stop,
+            window=_timestamp_period,
+        )
+
+    def add_schedule(self, schedule: Schedule):
+        """Mapped rooms cannot take bookings.
+
+        Raises:
+            RoomIsReadOnly: Always.
+        """
+        raise RoomIsReadOnly(f'Room "{self._type.value}-{self.number}" is read-only.')
+
+    def update_schedule(self, schedule: Schedule, schedule_id: int):
+        """Mapped rooms cannot change bookings.
+
+        Raises:
+            RoomIsReadOnly: Always.
+        """
+        raise RoomIsReadOnly(f'Room "{self._type.value}-{self.number}" is read-only.')
+
+    def cancel_schedule(self, schedule_id: int):
+        """Mapped rooms cannot cancel bookings.
+
+        Raises:
+            RoomIsReadOnly: Always.
+        """
+        raise RoomIsReadOnly(f'Room "{self._type.value}-{self.number}" is read-only.')
+
+    def update_price(self, new_price: float):
+        """Mapped rooms cannot change price.
+
+        Raises:
+            RoomIsReadOnly: Always.
+        """
+        raise RoomIsReadOnly(f'Room "{self._type.value}-{self.number}" is read-only.')
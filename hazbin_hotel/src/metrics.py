@@ -0,0 +1,269 @@
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Tuple
+
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2)
+"""tuple: Upper bounds, in seconds, of the latency histogram buckets."""
+
+EXAMINED_BUCKETS = (1, 2, 4, 8, 12, 16, 20, 24, 32)
+"""tuple: Upper bounds of the schedules-examined histogram buckets."""
+
+INSTRUMENTED = (
+    (Hotel, "schedule_a_room"),
+    (Room, "is_period_available"),
+    (Room, "add_schedule"),
+    (Room, "update_schedule"),
+)
+"""tuple: The (class, method) pairs wrapped while metrics are enabled."""
+
+
+class Histogram:
+    """Cumulative histogram of observed values, in the Prometheus layout.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the buckets; a last, unbounded bucket is implied.
+        counts (List[int]): Observations per bucket, the last one counting values above every bound.
+        count (int): Number of observations.
+        sum (float): Sum of the observed values.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records a value. Callers serialize observations.
+
+        Args:
+            value (float): The observed value.
+
+        Examples:
+            >>> histogram = Histogram((1, 5))
+            >>> for value in (0.5, 3, 3, 10):
+            ...     histogram.observe(value)
+            >>> histogram.cumulative_counts(), histogram.count, histogram.sum
+            ([1, 3, 4], 4, 16.5)
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        """Counts of observations up to each bound, the last one being the total count.
+
+        Returns:
+            List[int]: Cumulative count per bucket.
+        """
+        cumulative, total = [], 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class Metrics:
+    """Optional instrumentation of the booking hot path.
+
+    While enabled, `Hotel.schedule_a_room`, `Room.is_period_available`, `Room.add_schedule` and
+    `Room.update_schedule` are wrapped to record, per operation, a latency histogram (whose
+    count is the number of calls) and the exceptions raised, by type, e.g. `RoomNotAvailable`,
+    `RoomTypeNotAvailable` or `ScheduleCannotBeOverwritten`. Availability checks also record
+    how many schedules the interval index examines: the binary-search comparisons plus the
+    candidate schedule, about log2(n) + 1 for a room with n schedules.
+
+    Disabled metrics restore the original methods, so instrumentation costs nothing when off.
+    The wrappers are installed on the classes, so they apply to every hotel and room of the
+    process and only one `Metrics` can be enabled at a time.
+
+    Attributes:
+        latencies (Dict[str, Histogram]): Latency histogram of each operation, in seconds.
+        rejections (Dict[Tuple[str, str], int]): Exceptions raised, by operation and exception type name.
+        examined (Histogram): Schedules examined per availability check.
+        _originals (Dict[Tuple[type, str], Callable]): Methods replaced while enabled.
+        _lock (threading.Lock): Lock serializing updates of the recorded values.
+    """
+
+    _enabled: "Metrics | None" = None
+    _enabled_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initializes empty, disabled metrics."""
+        self.latencies = {f"{cls.__name__}.{name}": Histogram(LATENCY_BUCKETS) for cls, name in INSTRUMENTED}
+        self.rejections: Dict[Tuple[str, str], int] = {}
+        self.examined = Histogram(EXAMINED_BUCKETS)
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Metrics":
+        self.enable()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Whether these metrics are recording."""
+        return Metrics._enabled is self
+
+    def enable(self) -> None:
+        """Starts recording by wrapping the instrumented methods.
+
+        Raises:
+            RuntimeError: If other metrics are already enabled.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> from hazbin_hotel.src.enums.types import RoomTypeEnum
+            >>> from hazbin_hotel.src.period import Period
+            >>> room = Room(RoomTypeEnum.SUITE, 1450, [])
+            >>> with Metrics() as metrics:
+            ...     room.is_period_available(Period(datetime(2024, 11, 16), datetime(2024, 11, 19)))
+            True
+            >>> metrics.latencies["Room.is_period_available"].count
+            1
+        """
+        with Metrics._enabled_lock:
+            if Metrics._enabled is self:
+                return
+            if Metrics._enabled is not None:
+                raise RuntimeError("Other metrics are already enabled.")
+            for cls, name in INSTRUMENTED:
+                original = cls.__dict__[name]
+                self._originals[(cls, name)] = original
+                setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", original))
+            Metrics._enabled = self
+
+    def disable(self) -> None:
+        """Stops recording and restores the original methods. Recorded values are kept."""
+        with Metrics._enabled_lock:
+            if Metrics._enabled is not self:
+                return
+            for (cls, name), original in self._originals.items():
+                setattr(cls, name, original)
+            self._originals.clear()
+            Metrics._enabled = None
+
+    def reset(self) -> None:
+        """Forgets every recorded value."""
+        with self._lock:
+            self.latencies = {name: Histogram(LATENCY_BUCKETS) for name in self.latencies}
+            self.rejections = {}
+            self.examined = Histogram(EXAMINED_BUCKETS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copies the recorded values into plain data.
+
+        Returns:
+            Dict[str, Any]: Per operation, the call count, total and bucketed latencies and the
+                rejections by exception type, plus the schedules examined per availability check.
+        """
+        with self._lock:
+            return {
+                "operations": {
+                    name: {
+                        "calls": histogram.count,
+                        "seconds_total": histogram.sum,
+                        "latency_buckets": _buckets(histogram),
+                        "rejections": {
+                            exception: count
+                            for (operation, exception), count in sorted(self.rejections.items())
+                            if operation == name
+                        },
+                    }
+                    for name, histogram in self.latencies.items()
+                },
+                "availability_schedules_examined": {
+                    "checks": self.examined.count,
+                    "total": int(self.examined.sum),
+                    "buckets": _buckets(self.examined),
+                },
+            }
+
+    def to_json(self) -> str:
+        """Renders `snapshot` as JSON.
+
+        Returns:
+            str: The JSON document.
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Renders the recorded values in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = [
+            "# HELP hotel_operation_duration_seconds Latency of the instrumented hotel operations.",
+            "# TYPE hotel_operation_duration_seconds histogram",
+        ]
+        with self._lock:
+            for name, histogram in self.latencies.items():
+                lines.extend(_histogram_lines("hotel_operation_duration_seconds", histogram, f'operation="{name}"'))
+            lines += [
+                "# HELP hotel_operation_rejections_total Exceptions raised by the instrumented hotel operations.",
+                "# TYPE hotel_operation_rejections_total counter",
+            ]
+            for (operation, exception), count in sorted(self.rejections.items()):
+                lines.append(
+                    f'hotel_operation_rejections_total{{operation="{operation}",exception="{exception}"}} {count}'
+                )
+            lines += [
+                "# HELP hotel_availability_schedules_examined Schedules examined per availability check.",
+                "# TYPE hotel_availability_schedules_examined histogram",
+            ]
+            lines.extend(_histogram_lines("hotel_availability_schedules_examined", self.examined))
+        return "\n".join(lines) + "\n"
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        """Wraps a method to record its latency and the exceptions it raises."""
+        lock = self._lock
+        clock = time.perf_counter
+        is_period_available = name == "Room.is_period_available"
+
+        @functools.wraps(method)
+        def instrumented(*args, **kwargs):
+            began = clock()
+            try:
+                return method(*args, **kwargs)
+            except Exception as error:
+                with lock:
+                    key = (name, type(error).__name__)
+                    self.rejections[key] = self.rejections.get(key, 0) + 1
+                raise
+            finally:
+                elapsed = clock() - began
+                with lock:
+                    # Looked up on each call, as `reset` replaces the histograms.
+                    self.latencies[name].observe(elapsed)
+                    if is_period_available:
+                        self.examined.observe(len(args[0]._schedule_index).bit_length() + 1)
+
+        return instrumented
+
+
+def _buckets(histogram: Histogram) -> Dict[str, int]:
+    """Maps each bucket bound, as a string, to its cumulative count."""
+    bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+    return dict(zip(bounds, histogram.cumulative_counts()))
+
+
+def _histogram_lines(metric: str, histogram: Histogram, labels: str = "") -> List[str]:
+    """Renders a histogram as Prometheus samples."""
+    separator = "," if labels else ""
+    lines = [
+        f'{metric}_bucket{{{labels}{separator}le="{bound}"}} {count}' for bound, count in _buckets(histogram).items()
+    ]
+    braces = f"{{{labels}}}" if labels else ""
+    lines.append(f"{metric}_sum{braces} {histogram.sum}")
+    lines.append(f"{metric}_count{braces} {histogram.count}")
+    return lines
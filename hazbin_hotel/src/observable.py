@@ -0,0 +1,89 @@
+from typing import Any, Callable, Iterable
+
+Listener = Callable[..., Any]
+"""Callable invoked as `listener(event, source, **details)` when an observable changes."""
+
+
+class Observable:
+    """Mixin that lets an object notify subscribed listeners about its changes.
+
+    Listeners are called synchronously, in subscription order, with the event name,
+    the object that changed and keyword details specific to the event.
+
+    The listeners are kept in a tuple that is replaced on every (un)subscription, so
+    notifying needs no copy and objects created in bulk can share the same tuple.
+
+    Attributes:
+        _listeners (Tuple[Listener, ...] | None): Subscribed listeners, None until the first subscription.
+    """
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        """Initializes the observable without listeners."""
+        self._listeners = None
+
+    def subscribe(self, listener: Listener) -> None:
+        """Subscribes a listener to the changes of this object.
+
+        Args:
+            listener (Listener): Callable invoked as `listener(event, source, **details)`.
+
+        Examples:
+            >>> observable = Observable()
+            >>> observable.subscribe(lambda event, source, **details: print(event, details))
+            >>> observable._notify("changed", value=1)
+            changed {'value': 1}
+        """
+        self._listeners = (listener,) if self._listeners is None else self._listeners + (listener,)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """Unsubscribes a previously subscribed listener.
+
+        Args:
+            listener (Listener): The listener to remove.
+
+        Raises:
+            ValueError: If the listener is not subscribed.
+        """
+        listeners = list(self._listeners or ())
+        if listener not in listeners:
+            raise ValueError("Listener is not subscribed.")
+        listeners.remove(listener)
+        self._listeners = tuple(listeners) or None
+
+    @staticmethod
+    def subscribe_all(observables: Iterable["Observable"], listener: Listener) -> None:
+        """Subscribes a listener to many observables at once, e.g. every schedule of a room.
+
+        The observables without listeners share a single listener tuple, so following many
+        new objects costs no allocation per object. The others are subscribed one by one.
+
+        Args:
+            observables (Iterable[Observable]): The observables to follow.
+            listener (Listener): Callable invoked as `listener(event, source, **details)`.
+
+        Examples:
+            >>> observables = [Observable(), Observable()]
+            >>> Observable.subscribe_all(observables, lambda event, source, **details: print(event))
+            >>> observables[1]._notify("changed")
+            changed
+        """
+        shared = (listener,)
+        for observable in observables:
+            if observable._listeners is None:
+                observable._listeners = shared
+            else:
+                observable.subscribe(listener)
+
+    def _notify(self, event: str, **details: Any) -> None:
+        """Calls every subscribed listener with the given event.
+
+        Args:
+            event (str): Name of the event.
+            **details: Event specific details forwarded to the listeners.
+        """
+        listeners = self._listeners
+        if listeners:
+            for listener in listeners:
+                listener(event, self, **details)
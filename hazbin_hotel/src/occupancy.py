@@ -0,0 +1,187 @@
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+
+np = None  # NumPy, imported by the first `OccupancyMatrix` as it is optional and slow to import.
+
+
+def _import_numpy() -> None:
+    """Imports NumPy into the module namespace on first use.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised only without the optional dependency
+            raise ImportError("OccupancyMatrix requires NumPy: poetry install --extras numpy") from None
+        np = numpy
+
+
+class OccupancyMatrix:
+    """Rooms × nights occupancy of a hotel over a fixed season, backed by NumPy.
+
+    A schedule occupies the nights from its start date up to the night before its end
+    date, and at least the night of its start date. Nights outside the season are ignored.
+
+    The matrix is built from every schedule of the hotel in one vectorized pass: the
+    nights of each schedule are marked in a difference array which a cumulative sum turns
+    into per-night booking counts. Afterwards it follows the hotel events, so bookings,
+    cancellations, schedule updates, periods changed in place and added or removed rooms
+    only touch the affected cells.
+
+    Create the matrix before bookings start arriving from other threads: changes made
+    while it is being built may be missed.
+
+    Requires NumPy, which is an optional dependency.
+
+    Attributes:
+        hotel (Hotel): The hotel whose occupancy is tracked.
+        start (datetime): Start of the first night of the season.
+        days (int): Number of nights in the season.
+        _rooms (List[Room]): Rooms in matrix row order.
+        _rows (Dict[Room, int]): Row of each room.
+        _counts (np.ndarray): Bookings per room and night, as uint8.
+        _lock (threading.Lock): Lock serializing updates and reads of the matrix.
+    """
+
+    def __init__(self, hotel: Hotel, start: datetime, days: int) -> None:
+        """Builds the occupancy matrix of a hotel and starts following its changes.
+
+        Args:
+            hotel (Hotel): The hotel to track.
+            start (datetime): Start of the first night of the season.
+            days (int): Number of nights in the season.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If `days` is not positive.
+        """
+        _import_numpy()
+        if days <= 0:
+            raise ValueError("The season must have at least one night.")
+
+        self.hotel = hotel
+        self.start = start
+        self.days = days
+        self._lock = threading.Lock()
+        self._rooms = list(hotel.rooms)
+        self._rows = {room: row for row, room in enumerate(self._rooms)}
+        self._counts = self._build()
+        hotel.subscribe(self._on_hotel_event)
+
+    @property
+    def rooms(self) -> List[Room]:
+        """List[Room]: Gets the rooms in matrix row order."""
+        return list(self._rooms)
+
+    @property
+    def matrix(self) -> "np.ndarray":
+        """np.ndarray: Gets a rooms × nights boolean copy of the occupancy."""
+        with self._lock:
+            return self._counts > 0
+
+    def day_rates(self) -> "np.ndarray":
+        """Computes the share of rooms occupied on each night.
+
+        Returns:
+            np.ndarray: One occupancy rate per night of the season, between 0 and 1.
+        """
+        with self._lock:
+            if not self._rooms:
+                return np.zeros(self.days)
+            return (self._counts > 0).mean(axis=0)
+
+    def room_rates(self) -> Dict[Room, float]:
+        """Computes the share of the season each room is occupied.
+
+        Returns:
+            Dict[Room, float]: The occupancy rate of each room, between 0 and 1.
+        """
+        with self._lock:
+            rates = (self._counts > 0).mean(axis=1)
+            return {room: float(rate) for room, rate in zip(self._rooms, rates)}
+
+    def type_rates(self) -> Dict[RoomTypeEnum, float]:
+        """Computes the occupancy rate of each room type over the season.
+
+        Rooms are grouped by their current type.
+
+        Returns:
+            Dict[RoomTypeEnum, float]: The share of room nights occupied for each type present in the hotel.
+        """
+        with self._lock:
+            occupied = (self._counts > 0).mean(axis=1)
+            types = np.array([room.type.value for room in self._rooms])
+            return {
+                RoomTypeEnum(room_type): float(occupied[types == room_type].mean()) for room_type in np.unique(types)
+            }
+
+    def close(self) -> None:
+        """Stops following the hotel changes."""
+        self.hotel.unsubscribe(self._on_hotel_event)
+
+    def _build(self) -> "np.ndarray":
+        """Builds the booking counts of every room in one vectorized pass."""
+        schedules = [room.schedules for room in self._rooms]
+        periods = [schedule.period for room_schedules in schedules for schedule in room_schedules]
+        rows = np.repeat(np.arange(len(self._rooms)), [len(room_schedules) for room_schedules in schedules])
+        # Night offsets are the only per-schedule work left in Python; timedelta.days floors.
+        first = np.fromiter(((period.start - self.start).days for period in periods), np.int64, len(periods))
+        stop = np.fromiter(((period.end - self.start).days for period in periods), np.int64, len(periods))
+        stop = np.clip(np.maximum(stop, first + 1), 0, self.days)
+        first = np.clip(first, 0, self.days)
+
+        # Difference array: +1 on the first night of each schedule, -1 after its last one.
+        width = self.days + 1
+        size = len(self._rooms) * width
+        difference = np.bincount(rows * width + first, minlength=size) - np.bincount(
+            rows * width + stop, minlength=size
+        )
+        counts = np.cumsum(difference.reshape(len(self._rooms), width)[:, : self.days], axis=1)
+        return counts.astype(np.uint8)
+
+    def _nights(self, schedule: Schedule) -> slice:
+        """Maps a schedule to the slice of season nights it occupies."""
+        return self._nights_between(schedule.period.start, schedule.period.end)
+
+    def _nights_between(self, start: datetime, end: datetime) -> slice:
+        """Maps the bounds of a period to the slice of season nights it occupies."""
+        first = (start - self.start).days
+        stop = max((end - self.start).days, first + 1)
+        return slice(min(max(first, 0), self.days), min(max(stop, 0), self.days))
+
+    def _on_hotel_event(self, event: str, hotel: Hotel, *, room: Room, **details) -> None:
+        """Applies a hotel change to the affected cells of the matrix."""
+        with self._lock:
+            if event == "schedule_added":
+                self._counts[self._rows[room], self._nights(details["schedule"])] += 1
+            elif event == "schedule_cancelled":
+                self._counts[self._rows[room], self._nights(details["schedule"])] -= 1
+            elif event == "schedule_updated":
+                row = self._rows[room]
+                self._counts[row, self._nights(details["old_schedule"])] -= 1
+                self._counts[row, self._nights(details["new_schedule"])] += 1
+            elif event == "period_changed":
+                row = self._rows[room]
+                self._counts[row, self._nights_between(details["old_start"], details["old_end"])] -= 1
+                self._counts[row, self._nights(details["schedule"])] += 1
+            elif event == "room_added":
+                self._rows[room] = len(self._rooms)
+                self._rooms.append(room)
+                self._counts = np.vstack([self._counts, np.zeros((1, self.days), dtype=np.uint8)])
+                for schedule in room.schedules:
+                    self._counts[-1, self._nights(schedule)] += 1
+            elif event == "room_removed":
+                # Rooms with schedules cannot be removed, so the dropped row is empty.
+                row = self._rows.pop(room)
+                del self._rooms[row]
+                self._counts = np.delete(self._counts, row, axis=0)
+                self._rows = {room: row for row, room in enumerate(self._rooms)}
@@ -1,17 +1,26 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Iterable
 
 from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.observable import Observable
 
 
-class Period:
+class Period(Observable):
     """
     Represents a period with a start and end date.
 
+    Subscribed listeners are notified twice when `change_start` or `change_end` changes
+    the period: with `"period_changing"` (`start`, `end`) before the change, where a
+    listener rejects the new bounds by raising, and with `"period_changed"` (`old_start`,
+    `old_end`) once it is applied. Listeners are not pickled.
+
     Attributes:
         start (datetime): The start date of the period.
         end (datetime): The end date of the period.
     """
 
+    __slots__ = ("_start", "_end")
+
     def __init__(self, start: datetime, end: datetime):
         """
         Initializes a Period object with a start and end date.
@@ -25,9 +34,19 @@ class Period:
         """
         if start > end:
             raise InvalidPeriodError("Start date must be before end date.")
+        super().__init__()
         self._start = start
         self._end = end
 
+    def __getstate__(self) -> tuple:
+        """Pickles the period bounds without its listeners."""
+        return self._start, self._end
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restores a pickled period, without listeners."""
+        self._listeners = None
+        self._start, self._end = state
+
     def change_start(self, start: datetime) -> bool:
         """
         Changes the start date of the period.
@@ -38,6 +57,10 @@ class Period:
         Returns:
             bool: True if the start date was successfully changed, False otherwise.
 
+        Raises:
+            ScheduleCannotBeOverwritten: If the period is booked in a room and the new
+                bounds would overlap another schedule of the room.
+
         Examples:
             >>> from datetime import datetime
             >>> period = Period(datetime(2023, 1, 1), datetime(2023, 1, 2))
@@ -50,7 +73,7 @@ class Period:
         """
         if start > self._end:
             return False
-        self._start = start
+        self._change(start, self._end)
         return True
 
     def change_end(self, end: datetime) -> bool:
@@ -63,6 +86,10 @@ class Period:
         Returns:
             bool: True if the end date was successfully changed, False otherwise.
 
+        Raises:
+            ScheduleCannotBeOverwritten: If the period is booked in a room and the new
+                bounds would overlap another schedule of the room.
+
         Examples:
             >>> from datetime import datetime
             >>> period = Period(datetime(2023, 1, 2), datetime(2023, 1, 3))
@@ -75,9 +102,19 @@ class Period:
         """
         if self._start > end:
             return False
-        self._end = end
+        self._change(self._start, end)
         return True
 
+    def _change(self, start: datetime, end: datetime) -> None:
+        """Applies new bounds, letting listeners reject them first."""
+        if not self._listeners:
+            self._start, self._end = start, end
+            return
+        self._notify("period_changing", start=start, end=end)
+        old_start, old_end = self._start, self._end
+        self._start, self._end = start, end
+        self._notify("period_changed", old_start=old_start, old_end=old_end)
+
     @property
     def start(self) -> datetime:
         """
@@ -112,3 +149,350 @@ class Period:
 
     def __str__(self) -> str:
         return f"START: {self.start} | END: {self.end}"
+
+
+class DayPeriod:
+    """
+    Immutable, hashable period of whole days, stored as two integer day ordinals.
+
+    Bounds are proleptic Gregorian ordinals, as `date.toordinal` returns them, so
+    comparing periods compares two small integers instead of datetimes read through
+    properties. Periods are closed like `Period`: two periods sharing a day overlap, and a
+    period covers `nights` nights, from its start day to the night before its end day.
+
+    The time of day of the dates a period is built from is dropped. `start` and `end`
+    return midnight datetimes, so a `DayPeriod` can be used wherever a `Period` is read,
+    e.g. as the period of a `Schedule`. Being immutable, it replaces `change_start` and
+    `change_end` with `with_start` and `with_end`, which return a changed copy.
+
+    The `*_batch` methods compare the period with many periods given as arrays of
+    ordinals, e.g. from `to_arrays`, in one vectorized NumPy call. NumPy is optional and
+    only imported by them.
+
+    Attributes:
+        start_ordinal (int): Ordinal of the first day of the period.
+        end_ordinal (int): Ordinal of the last day of the period.
+    """
+
+    __slots__ = ("_start_ordinal", "_end_ordinal", "_start", "_end")
+
+    def __init__(self, start: date, end: date) -> None:
+        """
+        Initializes a period from its first and last days.
+
+        Args:
+            start (date): The start date, a `date` or `datetime`.
+            end (date): The end date, a `date` or `datetime`.
+
+        Raises:
+            InvalidPeriodError: If the start date is after the end date.
+        """
+        self._set(start.toordinal(), end.toordinal())
+
+    @classmethod
+    def from_ordinals(cls, start_ordinal: int, end_ordinal: int) -> "DayPeriod":
+        """
+        Creates a period from day ordinals, without converting dates.
+
+        Args:
+            start_ordinal (int): Ordinal of the first day.
+            end_ordinal (int): Ordinal of the last day.
+
+        Returns:
+            DayPeriod: The period.
+
+        Raises:
+            InvalidPeriodError: If the start is after the end.
+
+        Examples:
+            >>> print(DayPeriod.from_ordinals(739206, 739209))
+            START: 2024-11-16 00:00:00 | END: 2024-11-19 00:00:00
+        """
+        period = cls.__new__(cls)
+        period._set(start_ordinal, end_ordinal)
+        return period
+
+    @classmethod
+    def from_period(cls, period: Period) -> "DayPeriod":
+        """
+        Converts any period with `start` and `end` dates, e.g. a `Period`.
+
+        Args:
+            period (Period): The period to convert.
+
+        Returns:
+            DayPeriod: The days covered by the period.
+        """
+        return cls(period.start, period.end)
+
+    def _set(self, start_ordinal: int, end_ordinal: int) -> None:
+        if start_ordinal > end_ordinal:
+            raise InvalidPeriodError("Start date must be before end date.")
+        self._start_ordinal = start_ordinal
+        self._end_ordinal = end_ordinal
+        self._start = datetime.fromordinal(start_ordinal)
+        self._end = datetime.fromordinal(end_ordinal)
+
+    @property
+    def start_ordinal(self) -> int:
+        """int: Gets the ordinal of the first day of the period."""
+        return self._start_ordinal
+
+    @property
+    def end_ordinal(self) -> int:
+        """int: Gets the ordinal of the last day of the period."""
+        return self._end_ordinal
+
+    @property
+    def start(self) -> datetime:
+        """datetime: Gets the start date of the period, at midnight."""
+        return self._start
+
+    @property
+    def end(self) -> datetime:
+        """datetime: Gets the end date of the period, at midnight."""
+        return self._end
+
+    @property
+    def nights(self) -> int:
+        """
+        Gets the number of nights of the period, from its start day to the night before its end day.
+
+        Returns:
+            int: The number of nights, 0 for a single day.
+
+        Examples:
+            >>> DayPeriod(date(2024, 11, 16), date(2024, 11, 19)).nights
+            3
+        """
+        return self._end_ordinal - self._start_ordinal
+
+    def with_start(self, start: date) -> "DayPeriod | None":
+        """
+        Copies the period with another start date, as `Period.change_start` changes it.
+
+        Args:
+            start (date): The new start date.
+
+        Returns:
+            DayPeriod | None: The changed copy, or None if the start would be after the end.
+
+        Examples:
+            >>> period = DayPeriod(date(2023, 1, 1), date(2023, 1, 2))
+            >>> period.with_start(date(2023, 1, 3)) is None
+            True
+            >>> print(period.with_start(date(2023, 1, 2)).start)
+            2023-01-02 00:00:00
+        """
+        start_ordinal = start.toordinal()
+        if start_ordinal > self._end_ordinal:
+            return None
+        return DayPeriod.from_ordinals(start_ordinal, self._end_ordinal)
+
+    def with_end(self, end: date) -> "DayPeriod | None":
+        """
+        Copies the period with another end date, as `Period.change_end` changes it.
+
+        Args:
+            end (date): The new end date.
+
+        Returns:
+            DayPeriod | None: The changed copy, or None if the end would be before the start.
+
+        Examples:
+            >>> period = DayPeriod(date(2023, 1, 2), date(2023, 1, 3))
+            >>> period.with_end(date(2023, 1, 1)) is None
+            True
+            >>> print(period.with_end(date(2023, 1, 4)).end)
+            2023-01-04 00:00:00
+        """
+        end_ordinal = end.toordinal()
+        if self._start_ordinal > end_ordinal:
+            return None
+        return DayPeriod.from_ordinals(self._start_ordinal, end_ordinal)
+
+    def overlaps(self, other: "DayPeriod | Period") -> bool:
+        """
+        Checks if the period shares at least one day with another one.
+
+        Args:
+            other (DayPeriod | Period): The other period.
+
+        Returns:
+            bool: True if the periods overlap.
+
+        Examples:
+            >>> stay = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+            >>> stay.overlaps(DayPeriod(date(2024, 11, 19), date(2024, 11, 21)))
+            True
+            >>> stay.overlaps(DayPeriod(date(2024, 11, 20), date(2024, 11, 21)))
+            False
+        """
+        start, end = _ordinals(other)
+        return self._start_ordinal <= end and start <= self._end_ordinal
+
+    def intersection(self, other: "DayPeriod | Period") -> "DayPeriod | None":
+        """
+        Gets the days shared with another period.
+
+        Args:
+            other (DayPeriod | Period): The other period.
+
+        Returns:
+            DayPeriod | None: The shared days, or None if the periods do not overlap.
+
+        Examples:
+            >>> stay = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+            >>> print(stay.intersection(DayPeriod(date(2024, 11, 18), date(2024, 11, 25))))
+            START: 2024-11-18 00:00:00 | END: 2024-11-19 00:00:00
+        """
+        start, end = _ordinals(other)
+        start, end = max(self._start_ordinal, start), min(self._end_ordinal, end)
+        return DayPeriod.from_ordinals(start, end) if start <= end else None
+
+    def contains(self, item: "date | DayPeriod | Period") -> bool:
+        """
+        Checks if a day, or every day of a period, is inside the period.
+
+        Args:
+            item (date | DayPeriod | Period): A `date` or `datetime`, or a period.
+
+        Returns:
+            bool: True if the day or period is inside the period.
+
+        Examples:
+            >>> stay = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+            >>> stay.contains(datetime(2024, 11, 19, 23, 0)), stay.contains(date(2024, 11, 20))
+            (True, False)
+        """
+        if isinstance(item, date):
+            start = end = item.toordinal()
+        else:
+            start, end = _ordinals(item)
+        return self._start_ordinal <= start and end <= self._end_ordinal
+
+    def __contains__(self, item: "date | DayPeriod | Period") -> bool:
+        return self.contains(item)
+
+    @staticmethod
+    def to_arrays(periods: "Iterable[DayPeriod | Period]") -> tuple:
+        """
+        Packs periods into the arrays of ordinals taken by the batch methods.
+
+        Args:
+            periods (Iterable[DayPeriod | Period]): The periods.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The start and end ordinals, as int64 arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _import_numpy()
+        bounds = [ordinal for period in periods for ordinal in _ordinals(period)]
+        packed = numpy.fromiter(bounds, numpy.int64, len(bounds))
+        return packed[0::2], packed[1::2]
+
+    def overlaps_batch(self, starts, ends):
+        """
+        Checks which of many periods share at least one day with this one.
+
+        Args:
+            starts (numpy.ndarray): Start ordinals of the periods.
+            ends (numpy.ndarray): End ordinals of the periods, aligned with `starts`.
+
+        Returns:
+            numpy.ndarray: One boolean per period, True where it overlaps this period.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _import_numpy()
+        return (numpy.asarray(starts) <= self._end_ordinal) & (numpy.asarray(ends) >= self._start_ordinal)
+
+    def contains_batch(self, starts, ends):
+        """
+        Checks which of many periods lie entirely inside this one.
+
+        Args:
+            starts (numpy.ndarray): Start ordinals of the periods.
+            ends (numpy.ndarray): End ordinals of the periods, aligned with `starts`.
+
+        Returns:
+            numpy.ndarray: One boolean per period, True where it is inside this period.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _import_numpy()
+        return (numpy.asarray(starts) >= self._start_ordinal) & (numpy.asarray(ends) <= self._end_ordinal)
+
+    def intersection_batch(self, starts, ends) -> tuple:
+        """
+        Clips many periods to this one.
+
+        Args:
+            starts (numpy.ndarray): Start ordinals of the periods.
+            ends (numpy.ndarray): End ordinals of the periods, aligned with `starts`.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Start and end ordinals of each intersection.
+                A period that does not overlap this one gets a start after its end.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _import_numpy()
+        return numpy.maximum(starts, self._start_ordinal), numpy.minimum(ends, self._end_ordinal)
+
+    @staticmethod
+    def nights_batch(starts, ends):
+        """
+        Counts the nights of many periods.
+
+        Args:
+            starts (numpy.ndarray): Start ordinals of the periods.
+            ends (numpy.ndarray): End ordinals of the periods, aligned with `starts`.
+
+        Returns:
+            numpy.ndarray: The nights of each period, negative for the empty intersections
+                returned by `intersection_batch`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = _import_numpy()
+        return numpy.asarray(ends) - numpy.asarray(starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DayPeriod):
+            return NotImplemented
+        return self._start_ordinal == other._start_ordinal and self._end_ordinal == other._end_ordinal
+
+    def __hash__(self) -> int:
+        return hash((self._start_ordinal, self._end_ordinal))
+
+    def __reduce__(self) -> tuple:
+        return DayPeriod.from_ordinals, (self._start_ordinal, self._end_ordinal)
+
+    def __repr__(self) -> str:
+        return f"DayPeriod({self._start.date()}, {self._end.date()})"
+
+    def __str__(self) -> str:
+        return f"START: {self.start} | END: {self.end}"
+
+
+def _ordinals(period: "DayPeriod | Period") -> tuple:
+    """Gets the (start, end) day ordinals of any period."""
+    if isinstance(period, DayPeriod):
+        return period._start_ordinal, period._end_ordinal
+    return period.start.toordinal(), period.end.toordinal()
+
+
+def _import_numpy():
+    """Imports NumPy for the batch methods, as it is optional and slow to import."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised only without the optional dependency
+        raise ImportError("Batch period operations require NumPy: poetry install --extras numpy") from None
+    return numpy
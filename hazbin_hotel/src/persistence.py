@@ -0,0 +1,421 @@
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from enum import IntEnum
+from typing import Dict, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.utils import from_timestamp, to_timestamp
+from hazbin_hotel.src.versioning import VERSION_CLOCK, RoomVersion, capture_room
+
+SNAPSHOT_MAGIC = b"HZBSNAP1"
+"""bytes: Signature at the start of every snapshot file."""
+
+SNAPSHOT_FILE = "snapshot.bin"
+"""str: Name of the snapshot file inside the store directory."""
+
+_SNAPSHOT_HEADER = struct.Struct("<QQI")  # generation, version, room count
+_ROOM = struct.Struct("<qdI")  # number, price, schedule count
+_SCHEDULE = struct.Struct("<qqq")  # id, start timestamp, end timestamp
+_STRING = struct.Struct("<I")  # UTF-8 length
+_NUMBER = struct.Struct("<q")
+_PRICE = struct.Struct("<d")
+_RECORD_HEADER = struct.Struct("<IIBQ")  # payload length, CRC32 of version and payload, operation, version
+_CRC = struct.Struct("<I")
+
+
+class WalOperation(IntEnum):
+    """Operations recorded in the write-ahead log."""
+
+    ADD_ROOM = 1
+    REMOVE_ROOM = 2
+    UPDATE_PRICE = 3
+    CHANGE_TYPE = 4
+    ADD_SCHEDULE = 5
+    UPDATE_SCHEDULE = 6
+    CANCEL_SCHEDULE = 7
+
+
+class HotelStore:
+    """Persists a `Hotel` as a binary snapshot plus an append-only write-ahead log (WAL).
+
+    Every change published by the hotel (see `Hotel` and `Room` events) is appended to
+    the current WAL segment as a CRC-protected record. `load` restores the snapshot,
+    replays the WAL segments written after it and starts a new segment. `compact` folds
+    the WAL into a new snapshot; it can run in a background thread while the hotel keeps
+    taking bookings. It encodes a `HotelSnapshot` opened after the WAL switched to a new
+    segment, and drops the older segments only once the snapshot file is durably in place.
+
+    Changes made between the switch and the opening of the snapshot are both in the snapshot
+    and in the new segment. Every record carries the `VERSION_CLOCK` number of its change,
+    and the snapshot file the version of the `HotelSnapshot`, so `load` skips the records
+    of that segment the snapshot already holds: replaying them again is not idempotent,
+    e.g. a booking cancelled then rebooked by another client would be booked twice.
+
+    Files in the store directory:
+        - `snapshot.bin`: rooms and schedules as of version `V` of WAL generation `G`;
+        - `wal-<generation>.log`: WAL segments, replayed in generation order from `G`, from
+          version `V` for segment `G`. Versions are only compared within segment `G`, which
+          the process that wrote the snapshot wrote alone.
+
+    Attributes:
+        directory (str): Directory holding the snapshot and the WAL segments.
+        sync_every (int): Number of WAL records written between two `fsync` calls.
+        compact_after (int | None): Number of WAL records that triggers a background compaction.
+        hotel (Hotel | None): The hotel being persisted, once loaded.
+    """
+
+    def __init__(self, directory: str, *, sync_every: int = 1, compact_after: int | None = 100_000) -> None:
+        """Initializes a store over a directory, creating it if needed.
+
+        Args:
+            directory (str): Directory holding the snapshot and the WAL segments.
+            sync_every (int, optional): WAL records written between two `fsync` calls. Defaults to 1,
+                which makes every change durable before the mutating call returns.
+            compact_after (int | None, optional): WAL records that trigger a background compaction.
+                None disables automatic compaction. Defaults to 100000.
+
+        Raises:
+            ValueError: If `sync_every` is lower than 1.
+        """
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1.")
+        self.directory = directory
+        self.sync_every = sync_every
+        self.compact_after = compact_after
+        self.hotel = None
+        self._lock = threading.Lock()
+        self._wal = None
+        self._generation = 0
+        self._unsynced = 0
+        self._records = 0
+        self._compaction = None
+        self._compacting = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self) -> Hotel:
+        """Restores the hotel from disk and starts logging its changes.
+
+        Returns:
+            Hotel: The restored hotel, empty if nothing was persisted yet.
+        """
+        generation, version, rooms = self._read_snapshot()
+        hotel = Hotel(rooms)
+
+        replayed = 0
+        segments = [segment for segment in self._segments() if segment >= generation]
+        for segment in segments:
+            replayed += self._replay(hotel, self._segment_path(segment), version if segment == generation else 0)
+
+        self.hotel = hotel
+        self._generation = max([generation, *segments]) + 1
+        self._wal = open(self._segment_path(self._generation), "ab")
+        hotel.subscribe(self._on_hotel_event)
+
+        if replayed or len(segments) > 1:
+            self.compact_in_background()
+        return hotel
+
+    def sync(self) -> None:
+        """Forces every WAL record written so far to disk."""
+        with self._lock:
+            self._sync()
+
+    def compact(self) -> None:
+        """Writes a snapshot of the current state and drops the WAL segments it covers.
+
+        Compactions run one at a time. Changes keep being logged meanwhile, to the segment
+        started by the compaction.
+        """
+        with self._compacting:
+            with self._lock:
+                self._sync()
+                self._wal.close()
+                self._generation += 1
+                self._wal = open(self._segment_path(self._generation), "ab")
+                self._records = 0
+                generation = self._generation
+            # Opened after the new segment is started, so every change it misses is logged there, and
+            # outside `_lock`, which the hotel takes through its listeners with its own lock held.
+            with self.hotel.snapshot() as snapshot:
+                data = _encode_snapshot(generation, snapshot.version, snapshot.rooms)
+
+            temporary_path = os.path.join(self.directory, SNAPSHOT_FILE + ".tmp")
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, os.path.join(self.directory, SNAPSHOT_FILE))
+            self._sync_directory()
+
+            for segment in self._segments():
+                if segment < generation:
+                    os.remove(self._segment_path(segment))
+
+    def compact_in_background(self) -> threading.Thread:
+        """Runs `compact` in a daemon thread, unless a compaction is already running.
+
+        Returns:
+            threading.Thread: The thread running the compaction.
+        """
+        if self._compaction is None or not self._compaction.is_alive():
+            self._compaction = threading.Thread(target=self.compact, name="hotel-store-compaction", daemon=True)
+            self._compaction.start()
+        return self._compaction
+
+    def close(self) -> None:
+        """Waits for a running compaction, syncs the WAL and stops logging changes."""
+        if self._compaction is not None:
+            self._compaction.join()
+        if self.hotel is not None:
+            self.hotel.unsubscribe(self._on_hotel_event)
+        with self._lock:
+            if self._wal is not None:
+                self._sync()
+                self._wal.close()
+                self._wal = None
+
+    def _on_hotel_event(self, event: str, hotel: Hotel, room: Room, **details) -> None:
+        """Appends the WAL record matching a hotel event, numbered with the version of the change."""
+        number = _NUMBER.pack(room.number)
+        # Rooms notify their changes with their lock held, so `changed_at` is the number of this
+        # change, and the hotel adds and removes rooms with the lock it opens snapshots with. A type
+        # change, notified after the room lock is released, may get a later number: replaying it
+        # again sets the same type.
+        version = VERSION_CLOCK.stamp() if event in ("room_added", "room_removed") else room.changed_at
+        if event == "schedule_added":
+            record = (WalOperation.ADD_SCHEDULE, number + _encode_schedule(details["schedule"]))
+        elif event == "schedule_updated":
+            old_id = _NUMBER.pack(details["old_schedule"].id)
+            record = (WalOperation.UPDATE_SCHEDULE, number + old_id + _encode_schedule(details["new_schedule"]))
+        elif event in ("period_changed", "client_name_changed"):
+            # Schedules changed in place are logged as updates keeping their ID.
+            schedule = details["schedule"]
+            record = (WalOperation.UPDATE_SCHEDULE, number + _NUMBER.pack(schedule.id) + _encode_schedule(schedule))
+        elif event == "schedule_cancelled":
+            record = (WalOperation.CANCEL_SCHEDULE, number + _NUMBER.pack(details["schedule"].id))
+        elif event == "price_updated":
+            record = (WalOperation.UPDATE_PRICE, number + _PRICE.pack(details["new_price"]))
+        elif event == "type_changed":
+            record = (WalOperation.CHANGE_TYPE, number + _encode_string(details["new_type"].value))
+        elif event == "room_added":
+            with room.lock:
+                record = (WalOperation.ADD_ROOM, _encode_room(capture_room(room)))
+        elif event == "room_removed":
+            record = (WalOperation.REMOVE_ROOM, number)
+        else:
+            return
+
+        operation, payload = record
+        header = _RECORD_HEADER.pack(len(payload), _checksum(version, payload), operation, version)
+        with self._lock:
+            self._wal.write(header + payload)
+            self._unsynced += 1
+            self._records += 1
+            if self._unsynced >= self.sync_every:
+                self._sync()
+            needs_compaction = self.compact_after is not None and self._records >= self.compact_after
+        if needs_compaction:
+            self.compact_in_background()
+
+    def _sync(self) -> None:
+        """Flushes and fsyncs the current WAL segment. Must be called with `_lock` held."""
+        if self._unsynced:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._unsynced = 0
+
+    def _sync_directory(self) -> None:
+        """Makes file creations and renames in the store directory durable."""
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _segment_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"wal-{generation:012d}.log")
+
+    def _segments(self) -> List[int]:
+        """Returns the generations of the WAL segments on disk, in ascending order."""
+        return sorted(
+            int(name[4:-4]) for name in os.listdir(self.directory) if name.startswith("wal-") and name.endswith(".log")
+        )
+
+    def _read_snapshot(self) -> Tuple[int, int, List[Room]]:
+        """Reads the snapshot file.
+
+        Returns:
+            Tuple[int, int, List[Room]]: The first WAL generation to replay, the version of the
+                snapshot and the restored rooms.
+
+        Raises:
+            ValueError: If the snapshot file is corrupted.
+        """
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return 0, 0, []
+
+        with open(path, "rb") as file:
+            data = memoryview(file.read())
+        (checksum,) = _CRC.unpack_from(data, len(data) - _CRC.size)
+        if data[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or zlib.crc32(data[: -_CRC.size]) != checksum:
+            raise ValueError(f'Snapshot "{path}" is corrupted.')
+
+        generation, version, room_count = _SNAPSHOT_HEADER.unpack_from(data, len(SNAPSHOT_MAGIC))
+        offset = len(SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size
+        rooms = []
+        for _ in range(room_count):
+            room, offset = _decode_room(data, offset)
+            rooms.append(room)
+        return generation, version, rooms
+
+    def _replay(self, hotel: Hotel, path: str, since: int) -> int:
+        """Applies the records of a WAL segment to the hotel.
+
+        Replay stops at the first incomplete or corrupted record, which can only be the
+        tail of a segment interrupted by a crash. Records whose change the hotel already
+        holds otherwise, e.g. segments copied twice, are skipped as well.
+
+        Args:
+            hotel (Hotel): The hotel to update.
+            path (str): Path of the WAL segment.
+            since (int): Version of the snapshot the hotel was restored from, whose records
+                are skipped as the snapshot already holds their changes; 0 to apply every record.
+
+        Returns:
+            int: The number of records applied.
+        """
+        with open(path, "rb") as file:
+            data = memoryview(file.read())
+
+        rooms: Dict[int, Room] = {room.number: room for room in hotel.rooms}
+        schedules: Dict[int, Dict[int, Schedule]] = {}
+
+        def schedules_of(room: Room) -> Dict[int, Schedule]:
+            if room.number not in schedules:
+                schedules[room.number] = {schedule.id: schedule for schedule in room.schedules}
+            return schedules[room.number]
+
+        offset = records = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            length, checksum, operation, version = _RECORD_HEADER.unpack_from(data, offset)
+            payload = data[offset + _RECORD_HEADER.size : offset + _RECORD_HEADER.size + length]
+            if len(payload) < length or _checksum(version, payload) != checksum:
+                break
+            offset += _RECORD_HEADER.size + length
+            if version < since:
+                continue
+            records += 1
+
+            if operation == WalOperation.ADD_ROOM:
+                room, _ = _decode_room(payload, 0)
+                if room.number not in rooms:
+                    hotel.add_room(room)
+                    rooms[room.number] = room
+                continue
+
+            (number,) = _NUMBER.unpack_from(payload, 0)
+            room = rooms.get(number)
+            if room is None:
+                continue
+
+            if operation == WalOperation.REMOVE_ROOM:
+                hotel.remove_room(room)
+                del rooms[number]
+                schedules.pop(number, None)
+            elif operation == WalOperation.UPDATE_PRICE:
+                room.update_price(_PRICE.unpack_from(payload, _NUMBER.size)[0])
+            elif operation == WalOperation.CHANGE_TYPE:
+                room_type = RoomTypeEnum(_decode_string(payload, _NUMBER.size)[0])
+                if room.type != room_type:
+                    room.type = room_type
+            elif operation == WalOperation.ADD_SCHEDULE:
+                schedule, _ = _decode_schedule(payload, _NUMBER.size)
+                if schedule.id not in schedules_of(room):
+                    room.add_schedule(schedule)
+                    schedules_of(room)[schedule.id] = schedule
+            elif operation == WalOperation.UPDATE_SCHEDULE:
+                (old_id,) = _NUMBER.unpack_from(payload, _NUMBER.size)
+                schedule, _ = _decode_schedule(payload, 2 * _NUMBER.size)
+                if old_id in schedules_of(room):
+                    room.update_schedule(schedule, old_id)
+                    del schedules_of(room)[old_id]
+                    schedules_of(room)[schedule.id] = schedule
+            elif operation == WalOperation.CANCEL_SCHEDULE:
+                (schedule_id,) = _NUMBER.unpack_from(payload, _NUMBER.size)
+                if schedule_id in schedules_of(room):
+                    room.cancel_schedule(schedule_id)
+                    del schedules_of(room)[schedule_id]
+        return records
+
+
+def _checksum(version: int, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(_NUMBER.pack(version)))
+
+
+def _encode_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return _STRING.pack(len(encoded)) + encoded
+
+
+def _decode_string(data: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _STRING.unpack_from(data, offset)
+    offset += _STRING.size
+    return bytes(data[offset : offset + length]).decode("utf-8"), offset + length
+
+
+def _encode_schedule(schedule: Schedule) -> bytes:
+    period = schedule.period
+    return _pack_schedule(schedule.id, schedule.client_name, period.start, period.end)
+
+
+def _pack_schedule(schedule_id: int, client_name: str, start: datetime, end: datetime) -> bytes:
+    return _SCHEDULE.pack(schedule_id, to_timestamp(start), to_timestamp(end)) + _encode_string(client_name)
+
+
+def _decode_schedule(data: memoryview, offset: int) -> Tuple[Schedule, int]:
+    schedule_id, start, end = _SCHEDULE.unpack_from(data, offset)
+    client_name, offset = _decode_string(data, offset + _SCHEDULE.size)
+    schedule = Schedule(client_name, Period(from_timestamp(start), from_timestamp(end)))
+    schedule.id = schedule_id
+    Schedule.reserve_ids_up_to(schedule_id)
+    return schedule, offset
+
+
+def _encode_snapshot(generation: int, version: int, rooms: Tuple[RoomVersion, ...]) -> bytes:
+    """Serializes the rooms of a hotel snapshot."""
+    data = bytearray(SNAPSHOT_MAGIC)
+    data += _SNAPSHOT_HEADER.pack(generation, version, len(rooms))
+    for room in rooms:
+        data += _encode_room(room)
+    data += _CRC.pack(zlib.crc32(data))
+    return bytes(data)
+
+
+def _encode_room(room: RoomVersion) -> bytes:
+    data = bytearray(_ROOM.pack(room.number, room.price, len(room.schedules)))
+    data += _encode_string(room.type.value)
+    for schedule in room.schedules:
+        data += _pack_schedule(*schedule)
+    return bytes(data)
+
+
+def _decode_room(data: memoryview, offset: int) -> Tuple[Room, int]:
+    number, price, schedule_count = _ROOM.unpack_from(data, offset)
+    room_type, offset = _decode_string(data, offset + _ROOM.size)
+    schedules = []
+    for _ in range(schedule_count):
+        schedule, offset = _decode_schedule(data, offset)
+        schedules.append(schedule)
+
+    room = Room(RoomTypeEnum(room_type), price, schedules)
+    room.number = number
+    Room.reserve_numbers_up_to(number)
+    return room, offset
@@ -0,0 +1,178 @@
+from datetime import datetime
+from itertools import accumulate
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+
+WEEKEND = (5, 6)
+"""tuple: Weekday numbers (as returned by `datetime.weekday`) of Saturday and Sunday."""
+
+
+class PricingEngine:
+    """Quotes what a stay costs, night by night.
+
+    The rate of a night is the room base price × the room type multiplier × the date
+    factor of the night. Date factors come from weekday factors (e.g. weekends) and
+    seasons, which may be restricted to some room types; overlapping factors multiply.
+
+    A stay occupies the nights from its start date up to the night before its end date,
+    and at least the night of its start date. Quotes are rounded to cents.
+
+    Date factors are precomputed over a calendar, together with their prefix sums, so a
+    stay inside the calendar is priced in constant time whatever its length. Nights
+    outside the calendar are priced one by one.
+
+    Attributes:
+        start (datetime): Start of the first night of the calendar.
+        days (int): Number of nights in the calendar.
+        _weekday_factors (Dict[int, float]): Factor of each weekday with a non-default rate.
+        _seasons (List[Tuple[int, int, float, FrozenSet[RoomTypeEnum] | None]]): First and last night
+            offsets, factor and room types of every season.
+        _prefix_sums (Dict[RoomTypeEnum, List[float]]): Prefix sums of the date factors per room type.
+    """
+
+    def __init__(self, start: datetime, days: int, weekday_factors: Dict[int, float] | None = None) -> None:
+        """Initializes the engine over a calendar.
+
+        Args:
+            start (datetime): Start of the first night of the calendar.
+            days (int): Number of nights in the calendar.
+            weekday_factors (Dict[int, float] | None, optional): Factor applied on each weekday,
+                keyed by `datetime.weekday` number. Defaults to no weekday factor.
+
+        Raises:
+            ValueError: If `days` is not positive or a factor is negative.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> engine = PricingEngine(datetime(2024, 11, 1), 365, weekday_factors={day: 1.25 for day in WEEKEND})
+            >>> room = Room(RoomTypeEnum.SUITE, 100, [])
+            >>> engine.quote(room, Period(datetime(2024, 11, 1), datetime(2024, 11, 4)))  # Friday to Monday
+            700.0
+        """
+        if days <= 0:
+            raise ValueError("The calendar must have at least one night.")
+        weekday_factors = dict(weekday_factors or {})
+        for factor in weekday_factors.values():
+            self._validate_factor(factor)
+
+        self.start = start
+        self.days = days
+        self._weekday_factors = weekday_factors
+        self._seasons = []
+        self._prefix_sums = {}
+
+    def add_season(
+        self, start: datetime, end: datetime, factor: float, room_types: Iterable[RoomTypeEnum] | None = None
+    ) -> None:
+        """Applies a factor to every night from `start` to `end`, both dates included.
+
+        Args:
+            start (datetime): Date of the first night of the season.
+            end (datetime): Date of the last night of the season.
+            factor (float): Factor applied to the nights of the season.
+            room_types (Iterable[RoomTypeEnum] | None, optional): Room types the season applies to.
+                Defaults to every room type.
+
+        Raises:
+            InvalidPeriodError: If the start date is after the end date.
+            ValueError: If the factor is negative.
+        """
+        Period(start, end)
+        self._validate_factor(factor)
+        room_types = frozenset(room_types) if room_types is not None else None
+        self._seasons.append((self._night(start), self._night(end), factor, room_types))
+        self._prefix_sums.clear()
+
+    def nightly_rate(self, room: Room, date: datetime) -> float:
+        """Computes the rate of a room for the night of a date.
+
+        Args:
+            room (Room): The room to price.
+            date (datetime): The date of the night.
+
+        Returns:
+            float: The rate of the night, rounded to cents.
+        """
+        return round(room.price * room.multiplier_factor_price * self._factor(self._night(date), room.type), 2)
+
+    def quote(self, room: Room, period: Period) -> float:
+        """Computes the total cost of a stay.
+
+        Args:
+            room (Room): The room to price.
+            period (Period): The stay.
+
+        Returns:
+            float: The cost of every night of the stay, rounded to cents.
+        """
+        return self.quote_many([(room, period)])[0]
+
+    def quote_many(self, quotes: Iterable[Tuple[Room, Period]]) -> List[float]:
+        """Computes the total cost of many stays at once.
+
+        Each stay inside the calendar costs two lookups in the prefix sums of its room type,
+        which are built once per room type and reused by every later quote.
+
+        Args:
+            quotes (Iterable[Tuple[Room, Period]]): The (room, stay) pairs to price.
+
+        Returns:
+            List[float]: The cost of each stay, in input order, rounded to cents.
+        """
+        start, days, prefix_sums = self.start, self.days, self._prefix_sums
+        totals = []
+        for room, period in quotes:
+            room_type = room.type
+            first = (period.start - start).days
+            stop = max((period.end - start).days, first + 1)
+            if 0 <= first and stop <= days:
+                prefix_sum = prefix_sums.get(room_type)
+                if prefix_sum is None:
+                    prefix_sum = self._prefix_sum(room_type)
+                factors = prefix_sum[stop] - prefix_sum[first]
+            else:
+                factors = sum(self._factor(night, room_type) for night in range(first, stop))
+            totals.append(round(room.price * room.multiplier_factor_price * factors, 2))
+        return totals
+
+    def _prefix_sum(self, room_type: RoomTypeEnum) -> List[float]:
+        """Builds and caches the prefix sums of the calendar date factors of a room type."""
+        factors = [1.0] * self.days
+        if self._weekday_factors:
+            first_weekday = self.start.weekday()
+            for night in range(self.days):
+                factors[night] = self._weekday_factors.get((first_weekday + night) % 7, 1.0)
+        for first, last, factor, room_types in self._seasons:
+            if room_types is None or room_type in room_types:
+                for night in range(max(first, 0), min(last + 1, self.days)):
+                    factors[night] *= factor
+        prefix_sum = self._prefix_sums[room_type] = list(accumulate(factors, initial=0.0))
+        return prefix_sum
+
+    def _factor(self, night: int, room_type: RoomTypeEnum) -> float:
+        """Computes the date factor of a single night, counted from the calendar start."""
+        factor = self._weekday_factors.get((self.start.weekday() + night) % 7, 1.0)
+        for first, last, season_factor, room_types in self._seasons:
+            if first <= night <= last and (room_types is None or room_type in room_types):
+                factor *= season_factor
+        return factor
+
+    def _night(self, date: datetime) -> int:
+        """Offset of the night of a date from the calendar start."""
+        return (date - self.start).days
+
+    @staticmethod
+    def _validate_factor(factor: float) -> None:
+        """Validates a rate factor.
+
+        Args:
+            factor (float): The factor to validate.
+
+        Raises:
+            ValueError: If the factor is negative.
+        """
+        if factor < 0:
+            raise ValueError("Rate factor cannot be negative.")
@@ -1,16 +1,60 @@
-from typing import List
-
-from colorama import Fore, Style
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
 
 from hazbin_hotel.src.enums.types import ROOM_MULTIPLIERS, RoomTypeEnum
-from hazbin_hotel.src.exceptions import InvalidRoomType, ScheduleCannotBeOverwritten
+from hazbin_hotel.src.exceptions import (
+    InvalidRoomType,
+    ScheduleCannotBeOverwritten,
+    ScheduleNotFound,
+)
+from hazbin_hotel.src.observable import Observable
 from hazbin_hotel.src.period import Period
 from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.schedule_index import ScheduleIndex
+from hazbin_hotel.src.versioning import (
+    VERSION_CLOCK,
+    RoomVersion,
+    ScheduleVersion,
+    prune_versions,
+)
 
 
-class Room:
+class Room(Observable):
     """Represents a room in a hotel with specific attributes, price, type, and scheduling availability.
 
+    Subscribed listeners are notified of every change made to the room:
+
+    - `"schedule_added"` (`schedule`) by `add_schedule`;
+    - `"schedule_updated"` (`old_schedule`, `new_schedule`) by `update_schedule`;
+    - `"schedule_cancelled"` (`schedule`) by `cancel_schedule`;
+    - `"price_updated"` (`old_price`, `new_price`) by `update_price`;
+    - `"type_changed"` (`old_type`, `new_type`) when the room type is changed;
+    - `"period_changed"` (`schedule`, `old_start`, `old_end`) when the period of a schedule
+      is changed in place, e.g. by `Period.change_end`;
+    - `"client_name_changed"` (`schedule`, `old_client_name`, `new_client_name`) when a
+      client is renamed.
+
+    The room follows its schedules and their periods, so a period changed in place is
+    re-indexed, and a change that would overlap another schedule of the room is rejected
+    with `ScheduleCannotBeOverwritten`, leaving the period untouched.
+
+    Schedule changes and availability checks are serialized by a per-room lock, which callers
+    can also hold through `lock` to check and book atomically, or to change a period in place
+    atomically. Room numbers are allocated atomically.
+
+    Every change is committed with a number from `VERSION_CLOCK`, so a `HotelSnapshot`
+    keeps reading the room as it was when the snapshot was opened. Listeners are notified
+    of a change with the room lock still held, and can read its number from `changed_at`,
+    except for `"type_changed"`, notified once the lock is released. The state a change
+    replaces is copied only if an open snapshot may still read it, and dropped once those
+    snapshots are released. Changes made in place, to a period or a client name, are
+    announced to the room before they are applied and committed once they are: in between,
+    snapshots keep reading the schedule as it was before the change.
+
+    Rooms can be pickled, e.g. to send them to another process: the copy gets a new lock,
+    no listeners and no old versions.
+
     Attributes:
         instance_count (int): Counter to assign unique room numbers.
         number (int): The unique identifier of the room instance.
@@ -18,9 +62,22 @@ class Room:
         _price (float): Base price for the room.
         _multiplier_factor_price (float): Multiplier for the room rate based on room type.
         _schedules (List[Schedule]): List of scheduled bookings for the room.
+        _schedule_index (ScheduleIndex): Sorted interval index over `_schedules` used for overlap checks.
+        _schedule_positions (Dict[int, int]): Position in `_schedules` of each schedule, by schedule ID.
+        _period_owners (Dict[Period, Schedule]): Schedule of each followed period.
+        _lock (threading.RLock): Lock serializing access to the schedules of the room.
+        _changed_at (int): Version number of the last change of the room.
+        _version (RoomVersion | None): Copy of the current state, once a snapshot read it.
+        _old_versions (Tuple[Tuple[int, RoomVersion], ...]): States replaced since the oldest open
+            snapshot, newest first, each with the version number it was committed at.
+        _schedule_versions (Dict[int, ScheduleVersion]): Copies of the schedules taken for versions,
+            by schedule ID, shared by the versions until the schedule changes.
+        _in_place (Dict[int, ScheduleVersion]): State of the schedules being changed in place, by
+            schedule ID, read by snapshots until the change is committed.
     """
 
     instance_count = 1
+    _number_lock = threading.Lock()
 
     def __init__(self, room_type: RoomTypeEnum, price: float, schedules: List[Schedule]) -> None:
         """Initializes the Room with a type, price, and existing schedules.
@@ -33,18 +90,84 @@ class Room:
         Raises:
             InvalidRoomType: If the room type is invalid.
             ValueError: If the price is negative.
+            ScheduleCannotBeOverwritten: If two of the initial schedules overlap.
         """
         self._validate_room_type(room_type)
         self._validate_room_price(price)
-
-        self.number = Room.instance_count
+        schedule_index = ScheduleIndex()
+        for schedule in schedules:
+            if schedule_index.overlaps(schedule.period.start, schedule.period.end):
+                raise ScheduleCannotBeOverwritten(f"The schedule {schedule.id} overlaps another initial schedule")
+            schedule_index.add(schedule)
+        super().__init__()
+
+        with Room._number_lock:
+            self.number = Room.instance_count
+            Room.instance_count += 1
+        self._lock = threading.RLock()
         self._type = room_type
         self._price = price
         self._multiplier_factor_price = 0
         self._schedules = schedules
+        self._schedule_index = schedule_index
+        self._schedule_positions = {schedule.id: position for position, schedule in enumerate(schedules)}
+        self._period_owners = {}
+        self._follow(schedules)
+        self._changed_at = 0
+        self._version = None
+        self._old_versions = ()
+        self._schedule_versions = {}
+        self._in_place = {}
 
         self._set_multiplier_factor(room_type)
-        Room.instance_count += 1
+
+    @staticmethod
+    def reserve_numbers_up_to(number: int) -> None:
+        """Makes sure room numbers up to `number` are never allocated again, e.g. after restoring rooms.
+
+        Args:
+            number (int): The highest room number already in use.
+        """
+        with Room._number_lock:
+            Room.instance_count = max(Room.instance_count, number + 1)
+
+    def __getstate__(self) -> dict:
+        """Pickles the room without its lock, listeners and versions."""
+        state = self.__dict__.copy()
+        for name in (
+            "_lock",
+            "_period_owners",
+            "_changed_at",
+            "_version",
+            "_old_versions",
+            "_schedule_versions",
+            "_in_place",
+        ):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores a pickled room with a new lock, no listeners and no old versions."""
+        self.__dict__.update(state)
+        self._listeners = None
+        self._lock = threading.RLock()
+        self._period_owners = {}
+        self._follow(self._schedules)
+        self._changed_at = 0
+        self._version = None
+        self._old_versions = ()
+        self._schedule_versions = {}
+        self._in_place = {}
+
+    @property
+    def lock(self) -> threading.RLock:
+        """threading.RLock: Gets the reentrant lock guarding the schedules of the room."""
+        return self._lock
+
+    @property
+    def changed_at(self) -> int:
+        """int: Gets the version number of the last change committed to the room, 0 if none was."""
+        return self._changed_at
 
     @property
     def price(self) -> float:
@@ -64,8 +187,18 @@ class Room:
     def type(self, new_type: RoomTypeEnum):
         self._validate_room_type(new_type)
         if self._type == new_type:
+            # Imported here, as nothing else needs colorama and it is slow to import.
+            from colorama import Fore, Style
+
             print(f"{Fore.YELLOW}[WARNING]: Same type was set!!{Style.RESET_ALL}")
-        self._type = new_type
+        with self._lock:
+            old_type = self._type
+            if old_type != new_type:
+                self._commit()
+            self._type = new_type
+            self._set_multiplier_factor(new_type)
+        if old_type != new_type:
+            self._notify("type_changed", old_type=old_type, new_type=new_type)
 
     @property
     def multiplier_factor_price(self) -> float:
@@ -86,9 +219,59 @@ class Room:
         Raises:
             ValueError: If the period is not available.
         """
-        if not self.is_period_available(schedule.period):
-            raise ValueError("The period is not available.")
-        self._schedules.append(schedule)
+        with self._lock:
+            if not self.is_period_available(schedule.period):
+                raise ValueError("The period is not available.")
+            self._commit()
+            self._schedule_positions[schedule.id] = len(self._schedules)
+            self._schedules.append(schedule)
+            self._schedule_index.add(schedule)
+            self._follow([schedule])
+            self._notify("schedule_added", schedule=schedule)
+
+    def get_schedule(self, schedule_id: int) -> Schedule:
+        """Gets a schedule of the room by its ID.
+
+        Args:
+            schedule_id (int): ID of the schedule.
+
+        Returns:
+            Schedule: The schedule with the given ID.
+
+        Raises:
+            ScheduleNotFound: If the room has no schedule with the given ID.
+        """
+        with self._lock:
+            return self._schedules[self._position_of(schedule_id)]
+
+    def cancel_schedule(self, schedule_id: int) -> Schedule:
+        """Cancels a schedule of the room, freeing its period.
+
+        The last schedule of the room takes the place of the cancelled one in `schedules`.
+
+        Args:
+            schedule_id (int): ID of the schedule to cancel.
+
+        Returns:
+            Schedule: The cancelled schedule.
+
+        Raises:
+            ScheduleNotFound: If the room has no schedule with the given ID.
+        """
+        with self._lock:
+            position = self._position_of(schedule_id)
+            cancelled = self._schedules[position]
+            self._commit()
+            self._schedule_versions.pop(schedule_id, None)
+            last = self._schedules.pop()
+            del self._schedule_positions[schedule_id]
+            if last is not cancelled:
+                self._schedules[position] = last
+                self._schedule_positions[last.id] = position
+            self._schedule_index.remove(cancelled)
+            self._unfollow(cancelled)
+            self._notify("schedule_cancelled", schedule=cancelled)
+            return cancelled
 
     def is_period_available(
         self,
@@ -113,17 +296,36 @@ class Room:
         if ignore_schedule and schedule_id is None:
             raise ValueError("Schedule ID is missing")
 
-        for scheduled in self._schedules:
-            if ignore_schedule and scheduled.id == schedule_id:
-                continue
+        with self._lock:
+            return not self._schedule_index.overlaps(
+                period.start, period.end, ignore_schedule=ignore_schedule, schedule_id=schedule_id
+            )
+
+    def available_windows(self, start: datetime, end: datetime, min_nights: int = 1) -> List[Period]:
+        """Lists the free windows of the room between two dates.
+
+        Bookings are day granular and closed, so a window starts the day after the booking
+        before it and ends the day before the booking after it.
 
-            if (
-                (scheduled.period.start <= period.start <= scheduled.period.end)
-                or (scheduled.period.start <= period.end <= scheduled.period.end)
-                or (period.start <= scheduled.period.start <= period.end)
-            ):
-                return False
-        return True
+        Args:
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_nights (int, optional): Shortest window to report, in nights. Defaults to 1.
+
+        Returns:
+            List[Period]: The free windows of the room, in date order.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> room = Room(RoomTypeEnum.SUITE, 1450, [])
+            >>> room.add_schedule(Schedule("Client A", Period(datetime(2024, 11, 16), datetime(2024, 11, 19))))
+            >>> for window in room.available_windows(datetime(2024, 11, 10), datetime(2024, 11, 30)):
+            ...     print(window)
+            START: 2024-11-10 00:00:00 | END: 2024-11-15 00:00:00
+            START: 2024-11-20 00:00:00 | END: 2024-11-30 00:00:00
+        """
+        with self._lock:
+            return self._schedule_index.free_windows(start, end, timedelta(days=min_nights), window=Period)
 
     def update_price(self, new_price: float):
         """Updates the room price.
@@ -135,7 +337,11 @@ class Room:
             ValueError: If the new price is negative.
         """
         self._validate_room_price(new_price)
-        self._price = new_price
+        with self._lock:
+            old_price = self._price
+            self._commit()
+            self._price = new_price
+            self._notify("price_updated", old_price=old_price, new_price=new_price)
 
     def update_schedule(self, schedule: Schedule, schedule_id: int):
         """Updates an existing schedule if the period is available.
@@ -146,16 +352,189 @@ class Room:
 
         Raises:
             ScheduleCannotBeOverwritten: If the period is not available for update.
+            ScheduleNotFound: If the room has no schedule with the given ID.
+        """
+        with self._lock:
+            position = self._position_of(schedule_id)
+            if not self.is_period_available(schedule.period, ignore_schedule=True, schedule_id=schedule_id):
+                raise ScheduleCannotBeOverwritten("The schedule cannot be overwritten")
+
+            replaced = self._schedules[position]
+            self._commit()
+            self._schedule_versions.pop(schedule_id, None)
+            self._schedules[position] = schedule
+            del self._schedule_positions[schedule_id]
+            self._schedule_positions[schedule.id] = position
+            self._schedule_index.remove(replaced)
+            self._schedule_index.add(schedule)
+            self._unfollow(replaced)
+            self._follow([schedule])
+            self._notify("schedule_updated", old_schedule=replaced, new_schedule=schedule)
+
+    def _follow(self, schedules: List[Schedule]) -> None:
+        """Follows schedules and their periods, so that changes made in place reach the room.
+
+        Args:
+            schedules (List[Schedule]): The schedules to follow.
+        """
+        # Schedules and periods stored outside `Schedule` and `Period` objects (e.g. `StoredSchedule`
+        # views) cannot change in place.
+        followed, periods = [], []
+        for schedule in schedules:
+            if isinstance(schedule, Observable):
+                followed.append(schedule)
+                period = schedule.period
+                if isinstance(period, Observable):
+                    self._period_owners[period] = schedule
+                    periods.append(period)
+        Observable.subscribe_all(followed, self._on_schedule_event)
+        Observable.subscribe_all(periods, self._on_period_event)
+
+    def _unfollow(self, schedule: Schedule) -> None:
+        # A change rejected by another listener after the room was told of it leaves its copy behind.
+        self._in_place.pop(schedule.id, None)
+        if isinstance(schedule, Observable):
+            schedule.unsubscribe(self._on_schedule_event)
+            if self._period_owners.pop(schedule.period, None) is not None:
+                schedule.period.unsubscribe(self._on_period_event)
+
+    def _on_schedule_event(self, event: str, schedule: Schedule, **details) -> None:
+        """Commits and forwards the client renames of the room schedules."""
+        if event == "client_name_changing":
+            with self._lock:
+                self._in_place[schedule.id] = self._copy_schedule(schedule)
+        elif event == "client_name_changed":
+            with self._lock:
+                period = schedule.period
+                self._commit(
+                    {schedule.id: ScheduleVersion(schedule.id, details["old_client_name"], period.start, period.end)}
+                )
+                self._in_place.pop(schedule.id, None)
+                self._schedule_versions.pop(schedule.id, None)
+                self._notify(event, schedule=schedule, **details)
+
+    def _on_period_event(self, event: str, period: Period, **details) -> None:
+        """Checks and re-indexes schedules whose period is changed in place.
+
+        Raises:
+            ScheduleCannotBeOverwritten: If the new bounds would overlap another schedule of the room.
+        """
+        with self._lock:
+            schedule = self._period_owners[period]
+            if event == "period_changing":
+                if self._schedule_index.overlaps(
+                    details["start"], details["end"], ignore_schedule=True, schedule_id=schedule.id
+                ):
+                    raise ScheduleCannotBeOverwritten("The schedule cannot be overwritten")
+                self._in_place[schedule.id] = self._copy_schedule(schedule)
+            elif event == "period_changed":
+                self._commit(
+                    {
+                        schedule.id: ScheduleVersion(
+                            schedule.id, schedule.client_name, details["old_start"], details["old_end"]
+                        )
+                    }
+                )
+                self._in_place.pop(schedule.id, None)
+                self._schedule_versions.pop(schedule.id, None)
+                self._schedule_index.remove(schedule)
+                self._schedule_index.add(schedule)
+                self._notify(event, schedule=schedule, **details)
+
+    def _commit(self, changed: Dict[int, ScheduleVersion] | None = None) -> None:
+        """Commits a change about to be applied, keeping the current state if a snapshot may read it.
+
+        Must be called with the room lock held, after the change is validated.
+
+        Args:
+            changed (Dict[int, ScheduleVersion] | None, optional): State of the schedules before the
+                change, for changes already applied in place. Defaults to none.
         """
-        if not self.is_period_available(schedule.period, ignore_schedule=True, schedule_id=schedule_id):
-            raise ScheduleCannotBeOverwritten("The schedule cannot be overwritten")
+        changed_at, oldest, newest = VERSION_CLOCK.commit(self, bool(self._old_versions))
+        if oldest is not None or self._old_versions:
+            old_versions = self._old_versions
+            if newest is not None and newest > self._changed_at:
+                version = self._version if changed is None and self._version is not None else self._capture(changed)
+                old_versions = ((self._changed_at, version),) + old_versions
+            self._old_versions = prune_versions(old_versions, changed_at, oldest)
+            if not self._old_versions:
+                VERSION_CLOCK.forget(self)
+        self._changed_at = changed_at
+        self._version = None
+
+    def _capture(self, changed: Dict[int, ScheduleVersion] | None = None) -> RoomVersion:
+        """Copies the current state of the room, sharing the copies of the schedules that did not change.
 
-        schedule_index_to_update = -1
-        for schedule_index, scheduled in enumerate(self._schedules):
-            if scheduled.id == schedule_id:
-                schedule_index_to_update = schedule_index
+        Args:
+            changed (Dict[int, ScheduleVersion] | None, optional): Versions to use instead of the
+                current state of some schedules, by ID. Defaults to none.
 
-        self._schedules[schedule_index_to_update] = schedule
+        Returns:
+            RoomVersion: The copy.
+        """
+        if self._in_place:
+            # Changes being made in place are not committed yet: the previous state is still current.
+            changed = {**self._in_place, **changed} if changed else self._in_place
+        cached = self._schedule_versions
+        schedules = []
+        for schedule in self._schedules:
+            version = cached.get(schedule.id)
+            if version is None:
+                period = schedule.period
+                version = ScheduleVersion(schedule.id, schedule.client_name, period.start, period.end)
+                # Only `Schedule` objects report their changes, other schedules are copied every time.
+                if isinstance(schedule, Observable):
+                    cached[schedule.id] = version
+            schedules.append(changed.get(schedule.id, version) if changed else version)
+        return RoomVersion(self.number, self._type, self._price, tuple(schedules))
+
+    @staticmethod
+    def _copy_schedule(schedule: Schedule) -> ScheduleVersion:
+        period = schedule.period
+        return ScheduleVersion(schedule.id, schedule.client_name, period.start, period.end)
+
+    def _version_at(self, version: int) -> RoomVersion:
+        """Gets the state of the room as of a version number read by an open snapshot.
+
+        Args:
+            version (int): The version number.
+
+        Returns:
+            RoomVersion: The state of the room after the changes numbered below `version`.
+        """
+        with self._lock:
+            if version >= self._changed_at:
+                if self._version is None:
+                    self._version = self._capture()
+                return self._version
+            for changed_at, old_version in self._old_versions:
+                if changed_at <= version:
+                    return old_version
+        raise ValueError(f"Version {version} of room {self.number} is no longer kept.")
+
+    def _prune_versions(self) -> None:
+        """Drops the old versions no open snapshot reads, once a snapshot is released."""
+        with self._lock:
+            self._old_versions = prune_versions(self._old_versions, self._changed_at, VERSION_CLOCK.oldest())
+            if not self._old_versions:
+                VERSION_CLOCK.forget(self)
+
+    def _position_of(self, schedule_id: int) -> int:
+        """Finds the position of a schedule in `_schedules`.
+
+        Args:
+            schedule_id (int): ID of the schedule.
+
+        Returns:
+            int: The position of the schedule.
+
+        Raises:
+            ScheduleNotFound: If the room has no schedule with the given ID.
+        """
+        position = self._schedule_positions.get(schedule_id)
+        if position is None:
+            raise ScheduleNotFound(f'Room "{self._type.value}-{self.number}" has no schedule {schedule_id}')
+        return position
 
     def _set_multiplier_factor(self, room_type: RoomTypeEnum) -> None:
         """Sets the multiplier factor for room price based on the room type.
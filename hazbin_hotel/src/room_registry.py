@@ -0,0 +1,399 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
+from heapq import merge
+from itertools import accumulate, chain
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotFound, RoomNumberTaken
+from hazbin_hotel.src.room import Room
+
+_BLOCK_SIZE = 128
+"""int: Rooms per block of `OrderedRooms`; a block is split once it holds twice as many."""
+
+
+def _number(room: Room) -> int:
+    return room.number
+
+
+class OrderedRooms(Sequence):
+    """Immutable sequence of rooms in number order, stored as a list of blocks.
+
+    The blocks are tuples shared between successive sequences: adding or removing a room
+    rebuilds its block and the tuple of blocks, O(b + n/b) for n rooms in blocks of b, rather
+    than copying every room, so a `HotelSnapshot` holds the rooms of the hotel as they were
+    when it opened without copying them.
+
+    Attributes:
+        _blocks (Tuple[Tuple[Room, ...], ...]): The rooms, in number order, split in blocks.
+        _offsets (Tuple[int, ...]): Position of the first room of each block.
+        _length (int): Number of rooms.
+    """
+
+    __slots__ = ("_blocks", "_offsets", "_length")
+
+    def __init__(self, blocks: Iterable[Tuple[Room, ...]] = ()) -> None:
+        """Initializes the sequence over some blocks.
+
+        Args:
+            blocks (Iterable[Tuple[Room, ...]], optional): Non-empty blocks of rooms, in number order.
+                Defaults to none.
+        """
+        self._blocks = tuple(blocks)
+        offsets = tuple(accumulate(map(len, self._blocks), initial=0))
+        self._offsets = offsets[:-1]
+        self._length = offsets[-1]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Room]:
+        return chain.from_iterable(self._blocks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("room index out of range")
+        block = bisect_right(self._offsets, index) - 1
+        return self._blocks[block][index - self._offsets[block]]
+
+    def __repr__(self) -> str:
+        return f"OrderedRooms({list(self)!r})"
+
+
+class RoomRegistry:
+    """Rooms of a hotel keyed by room number, also grouped by type.
+
+    Rooms are looked up by number in a dict, in constant time, and kept in number order both
+    overall, in the blocks of an `OrderedRooms`, and within each type, in a list sorted with
+    `bisect`. For n rooms, k of them of the type of the room, in blocks of b rooms:
+
+    - `add` and `remove` rebuild one block and the tuple of blocks, O(b + n/b), and insert
+      into or delete from the list of the type, O(k). They never re-sort the rooms;
+    - `add_many` and `remove_many` merge or filter every block and type list once, O(n + m log m)
+      for m rooms, rather than m times O(b + n/b + k);
+    - every change makes the next `of_type` call of a type rebuild its tuple, O(k).
+
+    Positional access goes through `ordered`, an immutable sequence replaced on every change,
+    and `of_type` returns a tuple built on first use after a change, so scanning the rooms
+    while they are being added or removed is safe, and repeated reads copy nothing. Each
+    tuple is cached with the number of changes it was built after, so a tuple built while
+    the registry changed is never served once the change is done.
+
+    The registry is not thread safe: `Hotel` changes it under its own lock.
+
+    Attributes:
+        _changes (int): Number of changes made to the registry, counted once each change is done.
+        _rooms (Dict[int, Room]): Rooms by number.
+        _blocks (List[Tuple[Room, ...]]): Blocks of `_ordered`, in number order.
+        _firsts (List[int]): Number of the first room of each block.
+        _ordered (OrderedRooms): Rooms in number order, as of the last change.
+        _rooms_by_type (Dict[RoomTypeEnum, List[Room]]): Rooms of each type, in number order.
+        _filed_types (Dict[int, RoomTypeEnum]): Type each room is filed under, by room number.
+        _of_type (Dict[RoomTypeEnum, Tuple[int, Tuple[Room, ...]]]): Rooms of each type, with the value of
+            `_changes` they were read at.
+    """
+
+    __slots__ = ("_changes", "_rooms", "_blocks", "_firsts", "_ordered", "_rooms_by_type", "_filed_types", "_of_type")
+
+    def __init__(self, rooms: Iterable[Room] = ()) -> None:
+        """Initializes the registry with some rooms.
+
+        Args:
+            rooms (Iterable[Room], optional): The rooms to register. Defaults to none.
+
+        Raises:
+            RoomNumberTaken: If two rooms share a number.
+        """
+        self._changes = 0
+        self._rooms: Dict[int, Room] = {}
+        self._rooms_by_type: Dict[RoomTypeEnum, List[Room]] = {}
+        self._filed_types: Dict[int, RoomTypeEnum] = {}
+        self._of_type: Dict[RoomTypeEnum, Tuple[int, Tuple[Room, ...]]] = {}
+        # Sorted rooms are appended to the type lists and cut into blocks in one pass.
+        rooms = sorted(rooms, key=_number)
+        for room in rooms:
+            if room.number in self._rooms:
+                raise RoomNumberTaken(f'Room number {room.number} is already taken by "{self._describe(room.number)}"')
+            self._rooms[room.number] = room
+            self._file(room, room.type)
+        self._cut_blocks(rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def __iter__(self) -> Iterator[Room]:
+        return iter(self._ordered)
+
+    def __contains__(self, room: object) -> bool:
+        return isinstance(room, Room) and self._rooms.get(room.number) is room
+
+    def ordered(self) -> OrderedRooms:
+        """Lists the rooms in number order.
+
+        Returns:
+            OrderedRooms: The rooms, an immutable sequence shared until the registry changes.
+        """
+        return self._ordered
+
+    def get(self, number: int) -> Room | None:
+        """Gets a room by its number.
+
+        Args:
+            number (int): The room number.
+
+        Returns:
+            Room | None: The room, or None if no room has this number.
+        """
+        return self._rooms.get(number)
+
+    def of_type(self, room_type: RoomTypeEnum) -> Tuple[Room, ...]:
+        """Lists the rooms of a type in number order.
+
+        Args:
+            room_type (RoomTypeEnum): The room type.
+
+        Returns:
+            Tuple[Room, ...]: The rooms of the type, shared until the registry changes.
+        """
+        changes = self._changes
+        cached = self._of_type.get(room_type)
+        if cached is None or cached[0] != changes:
+            cached = self._of_type[room_type] = (changes, tuple(self._rooms_by_type.get(room_type, ())))
+        return cached[1]
+
+    def first_of_type(self, room_type: RoomTypeEnum) -> Room | None:
+        """Gets the lowest numbered room of a type.
+
+        Args:
+            room_type (RoomTypeEnum): The room type.
+
+        Returns:
+            Room | None: The room, or None if the registry has no room of the type.
+        """
+        return next(iter(self._rooms_by_type.get(room_type, ())), None)
+
+    def has_type(self, room: Room, room_type: RoomTypeEnum) -> bool:
+        """Checks if a room is registered under a type.
+
+        Args:
+            room (Room): The room.
+            room_type (RoomTypeEnum): The room type.
+
+        Returns:
+            bool: True if the room is registered and filed under the type.
+        """
+        return self._rooms.get(room.number) is room and self._filed_types.get(room.number) is room_type
+
+    def add(self, room: Room) -> None:
+        """Registers a room under its number and current type.
+
+        Args:
+            room (Room): The room to register.
+
+        Raises:
+            RoomNumberTaken: If another room has the same number.
+        """
+        if room.number in self._rooms:
+            raise RoomNumberTaken(f'Room number {room.number} is already taken by "{self._describe(room.number)}"')
+        self._rooms[room.number] = room
+        self._insert_ordered(room)
+        self._file(room, room.type)
+        self._changes += 1
+
+    def add_many(self, rooms: Iterable[Room]) -> None:
+        """Registers rooms under their number and current type, all or none of them.
+
+        Args:
+            rooms (Iterable[Room]): The rooms to register.
+
+        Raises:
+            RoomNumberTaken: If another room, registered or among `rooms`, has the same number as one of them.
+        """
+        added: Dict[int, Room] = {}
+        for room in rooms:
+            if room.number in self._rooms:
+                raise RoomNumberTaken(f'Room number {room.number} is already taken by "{self._describe(room.number)}"')
+            if room.number in added:
+                raise RoomNumberTaken(f"Room number {room.number} is given to two of the added rooms")
+            added[room.number] = room
+        if not added:
+            return
+        rooms = sorted(added.values(), key=_number)
+        self._rooms.update(added)
+        by_type: Dict[RoomTypeEnum, List[Room]] = {}
+        for room in rooms:
+            by_type.setdefault(room.type, []).append(room)
+            self._filed_types[room.number] = room.type
+        for room_type, typed in by_type.items():
+            self._rooms_by_type[room_type] = list(merge(self._rooms_by_type.get(room_type, ()), typed, key=_number))
+        self._cut_blocks(list(merge(self._ordered, rooms, key=_number)))
+        self._changes += 1
+
+    def remove_many(self, rooms: Iterable[Room]) -> None:
+        """Unregisters rooms, all or none of them.
+
+        Args:
+            rooms (Iterable[Room]): The rooms to unregister.
+
+        Raises:
+            RoomNotFound: If one of the rooms is not registered, or is listed twice.
+        """
+        removed: Dict[int, Room] = {}
+        for room in rooms:
+            if room not in self or room.number in removed:
+                raise RoomNotFound(f"Room {room.number} is not registered in this hotel")
+            removed[room.number] = room
+        if not removed:
+            return
+        types = set()
+        for number in removed:
+            del self._rooms[number]
+            types.add(self._filed_types.pop(number))
+        for room_type in types:
+            kept = [room for room in self._rooms_by_type[room_type] if room.number not in removed]
+            if kept:
+                self._rooms_by_type[room_type] = kept
+            else:
+                del self._rooms_by_type[room_type]
+        self._cut_blocks([room for room in self._ordered if room.number not in removed])
+        self._changes += 1
+
+    def remove(self, room: Room) -> None:
+        """Unregisters a room.
+
+        Args:
+            room (Room): The room to unregister.
+
+        Raises:
+            RoomNotFound: If the room is not registered.
+        """
+        if room not in self:
+            raise RoomNotFound(f"Room {room.number} is not registered in this hotel")
+        del self._rooms[room.number]
+        self._remove_ordered(room)
+        self._unfile(room, room.type)
+        self._changes += 1
+
+    def retype(self, room: Room, old_type: RoomTypeEnum, new_type: RoomTypeEnum) -> None:
+        """Files a registered room under its new type. Rooms must be retyped as soon as their type changes.
+
+        Args:
+            room (Room): The retyped room.
+            old_type (RoomTypeEnum): The type the room was filed under.
+            new_type (RoomTypeEnum): The new type of the room.
+        """
+        self._unfile(room, old_type)
+        self._file(room, new_type)
+        self._changes += 1
+
+    def _cut_blocks(self, rooms: List[Room]) -> None:
+        """Replaces the ordered rooms with rooms already in number order."""
+        self._blocks: List[Tuple[Room, ...]] = [
+            tuple(rooms[start : start + _BLOCK_SIZE]) for start in range(0, len(rooms), _BLOCK_SIZE)
+        ]
+        self._firsts: List[int] = [block[0].number for block in self._blocks]
+        self._ordered = OrderedRooms(self._blocks)
+
+    def _insert_ordered(self, room: Room) -> None:
+        blocks, firsts = self._blocks, self._firsts
+        if not blocks:
+            blocks.append((room,))
+            firsts.append(room.number)
+        else:
+            index = max(bisect_right(firsts, room.number) - 1, 0)
+            block = blocks[index]
+            position = bisect_left(block, room.number, key=_number)
+            block = block[:position] + (room,) + block[position:]
+            if len(block) > 2 * _BLOCK_SIZE:
+                blocks[index : index + 1] = [block[:_BLOCK_SIZE], block[_BLOCK_SIZE:]]
+                firsts[index : index + 1] = [block[0].number, block[_BLOCK_SIZE].number]
+            else:
+                blocks[index] = block
+                firsts[index] = block[0].number
+        self._ordered = OrderedRooms(blocks)
+
+    def _remove_ordered(self, room: Room) -> None:
+        blocks, firsts = self._blocks, self._firsts
+        index = bisect_right(firsts, room.number) - 1
+        block = blocks[index]
+        position = bisect_left(block, room.number, key=_number)
+        block = block[:position] + block[position + 1 :]
+        if block:
+            blocks[index] = block
+            firsts[index] = block[0].number
+        else:
+            del blocks[index]
+            del firsts[index]
+        self._ordered = OrderedRooms(blocks)
+
+    def _file(self, room: Room, room_type: RoomTypeEnum) -> None:
+        insort(self._rooms_by_type.setdefault(room_type, []), room, key=_number)
+        self._filed_types[room.number] = room_type
+
+    def _unfile(self, room: Room, room_type: RoomTypeEnum) -> None:
+        del self._filed_types[room.number]
+        rooms = self._rooms_by_type[room_type]
+        del rooms[bisect_left(rooms, room.number, key=_number)]
+        if not rooms:
+            del self._rooms_by_type[room_type]
+
+    def _describe(self, number: int) -> str:
+        room = self._rooms[number]
+        return f"{room.type.value}-{room.number}"
+
+
+class RoomsView(Sequence):
+    """Read-only view over the rooms of a registry, in number order.
+
+    The view follows the registry: rooms added or removed later show up in it. Indexing
+    and iteration use `RoomRegistry.ordered`, membership is a lookup by number.
+
+    Examples:
+        >>> registry = RoomRegistry([Room(RoomTypeEnum.SUITE, 1450, [])])
+        >>> rooms = RoomsView(registry)
+        >>> registry.add(Room(RoomTypeEnum.FAMILY, 1000, []))
+        >>> [room.type.value for room in rooms]
+        ['SUITE', 'FAMILY']
+        >>> rooms[-1] in rooms, len(rooms)
+        (True, 2)
+    """
+
+    __slots__ = ("_registry",)
+
+    def __init__(self, registry: RoomRegistry) -> None:
+        """Initializes the view over a registry.
+
+        Args:
+            registry (RoomRegistry): The registry to expose.
+        """
+        self._registry = registry
+
+    def __len__(self) -> int:
+        return len(self._registry)
+
+    def __getitem__(self, index):
+        return self._registry.ordered()[index]
+
+    def __iter__(self) -> Iterator[Room]:
+        return iter(self._registry.ordered())
+
+    def __contains__(self, room: object) -> bool:
+        return room in self._registry
+
+    def __repr__(self) -> str:
+        return f"RoomsView({list(self)!r})"
+
+    def get(self, number: int) -> Room | None:
+        """Gets a room by its number.
+
+        Args:
+            number (int): The room number.
+
+        Returns:
+            Room | None: The room, or None if no room has this number.
+        """
+        return self._registry.get(number)
@@ -1,17 +1,35 @@
+import threading
+
+from hazbin_hotel.src.observable import Observable
 from hazbin_hotel.src.period import Period
 
 
-class Schedule:
+class Schedule(Observable):
     """
     Represents a schedule for a client within a specific period.
 
+    Subscribed listeners are notified twice when the client name is changed: with
+    `"client_name_changing"` (`client_name`) before the change, and with
+    `"client_name_changed"` (`old_client_name`, `new_client_name`) once it is applied.
+    Listeners are not pickled.
+
+    The period of a booked schedule can be changed in place, the room is notified by the
+    period itself, but it must be replaced through `Room.update_schedule`.
+
     Attributes:
         client_name (str): The name of the client.
         period (Period): The period of the schedule.
         id (int): The unique identifier for the schedule.
+        instance_counter (int): Next schedule ID to allocate.
+        id_stride (int): Step between allocated IDs, so processes sharing an ID space can
+            allocate from disjoint sequences.
     """
 
+    __slots__ = ("_client_name", "period", "id")
+
     instance_counter = 0
+    id_stride = 1
+    _id_lock = threading.Lock()
 
     def __init__(self, client_name: str, period: Period) -> None:
         """
@@ -21,10 +39,47 @@ class Schedule:
             client_name (str): The name of the client.
             period (Period): The period of the schedule.
         """
+        super().__init__()
         self._client_name = client_name
         self.period = period
-        self.id = Schedule.instance_counter
-        Schedule.instance_counter += 1
+        self.id = Schedule.allocate_id()
+
+    @staticmethod
+    def allocate_id() -> int:
+        """
+        Atomically takes the next schedule ID from `instance_counter`.
+
+        Returns:
+            int: A schedule ID not taken by any other thread.
+        """
+        with Schedule._id_lock:
+            schedule_id = Schedule.instance_counter
+            Schedule.instance_counter += Schedule.id_stride
+        return schedule_id
+
+    @staticmethod
+    def reserve_ids_up_to(schedule_id: int) -> None:
+        """
+        Makes sure IDs up to `schedule_id` are never allocated again, e.g. after restoring schedules.
+
+        The counter moves by whole strides, so it stays in its sequence when `id_stride` is above 1.
+
+        Args:
+            schedule_id (int): The highest ID already in use.
+        """
+        with Schedule._id_lock:
+            if Schedule.instance_counter <= schedule_id:
+                strides = (schedule_id - Schedule.instance_counter) // Schedule.id_stride + 1
+                Schedule.instance_counter += strides * Schedule.id_stride
+
+    def __getstate__(self) -> tuple:
+        """Pickles the schedule data without its listeners."""
+        return self._client_name, self.period, self.id
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restores a pickled schedule, without listeners."""
+        self._listeners = None
+        self._client_name, self.period, self.id = state
 
     @property
     def client_name(self) -> str:
@@ -59,4 +114,10 @@ class Schedule:
             >>> print(schedule.client_name)
             Client B
         """
+        old_client_name = self._client_name
+        if old_client_name == value or not self._listeners:
+            self._client_name = value
+            return
+        self._notify("client_name_changing", client_name=value)
         self._client_name = value
+        self._notify("client_name_changed", old_client_name=old_client_name, new_client_name=value)
@@ -0,0 +1,207 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Sequence, Tuple
+
+from hazbin_hotel.src.schedule import Schedule
+
+
+def _bounds(start: Any, end: Any) -> Tuple[Any, Any]:
+    return start, end
+
+
+def free_windows(
+    starts: Sequence[Any],
+    ends: Sequence[Any],
+    start: Any,
+    end: Any,
+    min_length: Any,
+    step: Any,
+    lo: int = 0,
+    hi: int | None = None,
+    window: Callable[[Any, Any], Any] = _bounds,
+) -> List[Any]:
+    """Sweeps sorted, non-overlapping bookings for the free windows inside [start, end].
+
+    Bookings are closed intervals, so a window starts one `step` after the booking before
+    it and ends one `step` before the booking after it. Bounds may be datetimes (with
+    timedelta lengths) or integer timestamps, as long as all arguments agree.
+
+    Args:
+        starts (Sequence): Booking starts, sorted ascending.
+        ends (Sequence): Booking ends, aligned with `starts` and therefore sorted as well.
+        start: Start of the searched range.
+        end: End of the searched range.
+        min_length: Shortest window to report, measured as `window end - window start`.
+        step: Granularity of bookings, the gap kept between a window and a booking.
+        lo (int, optional): First booking to consider. Defaults to 0.
+        hi (int | None, optional): Booking after the last one to consider. Defaults to `len(starts)`.
+        window (Callable, optional): Builds each reported window from its start and end.
+            Defaults to a (start, end) tuple.
+
+    Returns:
+        List: The free windows, in date order.
+
+    Examples:
+        >>> free_windows([5, 12], [8, 14], 0, 20, min_length=2, step=1)
+        [(0, 4), (9, 11), (15, 20)]
+    """
+    if hi is None:
+        hi = len(starts)
+    first = bisect_left(ends, start, lo, hi)
+    windows = []
+    cursor = start
+    # Bookings ending before the range are skipped; the rest are visited in order until
+    # one starts after it. Ends are sorted and at least `start`, so each booking pushes
+    # the cursor forward.
+    for booked_from, booked_until in zip(starts[first:hi], ends[first:hi]):
+        if booked_from > end:
+            break
+        window_end = booked_from - step
+        if window_end - cursor >= min_length:
+            windows.append(window(cursor, window_end))
+        cursor = booked_until + step
+    if end - cursor >= min_length:
+        windows.append(window(cursor, end))
+    return windows
+
+
+class ScheduleIndex:
+    """Sorted interval index over the schedules of a single room.
+
+    Starts and ends are kept in parallel lists sorted by start date, so overlap checks
+    are answered with a binary search instead of scanning every schedule. A room never
+    stores overlapping schedules, which means the ends are sorted as well and only the
+    schedule starting right before the end of the probed period can overlap it.
+
+    Periods are closed intervals, matching `Room.is_period_available`: two periods
+    sharing a single instant overlap.
+
+    Attributes:
+        _starts (List[datetime]): Start dates, sorted ascending.
+        _ends (List[datetime]): End dates, aligned with `_starts`.
+        _schedules (List[Schedule]): Indexed schedules, aligned with `_starts`.
+        _bounds (Dict[Schedule, Tuple[datetime, datetime]]): Bounds each schedule was indexed with.
+    """
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._starts = []
+        self._ends = []
+        self._schedules = []
+        self._bounds = {}
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __contains__(self, schedule: Schedule) -> bool:
+        return schedule in self._bounds
+
+    def add(self, schedule: Schedule) -> None:
+        """Indexes a schedule under the current bounds of its period.
+
+        Args:
+            schedule (Schedule): The schedule to index.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> from hazbin_hotel.src.period import Period
+            >>> index = ScheduleIndex()
+            >>> index.add(Schedule("Client A", Period(datetime(2024, 11, 16), datetime(2024, 11, 19))))
+            >>> len(index)
+            1
+        """
+        start, end = schedule.period.start, schedule.period.end
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._ends.insert(position, end)
+        self._schedules.insert(position, schedule)
+        self._bounds[schedule] = (start, end)
+
+    def remove(self, schedule: Schedule) -> None:
+        """Removes a schedule from the index.
+
+        The bounds stored when the schedule was indexed are used to locate it, so a
+        schedule whose period was changed in place can still be removed.
+
+        Args:
+            schedule (Schedule): The schedule to remove.
+
+        Raises:
+            KeyError: If the schedule is not indexed.
+        """
+        start, _ = self._bounds.pop(schedule)
+        position = bisect_left(self._starts, start)
+        while self._schedules[position] is not schedule:
+            position += 1
+        del self._starts[position]
+        del self._ends[position]
+        del self._schedules[position]
+
+    def bounds(self, schedule: Schedule) -> Tuple[datetime, datetime]:
+        """Returns the (start, end) bounds a schedule was indexed with.
+
+        Args:
+            schedule (Schedule): An indexed schedule.
+
+        Returns:
+            Tuple[datetime, datetime]: The indexed start and end dates.
+        """
+        return self._bounds[schedule]
+
+    def overlaps(
+        self, start: datetime, end: datetime, *, ignore_schedule: bool = False, schedule_id: int = None
+    ) -> bool:
+        """Checks if the closed interval [start, end] overlaps any indexed schedule.
+
+        Args:
+            start (datetime): Start of the probed period.
+            end (datetime): End of the probed period.
+            ignore_schedule (bool, optional): Whether to ignore a specific schedule. Defaults to False.
+            schedule_id (int, optional): ID of the schedule to ignore if `ignore_schedule` is True.
+
+        Returns:
+            bool: True if an indexed schedule overlaps the period.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> from hazbin_hotel.src.period import Period
+            >>> index = ScheduleIndex()
+            >>> schedule = Schedule("Client A", Period(datetime(2024, 11, 16), datetime(2024, 11, 19)))
+            >>> index.add(schedule)
+            >>> index.overlaps(datetime(2024, 11, 19), datetime(2024, 11, 21))
+            True
+            >>> index.overlaps(datetime(2024, 11, 20), datetime(2024, 11, 21))
+            False
+            >>> index.overlaps(
+            ...     datetime(2024, 11, 17), datetime(2024, 11, 18), ignore_schedule=True, schedule_id=schedule.id
+            ... )
+            False
+        """
+        # Schedules starting after `end` cannot overlap; the ends of the others are
+        # sorted, so only the last one (or the one before it, if ignored) matters.
+        position = bisect_right(self._starts, end) - 1
+        if ignore_schedule and position >= 0 and self._schedules[position].id == schedule_id:
+            position -= 1
+        return position >= 0 and self._ends[position] >= start
+
+    def free_windows(
+        self,
+        start: datetime,
+        end: datetime,
+        min_length: timedelta,
+        step: timedelta = timedelta(days=1),
+        window: Callable[[datetime, datetime], Any] = _bounds,
+    ) -> List[Any]:
+        """Lists the free windows inside [start, end], as the module-level `free_windows` does.
+
+        Args:
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_length (timedelta): Shortest window to report.
+            step (timedelta, optional): Gap kept between a window and a booking. Defaults to one day.
+            window (Callable, optional): Builds each reported window. Defaults to a (start, end) tuple.
+
+        Returns:
+            List: The free windows, in date order.
+        """
+        return free_windows(self._starts, self._ends, start, end, min_length, step, window=window)
@@ -0,0 +1,197 @@
+import sys
+from array import array
+from datetime import datetime
+from typing import Iterator
+
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.utils import from_timestamp, to_timestamp
+
+
+class ScheduleStore:
+    """Columnar storage for large numbers of schedules.
+
+    Instead of one `Schedule` and one `Period` object per booking, the store keeps
+    start and end dates as int64 timestamps (see `utils.to_timestamp`), IDs in an int64
+    array and interned client names in a list. Rows are exposed through `StoredSchedule`
+    and `StoredPeriod` views, which provide the same interface as `Schedule` and `Period`
+    and can be handed to a `Room`.
+
+    Attributes:
+        _starts (array): Start timestamps, one per row.
+        _ends (array): End timestamps, one per row.
+        _ids (array): Schedule IDs, one per row.
+        _client_names (List[str]): Interned client names, one per row.
+    """
+
+    __slots__ = ("_starts", "_ends", "_ids", "_client_names")
+
+    def __init__(self) -> None:
+        """Initializes an empty store."""
+        self._starts = array("q")
+        self._ends = array("q")
+        self._ids = array("q")
+        self._client_names = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, row: int) -> "StoredSchedule":
+        if not -len(self) <= row < len(self):
+            raise IndexError("ScheduleStore index out of range")
+        return StoredSchedule(self, row % len(self))
+
+    def __iter__(self) -> Iterator["StoredSchedule"]:
+        for row in range(len(self)):
+            yield StoredSchedule(self, row)
+
+    def append(self, client_name: str, start: datetime, end: datetime) -> "StoredSchedule":
+        """Stores a new booking, assigning it the next schedule ID.
+
+        Args:
+            client_name (str): The name of the client.
+            start (datetime): The start date of the booking.
+            end (datetime): The end date of the booking.
+
+        Returns:
+            StoredSchedule: A view over the stored booking.
+
+        Raises:
+            InvalidPeriodError: If the start date is after the end date.
+
+        Examples:
+            >>> from datetime import datetime
+            >>> store = ScheduleStore()
+            >>> schedule = store.append("Client A", datetime(2024, 11, 16), datetime(2024, 11, 19))
+            >>> print(schedule.client_name, schedule.period)
+            Client A START: 2024-11-16 00:00:00 | END: 2024-11-19 00:00:00
+        """
+        if start > end:
+            raise InvalidPeriodError("Start date must be before end date.")
+        return self._append_row(Schedule.allocate_id(), client_name, to_timestamp(start), to_timestamp(end))
+
+    def add(self, schedule: Schedule) -> "StoredSchedule":
+        """Copies an existing schedule into the store, keeping its ID.
+
+        Args:
+            schedule (Schedule): The schedule to copy.
+
+        Returns:
+            StoredSchedule: A view over the stored copy.
+        """
+        return self._append_row(
+            schedule.id,
+            schedule.client_name,
+            to_timestamp(schedule.period.start),
+            to_timestamp(schedule.period.end),
+        )
+
+    def _append_row(self, schedule_id: int, client_name: str, start: int, end: int) -> "StoredSchedule":
+        self._starts.append(start)
+        self._ends.append(end)
+        self._ids.append(schedule_id)
+        self._client_names.append(sys.intern(client_name))
+        return StoredSchedule(self, len(self._ids) - 1)
+
+
+class StoredPeriod:
+    """View over the period of one row of a `ScheduleStore`, with the `Period` interface.
+
+    Attributes:
+        _store (ScheduleStore): The store holding the row.
+        _row (int): Position of the row in the store.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: ScheduleStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def start(self) -> datetime:
+        """datetime: Gets the start date of the period."""
+        return from_timestamp(self._store._starts[self._row])
+
+    @property
+    def end(self) -> datetime:
+        """datetime: Gets the end date of the period."""
+        return from_timestamp(self._store._ends[self._row])
+
+    def change_start(self, start: datetime) -> bool:
+        """Changes the start date of the period, as `Period.change_start` does.
+
+        Args:
+            start (datetime): The new start date.
+
+        Returns:
+            bool: True if the start date was successfully changed, False otherwise.
+        """
+        timestamp = to_timestamp(start)
+        if timestamp > self._store._ends[self._row]:
+            return False
+        self._store._starts[self._row] = timestamp
+        return True
+
+    def change_end(self, end: datetime) -> bool:
+        """Changes the end date of the period, as `Period.change_end` does.
+
+        Args:
+            end (datetime): The new end date.
+
+        Returns:
+            bool: True if the end date was successfully changed, False otherwise.
+        """
+        timestamp = to_timestamp(end)
+        if self._store._starts[self._row] > timestamp:
+            return False
+        self._store._ends[self._row] = timestamp
+        return True
+
+    def __str__(self) -> str:
+        return f"START: {self.start} | END: {self.end}"
+
+
+class StoredSchedule:
+    """View over one row of a `ScheduleStore`, with the `Schedule` interface.
+
+    Views are created on demand and hold no booking data themselves. Two views over
+    the same row compare equal.
+
+    Attributes:
+        _store (ScheduleStore): The store holding the row.
+        _row (int): Position of the row in the store.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: ScheduleStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> int:
+        """int: Gets the unique identifier of the schedule."""
+        return self._store._ids[self._row]
+
+    @property
+    def client_name(self) -> str:
+        """str: Gets or sets the client name."""
+        return self._store._client_names[self._row]
+
+    @client_name.setter
+    def client_name(self, value: str) -> None:
+        self._store._client_names[self._row] = sys.intern(value)
+
+    @property
+    def period(self) -> StoredPeriod:
+        """StoredPeriod: Gets the period of the schedule."""
+        return StoredPeriod(self._store, self._row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StoredSchedule):
+            return NotImplemented
+        return self._store is other._store and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
@@ -0,0 +1,558 @@
+import itertools
+import multiprocessing
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    RoomNotAvailable,
+    RoomNotFound,
+    RoomTypeNotAvailable,
+    ScheduleNotFound,
+)
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.utils import format_date
+
+PARTITIONS = ("number", "type")
+"""tuple: Ways rooms can be partitioned across shards."""
+
+
+class ShardedHotel:
+    """Hotel whose rooms are partitioned across worker processes, one `Hotel` per shard.
+
+    A single `Hotel` is bound to one core by the GIL. Here each shard is a worker process
+    owning some of the rooms, reached over a local pipe, and this coordinator routes every
+    operation to the shards involved: by room number for operations on a room, by schedule
+    ID for operations on a schedule, and to every shard holding rooms of the requested type
+    for availability queries and bookings, merging their answers. Shards work in parallel
+    when a call fans out to several of them, when `schedule_many` splits a batch, and when
+    several threads use the coordinator at once.
+
+    Rooms are partitioned by `"number"` (round robin over room numbers, so every room type
+    spreads over the shards) or by `"type"` (all the rooms of a type live in one shard, so
+    bookings of a type never leave it).
+
+    The API matches `Hotel`, with two differences: rooms and schedules returned by the
+    coordinator are copies of the ones held by the shards, so they must be changed through
+    the coordinator, not in place; and `schedule_many` reports booked rooms by number, as
+    copying every booked room back with all its schedules would cost more than the booking.
+    Schedule IDs stay unique across shards: each shard allocates IDs from its own sequence,
+    and a schedule given to `update_schedule` or held by a room given to `add_room` receives
+    a new ID from the shard that stores it, which is written back or returned.
+
+    Call `close` (or use the hotel as a context manager) to stop the workers.
+
+    Attributes:
+        shards (int): Number of worker processes.
+        partition (str): How rooms are assigned to shards, one of `PARTITIONS`.
+        _room_shards (Dict[int, int]): Shard of each room, by room number.
+        _type_shards (Dict[RoomTypeEnum, Dict[int, int]]): Shards holding rooms of each type, with their room count.
+        _first_schedule_id (int): First ID allocated by the shards; shard `i` allocates `first + i + k × shards`.
+        _schedule_shards (Dict[int, int]): Shard of the schedules given IDs outside the shard sequences.
+        _lock (threading.Lock): Lock guarding the routing tables.
+        _connections (List[Connection]): Pipe end of each shard.
+        _connection_locks (List[threading.Lock]): Lock serializing the requests sent to each shard.
+        _processes (List[Process]): Worker process of each shard.
+    """
+
+    def __init__(self, rooms: List[Room], shards: int | None = None, partition: str = "number") -> None:
+        """Starts the workers and hands each one its share of the rooms.
+
+        Args:
+            rooms (List[Room]): The rooms of the hotel.
+            shards (int | None, optional): Number of worker processes. Defaults to the number of CPUs.
+            partition (str, optional): `"number"` or `"type"`. Defaults to `"number"`.
+
+        Raises:
+            ValueError: If the partition is not supported or `shards` is not positive.
+        """
+        if partition not in PARTITIONS:
+            raise ValueError(f'Unsupported partition "{partition}"')
+        shards = shards or os.cpu_count() or 1
+        if shards <= 0:
+            raise ValueError("A sharded hotel needs at least one shard.")
+
+        self.shards = shards
+        self.partition = partition
+        self._lock = threading.Lock()
+        self._room_shards = {}
+        self._type_shards = {}
+        self._schedule_shards = {}
+        self._next_shard = itertools.count()
+        self._first_schedule_id = max(
+            [Schedule.instance_counter] + [schedule.id + 1 for room in rooms for schedule in room.schedules]
+        )
+
+        partitions = [[] for _ in range(shards)]
+        for room in rooms:
+            shard = self._shard_for(room)
+            partitions[shard].append(room)
+            self._file_room(room, shard)
+            for schedule in room.schedules:
+                self._schedule_shards[schedule.id] = shard
+
+        context = multiprocessing.get_context()
+        self._connections = []
+        self._connection_locks = []
+        self._processes = []
+        for shard, shard_rooms in enumerate(partitions):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_serve,
+                args=(worker_connection, self._first_schedule_id + shard, shards),
+                name=f"hotel-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            # Rooms go through the pipe rather than the process arguments, so they are always
+            # pickled and the shard never inherits the listeners of the caller's objects.
+            connection.send(shard_rooms)
+            self._connections.append(connection)
+            self._connection_locks.append(threading.Lock())
+            self._processes.append(process)
+
+    def __enter__(self) -> "ShardedHotel":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def rooms(self) -> List[Room]:
+        """List[Room]: Gets copies of the rooms of every shard, sorted by room number."""
+        rooms = [room for rooms in self._fan_out(range(self.shards), "rooms") for room in rooms]
+        return sorted(rooms, key=lambda room: room.number)
+
+    def close(self) -> None:
+        """Stops the worker processes. The hotel cannot be used afterwards."""
+        for connection, lock in zip(self._connections, self._connection_locks):
+            with lock:
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass
+                connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def add_room(self, room: Room) -> List[int]:
+        """Adds a new room to the shard it belongs to.
+
+        The shard stores the schedules of the room under new IDs from its own sequence, as
+        IDs allocated by the caller may already be taken in the shard. The given room is left
+        untouched.
+
+        Args:
+            room (Room): The room to add to the hotel.
+
+        Returns:
+            List[int]: The IDs of the schedules of the room in the hotel, in `room.schedules` order.
+        """
+        shard = self._shard_for(room)
+        schedule_ids = self._call(shard, "add_room", room)
+        with self._lock:
+            self._file_room(room, shard)
+        return schedule_ids
+
+    def remove_room(self, room: Room) -> None:
+        """Removes a room from its shard if it has no schedules.
+
+        Args:
+            room (Room): The room to be removed.
+
+        Raises:
+            RoomHasSchedule: If the room has scheduled bookings.
+            RoomNotFound: If the room is not in this hotel.
+        """
+        shard = self._room_shards.get(room.number)
+        if shard is None:
+            raise RoomNotFound(f'Room "{room.type.value}-{room.number}" is not in this hotel')
+        removed = self._call(shard, "remove_room", room.number)
+        with self._lock:
+            self._unfile_room(removed, shard)
+
+    def check_room_type_availability(self, room_type: RoomTypeEnum) -> Room | None:
+        """Checks if there is a room of the specified type available.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room to check availability for.
+
+        Returns:
+            Room | None: A copy of a room of the specified type.
+
+        Raises:
+            RoomTypeNotAvailable: If no room of the specified type is available.
+        """
+        return self._call(self._shards_of(room_type)[0], "check_room_type_availability", room_type)
+
+    def find_available_room(self, room_type: RoomTypeEnum, period: Period) -> Room | None:
+        """Finds a room of the specified type that is free during the whole period.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the room must be free for.
+
+        Returns:
+            Room | None: A copy of a free room of the specified type, or None if all of them are booked.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+        """
+        rooms = self.find_available_rooms(room_type, period, limit=1)
+        return rooms[0] if rooms else None
+
+    def find_available_rooms(self, room_type: RoomTypeEnum, period: Period, limit: int | None = None) -> List[Room]:
+        """Finds the rooms of the specified type that are free during the whole period.
+
+        Every shard holding rooms of the type is queried in parallel.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            period (Period): The period the rooms must be free for.
+            limit (int | None, optional): Maximum number of rooms to return. Defaults to no limit.
+
+        Returns:
+            List[Room]: Copies of the free rooms of the specified type, grouped by shard.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+        """
+        answers = self._fan_out(self._shards_of(room_type), "find_available_rooms", room_type, period, limit)
+        return [room for rooms in answers for room in rooms][:limit]
+
+    def available_windows(
+        self, room_type: RoomTypeEnum, start: datetime, end: datetime, min_nights: int = 1
+    ) -> Dict[Room, List[Period]]:
+        """Lists the free windows of every room of the specified type between two dates.
+
+        Args:
+            room_type (RoomTypeEnum): The type of room requested.
+            start (datetime): Start of the searched range.
+            end (datetime): End of the searched range.
+            min_nights (int, optional): Shortest window to report, in nights. Defaults to 1.
+
+        Returns:
+            Dict[Room, List[Period]]: The free windows of a copy of each room of the type, grouped by shard.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the specified type.
+            InvalidPeriodError: If the start date is after the end date.
+        """
+        if start > end:
+            raise InvalidPeriodError("Start date must be before end date.")
+        answers = self._fan_out(self._shards_of(room_type), "available_windows", room_type, start, end, min_nights)
+        return {room: windows for answer in answers for room, windows in answer.items()}
+
+    def schedule_a_room(
+        self,
+        client_name: str,
+        room_type: RoomTypeEnum,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> bool:
+        """Schedules a room for a client if available.
+
+        The shards holding rooms of the type are tried in turn, starting from a different
+        one on each call so concurrent bookings spread over the shards.
+
+        Args:
+            client_name (str): The name of the client making the booking.
+            room_type (RoomTypeEnum): The type of room requested.
+            start_date (datetime): The start date of the booking period.
+            end_date (datetime): The end date of the booking period.
+
+        Returns:
+            bool: True if the booking was successful.
+
+        Raises:
+            RoomTypeNotAvailable: If the hotel has no room of the requested type.
+            RoomNotAvailable: If no room of the requested type is available for the specified period.
+        """
+        Period(start_date, end_date)
+        shards = self._shards_of(room_type)
+        first = next(self._next_shard) % len(shards)
+        for shard in shards[first:] + shards[:first]:
+            try:
+                return self._call(shard, "schedule_a_room", client_name, room_type, start_date, end_date)
+            except (RoomNotAvailable, RoomTypeNotAvailable):
+                continue
+        raise RoomNotAvailable(
+            f'"{room_type.value}" is not available from {format_date(start_date)} to {format_date(end_date)}'
+        )
+
+    def schedule_many(self, requests: Iterable[Tuple[str, RoomTypeEnum, datetime, datetime]]) -> List[int | Exception]:
+        """Schedules a batch of bookings, reporting the outcome of each one.
+
+        The batch is split between the shards holding rooms of each requested type, and
+        the shards book their part in parallel with `Hotel.schedule_many`. Bookings a shard
+        cannot serve are retried on the next shard holding the type, until one books them
+        or every shard has been tried.
+
+        Unlike `Hotel.schedule_many`, which returns the booked rooms, this reports each booked
+        room by its number: the room lives in a shard, and copying it back with all its
+        schedules would cost more than the booking.
+
+        Args:
+            requests (Iterable[Tuple[str, RoomTypeEnum, datetime, datetime]]): Bookings given as
+                `(client_name, room_type, start_date, end_date)`, as in `schedule_a_room`.
+
+        Returns:
+            List[int | Exception]: For each request, in the given order, the number of the room that
+                was booked or the exception `schedule_a_room` would have raised for it.
+        """
+        requests = list(requests)
+        results: List[int | Exception] = [None] * len(requests)
+        # Shards left to try for each pending request, in trial order.
+        candidates: Dict[int, List[int]] = {}
+        for position, (_, room_type, _, _) in enumerate(requests):
+            shards = self._type_shards.get(room_type)
+            if not shards:
+                results[position] = RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
+                continue
+            shards = sorted(shards)
+            first = position % len(shards)
+            candidates[position] = shards[first:] + shards[:first]
+
+        while candidates:
+            batches: Dict[int, List[int]] = {}
+            for position, shards in candidates.items():
+                batches.setdefault(shards.pop(0), []).append(position)
+            answers = self._fan_out(
+                list(batches),
+                "schedule_many",
+                arguments=[[requests[position] for position in batch] for batch in batches.values()],
+            )
+            for batch, answer in zip(batches.values(), answers):
+                for position, result in zip(batch, answer):
+                    results[position] = result
+                    if not isinstance(result, (RoomNotAvailable, RoomTypeNotAvailable)) or not candidates[position]:
+                        del candidates[position]
+        return results
+
+    def book_room(self, room: Room, room_type: RoomTypeEnum, client_name: str, period: Period) -> bool:
+        """Books a specific room if it is still a hotel room of the requested type and is free.
+
+        Args:
+            room (Room): The room to book, matched by number.
+            room_type (RoomTypeEnum): The type of room requested.
+            client_name (str): The name of the client making the booking.
+            period (Period): The booking period.
+
+        Returns:
+            bool: True if the room was booked, False if it was taken, removed or retyped meanwhile.
+        """
+        shard = self._room_shards.get(room.number)
+        if shard is None:
+            return False
+        return self._call(shard, "book_room", room.number, room_type, client_name, period)
+
+    def get_schedule(self, schedule_id: int) -> Schedule:
+        """Gets a copy of a booked schedule by its ID.
+
+        Args:
+            schedule_id (int): ID of the schedule.
+
+        Returns:
+            Schedule: A copy of the schedule with the given ID.
+
+        Raises:
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        return self._call(self._schedule_shard(schedule_id), "get_schedule", schedule_id)
+
+    def update_schedule(self, schedule: Schedule, schedule_id: int) -> None:
+        """Replaces a booked schedule in the room holding it.
+
+        The shard gives the new schedule an ID from its own sequence, which is written back
+        to `schedule.id`.
+
+        Args:
+            schedule (Schedule): New schedule details.
+            schedule_id (int): ID of the schedule to update.
+
+        Raises:
+            ScheduleCannotBeOverwritten: If the new period is not available in the room.
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        schedule.id = self._call(self._schedule_shard(schedule_id), "update_schedule", schedule, schedule_id)
+
+    def cancel_schedule(self, schedule_id: int) -> Schedule:
+        """Cancels a booked schedule, freeing its period in the room holding it.
+
+        Args:
+            schedule_id (int): ID of the schedule to cancel.
+
+        Returns:
+            Schedule: A copy of the cancelled schedule.
+
+        Raises:
+            ScheduleNotFound: If no room of the hotel has a schedule with the given ID.
+        """
+        return self._call(self._schedule_shard(schedule_id), "cancel_schedule", schedule_id)
+
+    def _shard_for(self, room: Room) -> int:
+        """Picks the shard a room belongs to under the partition of the hotel."""
+        if self.partition == "type":
+            return list(RoomTypeEnum).index(room.type) % self.shards
+        return room.number % self.shards
+
+    def _shards_of(self, room_type: RoomTypeEnum) -> List[int]:
+        """Lists the shards holding rooms of a type.
+
+        Raises:
+            RoomTypeNotAvailable: If no shard holds rooms of the type.
+        """
+        shards = self._type_shards.get(room_type)
+        if not shards:
+            raise RoomTypeNotAvailable(f'Room "{room_type.value}" is not available in this hotel')
+        return sorted(shards)
+
+    def _schedule_shard(self, schedule_id: int) -> int:
+        """Finds the shard holding a schedule from its ID.
+
+        Raises:
+            ScheduleNotFound: If the ID was never allocated to a schedule of this hotel.
+        """
+        shard = self._schedule_shards.get(schedule_id)
+        if shard is not None:
+            return shard
+        if schedule_id < self._first_schedule_id:
+            raise ScheduleNotFound(f"Schedule {schedule_id} is not booked in this hotel")
+        return (schedule_id - self._first_schedule_id) % self.shards
+
+    def _file_room(self, room: Room, shard: int) -> None:
+        self._room_shards[room.number] = shard
+        shards = self._type_shards.setdefault(room.type, {})
+        shards[shard] = shards.get(shard, 0) + 1
+
+    def _unfile_room(self, room: Room, shard: int) -> None:
+        del self._room_shards[room.number]
+        shards = self._type_shards[room.type]
+        shards[shard] -= 1
+        if not shards[shard]:
+            del shards[shard]
+            if not shards:
+                del self._type_shards[room.type]
+
+    def _call(self, shard: int, operation: str, *args: Any) -> Any:
+        """Runs an operation on one shard and returns its result, raising its exception."""
+        return self._fan_out([shard], operation, *args)[0]
+
+    def _fan_out(self, shards: Iterable[int], operation: str, *args: Any, arguments: List[tuple] | None = None) -> list:
+        """Runs an operation on several shards in parallel.
+
+        Requests are sent to every shard before any answer is read, so the shards work at the
+        same time. Shard locks are taken in shard order, so concurrent fan-outs cannot deadlock.
+
+        Args:
+            shards (Iterable[int]): The shards to query, each at most once.
+            operation (str): Name of the `_Shard` method to run.
+            *args: Arguments sent to every shard.
+            arguments (List[tuple] | None, optional): Per-shard argument, aligned with `shards`, used
+                instead of `args`.
+
+        Returns:
+            list: The result of each shard, aligned with `shards`.
+
+        Raises:
+            Exception: The first exception raised by a shard, once every answer has been read.
+        """
+        shards = list(shards)
+        if arguments is None:
+            requests = [(operation, args)] * len(shards)
+        else:
+            requests = [(operation, (argument,)) for argument in arguments]
+        locks = [self._connection_locks[shard] for shard in sorted(shards)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for shard, request in zip(shards, requests):
+                self._connections[shard].send(request)
+            answers = [self._connections[shard].recv() for shard in shards]
+        finally:
+            for lock in locks:
+                lock.release()
+        for succeeded, value in answers:
+            if not succeeded:
+                raise value
+        return [value for _, value in answers]
+
+
+class _Shard:
+    """Worker side of a shard: a `Hotel` answering the requests routed by the coordinator.
+
+    Rooms are addressed by number, since the coordinator only holds copies of them.
+    """
+
+    def __init__(self, rooms: List[Room]) -> None:
+        self.hotel = Hotel(rooms)
+
+    def rooms(self) -> List[Room]:
+        return list(self.hotel.rooms)
+
+    def add_room(self, room: Room) -> List[int]:
+        # Schedules created by the caller carry IDs from its sequence, so they are renumbered in ours.
+        schedules = list(room.schedules)
+        for schedule in schedules:
+            schedule.id = Schedule.allocate_id()
+        added = Room(room.type, room.price, schedules)
+        added.number = room.number
+        self.hotel.add_room(added)
+        return [schedule.id for schedule in schedules]
+
+    def remove_room(self, number: int) -> Room:
+        room = self.hotel.get_room(number)
+        self.hotel.remove_room(room)
+        return room
+
+    def schedule_many(self, requests: List[Tuple[str, RoomTypeEnum, datetime, datetime]]) -> List[int | Exception]:
+        return [result.number if isinstance(result, Room) else result for result in self.hotel.schedule_many(requests)]
+
+    def book_room(self, number: int, room_type: RoomTypeEnum, client_name: str, period: Period) -> bool:
+        room = self.hotel.rooms.get(number)
+        return room is not None and self.hotel.book_room(room, room_type, client_name, period)
+
+    def update_schedule(self, schedule: Schedule, schedule_id: int) -> int:
+        schedule.id = Schedule.allocate_id()
+        self.hotel.update_schedule(schedule, schedule_id)
+        return schedule.id
+
+    def __getattr__(self, operation: str) -> Any:
+        # Every other operation is answered by the hotel itself.
+        return getattr(self.hotel, operation)
+
+
+def _serve(connection, first_schedule_id: int, id_stride: int) -> None:
+    """Runs a shard: receives its rooms, then answers `(operation, args)` requests until `None` or a closed pipe.
+
+    Args:
+        connection (Connection): Worker end of the pipe to the coordinator.
+        first_schedule_id (int): First schedule ID the shard allocates.
+        id_stride (int): Step between the schedule IDs the shard allocates.
+    """
+    Schedule.instance_counter = first_schedule_id
+    Schedule.id_stride = id_stride
+    shard = _Shard(connection.recv())
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        operation, args = request
+        try:
+            answer = (True, getattr(shard, operation)(*args))
+        except Exception as error:
+            answer = (False, error)
+        connection.send(answer)
+    connection.close()
@@ -18,3 +18,45 @@ def format_date(date: datetime) -> str:
     """
 
     return date.strftime("%Y-%m-%d")
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+"""datetime: Naive reference instant for integer timestamps."""
+
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def to_timestamp(date: datetime) -> int:
+    """Converts a naive datetime object to microseconds since `EPOCH`.
+
+    Microseconds keep the conversion lossless, so the timestamp can be stored in an
+    int64 and turned back into the exact same datetime.
+
+    Args:
+        date (datetime): The datetime object to convert.
+
+    Returns:
+        int: Microseconds elapsed since `EPOCH`.
+
+    Example:
+        >>> from datetime import datetime
+        >>> to_timestamp(datetime(1970, 1, 2))
+        86400000000
+    """
+    return (date - EPOCH) // _MICROSECOND
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    """Converts microseconds since `EPOCH` back to a naive datetime object.
+
+    Args:
+        timestamp (int): Microseconds elapsed since `EPOCH`.
+
+    Returns:
+        datetime: The corresponding datetime object.
+
+    Example:
+        >>> from_timestamp(86400000000)
+        datetime.datetime(1970, 1, 2, 0, 0)
+    """
+    return EPOCH + datetime.timedelta(microseconds=timestamp)
@@ -0,0 +1,294 @@
+import itertools
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterator, NamedTuple, Sequence, Set, Tuple
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotFound
+
+
+class ScheduleVersion(NamedTuple):
+    """Immutable copy of a schedule, as seen by a `HotelSnapshot`.
+
+    Attributes:
+        id (int): The unique identifier of the schedule.
+        client_name (str): The name of the client.
+        start (datetime): The start date of the period.
+        end (datetime): The end date of the period.
+    """
+
+    id: int
+    client_name: str
+    start: datetime
+    end: datetime
+
+
+class RoomVersion(NamedTuple):
+    """Immutable copy of a room and its schedules, as seen by a `HotelSnapshot`.
+
+    Attributes:
+        number (int): The unique identifier of the room.
+        type (RoomTypeEnum): Type of the room.
+        price (float): Base price of the room.
+        schedules (Tuple[ScheduleVersion, ...]): The schedules of the room, in `Room.schedules` order.
+    """
+
+    number: int
+    type: RoomTypeEnum
+    price: float
+    schedules: Tuple[ScheduleVersion, ...]
+
+
+class VersionClock:
+    """Numbers the changes made to rooms and tracks the snapshots still reading old versions.
+
+    Every room change is committed with the next version number, and every snapshot takes
+    a number too: it sees the changes numbered below its own. A room keeps the state a
+    change replaces only while an open snapshot may still read it, and drops it once
+    those snapshots are released.
+
+    Without open snapshots, `commit` takes no lock: it takes the next number from `_numbers`,
+    an atomic counter, then checks `_opening` and `_readers`. A snapshot being opened is
+    announced through `_opening` before it takes its number, so a change numbered after the
+    snapshot always sees it and keeps the state the snapshot reads.
+
+    Attributes:
+        _numbers (Iterator[int]): Version numbers, allocated in increasing order.
+        _opening (int): Number of snapshots being registered.
+        _readers (Set[int]): Versions read by open snapshots.
+        _retaining (Set): Rooms holding old versions, pruned when snapshots are released.
+        _lock (threading.Lock): Lock serializing snapshot registration and old version tracking.
+    """
+
+    def __init__(self) -> None:
+        self._numbers = itertools.count(1)
+        self._opening = 0
+        self._readers: Set[int] = set()
+        self._retaining: Set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def readers(self) -> int:
+        """int: Gets the number of open snapshots."""
+        return len(self._readers)
+
+    def commit(self, room, retaining: bool = False) -> Tuple[int, int | None, int | None]:
+        """Numbers a room change, with the versions read by open snapshots. Must be called with the room lock held.
+
+        Args:
+            room (Room): The changed room, pruned when snapshots are released if snapshots are open.
+            retaining (bool, optional): Whether the room holds old versions, which must then be pruned
+                even without open snapshots. Defaults to False.
+
+        Returns:
+            Tuple[int, int | None, int | None]: The version number of the change, then the oldest and
+                newest versions read by open snapshots, None without open snapshots.
+        """
+        number = next(self._numbers)
+        if not (self._opening or self._readers or retaining):
+            return number, None, None
+        return (number, *self.reading(room))
+
+    def stamp(self) -> int:
+        """Numbers a change that keeps no old version, e.g. a room joining or leaving a hotel.
+
+        Returns:
+            int: The version number of the change.
+        """
+        return next(self._numbers)
+
+    def reading(self, room) -> Tuple[int | None, int | None]:
+        """Gets the versions read by open snapshots, before a room change that may replace a state they read.
+
+        Args:
+            room (Room): The changed room, pruned when snapshots are released if snapshots are open.
+
+        Returns:
+            Tuple[int | None, int | None]: The oldest and newest versions read by open snapshots,
+                None without open snapshots.
+        """
+        with self._lock:
+            readers = self._readers
+            if not readers:
+                return None, None
+            self._retaining.add(room)
+            return min(readers), max(readers)
+
+    def oldest(self) -> int | None:
+        """Gets the oldest version read by an open snapshot.
+
+        Returns:
+            int | None: The version, None without open snapshots.
+        """
+        with self._lock:
+            return min(self._readers, default=None)
+
+    def forget(self, room) -> None:
+        """Stops pruning a room that holds no old version. Must be called with the room lock held."""
+        with self._lock:
+            self._retaining.discard(room)
+
+    def open(self) -> int:
+        """Registers a snapshot of the changes committed so far.
+
+        Returns:
+            int: The version read by the snapshot.
+        """
+        with self._lock:
+            self._opening += 1
+            version = next(self._numbers)
+            self._readers.add(version)
+            self._opening -= 1
+            return version
+
+    def release(self, version: int) -> None:
+        """Unregisters a snapshot, dropping the old versions no other snapshot reads.
+
+        Args:
+            version (int): The version read by the snapshot.
+        """
+        with self._lock:
+            self._readers.remove(version)
+            oldest = min(self._readers, default=None)
+            if oldest is not None and oldest < version:
+                return
+            rooms = tuple(self._retaining)
+        # Rooms are pruned under their own lock, which writers hold while committing, against
+        # the snapshots open by then: a snapshot opened meanwhile may already need new old versions.
+        for room in rooms:
+            room._prune_versions()
+
+
+VERSION_CLOCK = VersionClock()
+"""VersionClock: Clock shared by every room of the process."""
+
+
+class HotelSnapshot:
+    """Consistent, read-only view of a hotel as it was when the snapshot was opened.
+
+    Opening a snapshot costs constant time: it records the current version and the rooms
+    of the hotel, and copies nothing. Each room is resolved to the `RoomVersion` the
+    snapshot reads the first time it is accessed; bookings made meanwhile commit new
+    versions and are never blocked by the report.
+
+    The rooms keep the old versions a snapshot reads until it is released, by closing it or
+    by leaving the `with` block it is used in; rooms resolved before can still be read then.
+
+    Attributes:
+        version (int): Version number of the snapshot, which sees the changes numbered below it.
+        _rooms (Sequence[Room]): The rooms of the hotel when the snapshot was opened, in room number order.
+        _versions (Dict[int, RoomVersion]): Resolved rooms, by number.
+        closed (bool): Whether the snapshot was released, after which unresolved rooms cannot be read.
+        _clock (VersionClock): The clock the snapshot is registered with.
+    """
+
+    def __init__(self, rooms: Sequence, clock: VersionClock = VERSION_CLOCK) -> None:
+        """Opens a snapshot of some rooms. Use `Hotel.snapshot` rather than this constructor.
+
+        Args:
+            rooms (Sequence[Room]): The rooms of the hotel, in room number order, never changed afterwards.
+            clock (VersionClock, optional): The clock versioning the rooms. Defaults to `VERSION_CLOCK`.
+        """
+        self.version = clock.open()
+        self.closed = False
+        self._clock = clock
+        self._rooms = rooms
+        self._versions: Dict[int, RoomVersion] = {}
+
+    def __enter__(self) -> "HotelSnapshot":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    @property
+    def rooms(self) -> Tuple[RoomVersion, ...]:
+        """Tuple[RoomVersion, ...]: Gets every room of the snapshot, in room number order."""
+        return tuple(self._resolve(room) for room in self._rooms)
+
+    def get_room(self, number: int) -> RoomVersion:
+        """Gets a room of the snapshot by its number.
+
+        Args:
+            number (int): The room number.
+
+        Returns:
+            RoomVersion: The room as the snapshot sees it.
+
+        Raises:
+            RoomNotFound: If the hotel had no room with this number when the snapshot was opened.
+        """
+        position = bisect_left(self._rooms, number, key=lambda room: room.number)
+        if position < len(self._rooms) and self._rooms[position].number == number:
+            return self._resolve(self._rooms[position])
+        raise RoomNotFound(f"The snapshot has no room {number}")
+
+    def schedules(self) -> Iterator[Tuple[RoomVersion, ScheduleVersion]]:
+        """Iterates over every schedule of the snapshot with its room.
+
+        Yields:
+            Tuple[RoomVersion, ScheduleVersion]: Each room, in room number order, with each of its schedules.
+        """
+        for room in self.rooms:
+            for schedule in room.schedules:
+                yield room, schedule
+
+    def close(self) -> None:
+        """Releases the snapshot. Rooms already resolved can still be read."""
+        if not self.closed:
+            self.closed = True
+            self._clock.release(self.version)
+
+    def _resolve(self, room) -> RoomVersion:
+        version = self._versions.get(room.number)
+        if version is None:
+            if self.closed:
+                raise ValueError("The snapshot is closed.")
+            version_at = getattr(room, "_version_at", None)
+            # Read-only rooms, e.g. `MappedRoom`, are not versioned as they never change.
+            version = version_at(self.version) if version_at else capture_room(room)
+            self._versions[room.number] = version
+        return version
+
+
+def capture_room(room) -> RoomVersion:
+    """Copies the current state of a room.
+
+    Args:
+        room (Room): The room to copy.
+
+    Returns:
+        RoomVersion: The copy.
+    """
+    schedules = tuple(
+        ScheduleVersion(schedule.id, schedule.client_name, schedule.period.start, schedule.period.end)
+        for schedule in room.schedules
+    )
+    return RoomVersion(room.number, room.type, room.price, schedules)
+
+
+def prune_versions(
+    history: Tuple[Tuple[int, RoomVersion], ...], until: int, oldest: int | None
+) -> Tuple[Tuple[int, RoomVersion], ...]:
+    """Drops the old versions of a room that no open snapshot reads.
+
+    Args:
+        history (Tuple[Tuple[int, RoomVersion], ...]): Old versions with the version number they
+            were committed at, newest first.
+        until (int): Version number at which the newest old version was replaced.
+        oldest (int | None): Oldest version read by an open snapshot, None without open snapshots.
+
+    Returns:
+        Tuple[Tuple[int, RoomVersion], ...]: The versions still read, newest first.
+    """
+    kept = 0
+    for since, _ in history:
+        if oldest is None or until <= oldest:
+            break
+        kept += 1
+        until = since
+    return history[:kept]
@@ -0,0 +1,140 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+from hazbin_hotel.src.async_hotel import AsyncHotel
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    RoomHasSchedule,
+    RoomNotAvailable,
+    RoomTypeNotAvailable,
+)
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestAsyncHotel(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.end_date = self.start_date + datetime.timedelta(days=3)
+        self.suites = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(3)]
+        self.hotel = AsyncHotel(Hotel(list(self.suites)))
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_check_room_type_availability(self):
+        room = asyncio.run(self.hotel.check_room_type_availability(RoomTypeEnum.SUITE))
+
+        self.assert_equal(room, self.suites[0])
+
+    def test_should_coalesce_identical_availability_queries(self):
+        async def query():
+            return await asyncio.gather(
+                *(self.hotel.find_available_room(RoomTypeEnum.SUITE, self.start_date, self.end_date) for _ in range(50))
+            )
+
+        rooms = asyncio.run(query())
+
+        self.assert_equal(set(rooms), {self.suites[0]})
+        self.assert_equal(self.hotel.queries_computed, 1)
+        self.assert_equal(self.hotel.queries_coalesced, 49)
+
+    def test_should_share_availability_errors(self):
+        async def query():
+            return await asyncio.gather(
+                *(
+                    self.hotel.find_available_room(RoomTypeEnum.BUNGALOW, self.start_date, self.end_date)
+                    for _ in range(3)
+                ),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(query())
+
+        self.assert_equal([type(error) for error in errors], [RoomTypeNotAvailable] * 3)
+
+    def test_should_book_every_free_room_for_concurrent_clients(self):
+        async def book(index):
+            try:
+                return await self.hotel.schedule_a_room(
+                    f"Guest {index}", RoomTypeEnum.SUITE, self.start_date, self.end_date
+                )
+            except RoomNotAvailable:
+                return False
+
+        async def book_all():
+            return await asyncio.gather(*(book(index) for index in range(5)))
+
+        results = asyncio.run(book_all())
+
+        self.assert_equal(results.count(True), 3)
+        self.assert_equal([len(room.schedules) for room in self.suites], [1, 1, 1])
+
+    def hold_room_lock(self, room: Room):
+        holding, release = threading.Event(), threading.Event()
+
+        def hold():
+            with room.lock:
+                holding.set()
+                release.wait(1)
+
+        holder = threading.Thread(target=hold)
+        return holder, holding, release
+
+    def book_while_held(self, release: threading.Event):
+        async def scenario():
+            booking = asyncio.ensure_future(
+                self.hotel.schedule_a_room("Angel", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+            )
+            await asyncio.sleep(0.05)
+            waiting = not booking.done()
+            release.set()
+            return waiting, await booking
+
+        return asyncio.run(scenario())
+
+    def test_should_keep_the_loop_running_while_a_booking_waits_for_a_room_locked_by_a_thread(self):
+        holder, holding, release = self.hold_room_lock(self.suites[0])
+        find_available_rooms = self.hotel.hotel.find_available_rooms
+
+        def find_then_hold(*args):
+            rooms = find_available_rooms(*args)
+            holder.start()
+            holding.wait()
+            return rooms
+
+        self.hotel.hotel.find_available_rooms = find_then_hold
+
+        self.assert_equal(self.book_while_held(release), (True, True))
+        holder.join()
+        self.assert_equal([len(room.schedules) for room in self.suites], [1, 0, 0])
+
+    def test_should_keep_the_loop_running_while_a_search_waits_for_a_room_locked_by_a_thread(self):
+        holder, holding, release = self.hold_room_lock(self.suites[0])
+        holder.start()
+        holding.wait()
+
+        self.assert_equal(self.book_while_held(release), (True, True))
+        holder.join()
+        self.assert_equal([len(room.schedules) for room in self.suites], [1, 0, 0])
+
+    def test_should_add_and_remove_rooms(self):
+        bungalow = Room(RoomTypeEnum.BUNGALOW, 2000, [])
+
+        async def scenario():
+            await self.hotel.add_room(bungalow)
+            await self.hotel.schedule_a_room("Angel", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+            with pytest.raises(RoomHasSchedule):
+                await self.hotel.remove_room(self.suites[0])
+            await self.hotel.remove_room(bungalow)
+
+        asyncio.run(scenario())
+
+        self.assert_equal(len(self.hotel.hotel.rooms), 3)
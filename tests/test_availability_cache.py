@@ -0,0 +1,139 @@
+import datetime
+
+import pytest
+
+from hazbin_hotel.src.availability_cache import AvailabilityCache
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomTypeNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestAvailabilityCache(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.suites = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(2)]
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel = Hotel(self.suites + [self.family])
+        self.now = 0.0
+        self.cache = AvailabilityCache(self.hotel, maxsize=3, ttl=60, clock=lambda: self.now)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def counters(self):
+        return self.cache.hits, self.cache.misses, self.cache.evictions, self.cache.invalidations
+
+    def test_should_answer_repeated_queries_from_the_cache(self):
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3)), self.suites)
+        self.assert_equal(self.cache.find_available_room(RoomTypeEnum.SUITE, self.period(0, 3)), self.suites[0])
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3), limit=0), [])
+
+        self.assert_equal(self.counters(), (2, 1, 0, 0))
+
+    def test_should_invalidate_only_overlapping_entries_of_the_booked_type(self):
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(10, 12))
+        self.cache.find_available_rooms(RoomTypeEnum.FAMILY, self.period(0, 3))
+
+        self.hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, self.start_date, self.start_date)
+
+        self.assert_equal(self.cache.invalidations, 1)
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3)), self.suites[1:])
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(10, 12))
+        self.cache.find_available_rooms(RoomTypeEnum.FAMILY, self.period(0, 3))
+        self.assert_equal(self.counters(), (2, 4, 0, 1))
+
+    def test_should_invalidate_on_updates_and_cancellations(self):
+        schedule = Schedule("Charlie", self.period(0, 1))
+        self.suites[0].add_schedule(schedule)
+        self.cache.available_windows(RoomTypeEnum.SUITE, self.start_date, self.start_date + datetime.timedelta(days=5))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(7, 8))
+
+        self.suites[0].update_schedule(Schedule("Charlie", self.period(7, 8)), schedule.id)
+        self.assert_equal(len(self.cache), 0)
+
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(7, 8)), self.suites[1:])
+        self.hotel.cancel_schedule(self.suites[0].schedules[0].id)
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(7, 8)), self.suites)
+
+    def test_should_invalidate_on_periods_changed_in_place(self):
+        schedule = Schedule("Charlie", self.period(0, 1))
+        self.suites[0].add_schedule(schedule)
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 1))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(7, 8))
+
+        schedule.period.change_end(self.start_date + datetime.timedelta(days=7))
+
+        self.assert_equal(self.cache.invalidations, 2)
+        self.assert_equal(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(7, 8)), self.suites[1:])
+
+    def test_should_invalidate_every_entry_of_added_removed_and_retyped_rooms(self):
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))
+        self.cache.find_available_rooms(RoomTypeEnum.FAMILY, self.period(0, 3))
+
+        suite = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.hotel.add_room(suite)
+        self.assert_equal(len(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))), 3)
+
+        self.hotel.remove_room(suite)
+        self.assert_equal(len(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))), 2)
+
+        self.family.type = RoomTypeEnum.SUITE
+        self.assert_equal(len(self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))), 3)
+        with pytest.raises(RoomTypeNotAvailable):
+            self.cache.find_available_rooms(RoomTypeEnum.FAMILY, self.period(0, 3))
+        self.assert_equal(self.cache.invalidations, 4)
+
+    def test_should_evict_least_recently_used_and_expired_entries(self):
+        for days in range(3):
+            self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(days, days))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 0))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(5, 5))
+
+        self.assert_equal(self.counters(), (1, 4, 1, 0))
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(1, 1))
+        self.assert_equal(self.cache.misses, 5)
+
+        self.now = 61
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(5, 5))
+        self.assert_equal(self.counters(), (1, 6, 3, 0))
+
+    def test_should_not_store_answers_computed_while_the_type_changed(self):
+        find_available_rooms = self.hotel.find_available_rooms
+
+        def find_and_book(room_type, period, limit=None):
+            rooms = find_available_rooms(room_type, period, limit)
+            self.hotel.schedule_a_room("Charlie", room_type, period.start, period.end)
+            return rooms
+
+        self.hotel.find_available_rooms = find_and_book
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))
+
+        self.assert_equal(len(self.cache), 0)
+
+    def test_should_stop_following_the_hotel_once_closed(self):
+        self.cache.find_available_rooms(RoomTypeEnum.SUITE, self.period(0, 3))
+        self.cache.close()
+
+        self.hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, self.start_date, self.start_date)
+
+        self.assert_equal(self.cache.invalidations, 0)
+        self.cache.clear()
+        self.assert_equal(len(self.cache), 0)
+
+    def test_should_validate_its_bounds(self):
+        with pytest.raises(ValueError):
+            AvailabilityCache(self.hotel, maxsize=0)
+        with pytest.raises(ValueError):
+            AvailabilityCache(self.hotel, ttl=0)
@@ -0,0 +1,130 @@
+import datetime
+import random
+
+from hazbin_hotel.src.availability_index import AvailabilityIndex
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestAvailabilityIndex(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.rooms = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(5)]
+        self.hotel = Hotel(self.rooms)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def days(self, first: int, last: int) -> Period:
+        return Period(self.start_date + datetime.timedelta(days=first), self.start_date + datetime.timedelta(days=last))
+
+    def index(self) -> AvailabilityIndex:
+        index = AvailabilityIndex(self.rooms, self.start_date)
+        for room in self.rooms:
+            index.fill(room)
+        return index
+
+    def test_should_skip_the_rooms_booked_on_a_day_of_the_period(self):
+        for room in self.rooms[:4]:
+            room.add_schedule(Schedule("Guest", self.days(1, 4)))
+
+        index = self.index()
+
+        self.assert_equal(list(index.candidates(self.days(0, 2))), [self.rooms[4]])
+        self.assert_equal(list(index.candidates(self.days(5, 6))), self.rooms)
+
+    def test_should_not_skip_rooms_booked_on_part_of_a_day(self):
+        noon = datetime.timedelta(hours=12)
+        self.rooms[0].add_schedule(Schedule("Guest", Period(self.start_date + noon, self.start_date + 3 * noon)))
+        self.rooms[1].add_schedule(Schedule("Guest", self.days(2, 3)))
+
+        index = self.index()
+
+        self.assert_equal(list(index.candidates(self.days(1, 1))), self.rooms)
+        self.assert_equal(list(index.candidates(self.days(1, 2))), self.rooms)
+        self.assert_equal(list(index.candidates(Period(self.start_date, self.start_date + noon))), self.rooms)
+        self.assert_equal(list(index.candidates(self.days(0, 3))), self.rooms[:1] + self.rooms[2:])
+
+    def test_should_build_the_index_once_searches_met_many_busy_rooms(self):
+        rooms = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(50)]
+        hotel = Hotel(rooms)
+        period = self.days(0, 2)
+        for room in rooms[:10]:
+            room.add_schedule(Schedule("Guest", self.days(1, 4)))
+        self.assert_equal(hotel.find_available_rooms(RoomTypeEnum.SUITE, period, limit=1), [rooms[10]])
+
+        for room in rooms[10:]:
+            if room not in (rooms[40], rooms[45]):
+                room.add_schedule(Schedule("Guest", self.days(1, 4)))
+        # The first search allowed for 60 busy rooms, 50 rooms and 10 bookings, and probed 10.
+        self.assert_equal(hotel.find_available_rooms(RoomTypeEnum.SUITE, period), [rooms[40], rooms[45]])
+        self.assert_equal(hotel._availability, {})
+        self.assert_equal(hotel.find_available_rooms(RoomTypeEnum.SUITE, period), [rooms[40], rooms[45]])
+        self.assert_equal(list(hotel._availability), [RoomTypeEnum.SUITE])
+
+        hotel.schedule_a_room("Guest", RoomTypeEnum.SUITE, period.start, period.end)
+        self.assert_equal(hotel.find_available_rooms(RoomTypeEnum.SUITE, period), [rooms[45]])
+
+        rooms[0].type = RoomTypeEnum.FAMILY
+        self.assert_equal((hotel._availability, hotel._probe_allowance), ({}, {}))
+
+    def test_should_follow_the_bookings_of_the_rooms(self):
+        schedule = Schedule("Guest", self.days(1, 4))
+        self.rooms[0].add_schedule(schedule)
+        index = self.hotel._availability_of(RoomTypeEnum.SUITE, self.days(0, 0))
+        self.assert_equal(self.rooms[0] in index.candidates(self.days(1, 2)), False)
+
+        schedule.period.change_end(self.start_date + datetime.timedelta(days=2))
+        self.assert_equal(self.rooms[0] in index.candidates(self.days(3, 3)), True)
+
+        self.rooms[0].update_schedule(Schedule("Guest", self.days(3, 5)), schedule.id)
+        self.assert_equal(
+            [self.rooms[0] in index.candidates(self.days(day, day + 1)) for day in (1, 3, 4)], [True, False, False]
+        )
+
+        self.hotel.cancel_schedule(self.rooms[0].schedules[0].id)
+        period = self.days(2, 3)
+        self.hotel.schedule_a_room("Guest", RoomTypeEnum.SUITE, period.start, period.end)
+        self.assert_equal(list(index.candidates(self.days(2, 3))), self.rooms[1:])
+
+    def test_should_drop_the_index_of_the_types_whose_rooms_change(self):
+        index = self.hotel._availability_of(RoomTypeEnum.SUITE, self.days(0, 0))
+        self.rooms[0].type = RoomTypeEnum.FAMILY
+        self.assert_equal(self.hotel._availability_of(RoomTypeEnum.SUITE, self.days(0, 0)) is index, False)
+
+        room = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.hotel.add_room(room)
+        self.assert_equal(room in self.hotel._availability_of(RoomTypeEnum.SUITE, self.days(0, 0)).rooms, True)
+
+        self.hotel.remove_rooms([room])
+        self.assert_equal(room in self.hotel._availability_of(RoomTypeEnum.SUITE, self.days(0, 0)).rooms, False)
+
+    def test_should_find_the_same_rooms_as_probing_each_of_them(self):
+        generator = random.Random(11)
+        hotel = Hotel([Room(generator.choice([RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY]), 1000, []) for _ in range(200)])
+        for step in range(2_000):
+            first = generator.randrange(60)
+            period = self.days(first, first + 1 + generator.randrange(4))
+            if generator.random() < 0.4:
+                period = Period(period.start + datetime.timedelta(hours=generator.randrange(24)), period.end)
+            room_type = generator.choice([RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY])
+            action = generator.random()
+            if action < 0.6:
+                if hotel.find_available_room(room_type, period) is not None:
+                    hotel.schedule_a_room("Guest", room_type, period.start, period.end)
+            elif action < 0.8:
+                room = generator.choice(list(hotel.rooms))
+                if room.schedules:
+                    room.cancel_schedule(generator.choice(room.schedules).id)
+            elif action < 0.85:
+                room = generator.choice(list(hotel.rooms))
+                room.type = RoomTypeEnum.SUITE if room.type == RoomTypeEnum.FAMILY else RoomTypeEnum.FAMILY
+            expected = [room for room in hotel.rooms_of_type(room_type) if room.is_period_available(period)]
+
+            self.assert_equal(hotel.find_available_rooms(room_type, period), expected, step)
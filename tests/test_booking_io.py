@@ -0,0 +1,146 @@
+import datetime
+import io
+import json
+
+import pytest
+
+from hazbin_hotel.src.booking_io import (
+    export_bookings,
+    import_bookings,
+    iter_bookings,
+    parse_date,
+)
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import BookingImportError
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestBookingIO(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [Schedule("Charlie", self.period(0, 2))])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [Schedule("Vaggie", self.period(1, 3))])
+        self.hotel = Hotel([self.suite, self.family])
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def empty_hotel(self):
+        rooms = []
+        for room in self.hotel.rooms:
+            rooms.append(Room(room.type, room.price, []))
+            rooms[-1].number = room.number
+        return Hotel(rooms)
+
+    @pytest.mark.parametrize("file_format", ["csv", "jsonl"])
+    def test_should_round_trip_bookings(self, file_format):
+        file = io.StringIO(newline="")
+        self.assert_equal(export_bookings(self.hotel, file, file_format), 2)
+
+        hotel = self.empty_hotel()
+        file.seek(0)
+        self.assert_equal(import_bookings(hotel, file, file_format, chunk_size=1), 2)
+
+        self.assert_equal(
+            [
+                (room.number, schedule.id, schedule.client_name, schedule.period.start, schedule.period.end)
+                for room, schedule in iter_bookings(hotel)
+            ],
+            [
+                (room.number, schedule.id, schedule.client_name, schedule.period.start, schedule.period.end)
+                for room, schedule in iter_bookings(self.hotel)
+            ],
+        )
+
+    def test_should_allocate_ids_after_imported_ones(self):
+        hotel = self.empty_hotel()
+        rows = f"room_number,client_name,start,end,id\n{self.family.number},Husk,2024-11-20,2024-11-21,41\n"
+
+        import_bookings(hotel, io.StringIO(rows))
+
+        self.assert_equal(hotel.get_schedule(41).client_name, "Husk")
+        self.assert_equal(Schedule("Niffty", self.period(0, 1)).id, 42)
+
+    def test_should_give_new_ids_to_rows_without_one(self):
+        record = {
+            "room_number": self.suite.number,
+            "client_name": "Alastor",
+            "start": "2024-11-20",
+            "end": "2024-11-21",
+        }
+
+        import_bookings(self.hotel, io.StringIO(json.dumps(record) + "\n\n"), "jsonl")
+
+        self.assert_equal([schedule.client_name for schedule in self.suite.schedules], ["Charlie", "Alastor"])
+        self.assert_equal(self.suite.schedules[-1].id, 2)
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            "{room},Angel Dust,2024-11-17,2024-11-18",  # overlaps Charlie
+            "99,Angel Dust,2024-11-20,2024-11-21",  # unknown room
+            "{room},Angel Dust,2024-11-22,2024-11-21",  # start after end
+            "{room},Angel Dust,tomorrow,2024-11-21",  # not a date
+            "{room},Angel Dust,2024-11-20T00:00:00+01:00,2024-11-21",  # UTC offset
+            "{room},Angel Dust,2024-11-20",  # missing column
+        ],
+    )
+    def test_should_report_the_invalid_line(self, row):
+        rows = f"room_number,client_name,start,end\n{self.suite.number},Husk,2024-11-20,2024-11-21\n{row}\n"
+
+        with pytest.raises(BookingImportError, match="^Line 3: "):
+            import_bookings(self.hotel, io.StringIO(rows.format(room=self.suite.number)))
+        self.assert_equal([schedule.client_name for schedule in self.suite.schedules], ["Charlie"])
+
+    @pytest.mark.parametrize("field, value", [("start", 20241122), ("end", None), ("client_name", ["Angel Dust"])])
+    def test_should_report_the_json_line_with_a_field_of_the_wrong_type(self, field, value):
+        record = {"room_number": self.suite.number, "client_name": "Husk", "start": "2024-11-20", "end": "2024-11-21"}
+        rows = f"{json.dumps(record)}\n{json.dumps({**record, field: value})}\n"
+
+        with pytest.raises(BookingImportError, match=f'^Line 2: invalid record \\("{field}" must be a string\\)$'):
+            import_bookings(self.hotel, io.StringIO(rows), "jsonl")
+        self.assert_equal([schedule.client_name for schedule in self.suite.schedules], ["Charlie"])
+
+    def test_should_keep_the_chunks_imported_before_an_invalid_row(self):
+        rows = (
+            "room_number,client_name,start,end\n"
+            f"{self.suite.number},Husk,2024-11-20,2024-11-21\n"
+            f"{self.suite.number},Niffty,2024-11-23,2024-11-24\n"
+            f"{self.suite.number},Angel Dust,2024-11-17,2024-11-18\n"
+        )
+
+        with pytest.raises(BookingImportError, match="^Line 4: "):
+            import_bookings(self.hotel, io.StringIO(rows), chunk_size=2)
+        self.assert_equal([schedule.client_name for schedule in self.suite.schedules], ["Charlie", "Husk", "Niffty"])
+
+    def test_should_reject_already_booked_ids(self):
+        rows = f"id,room_number,client_name,start,end\n0,{self.family.number},Husk,2024-11-20,2024-11-21\n"
+
+        with pytest.raises(BookingImportError, match="schedule 0 is already booked"):
+            import_bookings(self.hotel, io.StringIO(rows))
+
+    def test_should_reject_files_without_required_columns(self):
+        with pytest.raises(BookingImportError, match="^Line 1: "):
+            import_bookings(self.hotel, io.StringIO("room_number,client_name\n"))
+
+    def test_should_reject_unknown_formats(self):
+        with pytest.raises(ValueError):
+            export_bookings(self.hotel, io.StringIO(), "xml")
+        with pytest.raises(ValueError):
+            import_bookings(self.hotel, io.StringIO(), chunk_size=0)
+
+    def test_should_parse_iso_dates(self):
+        self.assert_equal(parse_date("2024-11-16"), self.start_date)
+        with pytest.raises(ValueError):
+            parse_date("16/11/2024")
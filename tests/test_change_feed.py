@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+from hazbin_hotel.src.async_hotel import AsyncHotel
+from hazbin_hotel.src.change_feed import ChangeFeed
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import ChangeFeedGap
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestChangeFeed(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.room = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.hotel = Hotel([self.room])
+        self.feed = ChangeFeed(self.hotel, retention=3)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def book(self, days: int, client_name: str = "Alastor") -> None:
+        start = self.start_date + datetime.timedelta(days=3 * days)
+        self.hotel.schedule_a_room(client_name, RoomTypeEnum.SUITE, start, start + datetime.timedelta(days=1))
+
+    def test_should_publish_hotel_changes_in_batches(self):
+        subscription = self.feed.subscribe()
+        self.book(0)
+        schedule = self.room.schedules[0]
+        self.hotel.update_schedule(Schedule("Angel", Period(self.start_date, self.start_date)), schedule.id)
+        self.room.update_price(1500)
+
+        batch = subscription.get(max_items=2)
+        self.assert_equal([change.sequence for change in batch], [1, 2])
+        self.assert_equal(batch[0].event, "schedule_added")
+        self.assert_equal(batch[0].data["client_name"], "Alastor")
+        self.assert_equal(batch[1].data["old_schedule_id"], schedule.id)
+        self.assert_equal(batch[1].data["client_name"], "Angel")
+
+        change = subscription.get()[0]
+        self.assert_equal(
+            (change.event, change.room_number, change.data), ("price_updated", 1, {"old_price": 1450, "price": 1500})
+        )
+        self.assert_equal(subscription.position, 3)
+        self.assert_equal(subscription.get(timeout=0), [])
+
+    def test_should_copy_the_data_of_in_place_changes(self):
+        subscription = self.feed.subscribe()
+        self.book(0)
+        schedule = self.room.schedules[0]
+        old_end = schedule.period.end
+        schedule.period.change_end(old_end + datetime.timedelta(days=1))
+        schedule.client_name = "Charlie"
+
+        _, moved, renamed = subscription.get()
+        self.assert_equal(moved.data["old_end"], old_end)
+        self.assert_equal(moved.data["end"], old_end + datetime.timedelta(days=1))
+        self.assert_equal(
+            renamed.data, {"schedule_id": schedule.id, "old_client_name": "Alastor", "client_name": "Charlie"}
+        )
+
+    def test_should_resume_from_a_retained_sequence_number(self):
+        for days in range(4):
+            self.book(days)
+
+        subscription = self.feed.subscribe(since=2)
+
+        self.assert_equal([change.sequence for change in subscription.get()], [3, 4])
+        self.assert_equal(self.feed.changes_since(4), [])
+        with pytest.raises(ChangeFeedGap):
+            self.feed.subscribe(since=0)
+        with pytest.raises(ValueError):
+            self.feed.changes_since(5)
+
+    def test_should_drop_changes_when_the_queue_is_full(self):
+        oldest = self.feed.subscribe(maxsize=2)
+        newest = self.feed.subscribe(maxsize=2, overflow="drop_newest")
+        for days in range(3):
+            self.book(days)
+
+        self.assert_equal([change.sequence for change in oldest.get()], [2, 3])
+        self.assert_equal([change.sequence for change in newest.get()], [1, 2])
+        self.assert_equal((oldest.dropped, newest.dropped), (1, 1))
+
+    def test_should_block_the_publisher_until_the_consumer_catches_up(self):
+        subscription = self.feed.subscribe(maxsize=1, overflow="block", block_timeout=None)
+        self.book(0)
+        booked = threading.Event()
+        publisher = threading.Thread(target=lambda: (self.book(1), booked.set()))
+        publisher.start()
+
+        self.assert_equal(booked.wait(0.05), False)
+        self.assert_equal(subscription.get()[0].sequence, 1)
+        publisher.join(1)
+        self.assert_equal(booked.is_set(), True)
+        self.assert_equal(subscription.get()[0].sequence, 2)
+
+    def test_should_drop_the_oldest_change_after_the_block_timeout(self):
+        subscription = self.feed.subscribe(maxsize=1, overflow="block", block_timeout=0.01)
+        self.book(0)
+        self.book(1)
+
+        self.assert_equal([change.sequence for change in subscription.get()], [2])
+        self.assert_equal(subscription.dropped, 1)
+
+    def test_should_stop_iterating_once_closed(self):
+        subscription = self.feed.subscribe()
+        self.book(0)
+        self.feed.close()
+        self.book(1)
+
+        self.assert_equal([[change.sequence for change in batch] for batch in subscription], [[1]])
+        self.assert_equal(subscription.closed, True)
+        self.assert_equal(self.feed.sequence, 1)
+
+    def test_should_deliver_changes_to_asyncio_subscribers(self):
+        async def consume():
+            hotel = AsyncHotel(self.hotel)
+            subscription = self.feed.subscribe_async()
+            consumer = asyncio.create_task(anext(aiter(subscription)))
+            await asyncio.sleep(0)
+            await hotel.schedule_a_room("Husk", RoomTypeEnum.SUITE, self.start_date, self.start_date)
+            batch = await consumer
+            subscription.close()
+            return batch, await subscription.get()
+
+        batch, rest = asyncio.run(consume())
+
+        self.assert_equal(
+            [(change.event, change.data["client_name"]) for change in batch], [("schedule_added", "Husk")]
+        )
+        self.assert_equal(rest, [])
+
+    def test_should_not_block_the_publisher_of_asyncio_subscribers(self):
+        async def subscribe():
+            return self.feed.subscribe_async(overflow="block")
+
+        with pytest.raises(ValueError):
+            asyncio.run(subscribe())
+        with pytest.raises(ValueError):
+            self.feed.subscribe(overflow="drop_all")
+
+    def test_should_release_a_blocked_publisher_on_close(self):
+        subscription = self.feed.subscribe(maxsize=1, overflow="block", block_timeout=None)
+        self.book(0)
+        publisher = threading.Thread(target=self.book, args=(1,))
+        publisher.start()
+
+        subscription.close()
+        publisher.join(1)
+
+        self.assert_equal(publisher.is_alive(), False)
+        self.assert_equal(len(self.room.schedules), 2)
+        self.assert_equal([change.sequence for change in subscription.get()], [1])
+
+    def test_should_serve_readers_while_a_publisher_is_blocked(self):
+        blocking = self.feed.subscribe(maxsize=1, overflow="block", block_timeout=None)
+        self.book(0)
+        publisher = threading.Thread(target=self.book, args=(1,))
+        publisher.start()
+        while self.feed.sequence < 2:
+            publisher.join(0.001)
+
+        resumed = self.feed.subscribe(since=0)
+        self.assert_equal([change.sequence for change in self.feed.changes_since(0)], [1, 2])
+        self.assert_equal([change.sequence for change in resumed.get()], [1, 2])
+        self.assert_equal(publisher.is_alive(), True)
+
+        self.assert_equal([change.sequence for change in blocking.get()], [1])
+        publisher.join(1)
+        self.assert_equal([change.sequence for change in blocking.get()], [2])
+        self.assert_equal(resumed.get(timeout=0), [])
@@ -0,0 +1,195 @@
+import asyncio
+import datetime
+import io
+import json
+
+from hazbin_hotel.src import commands, main
+from hazbin_hotel.src.booking_io import parse_date
+from hazbin_hotel.src.commands import (
+    MAX_LINE,
+    CommandProcessor,
+    run_batch,
+    start_server,
+)
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+def book(client_name, start, end, **arguments):
+    return {"command": "book", "client_name": client_name, "start": start, "end": end, **arguments}
+
+
+class TestCommandProcessor(BaseTest):
+    def setup_method(self, _):
+        self.suites = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(2)]
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel = Hotel(self.suites + [self.family])
+        self.processor = CommandProcessor(self.hotel)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_book_the_first_free_room_of_a_type(self):
+        first = self.processor.execute(book("Charlie", "2024-11-16", "2024-11-19", room_type="SUITE", id="a"))
+        second = self.processor.execute(book("Vaggie", "2024-11-18", "2024-11-20", room_type="SUITE"))
+        third = self.processor.execute(book("Angel", "2024-11-18", "2024-11-18", room_type="SUITE"))
+
+        self.assert_equal(first, {"ok": True, "room": {"number": 1, "type": "SUITE", "price": 1450}, "id": "a"})
+        self.assert_equal(second["room"]["number"], 2)
+        self.assert_equal((third["ok"], third["error"]), (False, "RoomNotAvailable"))
+        self.assert_equal([len(room.schedules) for room in self.suites], [1, 1])
+
+    def test_should_book_a_given_room(self):
+        answer = self.processor.execute(book("Charlie", "2024-11-16", "2024-11-19", room_number=2))
+        taken = self.processor.execute(book("Vaggie", "2024-11-19", "2024-11-20", room_number=2))
+
+        self.assert_equal(answer["room"]["number"], 2)
+        self.assert_equal(taken["error"], "RoomNotAvailable")
+        self.assert_equal(self.suites[1].schedules[0].client_name, "Charlie")
+
+    def test_should_list_rooms_and_available_dates(self):
+        self.suites[0].add_schedule(Schedule("Charlie", Period(parse_date("2024-11-16"), parse_date("2024-11-19"))))
+
+        rooms = self.processor.execute({"command": "list_rooms"})["rooms"]
+        windows = self.processor.execute(
+            {"command": "list_available_dates", "room_number": 1, "start": "2024-11-10", "end": "2024-11-30"}
+        )["rooms"]
+
+        self.assert_equal([room["type"] for room in rooms], ["SUITE", "SUITE", "FAMILY"])
+        self.assert_equal(
+            windows[0]["windows"],
+            [["2024-11-10T00:00:00", "2024-11-15T00:00:00"], ["2024-11-20T00:00:00", "2024-11-30T00:00:00"]],
+        )
+        everything = self.processor.execute({"command": "list_available_dates"})["rooms"]
+        self.assert_equal(len(everything), 3)
+
+    def test_should_report_invalid_commands(self):
+        answers = [
+            self.processor.execute(command)
+            for command in (
+                ["book"],
+                {"command": "checkout", "id": 7},
+                book("Charlie", "2024-11-16", "tomorrow", room_type="SUITE"),
+                book("Charlie", "2024-11-16", "2024-11-19", room_type="CASTLE"),
+                book("Charlie", "2024-11-16", "2024-11-19", room_number=99),
+                book("Charlie", "2024-11-19", "2024-11-16", room_type="SUITE"),
+                book("Charlie", "2024-11-16", "2024-11-19", room_type="BUNGALOW"),
+            )
+        ]
+
+        self.assert_equal(
+            [answer["error"] for answer in answers],
+            ["InvalidCommand"] * 5 + ["InvalidPeriodError", "RoomTypeNotAvailable"],
+        )
+        self.assert_equal(answers[1]["id"], 7)
+        self.assert_equal(json.loads(self.processor.handle_line("{"))["error"], "InvalidCommand")
+
+    def test_should_run_a_batch(self):
+        lines = io.StringIO(
+            "\n".join(
+                json.dumps(book(f"Guest {day}", f"2024-11-{day:02}", f"2024-11-{day:02}", room_type="FAMILY"))
+                for day in range(1, 11)
+            )
+            + "\n\n"
+            + json.dumps(book("Late", "2024-11-05", "2024-11-05", room_type="FAMILY"))
+            + "\n"
+        )
+        output = io.StringIO()
+
+        count = run_batch(self.processor, lines, output)
+
+        answers = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assert_equal(count, 11)
+        self.assert_equal([answer["ok"] for answer in answers], [True] * 10 + [False])
+        self.assert_equal(len(self.family.schedules), 10)
+
+    def test_should_serve_pipelined_commands(self):
+        async def session():
+            server = await start_server(self.processor)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                days = [f"2024-12-{index // 2 + 1:02}" for index in range(40)]
+                commands = [book("Guest", day, day, room_type="SUITE", id=index) for index, day in enumerate(days)]
+                payload = "".join(json.dumps(command) + "\n" for command in commands).encode()
+                # Split mid-line, as the network would, and send everything before reading.
+                writer.write(payload[:1000])
+                await writer.drain()
+                writer.write(payload[1000:] + b'{"command": "list_rooms", "id": "last"}')
+                writer.write_eof()
+                answers = [json.loads(line) for line in (await reader.read()).splitlines()]
+                writer.close()
+                await writer.wait_closed()
+
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"x" * (MAX_LINE + 1))
+                await writer.drain()
+                oversized = json.loads(await reader.readline())
+                writer.close()
+                await writer.wait_closed()
+            finally:
+                server.close()
+                await server.wait_closed()
+            return answers, oversized
+
+        answers, oversized = asyncio.run(session())
+
+        self.assert_equal([answer["id"] for answer in answers], list(range(40)) + ["last"])
+        self.assert_equal(all(answer["ok"] for answer in answers), True)
+        self.assert_equal([len(room.schedules) for room in self.suites], [20, 20])
+        self.assert_equal(oversized["error"], "InvalidCommand")
+
+    def test_should_answer_the_commands_read_with_an_oversized_one(self, monkeypatch):
+        # Commands longer than a read cannot share it with a complete one at the default sizes.
+        monkeypatch.setattr(commands, "MAX_LINE", 100)
+
+        async def session():
+            server = await start_server(self.processor)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b'{"command": "list_rooms", "id": "first"}\n' + b"x" * 101)
+                await writer.drain()
+                answers = [json.loads(line) for line in (await reader.read()).splitlines()]
+                writer.close()
+                await writer.wait_closed()
+            finally:
+                server.close()
+                await server.wait_closed()
+            return answers
+
+        first, oversized = asyncio.run(session())
+
+        self.assert_equal((first["id"], first["ok"]), ("first", True))
+        self.assert_equal((oversized["ok"], oversized["error"]), (False, "InvalidCommand"))
+
+    def test_should_run_a_batch_from_the_command_line(self, tmp_path, monkeypatch, capsys):
+        commands = tmp_path / "commands.jsonl"
+        commands.write_text(json.dumps(book("Charlie", "2024-11-16", "2024-11-19", room_type="SUITE")) + "\n")
+        monkeypatch.setattr(main, "DATA_DIRECTORY", str(tmp_path / "data"))
+
+        self.assert_equal(main.main(["--batch", str(commands)]), 0)
+        self.assert_equal(main.main(["--batch", str(commands)]), 0)
+
+        answers = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        self.assert_equal([answer["ok"] for answer in answers], [True, False])
+
+    def test_should_book_only_the_chosen_stay_interactively(self, monkeypatch, capsys):
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+        check_in, check_out = today + datetime.timedelta(days=2), today + datetime.timedelta(days=4)
+        answers = iter(["Charlie", str(self.family.number), "1", f"{check_in:%Y-%m-%d}", f"{check_out:%Y-%m-%d}"])
+        monkeypatch.setattr("builtins.input", lambda _: next(answers))
+
+        main.book_a_room(self.hotel)
+
+        self.assert_equal([(s.period.start, s.period.end) for s in self.family.schedules], [(check_in, check_out)])
+        answers = iter(["Charlie", str(self.family.number), "0"])
+        main.book_a_room(self.hotel)
+        self.assert_equal(len(self.family.schedules), 1)
+        self.assert_equal(capsys.readouterr().out.endswith("Invalid options.\n"), True)
@@ -0,0 +1,176 @@
+import datetime
+import random
+import sys
+import threading
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    RoomHasSchedule,
+    RoomNotAvailable,
+    RoomTypeNotAvailable,
+)
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.versioning import VERSION_CLOCK
+from tests import BaseTest
+
+THREADS = 16
+
+
+class TestConcurrentBooking(BaseTest):
+    def setup_method(self, _):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.start_date = datetime.datetime(2024, 11, 16)
+
+    def teardown_method(self, _):
+        sys.setswitchinterval(self.switch_interval)
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    @staticmethod
+    def run_threads(target, count=THREADS):
+        barrier = threading.Barrier(count)
+        errors = []
+
+        def run(index):
+            barrier.wait()
+            try:
+                target(index)
+            except Exception as error:  # noqa: B902 - reported by the test thread
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_should_book_same_period_only_once(self):
+        hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, [])])
+        results = []
+
+        def book(index):
+            try:
+                results.append(
+                    hotel.schedule_a_room(
+                        f"Guest {index}",
+                        RoomTypeEnum.SUITE,
+                        self.start_date,
+                        self.start_date + datetime.timedelta(days=3),
+                    )
+                )
+            except RoomNotAvailable:
+                results.append(False)
+
+        for _ in range(20):
+            hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, [])])
+            results.clear()
+            self.run_threads(book)
+            self.assert_equal(results.count(True), 1)
+            self.assert_equal(len(hotel.rooms[0].schedules), 1)
+
+    def test_should_never_double_book_overlapping_periods(self):
+        hotel = Hotel([Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(3)])
+
+        def book(index):
+            generator = random.Random(index)
+            for attempt in range(200):
+                start = self.start_date + datetime.timedelta(hours=generator.randrange(24 * 60))
+                try:
+                    hotel.schedule_a_room(
+                        f"Guest {index}-{attempt}", RoomTypeEnum.SUITE, start, start + datetime.timedelta(hours=30)
+                    )
+                except RoomNotAvailable:
+                    pass
+
+        self.run_threads(book)
+
+        for room in hotel.rooms:
+            periods = sorted((schedule.period.start, schedule.period.end) for schedule in room.schedules)
+            for (_, previous_end), (next_start, _) in zip(periods, periods[1:]):
+                assert previous_end < next_start
+
+    def test_should_allocate_unique_schedule_ids(self):
+        period = Period(self.start_date, self.start_date + datetime.timedelta(days=1))
+        ids = []
+
+        def create(_):
+            ids.extend(Schedule("Guest", period).id for _ in range(500))
+
+        self.run_threads(create)
+
+        self.assert_equal(len(set(ids)), THREADS * 500)
+        self.assert_equal(Schedule.instance_counter, THREADS * 500)
+
+    def test_should_allocate_unique_room_numbers(self):
+        numbers = []
+
+        def create(_):
+            numbers.extend(Room(RoomTypeEnum.SINGLE, 100, []).number for _ in range(200))
+
+        self.run_threads(create)
+
+        self.assert_equal(len(set(numbers)), THREADS * 200)
+
+    @pytest.mark.parametrize("attempt", range(10))
+    def test_should_not_book_a_removed_room(self, attempt):
+        room = Room(RoomTypeEnum.SUITE, 1450, [])
+        hotel = Hotel([room])
+        outcomes = []
+
+        def race(index):
+            if index == 0:
+                try:
+                    hotel.remove_room(room)
+                    outcomes.append("removed")
+                except RoomHasSchedule:
+                    outcomes.append("kept")
+            else:
+                try:
+                    hotel.schedule_a_room(
+                        "Guest", RoomTypeEnum.SUITE, self.start_date, self.start_date + datetime.timedelta(days=1)
+                    )
+                    outcomes.append("booked")
+                except (RoomNotAvailable, RoomTypeNotAvailable):
+                    outcomes.append("rejected")
+
+        self.run_threads(race, count=4)
+
+        if "removed" in outcomes:
+            self.assert_equal(room.schedules, [])
+            self.assert_equal("booked" in outcomes, False)
+        else:
+            self.assert_equal(len(room.schedules), 1)
+
+    def test_should_read_consistent_snapshots_while_rooms_are_booked(self):
+        rooms = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(20)]
+        hotel = Hotel(rooms)
+        done = threading.Event()
+
+        def book():
+            for days in range(0, 150, 3):
+                start = self.start_date + datetime.timedelta(days=days)
+                for room in rooms:
+                    room.add_schedule(Schedule("Guest", Period(start, start + datetime.timedelta(days=1))))
+            done.set()
+
+        booker = threading.Thread(target=book)
+        booker.start()
+        counts = []
+        while not done.is_set():
+            with hotel.snapshot() as snapshot:
+                counts.append([len(room.schedules) for room in snapshot.rooms])
+        booker.join()
+
+        # Rooms are booked in turn, so a consistent view never has a room ahead of an earlier one.
+        self.assert_equal([count for count in counts if count != sorted(count, reverse=True)], [])
+        self.assert_equal([count for count in counts if count[0] - count[-1] > 1], [])
+        self.assert_equal(VERSION_CLOCK.readers, 0)
+        self.assert_equal([room._old_versions for room in rooms], [()] * len(rooms))
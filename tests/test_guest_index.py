@@ -0,0 +1,76 @@
+import datetime
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.guest_index import GuestIndex
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestGuestIndex(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.charlie = Schedule("Charlie Morningstar", self.period(0, 2))
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [self.charlie])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel = Hotel([self.suite, self.family])
+        self.guests = GuestIndex(self.hotel)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def test_should_find_bookings_ignoring_case_and_spaces(self):
+        self.hotel.schedule_a_room("charlie  MORNINGSTAR", RoomTypeEnum.FAMILY, self.start_date, self.start_date)
+
+        bookings = self.guests.bookings(" Charlie Morningstar")
+
+        self.assert_equal([room for room, _ in bookings], [self.suite, self.family])
+        self.assert_equal(bookings[0][1], self.charlie)
+        self.assert_equal(self.guests.bookings("Vaggie"), [])
+
+    def test_should_search_bookings_by_name_prefix(self):
+        self.family.add_schedule(Schedule("Chaz", self.period(0, 1)))
+        self.family.add_schedule(Schedule("Angel Dust", self.period(3, 4)))
+
+        self.assert_equal(
+            [schedule.client_name for _, schedule in self.guests.search("CHA")], ["Charlie Morningstar", "Chaz"]
+        )
+        self.assert_equal(len(self.guests.search("")), 3)
+        self.assert_equal(self.guests.search("Husk"), [])
+
+    def test_should_follow_renamed_schedules(self):
+        self.charlie.client_name = "Vaggie"
+
+        self.assert_equal(self.guests.bookings("Charlie Morningstar"), [])
+        self.assert_equal(self.guests.bookings("vaggie"), [(self.suite, self.charlie)])
+        self.assert_equal(self.guests.search("c"), [])
+
+    def test_should_follow_updated_and_cancelled_schedules(self):
+        updated = Schedule("Alastor", self.period(5, 6))
+        self.suite.update_schedule(updated, self.charlie.id)
+        self.assert_equal(self.guests.bookings("Charlie Morningstar"), [])
+        self.assert_equal(self.guests.bookings("Alastor"), [(self.suite, updated)])
+
+        self.charlie.client_name = "Lucifer"
+        self.assert_equal(self.guests.bookings("Lucifer"), [])
+
+        self.hotel.cancel_schedule(updated.id)
+        self.assert_equal(self.guests.bookings("Alastor"), [])
+
+    def test_should_index_added_rooms_and_stop_when_closed(self):
+        bungalow = Room(RoomTypeEnum.BUNGALOW, 2000, [Schedule("Husk", self.period(0, 1))])
+        self.hotel.add_room(bungalow)
+        self.assert_equal([room for room, _ in self.guests.bookings("husk")], [bungalow])
+
+        self.guests.close()
+        self.charlie.client_name = "Vaggie"
+        self.assert_equal(self.guests.bookings("Charlie Morningstar"), [(self.suite, self.charlie)])
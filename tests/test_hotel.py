@@ -1,4 +1,5 @@
 import datetime
+import random
 
 import pytest
 
@@ -6,8 +7,13 @@ from hazbin_hotel.src.enums.types import RoomTypeEnum
 from hazbin_hotel.src.exceptions import (
     RoomHasSchedule,
     RoomNotAvailable,
+    RoomNotFound,
+    RoomNumberTaken,
     RoomTypeNotAvailable,
+    ScheduleCannotBeOverwritten,
+    ScheduleNotFound,
 )
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
 from hazbin_hotel.src.hotel import Hotel
 from hazbin_hotel.src.period import Period
 from hazbin_hotel.src.room import Room
@@ -44,6 +50,7 @@ class TestHotel(BaseTest):
     def test_should_add_room(self, mocker):
         room_type = RoomTypeEnum.FAMILY
         room = mocker.Mock(spec=Room)
+        room.number = 2
         room.type = room_type
         room.price = 1200
         room.schedules = []
@@ -66,6 +73,67 @@ class TestHotel(BaseTest):
         with pytest.raises(RoomHasSchedule):
             self.hotel.remove_room(room)
 
+    def test_should_get_rooms_by_number_and_type(self):
+        suites = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(2)]
+        for room in reversed(suites):
+            self.hotel.add_room(room)
+
+        self.assert_equal(self.hotel.get_room(suites[0].number), suites[0])
+        self.assert_equal(list(self.hotel.rooms), [self.presidential_room] + suites)
+        self.assert_equal(self.hotel.rooms_of_type(RoomTypeEnum.SUITE), tuple(suites))
+        self.assert_equal(self.hotel.rooms_of_type(RoomTypeEnum.BUNGALOW), ())
+
+        self.hotel.remove_room(suites[0])
+        with pytest.raises(RoomNotFound):
+            self.hotel.get_room(suites[0].number)
+        with pytest.raises(RoomNotFound):
+            self.hotel.remove_room(suites[0])
+
+    def test_should_add_and_remove_rooms_in_bulk(self):
+        events = []
+        self.hotel.subscribe(lambda event, hotel, room, **_: events.append((event, room.number)))
+        suites = [Room(RoomTypeEnum.SUITE, 1450, []) for _ in range(3)]
+        self.hotel.add_rooms(reversed(suites))
+
+        self.assert_equal(list(self.hotel.rooms), [self.presidential_room] + suites)
+        self.assert_equal(self.hotel.rooms_of_type(RoomTypeEnum.SUITE), tuple(suites))
+        self.assert_equal(events, [("room_added", room.number) for room in suites])
+
+        suites[1].add_schedule(self.schedule)
+        with pytest.raises(RoomHasSchedule):
+            self.hotel.remove_rooms([suites[0], suites[1]])
+        with pytest.raises(RoomNumberTaken):
+            self.hotel.add_rooms([Room(RoomTypeEnum.FAMILY, 1000, []), suites[2]])
+        self.assert_equal(len(self.hotel.rooms), 4)
+
+        self.hotel.remove_rooms([suites[2], suites[0]])
+        self.assert_equal(list(self.hotel.rooms), [self.presidential_room, suites[1]])
+        self.assert_equal(self.hotel.rooms_of_type(RoomTypeEnum.SUITE), (suites[1],))
+        self.assert_equal(events[-2:], [("room_removed", suites[0].number), ("room_removed", suites[2].number)])
+        with pytest.raises(RoomNotFound):
+            self.hotel.remove_rooms([suites[0]])
+
+    def test_should_expose_rooms_as_a_read_only_view(self):
+        rooms = self.hotel.rooms
+        family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel.add_room(family)
+
+        self.assert_equal(len(rooms), 2)
+        self.assert_equal(rooms[-1], family)
+        self.assert_equal(family in rooms, True)
+        self.assert_equal(rooms.get(family.number), family)
+        self.assert_equal(hasattr(rooms, "append"), False)
+
+    def test_should_not_add_two_rooms_with_the_same_number(self):
+        twin = Room(RoomTypeEnum.SUITE, 1450, [])
+        twin.number = self.presidential_room.number
+
+        with pytest.raises(RoomNumberTaken):
+            self.hotel.add_room(twin)
+        with pytest.raises(RoomNumberTaken):
+            Hotel([self.presidential_room, twin])
+        self.assert_equal(list(self.hotel.rooms), [self.presidential_room])
+
     def test_should_schedule_a_room(self):
         room_type = RoomTypeEnum.PRESIDENTIAL_SUITE
 
@@ -81,3 +149,169 @@ class TestHotel(BaseTest):
 
         with pytest.raises(RoomNotAvailable):
             self.hotel.schedule_a_room("Chris", room_type, self.start_date, self.end_date)
+
+    def test_should_schedule_another_room_of_same_type_when_first_is_busy(self):
+        room_type = RoomTypeEnum.PRESIDENTIAL_SUITE
+        second_room = Room(room_type, 2200, [])
+        self.hotel.add_room(second_room)
+        self.presidential_room.add_schedule(self.schedule)
+
+        is_it_scheduled = self.hotel.schedule_a_room("Angel", room_type, self.start_date, self.end_date)
+
+        self.assert_equal(is_it_scheduled, True)
+        self.assert_equal(len(second_room.schedules), 1)
+
+    def test_should_not_find_removed_room_by_type(self):
+        self.hotel.remove_room(self.presidential_room)
+
+        with pytest.raises(RoomTypeNotAvailable):
+            self.hotel.check_room_type_availability(RoomTypeEnum.PRESIDENTIAL_SUITE)
+
+    def test_should_follow_room_type_change(self):
+        self.presidential_room.type = RoomTypeEnum.SUITE
+
+        self.assert_equal(self.hotel.check_room_type_availability(RoomTypeEnum.SUITE), self.presidential_room)
+        with pytest.raises(RoomTypeNotAvailable):
+            self.hotel.find_available_room(RoomTypeEnum.PRESIDENTIAL_SUITE, self.period)
+
+    def test_should_not_find_available_room_when_all_rooms_of_type_are_busy(self):
+        self.presidential_room.add_schedule(self.schedule)
+
+        self.assert_equal(self.hotel.find_available_room(RoomTypeEnum.PRESIDENTIAL_SUITE, self.period), None)
+
+    def test_should_find_every_available_room_of_type(self):
+        second_room = Room(RoomTypeEnum.PRESIDENTIAL_SUITE, 2200, [])
+        third_room = Room(RoomTypeEnum.PRESIDENTIAL_SUITE, 2200, [])
+        self.hotel.add_room(second_room)
+        self.hotel.add_room(third_room)
+        self.presidential_room.add_schedule(self.schedule)
+
+        rooms = self.hotel.find_available_rooms(RoomTypeEnum.PRESIDENTIAL_SUITE, self.period)
+
+        self.assert_equal(rooms, [second_room, third_room])
+        self.assert_equal(
+            self.hotel.find_available_rooms(RoomTypeEnum.PRESIDENTIAL_SUITE, self.period, limit=1), [second_room]
+        )
+
+    def test_should_find_available_rooms_of_type_in_a_large_hotel(self):
+        generator = random.Random(7)
+        types = [RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY, RoomTypeEnum.DELUXE]
+        for _ in range(1_000):
+            room = Room(generator.choice(types), 1000, [])
+            for day in range(0, 60, 12):
+                start = self.start_date + datetime.timedelta(days=day + generator.randrange(4))
+                room.add_schedule(Schedule("Guest", Period(start, start + datetime.timedelta(days=1))))
+            self.hotel.add_room(room)
+
+        for day in range(0, 60, 5):
+            start = self.start_date + datetime.timedelta(days=day)
+            period = Period(start, start + datetime.timedelta(days=2))
+            expected = [
+                room
+                for room in self.hotel.rooms
+                if room.type == RoomTypeEnum.SUITE and room.is_period_available(period)
+            ]
+
+            self.assert_equal(self.hotel.find_available_rooms(RoomTypeEnum.SUITE, period), expected)
+            self.assert_equal(self.hotel.find_available_rooms(RoomTypeEnum.SUITE, period, limit=10), expected[:10])
+
+    def test_should_list_available_windows_per_room(self):
+        second_room = Room(RoomTypeEnum.PRESIDENTIAL_SUITE, 2200, [])
+        self.hotel.add_room(second_room)
+        self.presidential_room.add_schedule(self.schedule)
+        start = self.start_date - datetime.timedelta(days=10)
+        end = self.end_date + datetime.timedelta(days=10)
+
+        windows = self.hotel.available_windows(RoomTypeEnum.PRESIDENTIAL_SUITE, start, end, min_nights=3)
+
+        self.assert_equal(list(windows), [self.presidential_room, second_room])
+        self.assert_equal(
+            [(window.start, window.end) for window in windows[self.presidential_room]],
+            [
+                (start, self.start_date - datetime.timedelta(days=1)),
+                (self.end_date + datetime.timedelta(days=1), end),
+            ],
+        )
+        self.assert_equal([(window.start, window.end) for window in windows[second_room]], [(start, end)])
+
+    def test_should_not_list_available_windows_of_missing_room_type(self):
+        with pytest.raises(RoomTypeNotAvailable):
+            self.hotel.available_windows(RoomTypeEnum.SUITE, self.start_date, self.end_date)
+        with pytest.raises(InvalidPeriodError):
+            self.hotel.available_windows(RoomTypeEnum.PRESIDENTIAL_SUITE, self.end_date, self.start_date)
+
+    def test_should_get_update_and_cancel_schedules_by_id(self):
+        self.presidential_room.add_schedule(self.schedule)
+        second_room = Room(RoomTypeEnum.PRESIDENTIAL_SUITE, 2200, [])
+        self.hotel.add_room(second_room)
+        self.hotel.schedule_a_room("Angel", RoomTypeEnum.PRESIDENTIAL_SUITE, self.start_date, self.end_date)
+        booked = second_room.schedules[0]
+
+        self.assert_equal(self.hotel.get_schedule(self.schedule.id), self.schedule)
+        self.assert_equal(self.hotel.get_schedule(booked.id), booked)
+
+        later_start = self.end_date + datetime.timedelta(days=1)
+        updated = Schedule("Angel", Period(later_start, later_start + datetime.timedelta(days=1)))
+        self.hotel.update_schedule(updated, booked.id)
+        self.assert_equal(second_room.schedules, [updated])
+        self.assert_equal(self.hotel.get_schedule(updated.id), updated)
+
+        self.assert_equal(self.hotel.cancel_schedule(self.schedule.id), self.schedule)
+        self.assert_equal(self.presidential_room.schedules, [])
+        with pytest.raises(ScheduleNotFound):
+            self.hotel.get_schedule(self.schedule.id)
+
+    def test_should_not_touch_unknown_or_conflicting_schedules(self):
+        self.presidential_room.add_schedule(self.schedule)
+        later_start = self.end_date + datetime.timedelta(days=1)
+        later = Schedule("Angel", Period(later_start, later_start + datetime.timedelta(days=1)))
+        self.presidential_room.add_schedule(later)
+
+        with pytest.raises(ScheduleNotFound):
+            self.hotel.cancel_schedule(later.id + 1)
+        with pytest.raises(ScheduleNotFound):
+            self.hotel.update_schedule(Schedule("Husk", self.period), later.id + 1)
+        with pytest.raises(ScheduleCannotBeOverwritten):
+            self.hotel.update_schedule(Schedule("Husk", self.period), later.id)
+
+    def test_should_schedule_many_and_report_each_result(self):
+        second_room = Room(RoomTypeEnum.PRESIDENTIAL_SUITE, 2200, [])
+        self.hotel.add_room(second_room)
+        later_start = self.end_date + datetime.timedelta(days=1)
+        later_end = later_start + datetime.timedelta(days=2)
+
+        results = self.hotel.schedule_many(
+            [
+                ("Charlie", RoomTypeEnum.PRESIDENTIAL_SUITE, later_start, later_end),
+                ("Vaggie", RoomTypeEnum.PRESIDENTIAL_SUITE, self.start_date, self.end_date),
+                ("Angel", RoomTypeEnum.PRESIDENTIAL_SUITE, self.start_date, self.end_date),
+                ("Husk", RoomTypeEnum.PRESIDENTIAL_SUITE, self.start_date, self.end_date),
+                ("Niffty", RoomTypeEnum.BUNGALOW, self.start_date, self.end_date),
+                ("Alastor", RoomTypeEnum.PRESIDENTIAL_SUITE, self.end_date, self.start_date),
+            ]
+        )
+
+        self.assert_equal(results[0], self.presidential_room)
+        self.assert_equal(results[1], self.presidential_room)
+        self.assert_equal(results[2], second_room)
+        assert isinstance(results[3], RoomNotAvailable)
+        assert isinstance(results[4], RoomTypeNotAvailable)
+        assert isinstance(results[5], InvalidPeriodError)
+        self.assert_equal(len(self.presidential_room.schedules), 2)
+        self.assert_equal(len(second_room.schedules), 1)
+
+    def test_should_schedule_many_with_timezone_aware_dates(self):
+        offset = datetime.timezone(datetime.timedelta(hours=-3))
+        start_date = self.start_date.replace(tzinfo=offset)
+        end_date = self.end_date.replace(tzinfo=offset)
+
+        results = self.hotel.schedule_many(
+            [
+                ("Charlie", RoomTypeEnum.PRESIDENTIAL_SUITE, start_date, end_date),
+                ("Vaggie", RoomTypeEnum.PRESIDENTIAL_SUITE, start_date, end_date),
+            ]
+        )
+
+        self.assert_equal(results[0], self.presidential_room)
+        assert isinstance(results[1], RoomNotAvailable)
+        self.assert_equal(self.presidential_room.schedules[0].period.start, start_date)
@@ -0,0 +1,19 @@
+import pytest
+
+from benchmarks.import_time import BUDGETS_MS, eager_imports, import_times
+from tests import BaseTest
+
+
+class TestImportTime(BaseTest):
+    @pytest.mark.parametrize("module", BUDGETS_MS)
+    def test_should_not_import_lazy_modules_eagerly(self, module):
+        self.assert_equal(eager_imports(import_times(module)), [])
+
+    def test_should_load_exported_names_on_first_use(self):
+        import hazbin_hotel
+        from hazbin_hotel.src.hotel import Hotel
+
+        self.assert_equal(hazbin_hotel.Hotel, Hotel)
+        self.assert_equal("ShardedHotel" in dir(hazbin_hotel), True)
+        with pytest.raises(AttributeError):
+            hazbin_hotel.Motel
@@ -0,0 +1,153 @@
+import datetime
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomIsReadOnly, RoomNotAvailable
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.mapped_snapshot import MappedSnapshot, write_mapped_snapshot
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestMappedSnapshot(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16, 12, 0, 0, 250)
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        for days, client_name in ((10, "Vaggie"), (0, "Charlie"), (20, "Ångel")):
+            start = self.start_date + datetime.timedelta(days=days)
+            self.suite.add_schedule(Schedule(client_name, Period(start, start + datetime.timedelta(days=3))))
+        self.hotel = Hotel([self.suite, self.family])
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def test_should_answer_availability_like_the_original_rooms(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        write_mapped_snapshot(self.hotel, path)
+
+        with MappedSnapshot(path) as snapshot:
+            suite = snapshot.rooms[0]
+            for start_days in range(-5, 30):
+                period = self.period(start_days, start_days + 2)
+                self.assert_equal(suite.is_period_available(period), self.suite.is_period_available(period))
+            self.assert_equal(
+                suite.is_period_available(
+                    self.period(11, 12), ignore_schedule=True, schedule_id=self.suite.schedules[0].id
+                ),
+                True,
+            )
+
+    def test_should_answer_availability_from_concurrent_threads(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        write_mapped_snapshot(self.hotel, path)
+        periods = [self.period(start_days, start_days + 2) for start_days in range(-5, 30)]
+        expected = [self.suite.is_period_available(period) for period in periods]
+
+        with MappedSnapshot(path) as snapshot:
+            suite = snapshot.rooms[0]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                answers = list(executor.map(lambda _: [suite.is_period_available(p) for p in periods], range(200)))
+
+        self.assert_equal(all(answer == expected for answer in answers), True)
+
+    def test_should_list_available_windows_like_the_original_rooms(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        write_mapped_snapshot(self.hotel, path)
+        start, end = self.start_date - datetime.timedelta(days=3), self.start_date + datetime.timedelta(days=40)
+
+        with MappedSnapshot(path) as snapshot:
+            for min_nights in (0, 1, 7):
+                self.assert_equal(
+                    [
+                        (window.start, window.end)
+                        for window in snapshot.rooms[0].available_windows(start, end, min_nights)
+                    ],
+                    [(window.start, window.end) for window in self.suite.available_windows(start, end, min_nights)],
+                )
+
+    def test_should_build_schedules_on_demand(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        write_mapped_snapshot(self.hotel, path)
+
+        with MappedSnapshot(path) as snapshot:
+            suite, family = snapshot.rooms
+            self.assert_equal(suite._schedules, None)
+            self.assert_equal([schedule.client_name for schedule in suite.schedules], ["Charlie", "Vaggie", "Ångel"])
+            self.assert_equal(suite.schedules[0].period.start, self.start_date)
+            self.assert_equal(suite.schedules[0].id, self.suite.schedules[1].id)
+            self.assert_equal((suite.number, suite.type, suite.price), (1, RoomTypeEnum.SUITE, 1450))
+            self.assert_equal(family.schedules, [])
+
+    def test_should_serve_hotel_queries_but_not_bookings(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        write_mapped_snapshot(self.hotel, path)
+
+        with MappedSnapshot(path) as snapshot:
+            hotel = snapshot.hotel()
+            self.assert_equal(hotel.find_available_room(RoomTypeEnum.SUITE, self.period(1, 2)), None)
+            self.assert_equal(hotel.find_available_room(RoomTypeEnum.SUITE, self.period(5, 6)), snapshot.rooms[0])
+            with pytest.raises(RoomNotAvailable):
+                hotel.schedule_a_room("Husk", RoomTypeEnum.SUITE, self.start_date, self.start_date)
+            with pytest.raises(RoomIsReadOnly):
+                hotel.schedule_a_room("Husk", RoomTypeEnum.FAMILY, self.start_date, self.start_date)
+
+    def test_should_not_map_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"\0" * 64)
+
+        with pytest.raises(ValueError):
+            MappedSnapshot(str(path))
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            MappedSnapshot(str(path))
+
+    def test_should_not_map_files_not_matching_their_header(self, tmp_path):
+        path = tmp_path / "hotel.map"
+        write_mapped_snapshot(self.hotel, str(path))
+        data = path.read_bytes()
+
+        path.write_bytes(data[:-1])
+        with pytest.raises(ValueError, match="its header describes"):
+            MappedSnapshot(str(path))
+        # Points the schedules of the family room, the second room record, past the last schedule row.
+        first = struct.calcsize("<8sQQQ") + struct.calcsize("<qd24sQQ") + struct.calcsize("<qd24s")
+        path.write_bytes(data[:first] + struct.pack("<Q", 4) + data[first + 8 :])
+        with pytest.raises(ValueError, match="past the last one"):
+            MappedSnapshot(str(path))
+
+    def test_should_write_a_consistent_state_while_rooms_are_booked(self, tmp_path):
+        path = str(tmp_path / "hotel.map")
+        stop = threading.Event()
+
+        def rebook():
+            # The suite always holds 3 schedules, the family room 0 or 1.
+            while not stop.is_set():
+                self.family.add_schedule(Schedule("Husk", self.period(0, 1)))
+                self.family.cancel_schedule(self.family.schedules[0].id)
+
+        booker = threading.Thread(target=rebook)
+        booker.start()
+        try:
+            for _ in range(50):
+                write_mapped_snapshot(self.hotel, path)
+                with MappedSnapshot(path) as snapshot:
+                    suite, family = snapshot.rooms
+                    self.assert_equal(len(suite.schedules), 3)
+                    self.assert_equal(len(family.schedules) in (0, 1), True)
+        finally:
+            stop.set()
+            booker.join()
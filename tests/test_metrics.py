@@ -0,0 +1,100 @@
+import datetime
+import json
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    RoomNotAvailable,
+    RoomTypeNotAvailable,
+    ScheduleNotFound,
+)
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.metrics import Metrics
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestMetrics(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.end_date = self.start_date + datetime.timedelta(days=3)
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.hotel = Hotel([self.suite])
+        self.metrics = Metrics()
+
+    def teardown_method(self, _):
+        self.metrics.disable()
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_record_calls_latencies_and_rejections(self):
+        with self.metrics:
+            self.hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+            with pytest.raises(RoomNotAvailable):
+                self.hotel.schedule_a_room("Vaggie", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+            with pytest.raises(RoomTypeNotAvailable):
+                self.hotel.schedule_a_room("Husk", RoomTypeEnum.BUNGALOW, self.start_date, self.end_date)
+            with pytest.raises(ScheduleNotFound):
+                self.suite.update_schedule(Schedule("Alastor", Period(self.start_date, self.end_date)), 99)
+
+        operations = self.metrics.snapshot()["operations"]
+        self.assert_equal(operations["Hotel.schedule_a_room"]["calls"], 3)
+        self.assert_equal(
+            operations["Hotel.schedule_a_room"]["rejections"], {"RoomNotAvailable": 1, "RoomTypeNotAvailable": 1}
+        )
+        self.assert_equal(operations["Room.add_schedule"]["calls"], 1)
+        self.assert_equal(operations["Room.update_schedule"]["rejections"], {"ScheduleNotFound": 1})
+        self.assert_equal(operations["Hotel.schedule_a_room"]["latency_buckets"]["+Inf"], 3)
+        self.assert_equal(operations["Hotel.schedule_a_room"]["seconds_total"] > 0, True)
+
+    def test_should_record_schedules_examined_per_availability_check(self):
+        for day in range(0, 21, 3):
+            start = self.start_date + datetime.timedelta(days=day)
+            self.suite.add_schedule(Schedule("Charlie", Period(start, start)))
+
+        with self.metrics:
+            self.suite.is_period_available(Period(self.end_date, self.end_date))
+
+        examined = self.metrics.snapshot()["availability_schedules_examined"]
+        self.assert_equal((examined["checks"], examined["total"]), (1, 4))
+
+    def test_should_restore_the_original_methods_when_disabled(self):
+        originals = Hotel.schedule_a_room, Room.is_period_available
+
+        self.metrics.enable()
+        self.assert_not_equal(Room.is_period_available, originals[1])
+        self.metrics.disable()
+        self.suite.is_period_available(Period(self.start_date, self.end_date))
+
+        self.assert_equal((Hotel.schedule_a_room, Room.is_period_available), originals)
+        self.assert_equal(self.metrics.snapshot()["operations"]["Room.is_period_available"]["calls"], 0)
+
+    def test_should_allow_a_single_enabled_instance(self):
+        self.metrics.enable()
+        with pytest.raises(RuntimeError):
+            Metrics().enable()
+        self.assert_equal(self.metrics.enabled, True)
+
+    def test_should_render_json_and_prometheus_text(self):
+        with self.metrics:
+            self.hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+            with pytest.raises(RoomNotAvailable):
+                self.hotel.schedule_a_room("Vaggie", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+
+        self.assert_equal(json.loads(self.metrics.to_json()), self.metrics.snapshot())
+        text = self.metrics.to_prometheus()
+        self.assert_equal(
+            'hotel_operation_duration_seconds_count{operation="Hotel.schedule_a_room"} 2' in text.splitlines(), True
+        )
+        self.assert_equal(
+            'hotel_operation_rejections_total{operation="Hotel.schedule_a_room",exception="RoomNotAvailable"} 1'
+            in text.splitlines(),
+            True,
+        )
+        self.assert_equal('hotel_availability_schedules_examined_bucket{le="+Inf"} 3' in text.splitlines(), True)
+
+        self.metrics.reset()
+        self.assert_equal(self.metrics.snapshot()["operations"]["Hotel.schedule_a_room"]["calls"], 0)
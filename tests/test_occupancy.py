@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.occupancy import OccupancyMatrix
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+pytest.importorskip("numpy")
+
+
+class TestOccupancyMatrix(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 1)
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [Schedule("Charlie", self.period(1, 3))])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [Schedule("Vaggie", self.period(-2, 1))])
+        self.hotel = Hotel([self.suite, self.family])
+        self.occupancy = OccupancyMatrix(self.hotel, self.start_date, 5)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def assert_matrix(self, expected):
+        self.assert_equal(self.occupancy.matrix.astype(int).tolist(), expected)
+
+    def test_should_build_occupancy_from_existing_schedules(self):
+        self.assert_matrix([[0, 1, 1, 0, 0], [1, 0, 0, 0, 0]])
+
+    def test_should_follow_added_and_updated_schedules(self):
+        self.family.add_schedule(Schedule("Angel", self.period(3, 9)))
+        self.assert_matrix([[0, 1, 1, 0, 0], [1, 0, 0, 1, 1]])
+
+        self.suite.update_schedule(Schedule("Charlie", self.period(2, 2)), self.suite.schedules[0].id)
+        self.assert_matrix([[0, 0, 1, 0, 0], [1, 0, 0, 1, 1]])
+
+    def test_should_follow_cancellations_and_periods_changed_in_place(self):
+        self.suite.schedules[0].period.change_start(self.start_date + datetime.timedelta(days=2))
+        self.family.schedules[0].period.change_end(self.start_date + datetime.timedelta(days=4))
+        self.assert_matrix([[0, 0, 1, 0, 0], [1, 1, 1, 1, 0]])
+
+        self.hotel.cancel_schedule(self.family.schedules[0].id)
+        self.assert_matrix([[0, 0, 1, 0, 0], [0, 0, 0, 0, 0]])
+
+    def test_should_follow_added_and_removed_rooms(self):
+        bungalow = Room(RoomTypeEnum.BUNGALOW, 2000, [Schedule("Husk", self.period(4, 5))])
+        self.hotel.add_room(bungalow)
+        self.assert_matrix([[0, 1, 1, 0, 0], [1, 0, 0, 0, 0], [0, 0, 0, 0, 1]])
+
+        empty = Room(RoomTypeEnum.DELUXE, 1300, [])
+        self.hotel.add_room(empty)
+        self.hotel.remove_room(empty)
+        self.assert_equal(self.occupancy.rooms, [self.suite, self.family, bungalow])
+
+    def test_should_compute_occupancy_rates(self):
+        self.hotel.add_room(Room(RoomTypeEnum.SUITE, 1450, [Schedule("Husk", self.period(0, 5))]))
+
+        self.assert_equal(self.occupancy.day_rates().tolist(), [2 / 3, 2 / 3, 2 / 3, 1 / 3, 1 / 3])
+        self.assert_equal(list(self.occupancy.room_rates().values()), [0.4, 0.2, 1.0])
+        self.assert_equal(
+            self.occupancy.type_rates(), {RoomTypeEnum.SUITE: pytest.approx(0.7), RoomTypeEnum.FAMILY: 0.2}
+        )
+
+    def test_should_stop_following_the_hotel_when_closed(self):
+        self.occupancy.close()
+        self.family.add_schedule(Schedule("Angel", self.period(3, 4)))
+
+        self.assert_matrix([[0, 1, 1, 0, 0], [1, 0, 0, 0, 0]])
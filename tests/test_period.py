@@ -5,12 +5,16 @@ from tests import BaseTest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from datetime import datetime
+import pickle
+from datetime import date, datetime
 
 import pytest
 
+from hazbin_hotel.src.enums.types import RoomTypeEnum
 from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
-from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.period import DayPeriod, Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
 
 
 class TestPeriod(BaseTest):
@@ -92,3 +96,122 @@ class TestPeriod(BaseTest):
         end = datetime(2023, 1, 2)
         period = Period(start, end)
         self.assert_equal(str(period), f"START: {start} | END: {end}")
+
+    def test_should_notify_listeners_before_and_after_a_change(self):
+        """
+        Test the `period_changing` and `period_changed` events of an in place change.
+        """
+        period = Period(datetime(2023, 1, 1), datetime(2023, 1, 5))
+        events = []
+        period.subscribe(lambda event, source, **details: events.append((event, period.start, details)))
+
+        period.change_end(datetime(2023, 1, 3))
+        period.change_start(datetime(2023, 1, 4))
+
+        self.assert_equal(
+            events,
+            [
+                ("period_changing", datetime(2023, 1, 1), {"start": datetime(2023, 1, 1), "end": datetime(2023, 1, 3)}),
+                (
+                    "period_changed",
+                    datetime(2023, 1, 1),
+                    {"old_start": datetime(2023, 1, 1), "old_end": datetime(2023, 1, 5)},
+                ),
+            ],
+        )
+
+    def test_should_leave_the_period_untouched_when_a_listener_rejects_a_change(self):
+        """
+        Test that a listener raising on `period_changing` cancels the change.
+        """
+        period = Period(datetime(2023, 1, 1), datetime(2023, 1, 5))
+
+        def reject(event, source, **details):
+            if event == "period_changing":
+                raise ValueError("rejected")
+
+        period.subscribe(reject)
+        with pytest.raises(ValueError):
+            period.change_start(datetime(2023, 1, 2))
+
+        self.assert_equal((period.start, period.end), (datetime(2023, 1, 1), datetime(2023, 1, 5)))
+        restored = pickle.loads(pickle.dumps(period))
+        self.assert_equal(restored.change_start(datetime(2023, 1, 2)), True)
+
+
+class TestDayPeriod(BaseTest):
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_keep_whole_days_as_ordinals(self):
+        period = DayPeriod(datetime(2024, 11, 16, 14, 30), date(2024, 11, 19))
+
+        self.assert_equal((period.start, period.end), (datetime(2024, 11, 16), datetime(2024, 11, 19)))
+        self.assert_equal(period.start_ordinal, date(2024, 11, 16).toordinal())
+        self.assert_equal(period.nights, 3)
+        self.assert_equal(DayPeriod.from_period(Period(datetime(2024, 11, 16), datetime(2024, 11, 19))), period)
+        with pytest.raises(InvalidPeriodError):
+            DayPeriod(date(2024, 11, 19), date(2024, 11, 16))
+
+    def test_should_be_immutable_and_hashable(self):
+        period = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+
+        with pytest.raises(AttributeError):
+            period.start = datetime(2024, 11, 17)
+        self.assert_equal(period.with_start(date(2024, 11, 17)), DayPeriod(date(2024, 11, 17), date(2024, 11, 19)))
+        self.assert_equal(period.with_end(date(2024, 11, 15)), None)
+        self.assert_equal(period.start, datetime(2024, 11, 16))
+        self.assert_equal(len({period, DayPeriod(date(2024, 11, 16), date(2024, 11, 19))}), 1)
+        self.assert_equal(pickle.loads(pickle.dumps(period)), period)
+
+    def test_should_compare_with_days_and_periods(self):
+        period = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+        legacy = Period(datetime(2024, 11, 19, 12), datetime(2024, 11, 25))
+
+        self.assert_equal(period.overlaps(legacy), True)
+        self.assert_equal(period.overlaps(DayPeriod(date(2024, 11, 20), date(2024, 11, 25))), False)
+        self.assert_equal(period.intersection(legacy), DayPeriod(date(2024, 11, 19), date(2024, 11, 19)))
+        self.assert_equal(period.intersection(DayPeriod(date(2024, 11, 1), date(2024, 11, 15))), None)
+        self.assert_equal(date(2024, 11, 16) in period, True)
+        self.assert_equal(period.contains(DayPeriod(date(2024, 11, 17), date(2024, 11, 18))), True)
+        self.assert_equal(period.contains(legacy), False)
+
+    def test_should_book_rooms_like_a_period(self):
+        room = Room(RoomTypeEnum.SUITE, 1450, [])
+        room.add_schedule(Schedule("Charlie", DayPeriod(date(2024, 11, 16), date(2024, 11, 19))))
+
+        self.assert_equal(room.is_period_available(DayPeriod(date(2024, 11, 19), date(2024, 11, 20))), False)
+        self.assert_equal(room.is_period_available(Period(datetime(2024, 11, 20), datetime(2024, 11, 21))), True)
+
+    def test_should_check_and_clip_periods_in_batch(self):
+        pytest.importorskip("numpy")
+        stay = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+        starts, ends = DayPeriod.to_arrays(
+            [DayPeriod(date(2024, 11, 10), date(2024, 11, 17)), DayPeriod(date(2024, 11, 20), date(2024, 11, 30))]
+        )
+
+        self.assert_equal(stay.overlaps_batch(starts, ends).tolist(), [True, False])
+        self.assert_equal(DayPeriod.nights_batch(*stay.intersection_batch(starts, ends)).tolist(), [1, -1])
+
+    def test_should_match_the_scalar_operations_in_batch(self):
+        pytest.importorskip("numpy")
+        period = DayPeriod(date(2024, 11, 16), date(2024, 11, 19))
+        others = [
+            DayPeriod(date(2024, 11, day), date(2024, 11, day + length))
+            for day in range(10, 25)
+            for length in (0, 2, 6)
+        ]
+        starts, ends = DayPeriod.to_arrays(others)
+
+        self.assert_equal(period.overlaps_batch(starts, ends).tolist(), [period.overlaps(other) for other in others])
+        self.assert_equal(period.contains_batch(starts, ends).tolist(), [period.contains(other) for other in others])
+        clipped_starts, clipped_ends = period.intersection_batch(starts, ends)
+        nights = DayPeriod.nights_batch(clipped_starts, clipped_ends)
+        expected = [period.intersection(other) for other in others]
+        self.assert_equal(
+            [int(night) if night >= 0 else None for night in nights],
+            [shared.nights if shared else None for shared in expected],
+        )
+        self.assert_equal(len(DayPeriod.to_arrays([])[0]), 0)
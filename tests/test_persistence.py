@@ -0,0 +1,242 @@
+import datetime
+import os
+import threading
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.persistence import SNAPSHOT_FILE, HotelStore
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestHotelStore(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16, 14, 0, 0, 500)
+        self.end_date = self.start_date + datetime.timedelta(days=3)
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def populate(self, directory):
+        store = HotelStore(directory, compact_after=None)
+        hotel = store.load()
+        suite = Room(RoomTypeEnum.SUITE, 1450, [])
+        family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        hotel.add_room(suite)
+        hotel.add_room(family)
+        hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, self.start_date, self.end_date)
+        suite.update_price(1500)
+        family.type = RoomTypeEnum.DELUXE
+        return store, hotel, suite, family
+
+    def assert_restored(self, hotel):
+        self.assert_equal([room.number for room in hotel.rooms], [1, 2])
+        suite, deluxe = hotel.rooms
+        self.assert_equal(suite.price, 1500)
+        self.assert_equal(deluxe.type, RoomTypeEnum.DELUXE)
+        self.assert_equal(len(suite.schedules), 1)
+        schedule = suite.schedules[0]
+        self.assert_equal(schedule.client_name, "Charlie")
+        self.assert_equal(schedule.period.start, self.start_date)
+        self.assert_equal(schedule.period.end, self.end_date)
+        self.assert_equal(hotel.check_room_type_availability(RoomTypeEnum.DELUXE), deluxe)
+
+    def test_should_start_with_empty_hotel(self, tmp_path):
+        store = HotelStore(str(tmp_path))
+
+        hotel = store.load()
+        store.close()
+
+        self.assert_equal(len(hotel.rooms), 0)
+
+    def test_should_restore_hotel_from_wal(self, tmp_path):
+        store, *_ = self.populate(str(tmp_path))
+        store.close()
+        self.teardown_method(None)
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        hotel = restored_store.load()
+        restored_store.close()
+
+        self.assert_restored(hotel)
+        self.assert_equal(Room.instance_count, 3)
+        self.assert_equal(Schedule.instance_counter, 1)
+
+    def test_should_restore_hotel_from_snapshot_and_wal_tail(self, tmp_path):
+        store, hotel, suite, _ = self.populate(str(tmp_path))
+        store.compact()
+        later_start = self.end_date + datetime.timedelta(days=1)
+        hotel.schedule_a_room("Vaggie", RoomTypeEnum.SUITE, later_start, later_start + datetime.timedelta(days=1))
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(os.path.exists(tmp_path / SNAPSHOT_FILE), True)
+        self.assert_equal([schedule.client_name for schedule in restored.rooms[0].schedules], ["Charlie", "Vaggie"])
+
+    def test_should_restore_updated_schedule_and_removed_room(self, tmp_path):
+        store, hotel, suite, family = self.populate(str(tmp_path))
+        hotel.remove_room(family)
+        new_start = self.start_date + datetime.timedelta(days=10)
+        updated = Schedule("Charlie", Period(new_start, new_start + datetime.timedelta(days=2)))
+        suite.update_schedule(updated, suite.schedules[0].id)
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(len(restored.rooms), 1)
+        self.assert_equal(restored.rooms[0].schedules[0].id, updated.id)
+        self.assert_equal(restored.rooms[0].schedules[0].period.start, new_start)
+
+    def test_should_restore_schedules_changed_in_place(self, tmp_path):
+        store, hotel, suite, _ = self.populate(str(tmp_path))
+        schedule = suite.schedules[0]
+        new_end = self.end_date + datetime.timedelta(days=2)
+        schedule.period.change_end(new_end)
+        schedule.client_name = "Charlie Morningstar"
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(len(restored.rooms[0].schedules), 1)
+        restored_schedule = restored.rooms[0].schedules[0]
+        self.assert_equal(restored_schedule.id, schedule.id)
+        self.assert_equal(restored_schedule.client_name, "Charlie Morningstar")
+        self.assert_equal(restored_schedule.period.end, new_end)
+
+    def test_should_restore_cancelled_schedule(self, tmp_path):
+        store, hotel, suite, _ = self.populate(str(tmp_path))
+        hotel.cancel_schedule(suite.schedules[0].id)
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(restored.rooms[0].schedules, [])
+
+    def test_should_ignore_torn_wal_tail(self, tmp_path):
+        store, *_ = self.populate(str(tmp_path))
+        store.close()
+        segment = sorted(name for name in os.listdir(tmp_path) if name.startswith("wal-"))[-1]
+        with open(tmp_path / segment, "ab") as file:
+            file.write(b"\x40\x00\x00\x00\x00")
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        hotel = restored_store.load()
+        restored_store.close()
+
+        self.assert_restored(hotel)
+
+    def test_should_replay_records_already_in_snapshot_once(self, tmp_path):
+        store, *_ = self.populate(str(tmp_path))
+        store.close()
+        segment = sorted(name for name in os.listdir(tmp_path) if name.startswith("wal-"))[-1]
+        with open(tmp_path / segment, "rb") as file:
+            records = file.read()
+        with open(tmp_path / "wal-999999999999.log", "wb") as file:
+            file.write(records)
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        hotel = restored_store.load()
+        restored_store.close()
+
+        self.assert_restored(hotel)
+
+    def test_should_compact_in_background_after_recovery(self, tmp_path):
+        store, *_ = self.populate(str(tmp_path))
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        hotel = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(os.path.exists(tmp_path / SNAPSHOT_FILE), True)
+        self.assert_equal(len([name for name in os.listdir(tmp_path) if name.startswith("wal-")]), 1)
+        self.assert_restored(hotel)
+
+    def test_should_compact_while_bookings_are_cancelled(self, tmp_path):
+        store = HotelStore(str(tmp_path), compact_after=None)
+        hotel = store.load()
+        for _ in range(20):
+            hotel.add_room(Room(RoomTypeEnum.SUITE, 1450, []))
+        for day in range(0, 300, 3):
+            start = self.start_date + datetime.timedelta(days=day)
+            for _ in range(20):
+                hotel.schedule_a_room("Charlie", RoomTypeEnum.SUITE, start, start + datetime.timedelta(days=1))
+        schedule_ids = [schedule.id for room in hotel.rooms for schedule in room.schedules]
+        started = threading.Event()
+
+        def cancel():
+            started.set()
+            for schedule_id in schedule_ids[::2]:
+                hotel.cancel_schedule(schedule_id)
+
+        canceller = threading.Thread(target=cancel)
+        canceller.start()
+        started.wait()
+        for _ in range(5):
+            store.compact()
+        canceller.join()
+        store.compact()
+        expected = {room.number: sorted(schedule.id for schedule in room.schedules) for room in hotel.rooms}
+        self.assert_equal(len([name for name in os.listdir(tmp_path) if name.startswith("wal-")]), 1)
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal(
+            {room.number: sorted(schedule.id for schedule in room.schedules) for room in restored.rooms}, expected
+        )
+        self.assert_equal(sum(len(ids) for ids in expected.values()), len(schedule_ids) // 2)
+
+    def test_should_not_replay_changes_made_while_compaction_opens_its_snapshot(self, tmp_path):
+        store, hotel, suite, _ = self.populate(str(tmp_path))
+        later_start = self.end_date + datetime.timedelta(days=1)
+        later_end = later_start + datetime.timedelta(days=2)
+        open_snapshot = hotel.snapshot
+
+        def rebook_then_open_snapshot():
+            hotel.schedule_a_room("Angel", RoomTypeEnum.SUITE, later_start, later_end)
+            hotel.cancel_schedule(suite.schedules[-1].id)
+            hotel.schedule_a_room("Husk", RoomTypeEnum.SUITE, later_start, later_end)
+            return open_snapshot()
+
+        # Runs the changes once the WAL switched to the new segment, before the snapshot is opened.
+        hotel.snapshot = rebook_then_open_snapshot
+        store.compact()
+        store.close()
+
+        restored_store = HotelStore(str(tmp_path), compact_after=None)
+        restored = restored_store.load()
+        restored_store.close()
+
+        self.assert_equal([schedule.client_name for schedule in restored.rooms[0].schedules], ["Charlie", "Husk"])
+
+    def test_should_not_load_corrupted_snapshot(self, tmp_path):
+        store, *_ = self.populate(str(tmp_path))
+        store.compact()
+        store.close()
+        with open(tmp_path / SNAPSHOT_FILE, "r+b") as file:
+            file.seek(20)
+            file.write(b"\xff")
+
+        with pytest.raises(ValueError):
+            HotelStore(str(tmp_path)).load()
+
+    def test_should_not_accept_invalid_sync_interval(self, tmp_path):
+        with pytest.raises(ValueError):
+            HotelStore(str(tmp_path), sync_every=0)
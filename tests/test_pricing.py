@@ -0,0 +1,88 @@
+import datetime
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.pricing import WEEKEND, PricingEngine
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestPricingEngine(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 4)  # Monday
+        self.engine = PricingEngine(self.start_date, 28, weekday_factors={day: 1.5 for day in WEEKEND})
+        self.suite = Room(RoomTypeEnum.SUITE, 100, [])
+        self.family = Room(RoomTypeEnum.FAMILY, 100, [])
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def test_should_quote_base_price_times_type_multiplier_per_night(self):
+        self.assert_equal(self.engine.quote(self.suite, self.period(0, 3)), 600.0)
+        self.assert_equal(self.engine.quote(self.family, self.period(0, 3)), 540.0)
+
+    def test_should_charge_at_least_one_night(self):
+        self.assert_equal(self.engine.quote(self.suite, self.period(1, 1)), 200.0)
+
+    def test_should_apply_weekday_factors(self):
+        self.assert_equal(self.engine.nightly_rate(self.suite, self.start_date + datetime.timedelta(days=5)), 300.0)
+        self.assert_equal(self.engine.quote(self.suite, self.period(3, 8)), 1200.0)
+
+    def test_should_apply_seasons_to_selected_room_types(self):
+        season_start = self.start_date + datetime.timedelta(days=1)
+        self.engine.add_season(season_start, season_start + datetime.timedelta(days=1), 2.0, [RoomTypeEnum.SUITE])
+
+        self.assert_equal(self.engine.quote(self.suite, self.period(0, 3)), 1000.0)
+        self.assert_equal(self.engine.quote(self.family, self.period(0, 3)), 540.0)
+
+    def test_should_quote_many_stays_like_single_quotes(self):
+        self.engine.add_season(
+            self.start_date + datetime.timedelta(days=10), self.start_date + datetime.timedelta(days=40), 0.8
+        )
+        quotes = [
+            (room, self.period(start_days, start_days + nights))
+            for room in (self.suite, self.family)
+            for start_days in range(-3, 35, 4)
+            for nights in (1, 2, 7)
+        ]
+
+        totals = self.engine.quote_many(quotes)
+
+        self.assert_equal(totals, [self.engine.quote(room, period) for room, period in quotes])
+        self.assert_equal(
+            totals,
+            [
+                round(
+                    sum(
+                        self.engine.nightly_rate(room, period.start + datetime.timedelta(days=night))
+                        for night in range(max((period.end - period.start).days, 1))
+                    ),
+                    2,
+                )
+                for room, period in quotes
+            ],
+        )
+
+    def test_should_follow_room_price_and_type_changes(self):
+        self.engine.quote(self.suite, self.period(0, 1))
+        self.suite.price = 200
+        self.suite.type = RoomTypeEnum.FAMILY
+
+        self.assert_equal(self.engine.quote(self.suite, self.period(0, 1)), 360.0)
+
+    def test_should_not_accept_invalid_seasons(self):
+        with pytest.raises(InvalidPeriodError):
+            self.engine.add_season(self.start_date, self.start_date - datetime.timedelta(days=1), 2.0)
+        with pytest.raises(ValueError):
+            self.engine.add_season(self.start_date, self.start_date, -1.0)
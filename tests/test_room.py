@@ -1,12 +1,17 @@
 import datetime
 import enum
 import os
+import pickle
 import sys
 
 import pytest
 
-from hazbin_hotel.src.enums.types import RoomTypeEnum
-from hazbin_hotel.src.exceptions import InvalidRoomType, ScheduleCannotBeOverwritten
+from hazbin_hotel.src.enums.types import ROOM_MULTIPLIERS, RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    InvalidRoomType,
+    ScheduleCannotBeOverwritten,
+    ScheduleNotFound,
+)
 from hazbin_hotel.src.period import Period
 from hazbin_hotel.src.room import Room
 from hazbin_hotel.src.schedule import Schedule
@@ -55,6 +60,13 @@ class TestRoom(BaseTest):
         self.assert_equal(room.number, 1)
         self.assert_equal(room.type, RoomTypeEnum.PRESIDENTIAL_SUITE)
 
+    def test_should_not_create_a_room_with_overlapping_schedules(self):
+        later = Period(self.end_period, self.end_period + datetime.timedelta(days=1))
+
+        with pytest.raises(ScheduleCannotBeOverwritten):
+            Room(RoomTypeEnum.SUITE, 1450, [Schedule("Cliente B", later), self.schedule])
+        self.assert_equal(Room(RoomTypeEnum.SUITE, 1450, []).number, self.room.number + 1)
+
     def test_should_be_able_to_add_schedule_in_room(self, mocker):
         start_period = self.end_period + datetime.timedelta(days=1)
         end_period = start_period + datetime.timedelta(hours=1, days=3)
@@ -88,6 +100,11 @@ class TestRoom(BaseTest):
     def test_should_be_able_to_change_room_type_specific_room(self):
         self.room.type = RoomTypeEnum.DELUXE
         self.assert_equal(self.room.type, RoomTypeEnum.DELUXE)
+        self.assert_equal(self.room.multiplier_factor_price, ROOM_MULTIPLIERS[RoomTypeEnum.DELUXE])
+
+    def test_should_warn_when_the_same_room_type_is_set(self, capsys):
+        self.room.type = self.room.type
+        self.assert_equal("[WARNING]: Same type was set!!" in capsys.readouterr().out, True)
 
     def test_should_not_be_able_to_change_room_type_specific_room_with_invalid_room_type(
         self,
@@ -143,4 +160,82 @@ class TestRoom(BaseTest):
         schedule_mock.id = 2
 
         with pytest.raises(ScheduleCannotBeOverwritten):
-            self.room.update_schedule(schedule_mock, schedule_mock.id)
+            self.room.update_schedule(schedule_mock, self.schedule.id)
+
+    def test_should_get_schedule_by_id(self):
+        self.assert_equal(self.room.get_schedule(self.schedule.id), self.schedule)
+        with pytest.raises(ScheduleNotFound):
+            self.room.get_schedule(self.schedule.id + 1)
+
+    def test_should_not_update_unknown_schedule(self):
+        free_start = self.end_period + datetime.timedelta(days=10)
+        schedule = Schedule("Cliente B", Period(free_start, free_start + datetime.timedelta(days=1)))
+
+        with pytest.raises(ScheduleNotFound):
+            self.room.update_schedule(schedule, self.schedule.id + 1)
+        self.assert_equal(self.room.schedules, [self.schedule])
+
+    def test_should_cancel_schedule_and_free_its_period(self):
+        later_start = self.end_period + datetime.timedelta(days=1)
+        later = Schedule("Cliente B", Period(later_start, later_start + datetime.timedelta(days=1)))
+        self.room.add_schedule(later)
+
+        cancelled = self.room.cancel_schedule(self.schedule.id)
+
+        self.assert_equal(cancelled, self.schedule)
+        self.assert_equal(self.room.schedules, [later])
+        self.assert_equal(self.room.get_schedule(later.id), later)
+        self.assert_equal(self.room.is_period_available(self.period), True)
+        with pytest.raises(ScheduleNotFound):
+            self.room.cancel_schedule(self.schedule.id)
+
+    def test_should_reindex_a_period_changed_in_place(self):
+        later_start = self.end_period + datetime.timedelta(days=10)
+        later = Schedule("Cliente B", Period(later_start, later_start + datetime.timedelta(days=1)))
+        self.room.add_schedule(later)
+        events = []
+        self.room.subscribe(lambda event, room, **details: events.append((event, details)))
+
+        self.assert_equal(self.period.change_end(self.end_period + datetime.timedelta(days=3)), True)
+
+        self.assert_equal(
+            events,
+            [
+                (
+                    "period_changed",
+                    {"schedule": self.schedule, "old_start": self.start_period, "old_end": self.end_period},
+                )
+            ],
+        )
+        self.assert_equal(self.room.is_period_available(Period(self.end_period, self.end_period)), False)
+        gap = self.end_period + datetime.timedelta(days=4)
+        self.assert_equal(self.room.is_period_available(Period(gap, gap)), True)
+
+    def test_should_reject_a_period_changed_in_place_over_another_schedule(self):
+        later_start = self.end_period + datetime.timedelta(days=2)
+        later = Schedule("Cliente B", Period(later_start, later_start + datetime.timedelta(days=1)))
+        self.room.add_schedule(later)
+
+        with pytest.raises(ScheduleCannotBeOverwritten):
+            self.period.change_end(later_start)
+        with pytest.raises(ScheduleCannotBeOverwritten):
+            later.period.change_start(self.end_period)
+
+        self.assert_equal(self.period.end, self.end_period)
+        self.assert_equal(later.period.start, later_start)
+        self.assert_equal(self.room.is_period_available(Period(later_start, later_start)), False)
+
+    def test_should_stop_following_cancelled_schedules(self):
+        self.room.cancel_schedule(self.schedule.id)
+        later_start = self.end_period + datetime.timedelta(days=1)
+        self.room.add_schedule(Schedule("Cliente B", Period(later_start, later_start)))
+
+        self.assert_equal(self.period.change_end(later_start), True)
+
+    def test_should_follow_schedules_of_a_pickled_room(self):
+        restored = pickle.loads(pickle.dumps(self.room))
+        later_start = self.end_period + datetime.timedelta(days=10)
+        restored.add_schedule(Schedule("Cliente B", Period(later_start, later_start)))
+
+        with pytest.raises(ScheduleCannotBeOverwritten):
+            restored.schedules[0].period.change_end(later_start)
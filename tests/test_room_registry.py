@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotFound, RoomNumberTaken
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.room_registry import RoomRegistry, RoomsView
+from hazbin_hotel.src.schedule import Schedule
+from tests import BaseTest
+
+
+class TestRoomRegistry(BaseTest):
+    def setup_method(self, _):
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.deluxe = Room(RoomTypeEnum.SUITE, 1300, [])
+        self.registry = RoomRegistry([self.deluxe, self.suite])
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_keep_rooms_in_number_order(self):
+        self.registry.add(self.family)
+
+        self.assert_equal(tuple(self.registry.ordered()), (self.suite, self.family, self.deluxe))
+        self.assert_equal(self.registry.of_type(RoomTypeEnum.SUITE), (self.suite, self.deluxe))
+        self.assert_equal(self.registry.first_of_type(RoomTypeEnum.SUITE), self.suite)
+        self.assert_equal(self.registry.get(self.family.number), self.family)
+        self.assert_equal(self.registry.get(99), None)
+
+    def test_should_remove_rooms(self):
+        self.registry.remove(self.suite)
+
+        self.assert_equal(list(self.registry), [self.deluxe])
+        self.assert_equal(self.suite in self.registry, False)
+        self.assert_equal(self.registry.first_of_type(RoomTypeEnum.SUITE), self.deluxe)
+        with pytest.raises(RoomNotFound):
+            self.registry.remove(self.suite)
+
+    def test_should_not_remove_a_different_room_with_a_registered_number(self):
+        twin = Room(RoomTypeEnum.SUITE, 1450, [])
+        twin.number = self.suite.number
+
+        with pytest.raises(RoomNumberTaken):
+            self.registry.add(twin)
+        with pytest.raises(RoomNotFound):
+            self.registry.remove(twin)
+        self.assert_equal(self.registry.get(self.suite.number), self.suite)
+
+    def test_should_file_retyped_rooms_under_their_new_type(self):
+        self.registry.retype(self.deluxe, RoomTypeEnum.SUITE, RoomTypeEnum.DELUXE)
+
+        self.assert_equal(self.registry.of_type(RoomTypeEnum.SUITE), (self.suite,))
+        self.assert_equal(self.registry.has_type(self.deluxe, RoomTypeEnum.DELUXE), True)
+        self.assert_equal(self.registry.has_type(self.deluxe, RoomTypeEnum.SUITE), False)
+
+        self.registry.retype(self.suite, RoomTypeEnum.SUITE, RoomTypeEnum.DELUXE)
+        self.assert_equal(self.registry.of_type(RoomTypeEnum.SUITE), ())
+        self.assert_equal(self.registry.of_type(RoomTypeEnum.DELUXE), (self.suite, self.deluxe))
+
+    def test_should_iterate_a_stable_copy_while_rooms_change(self):
+        rooms = RoomsView(self.registry)
+
+        for room in rooms:
+            self.registry.remove(room)
+
+        self.assert_equal(len(rooms), 0)
+        self.assert_equal(list(rooms), [])
+
+    def test_should_keep_order_across_blocks_and_share_unchanged_sequences(self):
+        generator = random.Random(3)
+        rooms = [Room(RoomTypeEnum.FAMILY, 1000, []) for _ in range(600)]
+        generator.shuffle(rooms)
+        registry = RoomRegistry(rooms[:500])
+        before = registry.ordered()
+        families = registry.of_type(RoomTypeEnum.FAMILY)
+
+        self.assert_equal(registry.of_type(RoomTypeEnum.FAMILY) is families, True)
+        for room in rooms[500:]:
+            registry.add(room)
+        for room in rooms[:250]:
+            registry.remove(room)
+
+        expected = sorted(rooms[250:], key=lambda room: room.number)
+        self.assert_equal(list(registry.ordered()), expected)
+        self.assert_equal(
+            [registry.ordered()[index] for index in (0, 199, -1)], [expected[0], expected[199], expected[-1]]
+        )
+        self.assert_equal(registry.of_type(RoomTypeEnum.FAMILY), tuple(expected))
+        self.assert_equal(list(before), sorted(rooms[:500], key=lambda room: room.number))
+        with pytest.raises(IndexError):
+            registry.ordered()[len(expected)]
+
+    def test_should_add_and_remove_rooms_in_bulk(self):
+        generator = random.Random(5)
+        rooms = [Room(generator.choice([RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY]), 1000, []) for _ in range(700)]
+        generator.shuffle(rooms)
+        registry = RoomRegistry(rooms[:300])
+        before = registry.ordered()
+
+        registry.add_many(rooms[300:])
+        registry.remove_many(rooms[:200])
+        registry.remove(rooms[250])
+        registry.add(rooms[250])
+
+        expected = sorted(rooms[200:], key=lambda room: room.number)
+        self.assert_equal(list(registry.ordered()), expected)
+        for room_type in (RoomTypeEnum.SUITE, RoomTypeEnum.FAMILY):
+            self.assert_equal(registry.of_type(room_type), tuple(room for room in expected if room.type == room_type))
+        self.assert_equal(len(before), 300)
+
+        twin = Room(RoomTypeEnum.SUITE, 1450, [])
+        twin.number = rooms[0].number
+        with pytest.raises(RoomNumberTaken):
+            registry.add_many([twin, Room(RoomTypeEnum.SUITE, 1450, []), twin])
+        with pytest.raises(RoomNumberTaken):
+            registry.add_many([rooms[0], rooms[300]])
+        with pytest.raises(RoomNotFound):
+            registry.remove_many([rooms[300], rooms[300]])
+        self.assert_equal(list(registry.ordered()), expected)
+        self.assert_equal(registry.get(rooms[0].number), None)
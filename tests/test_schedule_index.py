@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.schedule_index import ScheduleIndex
+from tests import BaseTest
+
+
+class TestScheduleIndex(BaseTest):
+    def setup_method(self, _):
+        self.index = ScheduleIndex()
+        self.first = Schedule("Client A", Period(datetime(2024, 11, 16), datetime(2024, 11, 19)))
+        self.second = Schedule("Client B", Period(datetime(2024, 11, 21), datetime(2024, 11, 26)))
+        self.index.add(self.second)
+        self.index.add(self.first)
+
+    @staticmethod
+    def teardown_method(_):
+        Schedule.instance_counter = 0
+
+    def test_should_detect_overlap_with_any_indexed_schedule(self):
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 10), datetime(2024, 11, 16)), True)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 17), datetime(2024, 11, 18)), True)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 19), datetime(2024, 11, 20)), True)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 10), datetime(2024, 11, 30)), True)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 26), datetime(2024, 11, 30)), True)
+
+    def test_should_not_detect_overlap_in_free_periods(self):
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 1), datetime(2024, 11, 15)), False)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 20), datetime(2024, 11, 20)), False)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 27), datetime(2024, 11, 30)), False)
+
+    def test_should_list_free_windows_between_schedules(self):
+        windows = self.index.free_windows(datetime(2024, 11, 10), datetime(2024, 11, 30), timedelta(days=1))
+
+        self.assert_equal(
+            windows,
+            [
+                (datetime(2024, 11, 10), datetime(2024, 11, 15)),
+                (datetime(2024, 11, 27), datetime(2024, 11, 30)),
+            ],
+        )
+
+    def test_should_list_short_free_windows_when_allowed(self):
+        windows = self.index.free_windows(datetime(2024, 11, 17), datetime(2024, 11, 30), timedelta(0))
+
+        self.assert_equal(
+            windows,
+            [
+                (datetime(2024, 11, 20), datetime(2024, 11, 20)),
+                (datetime(2024, 11, 27), datetime(2024, 11, 30)),
+            ],
+        )
+
+    def test_should_ignore_schedule_by_id(self):
+        self.assert_equal(
+            self.index.overlaps(
+                datetime(2024, 11, 22), datetime(2024, 11, 23), ignore_schedule=True, schedule_id=self.second.id
+            ),
+            False,
+        )
+        self.assert_equal(
+            self.index.overlaps(
+                datetime(2024, 11, 18), datetime(2024, 11, 23), ignore_schedule=True, schedule_id=self.second.id
+            ),
+            True,
+        )
+
+    def test_should_remove_schedule_changed_in_place(self):
+        self.first.period.change_end(datetime(2024, 11, 20))
+
+        self.index.remove(self.first)
+
+        self.assert_equal(len(self.index), 1)
+        self.assert_equal(self.first in self.index, False)
+        self.assert_equal(self.index.overlaps(datetime(2024, 11, 16), datetime(2024, 11, 19)), False)
+
+    def test_should_not_remove_unknown_schedule(self):
+        unknown = Schedule("Client C", Period(datetime(2024, 12, 1), datetime(2024, 12, 2)))
+
+        with pytest.raises(KeyError):
+            self.index.remove(unknown)
+
+    def test_should_agree_with_linear_scan(self):
+        start = datetime(2025, 1, 1)
+        for day in range(0, 300, 7):
+            self.index.add(Schedule("Client", Period(start + timedelta(days=day), start + timedelta(days=day + 3))))
+
+        for day in range(0, 310):
+            probe_start = start + timedelta(days=day)
+            probe_end = probe_start + timedelta(days=2)
+            expected = any(
+                scheduled.period.start <= probe_end and probe_start <= scheduled.period.end
+                for scheduled in self.index._schedules
+            )
+            self.assert_equal(self.index.overlaps(probe_start, probe_end), expected)
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions.room.invalid_period_error import InvalidPeriodError
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.schedule_store import ScheduleStore
+from tests import BaseTest
+
+
+class TestScheduleStore(BaseTest):
+    def setup_method(self, _):
+        Schedule.instance_counter = 0
+        self.store = ScheduleStore()
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def test_should_store_bookings_with_schedule_interface(self):
+        start = datetime(2024, 11, 16, 14, 30, 0, 123)
+        end = datetime(2024, 11, 19, 12)
+
+        schedule = self.store.append("Client A", start, end)
+
+        self.assert_equal(len(self.store), 1)
+        self.assert_equal(schedule.id, 0)
+        self.assert_equal(schedule.client_name, "Client A")
+        self.assert_equal(schedule.period.start, start)
+        self.assert_equal(schedule.period.end, end)
+        self.assert_equal(Schedule.instance_counter, 1)
+
+    def test_should_not_store_invalid_period(self):
+        with pytest.raises(InvalidPeriodError):
+            self.store.append("Client A", datetime(2024, 11, 19), datetime(2024, 11, 16))
+
+    def test_should_copy_existing_schedule_keeping_its_id(self):
+        schedule = Schedule("Client B", Period(datetime(2024, 11, 16), datetime(2024, 11, 19)))
+
+        stored = self.store.add(schedule)
+
+        self.assert_equal(stored.id, schedule.id)
+        self.assert_equal(stored.period.start, schedule.period.start)
+        self.assert_equal(self.store[0], stored)
+
+    def test_should_change_period_and_client_name_through_views(self):
+        schedule = self.store.append("Client C", datetime(2024, 11, 16), datetime(2024, 11, 19))
+
+        self.assert_equal(schedule.period.change_start(datetime(2024, 11, 20)), False)
+        self.assert_equal(schedule.period.change_start(datetime(2024, 11, 17)), True)
+        self.assert_equal(schedule.period.change_end(datetime(2024, 11, 16)), False)
+        self.assert_equal(schedule.period.change_end(datetime(2024, 11, 18)), True)
+        schedule.client_name = "Client D"
+
+        self.assert_equal(str(self.store[0].period), "START: 2024-11-17 00:00:00 | END: 2024-11-18 00:00:00")
+        self.assert_equal(self.store[-1].client_name, "Client D")
+
+    def test_should_be_usable_by_a_room(self):
+        first = self.store.append("Client E", datetime(2024, 11, 16), datetime(2024, 11, 19))
+        second = self.store.append("Client F", datetime(2024, 11, 18), datetime(2024, 11, 20))
+        room = Room(RoomTypeEnum.SUITE, 1000, [])
+
+        room.add_schedule(first)
+
+        with pytest.raises(ValueError):
+            room.add_schedule(second)
+        self.assert_equal(room.is_period_available(Period(datetime(2024, 11, 20), datetime(2024, 11, 21))), True)
+
+    def test_should_not_access_rows_out_of_range(self):
+        with pytest.raises(IndexError):
+            self.store[0]
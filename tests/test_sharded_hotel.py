@@ -0,0 +1,167 @@
+import datetime
+import pickle
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import (
+    RoomHasSchedule,
+    RoomNotAvailable,
+    RoomNotFound,
+    RoomTypeNotAvailable,
+    ScheduleNotFound,
+)
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.sharded_hotel import ShardedHotel
+from tests import BaseTest
+
+
+class TestShardedHotel(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.end_date = self.start_date + datetime.timedelta(days=3)
+        self.charlie = Schedule("Charlie", self.period(0, 3))
+        self.suites = [Room(RoomTypeEnum.SUITE, 1450, [self.charlie]), Room(RoomTypeEnum.SUITE, 1450, [])]
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel = ShardedHotel(self.suites + [self.family], shards=2)
+
+    def teardown_method(self, _):
+        self.hotel.close()
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def period(self, start_days, end_days):
+        return Period(
+            self.start_date + datetime.timedelta(days=start_days), self.start_date + datetime.timedelta(days=end_days)
+        )
+
+    def booked_clients(self):
+        return sorted(schedule.client_name for room in self.hotel.rooms for schedule in room.schedules)
+
+    def test_should_partition_rooms_across_shards(self):
+        self.assert_equal([room.number for room in self.hotel.rooms], [1, 2, 3])
+        self.assert_equal(self.hotel._type_shards[RoomTypeEnum.SUITE], {0: 1, 1: 1})
+
+        by_type = ShardedHotel(self.suites + [self.family], shards=2, partition="type")
+        try:
+            self.assert_equal(len(by_type._type_shards[RoomTypeEnum.SUITE]), 1)
+            self.assert_equal(by_type.check_room_type_availability(RoomTypeEnum.FAMILY).number, self.family.number)
+        finally:
+            by_type.close()
+
+    def test_should_book_rooms_on_every_shard(self):
+        later = self.start_date + datetime.timedelta(days=5)
+        for client_name in ("Vaggie", "Angel Dust"):
+            self.assert_equal(self.hotel.schedule_a_room(client_name, RoomTypeEnum.SUITE, later, later), True)
+
+        self.assert_equal(self.booked_clients(), ["Angel Dust", "Charlie", "Vaggie"])
+        with pytest.raises(RoomNotAvailable):
+            self.hotel.schedule_a_room("Husk", RoomTypeEnum.SUITE, later, later)
+        with pytest.raises(RoomTypeNotAvailable):
+            self.hotel.schedule_a_room("Husk", RoomTypeEnum.BUNGALOW, self.start_date, self.end_date)
+
+    def test_should_schedule_many_across_shards(self):
+        results = self.hotel.schedule_many(
+            [
+                ("Vaggie", RoomTypeEnum.SUITE, self.start_date, self.end_date),
+                (
+                    "Angel Dust",
+                    RoomTypeEnum.SUITE,
+                    self.start_date + datetime.timedelta(days=5),
+                    self.start_date + datetime.timedelta(days=6),
+                ),
+                ("Husk", RoomTypeEnum.SUITE, self.start_date, self.end_date),
+                ("Niffty", RoomTypeEnum.FAMILY, self.start_date, self.end_date),
+                ("Alastor", RoomTypeEnum.BUNGALOW, self.start_date, self.end_date),
+            ]
+        )
+
+        self.assert_equal(results[:2], [self.suites[1].number, self.suites[0].number])
+        self.assert_equal(isinstance(results[2], RoomNotAvailable), True)
+        self.assert_equal(results[3], self.family.number)
+        self.assert_equal(isinstance(results[4], RoomTypeNotAvailable), True)
+        self.assert_equal(self.booked_clients(), ["Angel Dust", "Charlie", "Niffty", "Vaggie"])
+
+    def test_should_merge_availability_from_every_shard(self):
+        self.assert_equal(
+            [room.number for room in self.hotel.find_available_rooms(RoomTypeEnum.SUITE, self.period(1, 2))],
+            [self.suites[1].number],
+        )
+        self.assert_equal(len(self.hotel.find_available_rooms(RoomTypeEnum.SUITE, self.period(5, 6))), 2)
+        self.assert_equal(self.hotel.find_available_room(RoomTypeEnum.SUITE, self.period(5, 6)) is not None, True)
+
+        windows = self.hotel.available_windows(RoomTypeEnum.SUITE, self.start_date, self.start_date.replace(day=30))
+        self.assert_equal(
+            {room.number: [window.start.day for window in room_windows] for room, room_windows in windows.items()},
+            {self.suites[0].number: [20], self.suites[1].number: [16]},
+        )
+
+    def test_should_route_schedule_ids_to_their_shard(self):
+        self.hotel.schedule_a_room("Vaggie", RoomTypeEnum.FAMILY, self.start_date, self.end_date)
+        vaggie = next(schedule for room in self.hotel.rooms for schedule in room.schedules if schedule.id != 0)
+
+        self.assert_equal(self.hotel.get_schedule(vaggie.id).client_name, "Vaggie")
+        self.assert_equal(self.hotel.get_schedule(self.charlie.id).client_name, "Charlie")
+
+        updated = Schedule("Alastor", self.period(4, 5))
+        self.hotel.update_schedule(updated, self.charlie.id)
+        self.assert_equal(self.hotel.get_schedule(updated.id).client_name, "Alastor")
+        with pytest.raises(ScheduleNotFound):
+            self.hotel.update_schedule(Schedule("Husk", self.period(0, 1)), vaggie.id + 1000)
+
+        self.assert_equal(self.hotel.cancel_schedule(vaggie.id).client_name, "Vaggie")
+        with pytest.raises(ScheduleNotFound):
+            self.hotel.get_schedule(vaggie.id)
+        self.assert_equal(self.booked_clients(), ["Alastor"])
+
+    def test_should_keep_schedule_ids_unique_across_shards(self):
+        later = self.start_date + datetime.timedelta(days=9)
+        self.hotel.schedule_many([(f"Guest {number}", RoomTypeEnum.SUITE, later, later) for number in range(2)])
+        self.hotel.schedule_a_room("Husk", RoomTypeEnum.FAMILY, self.start_date, self.end_date)
+
+        ids = [schedule.id for room in self.hotel.rooms for schedule in room.schedules]
+        self.assert_equal(len(set(ids)), 4)
+
+    def test_should_add_and_remove_rooms(self):
+        bungalow = Room(RoomTypeEnum.BUNGALOW, 2000, [Schedule("Husk", self.period(0, 1))])
+        (schedule_id,) = self.hotel.add_room(bungalow)
+
+        self.assert_equal(self.hotel.check_room_type_availability(RoomTypeEnum.BUNGALOW).number, bungalow.number)
+        self.assert_equal(self.hotel.get_schedule(schedule_id).client_name, "Husk")
+        with pytest.raises(RoomHasSchedule):
+            self.hotel.remove_room(bungalow)
+
+        self.hotel.cancel_schedule(schedule_id)
+        self.hotel.remove_room(bungalow)
+        with pytest.raises(RoomTypeNotAvailable):
+            self.hotel.check_room_type_availability(RoomTypeEnum.BUNGALOW)
+        with pytest.raises(RoomNotFound):
+            self.hotel.remove_room(bungalow)
+
+    def test_should_book_a_specific_room(self):
+        self.assert_equal(self.hotel.book_room(self.family, RoomTypeEnum.FAMILY, "Niffty", self.period(0, 1)), True)
+        self.assert_equal(self.hotel.book_room(self.family, RoomTypeEnum.FAMILY, "Husk", self.period(1, 2)), False)
+        self.assert_equal(self.hotel.book_room(self.family, RoomTypeEnum.SUITE, "Husk", self.period(5, 6)), False)
+
+    def test_should_pickle_rooms_without_lock_and_listeners(self):
+        self.suites[0].subscribe(lambda *_, **__: None)
+
+        room = pickle.loads(pickle.dumps(self.suites[0]))
+
+        self.assert_equal(room.number, self.suites[0].number)
+        self.assert_equal(room.schedules[0].client_name, "Charlie")
+        self.assert_equal(room.get_schedule(self.charlie.id).id, self.charlie.id)
+        self.assert_equal(room.is_period_available(self.period(1, 2)), False)
+        self.assert_not_equal(room.lock, self.suites[0].lock)
+        self.assert_equal(room._listeners, None)
+
+    def test_should_allocate_strided_schedule_ids(self):
+        Schedule.instance_counter, Schedule.id_stride = 1, 3
+        try:
+            self.assert_equal([Schedule.allocate_id(), Schedule.allocate_id()], [1, 4])
+            Schedule.reserve_ids_up_to(9)
+            self.assert_equal(Schedule.allocate_id(), 10)
+        finally:
+            Schedule.id_stride = 1
@@ -0,0 +1,133 @@
+import datetime
+
+import pytest
+
+from hazbin_hotel.src.enums.types import RoomTypeEnum
+from hazbin_hotel.src.exceptions import RoomNotFound
+from hazbin_hotel.src.hotel import Hotel
+from hazbin_hotel.src.period import Period
+from hazbin_hotel.src.room import Room
+from hazbin_hotel.src.schedule import Schedule
+from hazbin_hotel.src.versioning import VERSION_CLOCK, HotelSnapshot, ScheduleVersion
+from tests import BaseTest
+
+
+class TestHotelSnapshot(BaseTest):
+    def setup_method(self, _):
+        self.start_date = datetime.datetime(2024, 11, 16)
+        self.end_date = self.start_date + datetime.timedelta(days=3)
+        self.suite = Room(RoomTypeEnum.SUITE, 1450, [Schedule("Alastor", Period(self.start_date, self.end_date))])
+        self.family = Room(RoomTypeEnum.FAMILY, 1000, [])
+        self.hotel = Hotel([self.suite, self.family])
+
+    @staticmethod
+    def teardown_method(_):
+        Room.instance_count = 1
+        Schedule.instance_counter = 0
+
+    def later(self, days: int) -> Period:
+        start = self.end_date + datetime.timedelta(days=days)
+        return Period(start, start + datetime.timedelta(days=1))
+
+    def test_should_not_see_changes_committed_after_it_was_opened(self):
+        booked = self.suite.schedules[0]
+        with self.hotel.snapshot() as snapshot:
+            self.family.add_schedule(Schedule("Angel", self.later(1)))
+            self.hotel.update_schedule(Schedule("Husk", self.later(1)), booked.id)
+            self.family.update_price(1200)
+            self.family.type = RoomTypeEnum.DELUXE
+
+            suite, family = snapshot.rooms
+
+        self.assert_equal(suite.schedules, (ScheduleVersion(booked.id, "Alastor", self.start_date, self.end_date),))
+        self.assert_equal((family.type, family.price, family.schedules), (RoomTypeEnum.FAMILY, 1000, ()))
+        with self.hotel.snapshot() as snapshot:
+            suite, family = snapshot.rooms
+        self.assert_equal([schedule.client_name for schedule in suite.schedules], ["Husk"])
+        self.assert_equal((family.type, family.price, len(family.schedules)), (RoomTypeEnum.DELUXE, 1200, 1))
+
+    def test_should_keep_in_place_changes_out_of_older_snapshots(self):
+        schedule = self.suite.schedules[0]
+        snapshot = self.hotel.snapshot()
+
+        schedule.period.change_end(self.end_date + datetime.timedelta(days=1))
+        schedule.client_name = "Charlie"
+        self.hotel.cancel_schedule(schedule.id)
+
+        self.assert_equal(
+            snapshot.get_room(self.suite.number).schedules,
+            (ScheduleVersion(schedule.id, "Alastor", self.start_date, self.end_date),),
+        )
+        snapshot.close()
+
+    def test_should_keep_in_place_changes_out_of_snapshots_opened_while_they_are_applied(self):
+        seen = []
+
+        def open_snapshot(event, source, **_):
+            if event in ("period_changed", "client_name_changed"):
+                with self.hotel.snapshot() as snapshot:
+                    seen.append(snapshot.get_room(self.suite.number).schedules[-1])
+
+        moved = Schedule("Angel", self.later(1))
+        old_end, new_end = moved.period.end, moved.period.end + datetime.timedelta(days=1)
+        # Subscribed before the room, so notified while the room still holds the change uncommitted.
+        moved.period.subscribe(open_snapshot)
+        moved.subscribe(open_snapshot)
+        self.suite.add_schedule(moved)
+        moved.period.change_end(new_end)
+        moved.client_name = "Charlie"
+
+        self.assert_equal(
+            [(version.client_name, version.end) for version in seen], [("Angel", old_end), ("Angel", new_end)]
+        )
+        with self.hotel.snapshot() as snapshot:
+            after = snapshot.get_room(self.suite.number).schedules[-1]
+        self.assert_equal(after, ScheduleVersion(moved.id, "Charlie", moved.period.start, new_end))
+        self.assert_equal(self.suite._in_place, {})
+
+    def test_should_read_the_rooms_of_the_hotel_when_it_was_opened(self):
+        snapshot = self.hotel.snapshot()
+        added = Room(RoomTypeEnum.DELUXE, 1300, [])
+        self.hotel.add_room(added)
+        self.hotel.remove_room(self.family)
+
+        self.assert_equal([room.number for room in snapshot.rooms], [self.suite.number, self.family.number])
+        with pytest.raises(RoomNotFound):
+            snapshot.get_room(added.number)
+        snapshot.close()
+
+    def test_should_drop_old_versions_once_released(self):
+        first = self.hotel.snapshot()
+        self.family.add_schedule(Schedule("Angel", self.later(1)))
+        second = self.hotel.snapshot()
+        self.family.add_schedule(Schedule("Vaggie", self.later(3)))
+        self.assert_equal(len(self.family._old_versions), 2)
+
+        first.close()
+        self.assert_equal(len(self.family._old_versions), 1)
+        self.assert_equal(len(second.get_room(self.family.number).schedules), 1)
+        second.close()
+        self.assert_equal(self.family._old_versions, ())
+        self.assert_equal(self.family in VERSION_CLOCK._retaining, False)
+
+        with pytest.raises(ValueError):
+            first.get_room(self.family.number)
+
+    def test_should_not_copy_rooms_without_open_snapshots(self):
+        self.suite.update_price(1500)
+        self.family.add_schedule(Schedule("Angel", self.later(1)))
+
+        self.assert_equal((self.suite._old_versions, self.family._old_versions), ((), ()))
+        self.assert_equal(self.suite._version, None)
+
+    def test_should_iterate_schedules_with_their_room_until_closed(self):
+        snapshot = HotelSnapshot((self.suite, self.family))
+
+        self.assert_equal(len(snapshot), 2)
+        self.assert_equal(
+            [(room.number, schedule.client_name) for room, schedule in snapshot.schedules()],
+            [(self.suite.number, "Alastor")],
+        )
+        self.assert_equal(snapshot.closed, False)
+        snapshot.close()
+        self.assert_equal(snapshot.closed, True)